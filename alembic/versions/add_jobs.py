@@ -0,0 +1,58 @@
+"""add_jobs
+
+Revision ID: b2c3d4e5f6a8
+Revises: a1b2c3d4e5f7
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2c3d4e5f6a8'
+down_revision: Union[str, Sequence[str], None] = 'a1b2c3d4e5f7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add jobs / job_partials tables (background job queue, utils/job_queue.py)."""
+    op.create_table(
+        'jobs',
+        sa.Column('id', sa.Uuid(), nullable=False),
+        sa.Column('kind', sa.String(), nullable=False),
+        sa.Column('params', sa.JSON(), nullable=False),
+        sa.Column('status', sa.String(), nullable=False, server_default='queued'),
+        sa.Column('progress', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('message', sa.String(), nullable=True),
+        sa.Column('partials_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('result', sa.JSON(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('cancel_requested', sa.Boolean(), nullable=False, server_default='false'),
+        sa.Column('worker_id', sa.String(), nullable=True),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('heartbeat_at', sa.DateTime(), nullable=True),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_jobs_status_created', 'jobs', ['status', 'created_at'])
+    op.create_table(
+        'job_partials',
+        sa.Column('job_id', sa.Uuid(), nullable=False),
+        sa.Column('seq', sa.Integer(), nullable=False),
+        sa.Column('data', sa.JSON(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('job_id', 'seq'),
+        sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ondelete='CASCADE'),
+    )
+
+
+def downgrade() -> None:
+    """Drop jobs / job_partials tables."""
+    op.drop_table('job_partials')
+    op.drop_index('ix_jobs_status_created', table_name='jobs')
+    op.drop_table('jobs')
@@ -0,0 +1,35 @@
+"""add_player_name_key_seq
+
+Revision ID: d4e5f6a7b8c0
+Revises: c3d4e5f6a7b9
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4e5f6a7b8c0'
+down_revision: Union[str, Sequence[str], None] = 'c3d4e5f6a7b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add player_name_keys.seq (per-game-mode commit-order batch) and sync on it instead of created_at."""
+    op.add_column('player_name_keys', sa.Column('seq', sa.BigInteger(), nullable=False, server_default='0'))
+    op.create_index('ix_player_name_keys_game_mode_seq', 'player_name_keys', ['game_mode_id', 'seq'])
+    op.drop_index('ix_player_name_keys_game_mode_created', table_name='player_name_keys')
+
+
+def downgrade() -> None:
+    """Drop player_name_keys.seq."""
+    op.create_index(
+        'ix_player_name_keys_game_mode_created',
+        'player_name_keys',
+        ['game_mode_id', 'created_at'],
+    )
+    op.drop_index('ix_player_name_keys_game_mode_seq', table_name='player_name_keys')
+    op.drop_column('player_name_keys', 'seq')
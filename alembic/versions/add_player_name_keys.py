@@ -0,0 +1,56 @@
+"""add_player_name_keys
+
+Revision ID: e9f0a1b2c3d4
+Revises: d8e9f0a1b2c3
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'e9f0a1b2c3d4'
+down_revision: Union[str, Sequence[str], None] = 'd8e9f0a1b2c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Must match utils.name_index.normalize_full_name (lowercase, trimmed, single spaces).
+_NORMALIZED_NAME_SQL = "lower(regexp_replace(btrim(name), '\\s+', ' ', 'g'))"
+
+
+def upgrade() -> None:
+    """Add player_name_keys table and backfill it from existing players / prospects."""
+    op.create_table(
+        'player_name_keys',
+        sa.Column('game_mode_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('name_key', sa.String(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint('game_mode_id', 'name_key'),
+        sa.ForeignKeyConstraint(['game_mode_id'], ['game_modes.id'], ),
+    )
+    op.create_index(
+        'ix_player_name_keys_game_mode_created',
+        'player_name_keys',
+        ['game_mode_id', 'created_at'],
+    )
+
+    for table in ('players', 'youth_prospects', 'youth_academy_players'):
+        op.execute(
+            f"""
+            INSERT INTO player_name_keys (game_mode_id, name_key)
+            SELECT DISTINCT game_mode_id, {_NORMALIZED_NAME_SQL}
+            FROM {table}
+            WHERE name IS NOT NULL AND btrim(name) <> ''
+            ON CONFLICT DO NOTHING
+            """
+        )
+
+
+def downgrade() -> None:
+    """Drop player_name_keys table."""
+    op.drop_index('ix_player_name_keys_game_mode_created', table_name='player_name_keys')
+    op.drop_table('player_name_keys')
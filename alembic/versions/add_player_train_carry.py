@@ -0,0 +1,28 @@
+"""add_player_train_carry
+
+Revision ID: a1b2c3d4e5f7
+Revises: f0a1b2c3d4e5
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1b2c3d4e5f7'
+down_revision: Union[str, Sequence[str], None] = 'f0a1b2c3d4e5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add players.train_carry (persistent fractional training DP per attribute)."""
+    op.add_column('players', sa.Column('train_carry', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop players.train_carry."""
+    op.drop_column('players', 'train_carry')
@@ -0,0 +1,44 @@
+"""add_training_run_claims
+
+Revision ID: c3d4e5f6a7b9
+Revises: b2c3d4e5f6a8
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d4e5f6a7b9'
+down_revision: Union[str, Sequence[str], None] = 'b2c3d4e5f6a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add training_runs.training_kwargs / heartbeat_at and one active run per game mode."""
+    op.add_column('training_runs', sa.Column('training_kwargs', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    op.add_column('training_runs', sa.Column('heartbeat_at', sa.DateTime(), nullable=True))
+    # Runs left pending / running by earlier deploys have no live process; keep them resumable
+    op.execute(
+        "UPDATE training_runs SET status = 'failed', "
+        "error = 'Interrupted (no heartbeat); resume with resume_run_id' "
+        "WHERE status IN ('pending', 'running')"
+    )
+    op.create_index(
+        'ux_training_runs_active_game_mode',
+        'training_runs',
+        ['game_mode_id'],
+        unique=True,
+        postgresql_where=sa.text("status IN ('pending', 'running')"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the active-run index and the claim columns."""
+    op.drop_index('ux_training_runs_active_game_mode', table_name='training_runs')
+    op.drop_column('training_runs', 'heartbeat_at')
+    op.drop_column('training_runs', 'training_kwargs')
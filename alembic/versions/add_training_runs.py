@@ -0,0 +1,48 @@
+"""add_training_runs
+
+Revision ID: f0a1b2c3d4e5
+Revises: e9f0a1b2c3d4
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'f0a1b2c3d4e5'
+down_revision: Union[str, Sequence[str], None] = 'e9f0a1b2c3d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add training_runs table (season-rollover training jobs)."""
+    op.create_table(
+        'training_runs',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('game_mode_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('weeks', sa.Integer(), nullable=False, server_default='10'),
+        sa.Column('offseason', sa.Boolean(), nullable=False, server_default='true'),
+        sa.Column('chunk_size', sa.Integer(), nullable=False, server_default='5000'),
+        sa.Column('status', sa.String(), nullable=False, server_default='pending'),
+        sa.Column('last_player_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('players_total', sa.Integer(), nullable=True),
+        sa.Column('players_processed', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('players_per_sec', sa.Float(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.ForeignKeyConstraint(['game_mode_id'], ['game_modes.id'], ),
+    )
+    op.create_index('ix_training_runs_game_mode_status', 'training_runs', ['game_mode_id', 'status'])
+
+
+def downgrade() -> None:
+    """Drop training_runs table."""
+    op.drop_index('ix_training_runs_game_mode_status', table_name='training_runs')
+    op.drop_table('training_runs')
@@ -0,0 +1,108 @@
+"""
+API endpoints for gfx/ asset delivery.
+
+``/gfx`` itself is mounted in main.py (``GfxStaticFiles``); this router serves the asset
+manifest the templates use to build content-versioned (immutably cached) URLs, the
+kit renders cached by /kit-designer/api/render(-batch), the sprite atlases
+(utils/gfx_atlas.py) and picture thumbnails (utils/gfx_thumbs.py).
+"""
+
+import os
+from typing import List, Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import FileResponse, JSONResponse, Response
+
+from utils.gfx_assets import IMMUTABLE_CACHE_CONTROL, REVALIDATE_CACHE_CONTROL, etag_matches, gfx_manifest
+from utils.gfx_atlas import atlas_image_path, get_atlas_map
+from utils.gfx_catalog import normalize_folder_key
+from utils.gfx_thumbs import get_thumbnail
+from utils.kit_compositor import RENDER_FORMATS, cached_render
+
+router = APIRouter(tags=["gfx"])
+
+
+@router.get("/gfx-manifest")
+def get_gfx_manifest(request: Request, prefix: Optional[List[str]] = Query(None)):
+    """
+    Content hashes of the gfx assets under ``prefix`` (repeatable, gfx-relative folder, e.g.
+    ``kit_templates``). Load ``/gfx/<path>?v=<hash>``.
+
+    At least one non-root prefix is required: the route is public, and a manifest of all of
+    gfx/ would hash every file on the first request. The manifest version is the ETag; a
+    matching ``If-None-Match`` gets a 304.
+    """
+    if not prefix or any(not normalize_folder_key(p) for p in prefix):
+        raise HTTPException(status_code=400, detail="prefix is required (a gfx folder, e.g. kit_templates)")
+    manifest = gfx_manifest(prefix)
+    etag = f'"{manifest["version"]}"'
+    headers = {"ETag": etag, "Cache-Control": REVALIDATE_CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(content=manifest, headers=headers)
+
+
+@router.get("/gfx-kit/{name}")
+def get_kit_render(name: str, request: Request):
+    """A cached kit render ``<key>.<png|webp>``; the key is a content hash, so it never changes."""
+    key, _, fmt = name.rpartition(".")
+    data = cached_render(key, fmt) if key.isalnum() else None
+    if data is None:
+        raise HTTPException(status_code=404, detail="Kit render not found")
+    etag = f'"{key}"'
+    headers = {"ETag": etag, "Cache-Control": IMMUTABLE_CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=data, media_type=RENDER_FORMATS[fmt], headers=headers)
+
+
+_ATLAS_MEDIA_TYPES = {".webp": "image/webp", ".svg": "image/svg+xml"}
+
+
+@router.get("/gfx-atlas/{filename}")
+def get_gfx_atlas(filename: str, request: Request):
+    """
+    Sprite atlases: ``<name>.json`` is the coordinate map (revalidated, ETag = the atlas image
+    name); the image it points at (``<name>.<hash>.webp|svg``) is immutable.
+    """
+    if filename.endswith(".json"):
+        try:
+            atlas = get_atlas_map(filename[: -len(".json")])
+        except KeyError:
+            raise HTTPException(status_code=404, detail="Atlas not found")
+        etag = f'"{atlas["image"]}"'
+        headers = {"ETag": etag, "Cache-Control": REVALIDATE_CACHE_CONTROL}
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+        return JSONResponse(content=atlas, headers=headers)
+
+    path = atlas_image_path(filename)
+    media_type = _ATLAS_MEDIA_TYPES.get(os.path.splitext(filename)[1])
+    if path is None or media_type is None:
+        raise HTTPException(status_code=404, detail="Atlas image not found")
+    etag = f'"{filename}"'
+    headers = {"ETag": etag, "Cache-Control": IMMUTABLE_CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return FileResponse(path, media_type=media_type, headers=headers)
+
+
+@router.get("/gfx-thumb/{width}/{path:path}")
+def get_gfx_thumbnail(width: int, path: str, request: Request, v: Optional[str] = None):
+    """
+    ``width`` px WebP thumbnail of gfx picture ``path`` (profile pictures, e.g.
+    ``/gfx-thumb/192/player_profile_pics/AfricaEast/<file>.webp``), encoded on first request.
+    Caching follows /gfx: immutable with ``?v=<source hash>``, revalidated (ETag) otherwise.
+    """
+    try:
+        thumb = get_thumbnail(path, width)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if thumb is None:
+        raise HTTPException(status_code=404, detail="Picture not found")
+    thumb_file, digest = thumb
+    etag = f'"{digest}-{width}"'
+    headers = {"ETag": etag, "Cache-Control": IMMUTABLE_CACHE_CONTROL if v == digest else REVALIDATE_CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return FileResponse(thumb_file, media_type="image/webp", headers=headers)
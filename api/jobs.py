@@ -0,0 +1,119 @@
+"""
+API endpoints for background jobs (utils/job_queue.py).
+
+Jobs are submitted by the feature endpoints (``POST /api/test-bench/simulate/jobs``,
+``/api/youth-academy/train-promoted-players/jobs``,
+``/api/youth-academy/generate-prospects-all-nations/jobs``); this router reports on them:
+poll ``GET /api/jobs/{job_id}?since=<seq>`` (progress, new partial results, the result once
+completed) or read ``GET /api/jobs/{job_id}/stream`` as Server-Sent Events.
+"""
+
+import asyncio
+import json
+import time
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+from utils.execution import offload
+from utils.job_queue import FINISHED_STATUSES, JOB_HANDLERS, JOB_STATUSES, cancel_job, get_job, list_jobs
+
+router = APIRouter(prefix="/api/jobs", tags=["jobs"])
+
+_STREAM_POLL_SECONDS = 0.5
+_STREAM_KEEPALIVE_SECONDS = 15.0
+
+
+def _job_uuid(job_id: str) -> UUID:
+    try:
+        return UUID(job_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid job_id format")
+
+
+@router.get("")
+@offload("db")
+def get_jobs(
+    kind: Optional[str] = None,
+    status: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+):
+    """Most recent jobs first (summaries without results)."""
+    if kind is not None and kind not in JOB_HANDLERS:
+        raise HTTPException(status_code=400, detail=f"Unknown job kind: {kind}")
+    if status is not None and status not in JOB_STATUSES:
+        raise HTTPException(status_code=400, detail=f"Unknown job status: {status}")
+    return {"jobs": list_jobs(kind=kind, status=status, limit=limit)}
+
+
+@router.get("/{job_id}")
+@offload("db")
+def get_job_status(job_id: str, since: Optional[int] = Query(None, ge=0)):
+    """
+    Job status / progress, and its ``result`` once completed. With ``since``, also the
+    partial results after that sequence number (pass the last ``seq`` seen, 0 for all).
+    """
+    job = get_job(_job_uuid(job_id), since=since)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@router.post("/{job_id}/cancel")
+@offload("db")
+def cancel_job_endpoint(job_id: str):
+    """Cancel a queued job, or stop a running one at its next progress report."""
+    job = cancel_job(_job_uuid(job_id))
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+def _sse(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@router.get("/{job_id}/stream")
+async def stream_job(job_id: str, since: int = Query(0, ge=0)):
+    """
+    Server-Sent Events for one job: ``progress`` (status / progress / message changes),
+    ``partial`` (``{seq, data}`` per partial result after ``since``) and a final ``done``
+    with the full summary and result, after which the stream ends.
+    """
+    job_uuid = _job_uuid(job_id)
+    if await run_in_threadpool(get_job, job_uuid, None, False) is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    async def events():
+        cursor = since
+        last_state = None
+        last_sent = time.monotonic()
+        while True:
+            job = await run_in_threadpool(get_job, job_uuid, cursor, False)
+            if job is None:
+                return
+            for partial in job.pop("partials"):
+                cursor = partial["seq"]
+                yield _sse("partial", partial)
+                last_sent = time.monotonic()
+            state = (job["status"], job["progress"], job["message"])
+            if state != last_state:
+                last_state = state
+                yield _sse("progress", {k: job[k] for k in ("job_id", "status", "progress", "message", "partials_count")})
+                last_sent = time.monotonic()
+            if job["status"] in FINISHED_STATUSES:
+                yield _sse("done", await run_in_threadpool(get_job, job_uuid))
+                return
+            if time.monotonic() - last_sent >= _STREAM_KEEPALIVE_SECONDS:
+                yield ": keepalive\n\n"
+                last_sent = time.monotonic()
+            await asyncio.sleep(_STREAM_POLL_SECONDS)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
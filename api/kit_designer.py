@@ -1,23 +1,38 @@
 """
 API endpoints for the Kit Designer workbench.
 
-Serves the single-page kit designer UI and provides endpoints to list
-available kit templates, crest assets, and sponsor mask designs.
+Serves the single-page kit designer UI, lists available kit templates, crest
+assets, and sponsor mask designs (one combined manifest, or per list) from the
+in-memory gfx catalog, and renders kits server-side (utils/kit_compositor.py)
+for thumbnails.
 """
 
-import os
+import hashlib
+import json
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
-from fastapi import APIRouter
-from fastapi.responses import HTMLResponse
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import HTMLResponse, JSONResponse, Response
+from pydantic import BaseModel, Field
 
-router = APIRouter(prefix="/kit-designer", tags=["kit-designer"])
+from utils.gfx_assets import IMMUTABLE_CACHE_CONTROL, REVALIDATE_CACHE_CONTROL, etag_matches, gfx_manifest
+from utils.execution import offload, run_offloaded
+from utils.gfx_catalog import GfxCatalog, get_gfx_catalog
+from utils.kit_compositor import RENDER_FORMATS, render_kit
 
-_GFX_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "gfx")
+router = APIRouter(prefix="/kit-designer", tags=["kit-designer"])
 
 _BROWSER_EXTS = (".png", ".jpg", ".jpeg", ".svg", ".webp")
 
-_FULLKIT_DIR = os.path.join(_GFX_DIR, "kit_templates", "fullkit")
-_TEMPLATES_DIR = os.path.join(_GFX_DIR, "kit_templates")
+# gfx-relative folders (utils/gfx_catalog.py keys)
+_TEMPLATES_REL = "kit_templates"
+_SPONSORS_REL = "sponsors"
+_CRESTS_REL = "crests"
+_MANIFEST_PREFIXES = (_TEMPLATES_REL, _SPONSORS_REL, _CRESTS_REL)
+
+_KIT_PREFIXES = ("s_", "e_", "kit")
+_SHORTS_PREFIX = "shorts_"
+_SOCKS_PREFIX = "socks_"
 
 
 @router.get("/", response_class=HTMLResponse)
@@ -36,102 +51,103 @@ async def kit_designer_ui():
         )
 
 
-@router.get("/api/collars")
-async def list_collars():
-    """Return available collar designs.
+def _browser_files(catalog: GfxCatalog, folder: str) -> List[str]:
+    return [f for f in catalog.files.get(folder, ()) if f.lower().endswith(_BROWSER_EXTS)]
+
+
+def _style_folders(catalog: GfxCatalog, prefixes) -> List[Dict[str, Any]]:
+    return [
+        {"name": d, "files": _browser_files(catalog, f"{_TEMPLATES_REL}/{d}")}
+        for d in catalog.folder_subfolders(_TEMPLATES_REL)
+        if d.lower().startswith(prefixes)
+    ]
+
+
+def _build_asset_listing(catalog: GfxCatalog) -> Dict[str, Any]:
+    """Every kit-designer asset list, from one gfx catalog snapshot."""
+    return {
+        "kits": _style_folders(catalog, _KIT_PREFIXES),
+        "shorts": _style_folders(catalog, _SHORTS_PREFIX),
+        "socks": _style_folders(catalog, _SOCKS_PREFIX),
+        "collars": [d for d in catalog.folder_subfolders(_TEMPLATES_REL) if d.lower().startswith("collar")],
+        "patterns": _browser_files(catalog, f"{_TEMPLATES_REL}/patterns"),
+        "sponsor_designs": [
+            {"name": d, "files": _browser_files(catalog, f"{_SPONSORS_REL}/{d}")}
+            for d in catalog.folder_subfolders(_SPONSORS_REL)
+        ],
+        "crests": _browser_files(catalog, _CRESTS_REL),
+    }
 
-    Scans for subdirectories named ``collar*`` inside kit_templates/.
+
+# (catalog the listing was built from, listing); rebuilt when the gfx catalog is, i.e.
+# when a directory under gfx/ changes
+_ASSET_LISTING: Optional[Tuple[GfxCatalog, Dict[str, Any]]] = None
+
+
+def _asset_listing() -> Dict[str, Any]:
+    global _ASSET_LISTING
+    catalog = get_gfx_catalog()
+    cached = _ASSET_LISTING
+    if cached is None or cached[0] is not catalog:
+        cached = (catalog, _build_asset_listing(catalog))
+        _ASSET_LISTING = cached
+    return cached[1]
+
+
+@router.get("/api/manifest")
+def kit_designer_manifest(request: Request):
     """
-    if not os.path.isdir(_TEMPLATES_DIR):
-        return {"collars": []}
-    collars = sorted(
-        d
-        for d in os.listdir(_TEMPLATES_DIR)
-        if d.lower().startswith("collar") and os.path.isdir(os.path.join(_TEMPLATES_DIR, d))
-    )
-    return {"collars": collars}
+    Everything the designer loads at startup in one response: the kits / shorts / socks /
+    collars / patterns / sponsor_designs / crests lists plus ``assets`` (gfx-relative path ->
+    content hash, for ``/gfx/<path>?v=<hash>`` URLs). ``version`` is the ETag; a matching
+    ``If-None-Match`` gets a 304.
+    """
+    listing = _asset_listing()
+    assets = gfx_manifest(_MANIFEST_PREFIXES)
+    version = hashlib.sha256(
+        json.dumps(listing, sort_keys=True).encode("utf-8") + assets["version"].encode("ascii")
+    ).hexdigest()[:16]
+    etag = f'"{version}"'
+    headers = {"ETag": etag, "Cache-Control": REVALIDATE_CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(content={"version": version, **listing, "assets": assets["assets"]}, headers=headers)
 
 
-_KIT_PREFIXES = ("s_", "e_", "kit")
-_SHORTS_PREFIX = "shorts_"
-_SOCKS_PREFIX = "socks_"
+@router.get("/api/collars")
+async def list_collars():
+    """Return available collar designs (``collar*`` folders inside kit_templates/)."""
+    return {"collars": _asset_listing()["collars"]}
+
 
 @router.get("/api/kits")
 async def list_kits():
     """Return available kit design folders with their mask files.
 
-    Scans for subdirectories starting with ``s_`` (simple), ``e_`` (exotic),
-    or ``kit`` inside kit_templates/.
-    Each kit folder holds shirt secondary/tertiary masks specific to that design.
-    Returns a list of objects: { name, files } where *files* lists the mask PNGs
-    found inside the folder so the frontend can load them dynamically.
+    Kit folders are subdirectories of kit_templates/ starting with ``s_`` (simple),
+    ``e_`` (exotic), or ``kit``. Each holds shirt secondary/tertiary masks specific to
+    that design. Returns a list of objects: { name, files } where *files* lists the mask
+    PNGs found inside the folder so the frontend can load them dynamically.
     """
-    if not os.path.isdir(_TEMPLATES_DIR):
-        return {"kits": []}
-    kit_dirs = sorted(
-        d
-        for d in os.listdir(_TEMPLATES_DIR)
-        if d.lower().startswith(_KIT_PREFIXES) and os.path.isdir(os.path.join(_TEMPLATES_DIR, d))
-    )
-    kits = []
-    for d in kit_dirs:
-        folder = os.path.join(_TEMPLATES_DIR, d)
-        files = sorted(
-            f for f in os.listdir(folder)
-            if f.lower().endswith(_BROWSER_EXTS)
-        )
-        kits.append({"name": d, "files": files})
-    return {"kits": kits}
+    return {"kits": _asset_listing()["kits"]}
 
 
 @router.get("/api/shorts")
 async def list_shorts_styles():
     """Return available shorts design folders with their mask files."""
-    if not os.path.isdir(_TEMPLATES_DIR):
-        return {"shorts": []}
-    style_dirs = sorted(
-        d
-        for d in os.listdir(_TEMPLATES_DIR)
-        if d.lower().startswith(_SHORTS_PREFIX) and os.path.isdir(os.path.join(_TEMPLATES_DIR, d))
-    )
-    styles = []
-    for d in style_dirs:
-        folder = os.path.join(_TEMPLATES_DIR, d)
-        files = sorted(f for f in os.listdir(folder) if f.lower().endswith(_BROWSER_EXTS))
-        styles.append({"name": d, "files": files})
-    return {"shorts": styles}
+    return {"shorts": _asset_listing()["shorts"]}
 
 
 @router.get("/api/socks")
 async def list_socks_styles():
     """Return available socks design folders with their mask files."""
-    if not os.path.isdir(_TEMPLATES_DIR):
-        return {"socks": []}
-    style_dirs = sorted(
-        d
-        for d in os.listdir(_TEMPLATES_DIR)
-        if d.lower().startswith(_SOCKS_PREFIX) and os.path.isdir(os.path.join(_TEMPLATES_DIR, d))
-    )
-    styles = []
-    for d in style_dirs:
-        folder = os.path.join(_TEMPLATES_DIR, d)
-        files = sorted(f for f in os.listdir(folder) if f.lower().endswith(_BROWSER_EXTS))
-        styles.append({"name": d, "files": files})
-    return {"socks": styles}
+    return {"socks": _asset_listing()["socks"]}
 
 
 @router.get("/api/patterns")
 async def list_patterns():
     """Return a list of available pattern image filenames."""
-    patterns_dir = os.path.join(_GFX_DIR, "kit_templates", "patterns")
-    if not os.path.isdir(patterns_dir):
-        return {"patterns": []}
-    files = sorted(
-        f
-        for f in os.listdir(patterns_dir)
-        if f.lower().endswith(_BROWSER_EXTS)
-    )
-    return {"patterns": files}
+    return {"patterns": _asset_listing()["patterns"]}
 
 
 @router.get("/api/sponsor-designs")
@@ -142,34 +158,62 @@ async def list_sponsor_designs():
     - fixed-color layer: fixed_color.png or sponsor_fixed.png
     - tintable masks: mask_primary/secondary/tertiary.png (or sponsor_* aliases)
     """
-    sponsors_dir = os.path.join(_GFX_DIR, "sponsors")
-    if not os.path.isdir(sponsors_dir):
-        return {"sponsor_designs": []}
-    design_dirs = sorted(
-        d
-        for d in os.listdir(sponsors_dir)
-        if os.path.isdir(os.path.join(sponsors_dir, d))
-    )
-    designs = []
-    for d in design_dirs:
-        folder = os.path.join(sponsors_dir, d)
-        files = sorted(
-            f for f in os.listdir(folder)
-            if f.lower().endswith(_BROWSER_EXTS)
-        )
-        designs.append({"name": d, "files": files})
-    return {"sponsor_designs": designs}
+    return {"sponsor_designs": _asset_listing()["sponsor_designs"]}
 
 
 @router.get("/api/crests")
 async def list_crests():
     """Return a list of available crest image filenames."""
-    crests_dir = os.path.join(_GFX_DIR, "crests")
-    if not os.path.isdir(crests_dir):
-        return {"crests": []}
-    files = sorted(
-        f
-        for f in os.listdir(crests_dir)
-        if f.lower().endswith(_BROWSER_EXTS)
+    return {"crests": _asset_listing()["crests"]}
+
+
+class KitRenderRequest(BaseModel):
+    """Kit designer config JSON ("Show JSON") rendered at ``width`` px wide."""
+    spec: Dict[str, Any] = Field(default_factory=dict)
+    width: int = 256  # one of RENDER_WIDTHS
+    format: Literal["png", "webp"] = "webp"
+
+
+class KitRenderBatchRequest(BaseModel):
+    specs: List[Dict[str, Any]] = Field(..., max_length=500)
+    width: int = 128  # one of RENDER_WIDTHS
+    format: Literal["png", "webp"] = "webp"
+
+
+def _render_url(key: str, fmt: str) -> str:
+    return f"/gfx-kit/{key}.{fmt}"
+
+
+@router.post("/api/render")
+async def render_kit_image(request: KitRenderRequest):
+    """Render one kit; the image is also cached at the returned ``X-Kit-Render-Url``."""
+    try:
+        key, data = await run_offloaded("cpu", render_kit, request.spec, request.width, request.format)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return Response(
+        content=data,
+        media_type=RENDER_FORMATS[request.format],
+        headers={
+            "ETag": f'"{key}"',
+            "Cache-Control": IMMUTABLE_CACHE_CONTROL,
+            "X-Kit-Render-Url": _render_url(key, request.format),
+        },
     )
-    return {"crests": files}
+
+
+@router.post("/api/render-batch")
+@offload("cpu")
+def render_kit_batch(request: KitRenderBatchRequest):
+    """
+    Render many kits (e.g. every club of a match-day listing) and return one cached,
+    immutable thumbnail URL per spec (or the error for that spec), in request order.
+    """
+    renders = []
+    for spec in request.specs:
+        try:
+            key, _ = render_kit(spec, request.width, request.format)
+            renders.append({"key": key, "url": _render_url(key, request.format)})
+        except ValueError as e:
+            renders.append({"error": str(e)})
+    return {"renders": renders}
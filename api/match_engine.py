@@ -9,6 +9,7 @@ from match_engine.models import Player, Team
 from match_engine.simulator import simulate_match
 from match_engine.statistics import aggregate_match_log_to_stats_v2
 from match_engine.constants import OUTFIELD_ATTRS, GOALKEEPER_ATTRS, POSITIONS
+from utils.execution import offload
 
 router = APIRouter(prefix="/api/match-engine", tags=["match-engine"])
 
@@ -113,7 +114,8 @@ def skill_usage_to_response(skill_usage) -> SkillUsageResponse:
 # ============ API ENDPOINTS ============
 
 @router.post("/simulate", response_model=MatchResultResponse)
-async def simulate_match_endpoint(request: MatchSimulationRequest):
+@offload("cpu")
+def simulate_match_endpoint(request: MatchSimulationRequest):
     """
     Simulate a single match between two teams.
     
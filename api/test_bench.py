@@ -3,12 +3,15 @@ API endpoints for test bench UI.
 """
 
 from fastapi import APIRouter
+from fastapi.encoders import jsonable_encoder
 from fastapi.responses import HTMLResponse
 from pydantic import BaseModel, Field
 from typing import List, Dict
 from match_engine.models import Player, Team
 from match_engine.simulator import simulate_match
 from match_engine.statistics import aggregate_match_log_to_stats_v2
+from utils.execution import offload
+from utils.job_queue import report_progress, submit_job
 from api.match_engine import (
     PlayerInput, TeamInput, player_input_to_model, team_input_to_model,
     skill_usage_to_response, TeamStatsResponse, PlayerStatsResponse
@@ -50,7 +53,8 @@ async def test_bench_ui():
 
 
 @router.post("/simulate", response_model=BatchSimulationResponse)
-async def batch_simulate(request: BatchSimulationRequest):
+@offload("cpu")
+def batch_simulate(request: BatchSimulationRequest):
     """
     Simulate multiple matches between two teams and return aggregated statistics.
     """
@@ -81,8 +85,10 @@ async def batch_simulate(request: BatchSimulationRequest):
         total_home_goals = 0
         total_away_goals = 0
         match_score_frequency = Counter()  # Track match scores separately
+        # As a background job: running totals every 10% of the batch
+        partial_every = max(1, request.num_matches // 10)
         
-        for _ in range(request.num_matches):
+        for match_num in range(1, request.num_matches + 1):
             sim = simulate_match(home_team, away_team, minutes=request.minutes)
             stats = aggregate_match_log_to_stats_v2(sim)
             all_stats.append(stats)
@@ -110,6 +116,18 @@ async def batch_simulate(request: BatchSimulationRequest):
             # Track score frequency (format: "home-away")
             score_key = f"{home_score}-{away_score}"
             match_score_frequency[score_key] += 1
+
+            partial = None
+            if match_num % partial_every == 0 or match_num == request.num_matches:
+                partial = {
+                    "matches_done": match_num,
+                    "home_wins": home_wins,
+                    "away_wins": away_wins,
+                    "draws": draws,
+                    "home_avg_goals": total_home_goals / match_num,
+                    "away_avg_goals": total_away_goals / match_num,
+                }
+            report_progress(match_num, request.num_matches, f"{match_num}/{request.num_matches} matches", partial)
         
         # Aggregate all statistics
         aggregated = all_stats[0]
@@ -219,3 +237,18 @@ async def batch_simulate(request: BatchSimulationRequest):
         import traceback
         error_detail = f"{type(e).__name__}: {str(e)}\n\nTraceback:\n{traceback.format_exc()}"
         raise HTTPException(status_code=500, detail=f"Internal error: {error_detail}")
+
+
+@router.post("/simulate/jobs", status_code=202)
+@offload("db")
+def submit_batch_simulation_job(request: BatchSimulationRequest):
+    """
+    Queue the batch simulation as a background job (no request timeout for large batches).
+    Poll ``status_url`` (``?since=<seq>`` for the running totals) or read ``stream_url``.
+    """
+    return submit_job("batch_simulation", jsonable_encoder(request))
+
+
+def run_batch_simulation_job(params: Dict, db=None) -> BatchSimulationResponse:
+    """Job handler (utils/job_queue.py) for ``batch_simulation``."""
+    return batch_simulate.__wrapped__(BatchSimulationRequest(**params))
@@ -2,10 +2,15 @@
 API endpoints for youth academy system.
 """
 
+import threading
+import time
+from contextlib import nullcontext
+
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse, HTMLResponse
 from pydantic import BaseModel, Field
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 from uuid import UUID, uuid4
 from datetime import datetime
 from functools import lru_cache
@@ -19,18 +24,26 @@ from utils.youth_academy import (
     calculate_attribute_ranges,
     promote_academy_player,
     process_academy_week,
+    progress_academy_week_bulk,
+    reveal_attribute_ranges,
     assign_talent_rating,
     resolve_profile_pic_folder_for_display,
+    resolve_profile_pic_folders_for_display,
 )
 from utils.name_generation import select_heritage_group
+from utils.name_index import get_name_index, persist_names
+from utils.prospect_jobs import cancel_prospect_job, get_prospect_job, start_prospect_job
 from utils.player_development import (
     compile_growth_schedule,
     list_training_program_names,
-    train_one_season_with_growth,
     OUTFIELD_PROGRAMS,
     GK_PROGRAMS,
     INDIVIDUAL_PROGRAM_NAME,
 )
+from utils.training_engine import train_one_season_vectorized
+from utils.development_projection import project_development
+from utils.execution import offload
+from utils.job_queue import JobCancelled, report_progress, submit_job
 from match_engine.constants import GOALKEEPER_ATTRS, OUTFIELD_ATTRS
 
 
@@ -61,6 +74,11 @@ class InMemoryStorage:
 # Global in-memory storage instance
 _in_memory_storage = InMemoryStorage()
 
+# Handlers run on worker threads (utils/execution.py) and the in-memory store is plain dicts:
+# without a database they hold this lock, i.e. run one at a time as they did on the event loop
+_STORE_LOCK = threading.RLock()
+_HANDLER_LOCK = _STORE_LOCK if engine is None else None
+
 
 def get_or_create_test_club_in_memory() -> tuple:
     """Get or create test club and game mode IDs for in-memory mode."""
@@ -317,7 +335,8 @@ class CapacityResponse(BaseModel):
 
 @router.get("/prospects", response_model=List[ProspectResponse])
 @router.get("/prospects/{club_id}", response_model=List[ProspectResponse])
-async def get_prospects(club_id: Optional[str] = None, db: Optional[Session] = Depends(get_db)):
+@offload("db", lock=_HANDLER_LOCK)
+def get_prospects(club_id: Optional[str] = None, db: Optional[Session] = Depends(get_db)):
     """Get available prospects for a club this week (status='available')."""
     try:
         # In-memory mode
@@ -339,28 +358,30 @@ async def get_prospects(club_id: Optional[str] = None, db: Optional[Session] = D
                     if str(p.get("club_id")) == str(club_uuid) and p.get("status") == "available"
                 ]
             
-            results = []
+            heritage_groups = []
             for p in prospects_list:
-                heritage_group = None
+                # Heritage group from _player_data if available
+                player_data = p.get("_player_data") or {}
+                heritage_groups.append(
+                    player_data.get("heritage_group") or select_heritage_group(p.get("nationality", "ENG"))
+                )
+            # All display folders in one pass over the profile-picture index
+            folders = resolve_profile_pic_folders_for_display(
+                (hg, p.get("profile_pic"), p.get("profile_pic_folder"))
+                for hg, p in zip(heritage_groups, prospects_list)
+            )
+
+            results = []
+            for p, heritage_group, profile_pic_folder in zip(prospects_list, heritage_groups, folders):
                 name_structure = None
                 
-                # Get heritage_group and name_structure from _player_data if available
+                # Get name_structure from _player_data if available
                 player_data = p.get("_player_data")
                 naming_pool_attempted = None
                 if player_data:
-                    heritage_group = player_data.get("heritage_group")
                     name_structure = player_data.get("name_structure")
                     naming_pool_attempted = player_data.get("naming_pool_attempted")
                 
-                nat_for_pic = p.get("nationality", "ENG")
-                if not heritage_group:
-                    heritage_group = select_heritage_group(nat_for_pic)
-                profile_pic_folder = resolve_profile_pic_folder_for_display(
-                    heritage_group,
-                    p.get("profile_pic"),
-                    p.get("profile_pic_folder"),
-                )
-                
                 results.append(ProspectResponse(
                     id=p["id"],
                     name=p["name"],
@@ -400,17 +421,14 @@ async def get_prospects(club_id: Optional[str] = None, db: Optional[Session] = D
                 YouthProspect.status == "available"
             ).all()
         
+        # Determine heritage group for folder
+        heritage_groups = [select_heritage_group(p.nationality or "ENG") for p in prospects]
+        folders = resolve_profile_pic_folders_for_display(
+            (hg, p.profile_pic, None) for hg, p in zip(heritage_groups, prospects)
+        )
+
         results = []
-        for p in prospects:
-            # Determine heritage group for folder
-            player_nationality = p.nationality or "ENG"
-            heritage_group = select_heritage_group(player_nationality)
-            profile_pic_folder = resolve_profile_pic_folder_for_display(
-                heritage_group,
-                p.profile_pic,
-                None,
-            )
-            
+        for p, heritage_group, profile_pic_folder in zip(prospects, heritage_groups, folders):
             # Get heritage_group and name_structure from database or determine
             heritage_group_db = heritage_group
             name_structure_db = None
@@ -441,7 +459,8 @@ async def get_prospects(club_id: Optional[str] = None, db: Optional[Session] = D
 
 
 @router.post("/prospects/{prospect_id}/promote")
-async def promote_prospect(prospect_id: str, db: Optional[Session] = Depends(get_db)):
+@offload("db", lock=_HANDLER_LOCK)
+def promote_prospect(prospect_id: str, db: Optional[Session] = Depends(get_db)):
     """Promote a prospect to the youth academy."""
     try:
         import random
@@ -624,7 +643,8 @@ async def promote_prospect(prospect_id: str, db: Optional[Session] = Depends(get
 
 
 @router.post("/prospects/{prospect_id}/reject")
-async def reject_prospect(prospect_id: str, db: Optional[Session] = Depends(get_db)):
+@offload("db", lock=_HANDLER_LOCK)
+def reject_prospect(prospect_id: str, db: Optional[Session] = Depends(get_db)):
     """Reject a prospect (remove from available list)."""
     try:
         # In-memory mode
@@ -663,7 +683,8 @@ async def reject_prospect(prospect_id: str, db: Optional[Session] = Depends(get_
 
 
 @router.post("/prospects/reject-all")
-async def reject_all_prospects(db: Optional[Session] = Depends(get_db)):
+@offload("db", lock=_HANDLER_LOCK)
+def reject_all_prospects(db: Optional[Session] = Depends(get_db)):
     """Reject all available prospects."""
     try:
         # In-memory mode
@@ -691,7 +712,8 @@ async def reject_all_prospects(db: Optional[Session] = Depends(get_db)):
 
 
 @router.post("/players/clear-all")
-async def clear_all_academy_players(db: Optional[Session] = Depends(get_db)):
+@offload("db", lock=_HANDLER_LOCK)
+def clear_all_academy_players(db: Optional[Session] = Depends(get_db)):
     """
     Remove every youth academy player record (active, promoted, released).
 
@@ -724,7 +746,8 @@ async def clear_all_academy_players(db: Optional[Session] = Depends(get_db)):
 
 @router.get("/players", response_model=List[AcademyPlayerResponse])
 @router.get("/players/{club_id}", response_model=List[AcademyPlayerResponse])
-async def get_academy_players(club_id: Optional[str] = None, db: Optional[Session] = Depends(get_db)):
+@offload("db", lock=_HANDLER_LOCK)
+def get_academy_players(club_id: Optional[str] = None, db: Optional[Session] = Depends(get_db)):
     """Get all academy players for a club (status='active')."""
     try:
         # In-memory mode
@@ -744,17 +767,14 @@ async def get_academy_players(club_id: Optional[str] = None, db: Optional[Sessio
                     if str(p.get("club_id")) == str(club_uuid) and p.get("status") == "active"
                 ]
             
+            # Determine heritage group for folder; all folders in one index pass
+            folders = resolve_profile_pic_folders_for_display(
+                (select_heritage_group(p.get("nationality", "ENG")), p.get("profile_pic"), p.get("profile_pic_folder"))
+                for p in academy_players_list
+            )
+
             results = []
-            for p in academy_players_list:
-                # Determine heritage group for folder
-                player_nationality = p.get("nationality", "ENG")
-                heritage_group = select_heritage_group(player_nationality)
-                profile_pic_folder = resolve_profile_pic_folder_for_display(
-                    heritage_group,
-                    p.get("profile_pic"),
-                    p.get("profile_pic_folder"),
-                )
-                
+            for p, profile_pic_folder in zip(academy_players_list, folders):
                 results.append(AcademyPlayerResponse(
                     id=p["id"],
                     name=p["name"],
@@ -799,17 +819,13 @@ async def get_academy_players(club_id: Optional[str] = None, db: Optional[Sessio
                 YouthAcademyPlayer.status == "active"
             ).all()
         
+        # Determine heritage group for folder; all folders in one index pass
+        folders = resolve_profile_pic_folders_for_display(
+            (select_heritage_group(p.nationality or "ENG"), p.profile_pic, None) for p in academy_players
+        )
+
         results = []
-        for p in academy_players:
-            # Determine heritage group for folder
-            player_nationality = p.nationality or "ENG"
-            heritage_group = select_heritage_group(player_nationality)
-            profile_pic_folder = resolve_profile_pic_folder_for_display(
-                heritage_group,
-                p.profile_pic,
-                None,
-            )
-            
+        for p, profile_pic_folder in zip(academy_players, folders):
             results.append(AcademyPlayerResponse(
                 id=str(p.id),
                 name=p.name,
@@ -842,7 +858,8 @@ async def get_academy_players(club_id: Optional[str] = None, db: Optional[Sessio
 
 
 @router.patch("/players/{academy_player_id}")
-async def update_academy_player(
+@offload("db", lock=_HANDLER_LOCK)
+def update_academy_player(
     academy_player_id: str,
     request: UpdateAcademyPlayerRequest,
     db: Optional[Session] = Depends(get_db),
@@ -896,7 +913,8 @@ async def update_academy_player(
 
 
 @router.post("/players/{academy_player_id}/release")
-async def release_academy_player(academy_player_id: str, db: Optional[Session] = Depends(get_db)):
+@offload("db", lock=_HANDLER_LOCK)
+def release_academy_player(academy_player_id: str, db: Optional[Session] = Depends(get_db)):
     """Release an academy player."""
     try:
         player_uuid = UUID(academy_player_id)
@@ -932,7 +950,8 @@ async def release_academy_player(academy_player_id: str, db: Optional[Session] =
 
 
 @router.post("/players/{academy_player_id}/promote")
-async def promote_academy_player_endpoint(academy_player_id: str, db: Optional[Session] = Depends(get_db)):
+@offload("db", lock=_HANDLER_LOCK)
+def promote_academy_player_endpoint(academy_player_id: str, db: Optional[Session] = Depends(get_db)):
     """Promote an academy player to the main team (early promotion)."""
     try:
         player_uuid = UUID(academy_player_id)
@@ -975,7 +994,8 @@ async def promote_academy_player_endpoint(academy_player_id: str, db: Optional[S
 
 @router.get("/capacity", response_model=CapacityResponse)
 @router.get("/capacity/{club_id}", response_model=CapacityResponse)
-async def get_academy_capacity(club_id: Optional[str] = None, db: Optional[Session] = Depends(get_db)):
+@offload("db", lock=_HANDLER_LOCK)
+def get_academy_capacity(club_id: Optional[str] = None, db: Optional[Session] = Depends(get_db)):
     """Get youth academy capacity for a club."""
     try:
         # In-memory mode
@@ -1069,7 +1089,8 @@ class GenerateProspectsForAllNationsRequest(BaseModel):
 
 
 @router.post("/generate-prospects")
-async def generate_prospects_endpoint(request: GenerateProspectsRequest, db: Optional[Session] = Depends(get_db)):
+@offload("heavy", lock=_HANDLER_LOCK)
+def generate_prospects_endpoint(request: GenerateProspectsRequest, db: Optional[Session] = Depends(get_db)):
     """Generate weekly prospects for testing (workbench endpoint)."""
     try:
         # In-memory mode
@@ -1086,6 +1107,8 @@ async def generate_prospects_endpoint(request: GenerateProspectsRequest, db: Opt
             
             season_uuid = UUID(request.season_id) if request.season_id else None
             
+            name_index = get_name_index(db, game_mode_uuid)
+            
             # Generate prospects with potential filtering if specified
             prospect_data_list = []
             
@@ -1102,7 +1125,8 @@ async def generate_prospects_endpoint(request: GenerateProspectsRequest, db: Opt
                         youth_facilities_level=request.youth_facilities_level,
                         is_goalkeeper=request.is_goalkeeper,
                         nationality=request.nationality,
-                        heritage_options=request.heritage_options
+                        heritage_options=request.heritage_options,
+                        used_names=name_index,
                     )
                     if temp_prospects:
                         prospect = temp_prospects[0]
@@ -1144,7 +1168,8 @@ async def generate_prospects_endpoint(request: GenerateProspectsRequest, db: Opt
                         youth_facilities_level=request.youth_facilities_level,
                         is_goalkeeper=request.is_goalkeeper,
                         nationality=request.nationality,
-                        heritage_options=request.heritage_options
+                        heritage_options=request.heritage_options,
+                        used_names=name_index,
                     )
                     
                     for prospect in temp_prospects:
@@ -1265,6 +1290,8 @@ async def generate_prospects_endpoint(request: GenerateProspectsRequest, db: Opt
         
         season_uuid = UUID(request.season_id) if request.season_id else None
         
+        name_index = get_name_index(db, game_mode_uuid)
+        
         # Generate prospects with potential filtering if specified
         prospect_data_list = []
         
@@ -1281,7 +1308,8 @@ async def generate_prospects_endpoint(request: GenerateProspectsRequest, db: Opt
                     youth_facilities_level=request.youth_facilities_level,
                     is_goalkeeper=request.is_goalkeeper,
                     nationality=request.nationality,
-                    heritage_options=request.heritage_options
+                    heritage_options=request.heritage_options,
+                    used_names=name_index,
                 )
                 if temp_prospects:
                     prospect = temp_prospects[0]
@@ -1323,7 +1351,8 @@ async def generate_prospects_endpoint(request: GenerateProspectsRequest, db: Opt
                     youth_facilities_level=request.youth_facilities_level,
                     is_goalkeeper=request.is_goalkeeper,
                     nationality=request.nationality,
-                    heritage_options=request.heritage_options
+                    heritage_options=request.heritage_options,
+                    used_names=name_index,
                 )
                 
                 for prospect in temp_prospects:
@@ -1390,6 +1419,7 @@ async def generate_prospects_endpoint(request: GenerateProspectsRequest, db: Opt
                 week_number=prospect.week_number
             ))
         
+        persist_names(db, game_mode_uuid, [p.name for p in created_prospects])
         db.commit()
         
         return {
@@ -1406,15 +1436,85 @@ async def generate_prospects_endpoint(request: GenerateProspectsRequest, db: Opt
         raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
 
 
+def _store_prospects_in_memory(prospects: List[dict]) -> int:
+    """Store generated prospect dicts in the in-memory storage (bulk job ``store`` callback)."""
+    with _STORE_LOCK:
+        for prospect_data in prospects:
+            player_data = prospect_data.pop("_player_data", None)
+            prospect_id = str(uuid4())
+
+            heritage_group = None
+            if player_data and player_data.get("heritage_group"):
+                heritage_group = player_data.get("heritage_group")
+            else:
+                heritage_group = select_heritage_group(prospect_data.get("nationality", "ENG"))
+
+            profile_pic_folder = resolve_profile_pic_folder_for_display(
+                heritage_group,
+                prospect_data.get("profile_pic"),
+                prospect_data.get("profile_pic_folder"),
+            )
+
+            season_id = prospect_data.get("season_id")
+            _in_memory_storage.prospects[prospect_id] = {
+                "id": prospect_id,
+                "club_id": str(prospect_data["club_id"]),
+                "game_mode_id": str(prospect_data["game_mode_id"]),
+                "season_id": str(season_id) if season_id else None,
+                "week_number": prospect_data["week_number"],
+                "name": prospect_data["name"],
+                "talent_rating": prospect_data["talent_rating"],
+                "is_goalkeeper": prospect_data["is_goalkeeper"],
+                "nationality": prospect_data.get("nationality"),
+                "skin_tone": prospect_data.get("skin_tone"),
+                "profile_pic": prospect_data.get("profile_pic"),
+                "profile_pic_folder": profile_pic_folder,
+                "potential_min": prospect_data["potential_min"],
+                "potential_max": prospect_data["potential_max"],
+                "actual_potential": prospect_data["actual_potential"],
+                "status": "available",
+                "_player_data": player_data,
+            }
+    return len(prospects)
+
+
+def _store_prospects_db(game_mode_uuid: UUID, prospects: List[dict]) -> int:
+    """Bulk-insert generated prospects and their name keys in one transaction (job ``store`` callback)."""
+    from sqlalchemy import insert
+
+    rows = []
+    for prospect_data in prospects:
+        prospect_data.pop("_player_data", None)
+        # Not a DB column (folder is resolved for display in API responses)
+        prospect_data.pop("profile_pic_folder", None)
+        rows.append(dict(prospect_data, id=uuid4()))
+    if not rows:
+        return 0
+
+    db = SessionLocal()
+    try:
+        db.execute(insert(YouthProspect), rows)
+        persist_names(db, game_mode_uuid, [r["name"] for r in rows])
+        db.commit()
+        return len(rows)
+    finally:
+        db.close()
+
+
 @router.post("/generate-prospects-all-nations", response_model=dict)
-async def generate_prospects_all_nations_endpoint(
+@offload("db", lock=_HANDLER_LOCK)
+def generate_prospects_all_nations_endpoint(
     request: GenerateProspectsForAllNationsRequest,
     db: Optional[Session] = Depends(get_db),
 ):
-    """Generate `per_nation` prospects for every nationality code in the dropdown list."""
+    """
+    Generate `per_nation` prospects for every nationality code in the dropdown list.
+
+    Runs as a background job (nations generated in parallel on a process pool, then one bulk
+    insert); returns the job summary. Poll /generate-prospects-all-nations/{job_id}.
+    """
     try:
         from utils.name_data import COUNTRY_FEDERATION, HERITAGE_CONFIG
-        import random as _rnd
 
         if request.nationalities and len(request.nationalities) > 0:
             nation_codes = sorted(set(request.nationalities))
@@ -1422,207 +1522,52 @@ async def generate_prospects_all_nations_endpoint(
             # Same backing sources as /nationalities
             nation_codes = sorted(set(COUNTRY_FEDERATION.keys()) | set(HERITAGE_CONFIG.keys()))
 
-        # In-memory mode
         if db is None:
+            # In-memory mode
             if not request.club_id or not request.game_mode_id:
                 club_uuid, game_mode_uuid = get_or_create_test_club_in_memory()
                 _in_memory_storage.youth_facilities_level = request.youth_facilities_level
             else:
                 club_uuid = UUID(request.club_id)
                 game_mode_uuid = UUID(request.game_mode_id)
-
-            season_uuid = UUID(request.season_id) if request.season_id else None
-
-            created_count = 0
-            for nat_code in nation_codes:
-                # Generate exact `per_nation` prospects for this nationality
-                temp_prospects = generate_weekly_prospects(
-                    club_id=club_uuid,
-                    game_mode_id=game_mode_uuid,
-                    season_id=season_uuid,
-                    week_number=request.week_number,
-                    youth_facilities_level=request.youth_facilities_level,
-                    is_goalkeeper=request.is_goalkeeper,
-                    nationality=nat_code,
-                    heritage_options=None,
-                    num_prospects_override=request.per_nation,
-                )
-
-                # Optional potential shaping
-                if request.use_potential_range and request.min_potential is not None and request.max_potential is not None:
-                    for prospect in temp_prospects:
-                        new_potential = _rnd.randint(request.min_potential, request.max_potential)
-                        prospect["actual_potential"] = new_potential
-                        talent_rating, potential_min, potential_max = assign_talent_rating(
-                            new_potential, request.is_goalkeeper
-                        )
-                        prospect["talent_rating"] = talent_rating
-                        prospect["potential_min"] = potential_min
-                        prospect["potential_max"] = potential_max
-                        if "_player_data" in prospect:
-                            from utils.player_generation import apply_birth_development
-
-                            prospect["_player_data"]["potential"] = new_potential
-                            birth_dev_pct = prospect["_player_data"].get("birth_dev_pct", 0.25)
-                            attrs, nom, asg = apply_birth_development(
-                                is_gk=request.is_goalkeeper,
-                                potential=new_potential,
-                                birth_dev_pct=birth_dev_pct,
-                            )
-                            prospect["_player_data"]["attributes"] = attrs
-
-                elif request.min_potential is not None and request.max_potential is not None:
-                    # Filter-and-retry to keep the output fixed at `per_nation`
-                    passed = [p for p in temp_prospects if request.min_potential <= p["actual_potential"] <= request.max_potential]
-                    attempts = 0
-                    while len(passed) < request.per_nation and attempts < request.per_nation * 25:
-                        attempts += 1
-                        more = generate_weekly_prospects(
-                            club_id=club_uuid,
-                            game_mode_id=game_mode_uuid,
-                            season_id=season_uuid,
-                            week_number=request.week_number,
-                            youth_facilities_level=request.youth_facilities_level,
-                            is_goalkeeper=request.is_goalkeeper,
-                            nationality=nat_code,
-                            heritage_options=None,
-                            num_prospects_override=max(1, request.per_nation - len(passed)),
-                        )
-                        passed.extend([p for p in more if request.min_potential <= p["actual_potential"] <= request.max_potential])
-                    temp_prospects = passed[: request.per_nation]
-
-                # Store in memory
-                for prospect_data in temp_prospects:
-                    player_data = prospect_data.pop("_player_data", None)
-                    prospect_id = str(uuid4())
-
-                    heritage_group = None
-                    if player_data and player_data.get("heritage_group"):
-                        heritage_group = player_data.get("heritage_group")
-                    else:
-                        heritage_group = select_heritage_group(prospect_data.get("nationality", "ENG"))
-
-                    profile_pic_folder = resolve_profile_pic_folder_for_display(
-                        heritage_group,
-                        prospect_data.get("profile_pic"),
-                        prospect_data.get("profile_pic_folder"),
-                    )
-
-                    prospect_dict = {
-                        "id": prospect_id,
-                        "club_id": str(club_uuid),
-                        "game_mode_id": str(game_mode_uuid),
-                        "season_id": str(season_uuid) if season_uuid else None,
-                        "week_number": prospect_data["week_number"],
-                        "name": prospect_data["name"],
-                        "talent_rating": prospect_data["talent_rating"],
-                        "is_goalkeeper": prospect_data["is_goalkeeper"],
-                        "nationality": prospect_data.get("nationality"),
-                        "skin_tone": prospect_data.get("skin_tone"),
-                        "profile_pic": prospect_data.get("profile_pic"),
-                        "profile_pic_folder": profile_pic_folder,
-                        "potential_min": prospect_data["potential_min"],
-                        "potential_max": prospect_data["potential_max"],
-                        "actual_potential": prospect_data["actual_potential"],
-                        "status": "available",
-                        "_player_data": player_data,
-                    }
-                    _in_memory_storage.prospects[prospect_id] = prospect_dict
-                    created_count += 1
-
-            return {"message": "Bulk prospects generated", "count": created_count, "club_id": str(club_uuid), "game_mode_id": str(game_mode_uuid)}
-
-        # Database mode (slower for large nation counts, but supported)
-        if not request.club_id or not request.game_mode_id:
-            club, game_mode = get_or_create_test_club(db)
-            db.commit()
-            club_uuid = club.id
-            game_mode_uuid = game_mode.id
+            store = _store_prospects_in_memory
         else:
-            club_uuid = UUID(request.club_id)
-            game_mode_uuid = UUID(request.game_mode_id)
-
-        season_uuid = UUID(request.season_id) if request.season_id else None
-
-        created_count = 0
-        for nat_code in nation_codes:
-            temp_prospects = generate_weekly_prospects(
-                club_id=club_uuid,
-                game_mode_id=game_mode_uuid,
-                season_id=season_uuid,
-                week_number=request.week_number,
-                youth_facilities_level=request.youth_facilities_level,
-                is_goalkeeper=request.is_goalkeeper,
-                nationality=nat_code,
-                heritage_options=None,
-                num_prospects_override=request.per_nation,
-            )
-
-            if request.use_potential_range and request.min_potential is not None and request.max_potential is not None:
-                for prospect in temp_prospects:
-                    new_potential = _rnd.randint(request.min_potential, request.max_potential)
-                    prospect["actual_potential"] = new_potential
-                    talent_rating, potential_min, potential_max = assign_talent_rating(
-                        new_potential, request.is_goalkeeper
-                    )
-                    prospect["talent_rating"] = talent_rating
-                    prospect["potential_min"] = potential_min
-                    prospect["potential_max"] = potential_max
-
-                    if "_player_data" in prospect:
-                        from utils.player_generation import apply_birth_development
-
-                        prospect["_player_data"]["potential"] = new_potential
-                        birth_dev_pct = prospect["_player_data"].get("birth_dev_pct", 0.25)
-                        attrs, nom, asg = apply_birth_development(
-                            is_gk=request.is_goalkeeper,
-                            potential=new_potential,
-                            birth_dev_pct=birth_dev_pct,
-                        )
-                        prospect["_player_data"]["attributes"] = attrs
-            elif request.min_potential is not None and request.max_potential is not None:
-                passed = [p for p in temp_prospects if request.min_potential <= p["actual_potential"] <= request.max_potential]
-                attempts = 0
-                while len(passed) < request.per_nation and attempts < request.per_nation * 25:
-                    attempts += 1
-                    more = generate_weekly_prospects(
-                        club_id=club_uuid,
-                        game_mode_id=game_mode_uuid,
-                        season_id=season_uuid,
-                        week_number=request.week_number,
-                        youth_facilities_level=request.youth_facilities_level,
-                        is_goalkeeper=request.is_goalkeeper,
-                        nationality=nat_code,
-                        heritage_options=None,
-                        num_prospects_override=max(1, request.per_nation - len(passed)),
-                    )
-                    passed.extend([p for p in more if request.min_potential <= p["actual_potential"] <= request.max_potential])
-                temp_prospects = passed[: request.per_nation]
-
-            for prospect_data in temp_prospects:
-                player_data = prospect_data.pop("_player_data", None)
-                # Not a DB column
-                prospect_data.pop("profile_pic_folder", None)
-
-                # Resolve a folder for display (computed in API responses, but helps with legacy stored folders)
-                heritage_group = None
-                if player_data and player_data.get("heritage_group"):
-                    heritage_group = player_data.get("heritage_group")
-                else:
-                    heritage_group = select_heritage_group(prospect_data.get("nationality", "ENG"))
+            # Database mode
+            if not request.club_id or not request.game_mode_id:
+                club, game_mode = get_or_create_test_club(db)
+                db.commit()
+                club_uuid = club.id
+                game_mode_uuid = game_mode.id
+            else:
+                club_uuid = UUID(request.club_id)
+                game_mode_uuid = UUID(request.game_mode_id)
 
-                _ = resolve_profile_pic_folder_for_display(
-                    heritage_group,
-                    prospect_data.get("profile_pic"),
-                    prospect_data.get("profile_pic_folder"),
-                )
+            def store(prospects: List[dict]) -> int:
+                return _store_prospects_db(game_mode_uuid, prospects)
 
-                prospect = YouthProspect(**prospect_data)
-                db.add(prospect)
-                created_count += 1
+        season_uuid = UUID(request.season_id) if request.season_id else None
 
-        db.commit()
-        return {"message": "Bulk prospects generated", "count": created_count, "club_id": str(club_uuid), "game_mode_id": str(game_mode_uuid)}
+        # Potential range: sampled from the truncated distribution (no filter-and-retry),
+        # or uniform in range with use_potential_range
+        potential_range = None
+        if request.min_potential is not None and request.max_potential is not None:
+            potential_range = (request.min_potential, request.max_potential)
+
+        job = start_prospect_job(
+            club_id=club_uuid,
+            game_mode_id=game_mode_uuid,
+            nation_codes=nation_codes,
+            per_nation=request.per_nation,
+            name_index=get_name_index(db, game_mode_uuid),
+            store=store,
+            season_id=season_uuid,
+            week_number=request.week_number,
+            youth_facilities_level=request.youth_facilities_level,
+            is_goalkeeper=request.is_goalkeeper,
+            potential_range=potential_range,
+            uniform_potential=request.use_potential_range,
+        )
+        return {"message": "Bulk prospect generation started", **job}
 
     except HTTPException:
         raise
@@ -1632,9 +1577,57 @@ async def generate_prospects_all_nations_endpoint(
         raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
 
 
+@router.get("/generate-prospects-all-nations/{job_id}", response_model=dict)
+async def get_prospects_all_nations_job(job_id: str):
+    """Progress / result of a bulk all-nations prospect generation job."""
+    job = get_prospect_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Prospect generation job not found")
+    return job
+
+
+@router.post("/generate-prospects-all-nations/jobs", status_code=202)
+@offload("db")
+def submit_prospects_all_nations_job(request: GenerateProspectsForAllNationsRequest):
+    """
+    Queue bulk all-nations generation on the job queue (durable, visible to every API worker);
+    poll ``status_url`` for nation progress and the final counts.
+    """
+    return submit_job("generate_prospects_all_nations", jsonable_encoder(request))
+
+
+def run_generate_prospects_all_nations_job(params: Dict[str, Any], db: Optional[Session]) -> Dict[str, Any]:
+    """Job handler (utils/job_queue.py) for ``generate_prospects_all_nations``: starts the
+    prospect job and follows it to the end."""
+    with _HANDLER_LOCK or nullcontext():
+        job = generate_prospects_all_nations_endpoint.__wrapped__(GenerateProspectsForAllNationsRequest(**params), db)
+    while job["status"] in ("pending", "running"):
+        try:
+            report_progress(
+                job["nations_done"],
+                job["nations_total"],
+                f"{job['nations_done']}/{job['nations_total']} nations, {job['prospects_generated']} prospects",
+            )
+        except JobCancelled:
+            # Stop the generation itself (before it stores the intake), not just the polling
+            job = cancel_prospect_job(job["job_id"])
+            while job["status"] in ("pending", "running"):
+                time.sleep(0.1)
+                job = get_prospect_job(job["job_id"])
+            if job["status"] == "cancelled":
+                raise
+            break
+        time.sleep(0.5)
+        job = get_prospect_job(job["job_id"])
+    if job["status"] == "failed":
+        raise RuntimeError(job["error"] or "Prospect generation failed")
+    return job
+
+
 @router.post("/progress-week", response_model=dict)
 @router.post("/progress-week/{club_id}", response_model=dict)
-async def progress_week(club_id: Optional[str] = None, db: Optional[Session] = Depends(get_db)):
+@offload("heavy", lock=_HANDLER_LOCK)
+def progress_week(club_id: Optional[str] = None, db: Optional[Session] = Depends(get_db)):
     """Progress all academy players by one week (for testing)."""
     try:
         # In-memory mode
@@ -1659,15 +1652,15 @@ async def progress_week(club_id: Optional[str] = None, db: Optional[Session] = D
             # Process one week for all players
             for player in academy_players_list:
                 player["weeks_in_academy"] += 1
-                # Recalculate attribute ranges (narrowing from initial ranges)
-                if player.get("actual_attributes"):
-                    initial_ranges = player.get("initial_attribute_ranges")
-                    player["attribute_ranges"] = calculate_attribute_ranges(
-                        player["actual_attributes"],
-                        player["weeks_in_academy"],
-                        initial_ranges=initial_ranges
-                    )
-                
+            # Recalculate attribute ranges (narrowing from initial ranges), all players at once
+            revealed = [p for p in academy_players_list if p.get("actual_attributes")]
+            for player, ranges in zip(revealed, reveal_attribute_ranges(
+                [p["actual_attributes"] for p in revealed],
+                [p.get("initial_attribute_ranges") for p in revealed],
+                [p["weeks_in_academy"] for p in revealed],
+            )):
+                player["attribute_ranges"] = ranges
+            for player in academy_players_list:
                 # Auto-promote if weeks >= weeks_to_promotion
                 if player["weeks_in_academy"] >= player["weeks_to_promotion"]:
                     player["status"] = "promoted"  # Mark as promoted (in real system would create Player)
@@ -1692,35 +1685,16 @@ async def progress_week(club_id: Optional[str] = None, db: Optional[Session] = D
         if not club:
             raise HTTPException(status_code=404, detail="Club not found")
         
-        academy_players = db.query(YouthAcademyPlayer).filter(
-            YouthAcademyPlayer.club_id == club_uuid,
-            YouthAcademyPlayer.status == "active"
-        ).all()
-        
-        if not academy_players:
+        # One bulk UPDATE for the week; ORM objects only for players being promoted
+        progressed, _ = progress_academy_week_bulk(db, club_uuid)
+        if not progressed:
             return {"message": "No active academy players to progress", "progressed": 0}
         
-        # Process one week for all players
-        for player in academy_players:
-            player.weeks_in_academy += 1
-            # Recalculate attribute ranges (narrowing from initial ranges)
-            if player.actual_attributes:
-                initial_ranges = player.initial_attribute_ranges
-                player.attribute_ranges = calculate_attribute_ranges(
-                    player.actual_attributes,
-                    player.weeks_in_academy,
-                    initial_ranges=initial_ranges
-                )
-            
-            # Auto-promote if weeks >= weeks_to_promotion
-            if player.weeks_in_academy >= player.weeks_to_promotion:
-                promote_academy_player(player, db)
-        
         db.commit()
         
         return {
-            "message": f"Progressed {len(academy_players)} academy player(s) by one week",
-            "progressed": len(academy_players)
+            "message": f"Progressed {progressed} academy player(s) by one week",
+            "progressed": progressed
         }
     except HTTPException:
         raise
@@ -1876,7 +1850,8 @@ async def get_training_program_options(is_goalkeeper: bool = False):
 
 @router.get("/squad-players", response_model=List[SquadPlayerBrief])
 @router.get("/squad-players/{club_id}", response_model=List[SquadPlayerBrief])
-async def get_squad_players_for_workbench(club_id: Optional[str] = None, db: Optional[Session] = Depends(get_db)):
+@offload("db", lock=_HANDLER_LOCK)
+def get_squad_players_for_workbench(club_id: Optional[str] = None, db: Optional[Session] = Depends(get_db)):
     """Players eligible to clone for training simulation: contracted to club and/or promoted from academy."""
     try:
         if db is None:
@@ -1966,7 +1941,8 @@ class PromotedPlayerResponse(BaseModel):
 
 @router.get("/promoted-players", response_model=List[PromotedPlayerResponse])
 @router.get("/promoted-players/{club_id}", response_model=List[PromotedPlayerResponse])
-async def get_promoted_players(club_id: Optional[str] = None, db: Optional[Session] = Depends(get_db)):
+@offload("db", lock=_HANDLER_LOCK)
+def get_promoted_players(club_id: Optional[str] = None, db: Optional[Session] = Depends(get_db)):
     """Get all promoted players (from academy to main team)."""
     try:
         # In-memory mode
@@ -1988,17 +1964,14 @@ async def get_promoted_players(club_id: Optional[str] = None, db: Optional[Sessi
                     if str(p.get("club_id")) == str(club_uuid) and p.get("status") == "promoted"
                 ]
             
+            # Determine heritage group for folder; all folders in one index pass
+            folders = resolve_profile_pic_folders_for_display(
+                (select_heritage_group(p.get("nationality", "ENG")), p.get("profile_pic"), p.get("profile_pic_folder"))
+                for p in promoted_players_list
+            )
+
             results = []
-            for p in promoted_players_list:
-                # Determine heritage group for folder
-                player_nationality = p.get("nationality", "ENG")
-                heritage_group = select_heritage_group(player_nationality)
-                profile_pic_folder = resolve_profile_pic_folder_for_display(
-                    heritage_group,
-                    p.get("profile_pic"),
-                    p.get("profile_pic_folder"),
-                )
-                
+            for p, profile_pic_folder in zip(promoted_players_list, folders):
                 results.append(PromotedPlayerResponse(
                     id=p["id"],
                     name=p["name"],
@@ -2120,187 +2093,198 @@ class TrainPromotedPlayersResponse(BaseModel):
     development_points: List[Dict]  # DP breakdown per year
 
 
-@router.post("/train-promoted-players", response_model=TrainPromotedPlayersResponse)
-async def train_promoted_players(request: TrainPromotedPlayersRequest, db: Optional[Session] = Depends(get_db)):
-    """
-    Train from 16y1 for N years. Either pass `scenarios` (clone squad players with per-row programmes)
-    or omit scenarios to train all promoted players with the global primary/secondary/general fields.
-    """
-    try:
-        program_overrides: Optional[Dict[str, Dict[str, Any]]] = None
-        players: List[Any] = []
+def _resolve_training_players(
+    request: TrainPromotedPlayersRequest, db: Optional[Session]
+) -> Tuple[List[Any], Optional[Dict[str, Dict[str, Any]]]]:
+    """Sim player clones (and per-player programme overrides for scenarios) for ``train_promoted_players``."""
+    program_overrides: Optional[Dict[str, Dict[str, Any]]] = None
+    players: List[Any] = []
 
-        # --- Resolve club ---
-        if db is None:
-            if not request.club_id:
-                club_uuid, _ = get_or_create_test_club_in_memory()
-            else:
-                try:
-                    club_uuid = UUID(request.club_id)
-                except ValueError:
-                    raise HTTPException(status_code=400, detail="Invalid club_id format")
+    # --- Resolve club ---
+    if db is None:
+        if not request.club_id:
+            club_uuid, _ = get_or_create_test_club_in_memory()
         else:
-            if not request.club_id:
-                club, _ = get_or_create_test_club(db)
-                db.commit()
-                club_uuid = club.id
+            try:
+                club_uuid = UUID(request.club_id)
+            except ValueError:
+                raise HTTPException(status_code=400, detail="Invalid club_id format")
+    else:
+        if not request.club_id:
+            club, _ = get_or_create_test_club(db)
+            db.commit()
+            club_uuid = club.id
+        else:
+            try:
+                club_uuid = UUID(request.club_id)
+            except ValueError:
+                raise HTTPException(status_code=400, detail="Invalid club_id format")
+        club = db.query(Club).filter(Club.id == club_uuid).first()
+        if not club:
+            raise HTTPException(status_code=404, detail="Club not found")
+
+    # --- Scenarios: one independent clone + programme mix per row ---
+    if request.scenarios:
+        program_overrides = {}
+        for sc in request.scenarios:
+            if db is None:
+                ap = _in_memory_storage.academy_players.get(sc.source_player_id)
+                if (
+                    not ap
+                    or ap.get("status") != "promoted"
+                    or str(ap.get("club_id")) != str(club_uuid)
+                ):
+                    raise HTTPException(
+                        status_code=404,
+                        detail=f"Squad player not found or not promoted for this club: {sc.source_player_id}",
+                    )
+                igk = ap.get("is_goalkeeper", False)
+                _validate_training_program_selection(
+                    sc.primary_program,
+                    igk,
+                    individual_attr=sc.primary_individual_attr,
+                )
+                _validate_training_program_selection(
+                    sc.secondary_program,
+                    igk,
+                    individual_attr=sc.secondary_individual_attr,
+                )
+                sim = _workbench_sim_player_from_memory(ap, sc.label)
+                players.append(sim)
             else:
                 try:
-                    club_uuid = UUID(request.club_id)
+                    pid = UUID(sc.source_player_id)
                 except ValueError:
-                    raise HTTPException(status_code=400, detail="Invalid club_id format")
-            club = db.query(Club).filter(Club.id == club_uuid).first()
-            if not club:
-                raise HTTPException(status_code=404, detail="Club not found")
-
-        # --- Scenarios: one independent clone + programme mix per row ---
-        if request.scenarios:
-            program_overrides = {}
-            for sc in request.scenarios:
-                if db is None:
-                    ap = _in_memory_storage.academy_players.get(sc.source_player_id)
-                    if (
-                        not ap
-                        or ap.get("status") != "promoted"
-                        or str(ap.get("club_id")) != str(club_uuid)
-                    ):
-                        raise HTTPException(
-                            status_code=404,
-                            detail=f"Squad player not found or not promoted for this club: {sc.source_player_id}",
-                        )
-                    igk = ap.get("is_goalkeeper", False)
-                    _validate_training_program_selection(
-                        sc.primary_program,
-                        igk,
-                        individual_attr=sc.primary_individual_attr,
-                    )
-                    _validate_training_program_selection(
-                        sc.secondary_program,
-                        igk,
-                        individual_attr=sc.secondary_individual_attr,
-                    )
-                    sim = _workbench_sim_player_from_memory(ap, sc.label)
-                    players.append(sim)
-                else:
-                    try:
-                        pid = UUID(sc.source_player_id)
-                    except ValueError:
-                        raise HTTPException(status_code=400, detail="Invalid source_player_id UUID")
-                    player_row = db.query(Player).filter(Player.id == pid).first()
-                    if not player_row:
-                        raise HTTPException(status_code=404, detail=f"Player not found: {sc.source_player_id}")
-                    in_contract = (
-                        db.query(Contract)
-                        .filter(Contract.club_id == club_uuid, Contract.player_id == pid)
-                        .first()
-                    )
-                    ap_row = (
-                        db.query(YouthAcademyPlayer)
-                        .filter(
-                            YouthAcademyPlayer.club_id == club_uuid,
-                            YouthAcademyPlayer.promoted_to_player_id == pid,
-                        )
-                        .first()
-                    )
-                    if not in_contract and not ap_row:
-                        raise HTTPException(
-                            status_code=400,
-                            detail="Player is not in this club's squad (no contract or academy promotion).",
-                        )
-                    igk = player_row.is_goalkeeper
-                    _validate_training_program_selection(
-                        sc.primary_program,
-                        igk,
-                        individual_attr=sc.primary_individual_attr,
+                    raise HTTPException(status_code=400, detail="Invalid source_player_id UUID")
+                player_row = db.query(Player).filter(Player.id == pid).first()
+                if not player_row:
+                    raise HTTPException(status_code=404, detail=f"Player not found: {sc.source_player_id}")
+                in_contract = (
+                    db.query(Contract)
+                    .filter(Contract.club_id == club_uuid, Contract.player_id == pid)
+                    .first()
+                )
+                ap_row = (
+                    db.query(YouthAcademyPlayer)
+                    .filter(
+                        YouthAcademyPlayer.club_id == club_uuid,
+                        YouthAcademyPlayer.promoted_to_player_id == pid,
                     )
-                    _validate_training_program_selection(
-                        sc.secondary_program,
-                        igk,
-                        individual_attr=sc.secondary_individual_attr,
+                    .first()
+                )
+                if not in_contract and not ap_row:
+                    raise HTTPException(
+                        status_code=400,
+                        detail="Player is not in this club's squad (no contract or academy promotion).",
                     )
-                    sim = _workbench_sim_player_from_db(player_row, ap_row, sc.label)
-                    players.append(sim)
-
-                sid = str(players[-1].id)
-                program_overrides[sid] = {
-                    "primary_program": sc.primary_program,
-                    "primary_share": sc.primary_share,
-                    "primary_individual_attr": sc.primary_individual_attr,
-                    "secondary_program": sc.secondary_program,
-                    "secondary_share": sc.secondary_share,
-                    "secondary_individual_attr": sc.secondary_individual_attr,
-                    "general_share": sc.general_share,
-                }
-
-        # --- Legacy: all promoted players, single global programme ---
-        elif db is None:
-            promoted_players_list = [
-                p
-                for p in _in_memory_storage.academy_players.values()
-                if str(p.get("club_id")) == str(club_uuid) and p.get("status") == "promoted"
-            ]
-            if not promoted_players_list:
-                raise HTTPException(status_code=404, detail="No promoted players found")
-
-            class SimplePlayerMem:
-                def __init__(self, data):
-                    self.id = uuid4()
-                    self.potential = data.get("actual_potential", 2000)
-                    self.birth_dev_pct = data.get("birth_dev_pct", 0.15)
-                    self.base_training_pct = data.get("base_training_pct", 0.40)
-                    self.growth_training_pct = data.get("growth_training_pct", 0.45)
-                    self.growth_shape = data.get("growth_shape", 2.0)
-                    self.growth_peak_age = data.get("growth_peak_age", 22.0)
-                    self.growth_width = data.get("growth_width", 4.0)
-                    self.attributes = data.get("actual_attributes", {}).copy()
-                    self.actual_age_months = 16 * 12 + 1
-                    self.training_age_weeks = 1
-                    self.is_goalkeeper = data.get("is_goalkeeper", False)
-                    self.name = data.get("name", "Player")
-                    self.nationality = data.get("nationality", "ENG")
-                    self.profile_pic = data.get("profile_pic")
-                    self.profile_pic_folder = data.get("profile_pic_folder")
-
-            players = [SimplePlayerMem(p) for p in promoted_players_list]
-        else:
-            promoted_academy_players = (
-                db.query(YouthAcademyPlayer)
-                .filter(
-                    YouthAcademyPlayer.club_id == club_uuid,
-                    YouthAcademyPlayer.status == "promoted",
+                igk = player_row.is_goalkeeper
+                _validate_training_program_selection(
+                    sc.primary_program,
+                    igk,
+                    individual_attr=sc.primary_individual_attr,
+                )
+                _validate_training_program_selection(
+                    sc.secondary_program,
+                    igk,
+                    individual_attr=sc.secondary_individual_attr,
                 )
-                .all()
+                sim = _workbench_sim_player_from_db(player_row, ap_row, sc.label)
+                players.append(sim)
+
+            sid = str(players[-1].id)
+            program_overrides[sid] = {
+                "primary_program": sc.primary_program,
+                "primary_share": sc.primary_share,
+                "primary_individual_attr": sc.primary_individual_attr,
+                "secondary_program": sc.secondary_program,
+                "secondary_share": sc.secondary_share,
+                "secondary_individual_attr": sc.secondary_individual_attr,
+                "general_share": sc.general_share,
+            }
+
+    # --- Legacy: all promoted players, single global programme ---
+    elif db is None:
+        promoted_players_list = [
+            p
+            for p in _in_memory_storage.academy_players.values()
+            if str(p.get("club_id")) == str(club_uuid) and p.get("status") == "promoted"
+        ]
+        if not promoted_players_list:
+            raise HTTPException(status_code=404, detail="No promoted players found")
+
+        class SimplePlayerMem:
+            def __init__(self, data):
+                self.id = uuid4()
+                self.potential = data.get("actual_potential", 2000)
+                self.birth_dev_pct = data.get("birth_dev_pct", 0.15)
+                self.base_training_pct = data.get("base_training_pct", 0.40)
+                self.growth_training_pct = data.get("growth_training_pct", 0.45)
+                self.growth_shape = data.get("growth_shape", 2.0)
+                self.growth_peak_age = data.get("growth_peak_age", 22.0)
+                self.growth_width = data.get("growth_width", 4.0)
+                self.attributes = data.get("actual_attributes", {}).copy()
+                self.actual_age_months = 16 * 12 + 1
+                self.training_age_weeks = 1
+                self.is_goalkeeper = data.get("is_goalkeeper", False)
+                self.name = data.get("name", "Player")
+                self.nationality = data.get("nationality", "ENG")
+                self.profile_pic = data.get("profile_pic")
+                self.profile_pic_folder = data.get("profile_pic_folder")
+
+        players = [SimplePlayerMem(p) for p in promoted_players_list]
+    else:
+        promoted_academy_players = (
+            db.query(YouthAcademyPlayer)
+            .filter(
+                YouthAcademyPlayer.club_id == club_uuid,
+                YouthAcademyPlayer.status == "promoted",
             )
-            if not promoted_academy_players:
-                raise HTTPException(status_code=404, detail="No promoted players found")
-
-            class SimplePlayerDb:
-                def __init__(self, academy_player, player):
-                    self.id = player.id
-                    self.potential = player.potential
-                    self.birth_dev_pct = player.birth_dev_pct
-                    self.base_training_pct = player.base_training_pct
-                    self.growth_training_pct = player.growth_training_pct
-                    self.growth_shape = player.growth_shape
-                    self.growth_peak_age = player.growth_peak_age
-                    self.growth_width = player.growth_width
-                    self.attributes = (player.attributes or {}).copy()
-                    self.actual_age_months = 16 * 12 + 1
-                    self.training_age_weeks = 1
-                    self.is_goalkeeper = player.is_goalkeeper
-                    self.name = player.name
-                    self.nationality = player.nationality
-                    self.profile_pic = academy_player.profile_pic
-                    self.profile_pic_folder = None
-
-            players = []
-            for academy_player in promoted_academy_players:
-                if academy_player.promoted_to_player_id:
-                    player = db.query(Player).filter(Player.id == academy_player.promoted_to_player_id).first()
-                    if player:
-                        players.append(SimplePlayerDb(academy_player, player))
-            if not players:
-                raise HTTPException(status_code=404, detail="No promoted player records found")
+            .all()
+        )
+        if not promoted_academy_players:
+            raise HTTPException(status_code=404, detail="No promoted players found")
+
+        class SimplePlayerDb:
+            def __init__(self, academy_player, player):
+                self.id = player.id
+                self.potential = player.potential
+                self.birth_dev_pct = player.birth_dev_pct
+                self.base_training_pct = player.base_training_pct
+                self.growth_training_pct = player.growth_training_pct
+                self.growth_shape = player.growth_shape
+                self.growth_peak_age = player.growth_peak_age
+                self.growth_width = player.growth_width
+                self.attributes = (player.attributes or {}).copy()
+                self.actual_age_months = 16 * 12 + 1
+                self.training_age_weeks = 1
+                self.is_goalkeeper = player.is_goalkeeper
+                self.name = player.name
+                self.nationality = player.nationality
+                self.profile_pic = academy_player.profile_pic
+                self.profile_pic_folder = None
+
+        players = []
+        for academy_player in promoted_academy_players:
+            if academy_player.promoted_to_player_id:
+                player = db.query(Player).filter(Player.id == academy_player.promoted_to_player_id).first()
+                if player:
+                    players.append(SimplePlayerDb(academy_player, player))
+        if not players:
+            raise HTTPException(status_code=404, detail="No promoted player records found")
+    return players, program_overrides
+
+
+@router.post("/train-promoted-players", response_model=TrainPromotedPlayersResponse)
+@offload("heavy")
+def train_promoted_players(request: TrainPromotedPlayersRequest, db: Optional[Session] = Depends(get_db)):
+    """
+    Train from 16y1 for N years. Either pass `scenarios` (clone squad players with per-row programmes)
+    or omit scenarios to train all promoted players with the global primary/secondary/general fields.
+    """
+    try:
+        # Only resolving the squad reads the in-memory store; training works on clones
+        with _STORE_LOCK if db is None else nullcontext():
+            players, program_overrides = _resolve_training_players(request, db)
 
         # Global programme validation for mixed squads (only needed for Individual).
         # Workbench scenarios validate per-row; this guards the legacy global fields.
@@ -2390,7 +2374,7 @@ async def train_promoted_players(request: TrainPromotedPlayersRequest, db: Optio
                 player_training_weeks_before[player_id] = player.training_age_weeks
             
             # Train for 10 weeks (1 season)
-            season_totals = train_one_season_with_growth(
+            season_totals = train_one_season_vectorized(
                 players,
                 growth_caches,
                 train_carries,
@@ -2484,6 +2468,13 @@ async def train_promoted_players(request: TrainPromotedPlayersRequest, db: Optio
             
             yearly_snapshots.append(snapshot)
             yearly_dp_breakdown.append(dp_breakdown)
+            # As a background job: each trained year is a partial result
+            report_progress(
+                year_num,
+                request.years_to_simulate,
+                f"Trained {year_num}/{request.years_to_simulate} years",
+                {"snapshot": snapshot, "development_points": dp_breakdown},
+            )
         
         return TrainPromotedPlayersResponse(
             players=yearly_snapshots,
@@ -2495,6 +2486,211 @@ async def train_promoted_players(request: TrainPromotedPlayersRequest, db: Optio
         raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
 
 
+@router.post("/train-promoted-players/jobs", status_code=202)
+@offload("db")
+def submit_train_promoted_players_job(request: TrainPromotedPlayersRequest):
+    """
+    Queue multi-year training as a background job (up to 20 years without request timeouts).
+    Poll ``status_url`` with ``?since=<seq>``: each trained year arrives as a partial result.
+    """
+    return submit_job("train_promoted_players", jsonable_encoder(request))
+
+
+def run_train_promoted_players_job(params: Dict[str, Any], db: Optional[Session]) -> TrainPromotedPlayersResponse:
+    """Job handler (utils/job_queue.py) for ``train_promoted_players`` (locks the in-memory
+    store only while resolving the squad, not for the whole run)."""
+    return train_promoted_players.__wrapped__(TrainPromotedPlayersRequest(**params), db)
+
+
+class DevelopmentProjectionRequest(BaseModel):
+    """Expected development curve for one player (by id, or from explicit generation fields)."""
+    source_player_id: Optional[str] = Field(
+        default=None,
+        description="In-memory: academy player id (projected from 16y1); database: Player UUID (projected from now)",
+    )
+    potential: Optional[int] = None
+    base_training_pct: Optional[float] = None
+    growth_training_pct: Optional[float] = None
+    growth_shape: Optional[float] = None
+    growth_peak_age: Optional[float] = None
+    is_goalkeeper: bool = False
+    attributes: Optional[Dict[str, int]] = None
+    training_age_weeks: int = Field(default=1, ge=0)
+    actual_age_months: int = Field(default=16 * 12 + 1, ge=0)
+    training_facilities: int = Field(default=10, ge=0, le=10)
+    primary_program: Optional[str] = "Balanced"
+    primary_individual_attr: Optional[str] = None
+    primary_share: float = Field(default=0.4, ge=0, le=1)
+    secondary_program: Optional[str] = "Balanced"
+    secondary_individual_attr: Optional[str] = None
+    secondary_share: float = Field(default=0.2, ge=0, le=1)
+    general_share: float = Field(default=0.4, ge=0, le=1)
+    years_to_simulate: int = Field(default=15, ge=1, le=20)
+    percentiles: Optional[List[float]] = Field(
+        default=None,
+        description="e.g. [10, 50, 90]; adds Monte Carlo percentile bands per year (cached per input)",
+    )
+
+
+@router.post("/development-projection")
+@offload("heavy", lock=_HANDLER_LOCK)
+def development_projection(request: DevelopmentProjectionRequest, db: Optional[Session] = Depends(get_db)):
+    """
+    Projected attribute trajectory per season without running the training simulation:
+    expected values (expected-value propagation) and optional percentile bands.
+    """
+    if request.percentiles and any(q < 0 or q > 100 for q in request.percentiles):
+        raise HTTPException(status_code=400, detail="percentiles must be between 0 and 100")
+
+    if request.source_player_id:
+        if db is None:
+            ap = _in_memory_storage.academy_players.get(request.source_player_id)
+            if not ap:
+                raise HTTPException(status_code=404, detail=f"Academy player not found: {request.source_player_id}")
+            player = _workbench_sim_player_from_memory(ap, None)
+        else:
+            try:
+                pid = UUID(request.source_player_id)
+            except ValueError:
+                raise HTTPException(status_code=400, detail="Invalid source_player_id UUID")
+            player = db.query(Player).filter(Player.id == pid).first()
+            if not player:
+                raise HTTPException(status_code=404, detail=f"Player not found: {request.source_player_id}")
+    else:
+        missing = [
+            f for f in ("potential", "base_training_pct", "growth_training_pct", "growth_shape", "growth_peak_age")
+            if getattr(request, f) is None
+        ]
+        if missing:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Provide source_player_id or all of: {', '.join(missing)}",
+            )
+        player = SimpleNamespace(
+            potential=request.potential,
+            base_training_pct=request.base_training_pct,
+            growth_training_pct=request.growth_training_pct,
+            growth_shape=request.growth_shape,
+            growth_peak_age=request.growth_peak_age,
+            is_goalkeeper=request.is_goalkeeper,
+            attributes=request.attributes or {},
+            training_age_weeks=request.training_age_weeks,
+            actual_age_months=request.actual_age_months,
+        )
+
+    is_gk = bool(player.is_goalkeeper)
+    _validate_training_program_selection(request.primary_program, is_gk, individual_attr=request.primary_individual_attr)
+    _validate_training_program_selection(request.secondary_program, is_gk, individual_attr=request.secondary_individual_attr)
+
+    return project_development(
+        potential=player.potential,
+        base_training_pct=player.base_training_pct,
+        growth_training_pct=player.growth_training_pct,
+        growth_shape=player.growth_shape,
+        growth_peak_age=player.growth_peak_age,
+        is_goalkeeper=is_gk,
+        attributes=player.attributes or {},
+        train_carry=getattr(player, "train_carry", None),
+        training_age_weeks=player.training_age_weeks or 0,
+        actual_age_months=player.actual_age_months or 0,
+        training_facilities_level=request.training_facilities,
+        primary_program=request.primary_program,
+        primary_share=request.primary_share,
+        primary_individual_attr=request.primary_individual_attr,
+        secondary_program=request.secondary_program,
+        secondary_share=request.secondary_share,
+        secondary_individual_attr=request.secondary_individual_attr,
+        general_share=request.general_share,
+        years=request.years_to_simulate,
+        percentiles=request.percentiles,
+    )
+
+
+class TrainingRolloverRequest(BaseModel):
+    """Season-rollover training for every player of a game mode (database mode only)."""
+    game_mode_id: Optional[str] = None
+    weeks: int = Field(default=10, ge=0, le=52, description="Training weeks applied to each player")
+    offseason: bool = Field(default=True, description="Add the 2-month off-season after the weeks")
+    chunk_size: int = Field(default=5000, ge=100, le=50000)
+    resume_run_id: Optional[str] = Field(default=None, description="Continue an unfinished training run")
+    primary_program: Optional[str] = "Balanced"
+    primary_share: float = Field(default=0.4, ge=0, le=1)
+    secondary_program: Optional[str] = "Balanced"
+    secondary_share: float = Field(default=0.2, ge=0, le=1)
+    general_share: float = Field(default=0.4, ge=0, le=1)
+    gk_primary_program: Optional[str] = Field(default="Balanced", description="Goalkeepers' primary programme")
+    gk_secondary_program: Optional[str] = Field(default="Balanced", description="Goalkeepers' secondary programme")
+
+
+@router.post("/training-rollover")
+async def start_training_rollover(request: TrainingRolloverRequest):
+    """
+    Start (or resume) a background training run; poll GET /training-rollover/{run_id}.
+
+    Outfield players train on ``primary_program`` / ``secondary_program`` (OUTFIELD_PROGRAMS),
+    goalkeepers on ``gk_primary_program`` / ``gk_secondary_program`` (GK_PROGRAMS), with the
+    same shares. A programme left null drops out of the mix; the other shares are rescaled.
+    """
+    if engine is None:
+        raise HTTPException(status_code=400, detail="Training rollover requires a database")
+    from utils.season_rollover import TrainingRunConflict, start_training_rollover_in_background
+
+    try:
+        resume_id = UUID(request.resume_run_id) if request.resume_run_id else None
+        game_mode_uuid = UUID(request.game_mode_id) if request.game_mode_id else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid UUID format")
+    if resume_id is None and game_mode_uuid is None:
+        raise HTTPException(status_code=400, detail="game_mode_id is required")
+
+    for name in (request.primary_program, request.secondary_program):
+        if name is not None and name not in OUTFIELD_PROGRAMS:
+            raise HTTPException(status_code=400, detail=f"Invalid training program for rollover: {name}")
+    for name in (request.gk_primary_program, request.gk_secondary_program):
+        if name is not None and name not in GK_PROGRAMS:
+            raise HTTPException(status_code=400, detail=f"Invalid goalkeeper training program for rollover: {name}")
+
+    # A resumed run keeps its stored weeks / chunk size / programme mix; a running run whose
+    # process died (no heartbeat) can be resumed, one that is still alive answers 409
+    try:
+        run_id = start_training_rollover_in_background(
+            game_mode_uuid,
+            weeks=request.weeks,
+            offseason=request.offseason,
+            chunk_size=request.chunk_size,
+            resume_run_id=resume_id,
+            primary_program=request.primary_program,
+            primary_share=request.primary_share,
+            secondary_program=request.secondary_program,
+            secondary_share=request.secondary_share,
+            general_share=request.general_share,
+            gk_primary_program=request.gk_primary_program,
+            gk_secondary_program=request.gk_secondary_program,
+        )
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Training run not found")
+    except TrainingRunConflict as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return {"run_id": str(run_id), "status_url": f"/api/youth-academy/training-rollover/{run_id}"}
+
+
+@router.get("/training-rollover/{run_id}")
+async def get_training_rollover(run_id: str):
+    """Progress / throughput of a training run."""
+    if engine is None:
+        raise HTTPException(status_code=400, detail="Training rollover requires a database")
+    from utils.season_rollover import get_training_run
+
+    try:
+        run_uuid = UUID(run_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid run_id format")
+    run = get_training_run(run_uuid)
+    if run is None:
+        raise HTTPException(status_code=404, detail="Training run not found")
+    return run
+
+
 @router.get("/nationalities")
 async def get_available_nationalities():
     """Return all nationalities from heritage composition (COUNTRY_FEDERATION + display names)."""
@@ -2525,6 +2721,43 @@ async def get_available_nationalities():
     return sorted(by_code.values(), key=lambda x: x["code"])
 
 
+@router.post("/reload-name-data")
+async def reload_name_data_endpoint(wait: bool = False):
+    """
+    Rebuild name pools + heritage composition from disk and swap them in atomically.
+    Runs in the background unless ``wait`` is true; poll GET /reload-name-data for status.
+    """
+    from utils import name_data
+
+    if wait:
+        import asyncio
+
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, name_data.reload_name_data)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Name data reload failed: {str(e)}")
+        return {"started": True, **name_data.reload_status()}
+
+    started = name_data.reload_name_data_in_background()
+    return {"started": started, **name_data.reload_status()}
+
+
+@router.get("/reload-name-data")
+async def reload_name_data_status():
+    """Status of the last name data reload (generation, timing, error)."""
+    from utils import name_data
+
+    return name_data.reload_status()
+
+
+@router.get("/profile-picture-folders")
+async def get_profile_picture_folders():
+    """Heritage group → profile-picture folder table (resolved buckets, remaps, unmatched)."""
+    from utils.youth_academy import get_picture_folder_table
+
+    return get_picture_folder_table().diagnostics()
+
+
 @router.get("/country-federations")
 async def get_country_federations():
     """Country code → regional confederation (UEFA, CONMEBOL, …) from composition data."""
@@ -2533,39 +2766,28 @@ async def get_country_federations():
     return {"by_country": dict(sorted(COUNTRY_FEDERATION.items()))}
 
 
-def _is_profile_image(fname: str) -> bool:
-    fl = fname.lower()
-    return fl.endswith(".png") or fl.endswith(".webp")
-
-
 @router.get("/random-profile-picture")
 async def get_random_profile_picture():
     """Get a random profile picture filename from any available gfx folder."""
-    import os as _os, random as _rnd
+    import random as _rnd
+    from utils.gfx_catalog import get_gfx_catalog
     from utils.youth_academy import _build_gfx_folder_map
 
     folder_map = _build_gfx_folder_map()
-    gfx_root = _os.path.join(_os.path.dirname(_os.path.dirname(__file__)), "gfx")
+    catalog = get_gfx_catalog()
 
     candidates = []
-    for actual_dir in set(folder_map.values()):
-        full = _os.path.join(gfx_root, actual_dir)
-        if _os.path.isdir(full):
-            imgs = [f for f in _os.listdir(full) if _is_profile_image(f)]
-            if imgs:
-                candidates.append((actual_dir, imgs))
+    for actual_dir in sorted(set(folder_map.values())):
+        imgs = catalog.folder_images(actual_dir)
+        if imgs:
+            candidates.append((actual_dir, imgs))
 
     # Composition buckets: gfx/player_profile_pics/<bucket>/
-    ppp = _os.path.join(gfx_root, "player_profile_pics")
-    if _os.path.isdir(ppp):
-        for entry in _os.listdir(ppp):
-            sub = _os.path.join(ppp, entry)
-            if not _os.path.isdir(sub):
-                continue
-            rel = f"player_profile_pics/{entry}"
-            imgs = [f for f in _os.listdir(sub) if _is_profile_image(f)]
-            if imgs:
-                candidates.append((rel, imgs))
+    for entry in catalog.folder_subfolders("player_profile_pics"):
+        rel = f"player_profile_pics/{entry}"
+        imgs = catalog.folder_images(rel)
+        if imgs:
+            candidates.append((rel, imgs))
 
     if not candidates:
         raise HTTPException(status_code=404, detail="No profile pictures found")
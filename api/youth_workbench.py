@@ -6,8 +6,10 @@ from fastapi import APIRouter
 from fastapi.responses import HTMLResponse
 from pydantic import BaseModel, Field
 from typing import List, Dict, Optional
-from utils.player_generation import create_player_data
-from utils.player_development import compile_growth_schedule, train_one_season_with_growth
+from utils.player_generation import create_player_data, create_players_batch
+from utils.player_development import compile_growth_schedule
+from utils.training_engine import train_one_season_vectorized
+from utils.execution import offload
 import uuid
 
 router = APIRouter(prefix="/api/youth-workbench", tags=["youth-workbench"])
@@ -73,35 +75,33 @@ async def youth_workbench_ui():
 
 
 @router.post("/generate", response_model=GeneratePlayersResponse)
-async def generate_players(request: GeneratePlayersRequest):
+@offload("cpu")
+def generate_players(request: GeneratePlayersRequest):
     """
     Generate multiple players for analysis.
     Returns player data and statistics for histogram generation.
     """
-    players = []
-    
-    for _ in range(request.num_players):
-        player_data = create_player_data(
-            club_id=str(uuid.uuid4()),
-            youth_facilities=request.youth_facilities,
-            is_goalkeeper=request.is_goalkeeper,
-            youth_player=False,
-            potential_alpha_base=(request.potential_alpha_base if request.potential_alpha_base is not None else 2.0),
-            potential_beta_base=(request.potential_beta_base if request.potential_beta_base is not None else 2.5),
-            potential_beta_facility_scale=(
-                request.potential_beta_facility_scale if request.potential_beta_facility_scale is not None else 20.0
-            ),
-            potential_tail_gamma=(request.potential_tail_gamma if request.potential_tail_gamma is not None else 1.0),
-        )
-        players.append(player_data)
-    
-    # Calculate statistics
-    potentials = [p["potential"] for p in players]
-    birth_dev_pcts = [p["birth_dev_pct"] for p in players]
-    base_training_pcts = [p["base_training_pct"] for p in players]
-    growth_training_pcts = [p["growth_training_pct"] for p in players]
-    growth_shapes = [p["growth_shape"] for p in players]  # This is now the k parameter
-    growth_peak_ages = [p["growth_peak_age"] for p in players]  # This is the b parameter
+    batch = create_players_batch(
+        request.num_players,
+        youth_facilities=request.youth_facilities,
+        is_goalkeeper=request.is_goalkeeper,
+        youth_player=False,
+        potential_alpha_base=(request.potential_alpha_base if request.potential_alpha_base is not None else 2.0),
+        potential_beta_base=(request.potential_beta_base if request.potential_beta_base is not None else 2.5),
+        potential_beta_facility_scale=(
+            request.potential_beta_facility_scale if request.potential_beta_facility_scale is not None else 20.0
+        ),
+        potential_tail_gamma=(request.potential_tail_gamma if request.potential_tail_gamma is not None else 1.0),
+    )
+    players = batch.to_dicts()
+
+    # Calculate statistics (straight from the batch columns)
+    potentials = batch.potential.tolist()
+    birth_dev_pcts = batch.birth_dev_pct.tolist()
+    base_training_pcts = batch.base_training_pct.tolist()
+    growth_training_pcts = batch.growth_training_pct.tolist()
+    growth_shapes = batch.growth_shape.tolist()  # This is now the k parameter
+    growth_peak_ages = batch.growth_peak_age.tolist()  # This is the b parameter
     
     statistics = {
         "potential": {
@@ -146,7 +146,8 @@ async def generate_players(request: GeneratePlayersRequest):
 
 
 @router.post("/develop", response_model=DevelopPlayersResponse)
-async def develop_players(request: DevelopPlayersRequest):
+@offload("cpu")
+def develop_players(request: DevelopPlayersRequest):
     """
     Create players at age 16y1 and simulate their development over multiple years.
     Returns yearly snapshots of player attributes and development points.
@@ -343,7 +344,7 @@ async def develop_players(request: DevelopPlayersRequest):
             player_training_weeks_before[player_id] = player.training_age_weeks
         
         # Train for 10 weeks (1 season)
-        season_totals = train_one_season_with_growth(
+        season_totals = train_one_season_vectorized(
             players,
             growth_caches,
             train_carries,
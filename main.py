@@ -4,7 +4,8 @@ from fastapi import FastAPI, Request
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import JSONResponse
 from database import engine
-from api import match_engine, test_bench, youth_workbench, youth_academy, kit_designer, sponsor_workbench
+from utils.gfx_assets import GfxStaticFiles
+from api import match_engine, test_bench, youth_workbench, youth_academy, kit_designer, sponsor_workbench, gfx, jobs
 
 app = FastAPI()
 
@@ -14,6 +15,7 @@ _PROTECTED_PREFIXES = (
     "/api/youth-workbench",
     "/api/youth-academy",
     "/api/sponsor-workbench",
+    "/api/jobs",
 )
 _OPEN_PATHS = {
     "/",
@@ -61,6 +63,29 @@ def startup():
         import models  # Import models only if database is available
         Base.metadata.create_all(bind=engine)
 
+    # Shared k x b growth-schedule table used by training
+    from utils.player_development import growth_schedule_table
+    growth_schedule_table()
+
+    # gfx/ asset catalog (profile pictures, kit templates, ...) and the heritage →
+    # picture folder table built on it, for in-memory lookups
+    from utils.youth_academy import get_picture_folder_table
+    get_picture_folder_table()
+
+    # Background job workers (JOB_WORKERS, default 2; 0 when they run as a separate service)
+    from utils.job_queue import start_job_workers
+    start_job_workers()
+
+
+@app.on_event("shutdown")
+def shutdown():
+    # Thread / process pools of the offloaded workbench endpoints (utils/execution.py)
+    from utils.execution import shutdown_executors
+    shutdown_executors()
+
+    from utils.job_queue import stop_job_workers
+    stop_job_workers()
+
 @app.get("/")
 def health():
     return {"status": "ok"}
@@ -80,13 +105,16 @@ app.include_router(youth_workbench.router)
 app.include_router(youth_academy.router)
 app.include_router(kit_designer.router)
 app.include_router(sponsor_workbench.router)
+app.include_router(gfx.router)
+app.include_router(jobs.router)
 
 # Serve static files for test bench UI (directory must exist — use static/.gitkeep in git)
 _static_dir = os.path.join(os.path.dirname(__file__), "static")
 if os.path.isdir(_static_dir):
     app.mount("/static", StaticFiles(directory=_static_dir), name="static")
 
-# Serve graphics files (player profile pictures, kit assets, etc.)
+# Serve graphics files (player profile pictures, kit assets, etc.) with content-hash ETags,
+# immutable caching for ?v=<hash> URLs (see /gfx-manifest) and pre-built WebP / gzip variants
 _gfx_dir = os.path.join(os.path.dirname(__file__), "gfx")
 if os.path.isdir(_gfx_dir):
-    app.mount("/gfx", StaticFiles(directory=_gfx_dir), name="gfx")
\ No newline at end of file
+    app.mount("/gfx", GfxStaticFiles(directory=_gfx_dir), name="gfx")
\ No newline at end of file
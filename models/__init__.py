@@ -21,3 +21,6 @@ from .cup_match import CupMatch
 from .youth_prospect import YouthProspect
 from .youth_academy_player import YouthAcademyPlayer
 
+from .player_name_key import PlayerNameKey
+from .training_run import TrainingRun
+from .job import Job, JobPartial
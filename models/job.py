@@ -0,0 +1,52 @@
+from uuid import uuid4
+from sqlalchemy import Column, String, Integer, Float, Boolean, ForeignKey, DateTime, Text, Index, JSON, Uuid
+from .base import Base
+
+# Generic Uuid / JSON types (not the postgresql dialect ones): without DATABASE_URL the job
+# queue keeps these tables in a local SQLite file (utils/job_queue.py).
+
+
+class Job(Base):
+    """
+    One queued background job (batch simulation, multi-year training, prospect generation).
+
+    Workers claim the oldest ``queued`` row, run the handler registered for ``kind`` with
+    ``params`` and store ``result`` (or ``error``). ``progress`` / ``message`` and the
+    ``job_partials`` rows are written while it runs; ``heartbeat_at`` is refreshed by the
+    worker so jobs of a dead worker can be re-queued.
+    """
+    __tablename__ = "jobs"
+
+    id = Column(Uuid, primary_key=True, default=uuid4)
+    kind = Column(String, nullable=False)
+    params = Column(JSON, nullable=False)
+
+    status = Column(String, nullable=False, default="queued")  # queued, running, completed, failed, cancelled
+    progress = Column(Float, nullable=False, default=0.0)  # 0..1
+    message = Column(String, nullable=True)
+    partials_count = Column(Integer, nullable=False, default=0)
+    result = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+    cancel_requested = Column(Boolean, nullable=False, default=False)
+
+    worker_id = Column(String, nullable=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, nullable=False)
+    started_at = Column(DateTime, nullable=True)
+    heartbeat_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        # Claiming (oldest queued first) and stale-job recovery
+        Index("ix_jobs_status_created", "status", "created_at"),
+    )
+
+
+class JobPartial(Base):
+    """Partial result ``seq`` (1, 2, ...) of a running job, for polling / streaming clients."""
+    __tablename__ = "job_partials"
+
+    job_id = Column(Uuid, ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True)
+    seq = Column(Integer, primary_key=True)
+    data = Column(JSON, nullable=False)
+    created_at = Column(DateTime, nullable=False)
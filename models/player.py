@@ -35,6 +35,7 @@ class Player(Base):
     
     # Attributes stored as JSONB for flexibility
     attributes = Column(JSONB, nullable=True)  # Dict of attribute_name -> value (1-20)
+    train_carry = Column(JSONB, nullable=True)  # Dict of attribute_name -> fractional DP not yet converted to +1
     non_playing_attributes = Column(JSONB, nullable=True)  # Dict: Injury Proneness, Professionalism, Adaptability, Aggression
     position_traits = Column(JSONB, nullable=True, default=list)  # List of position trait strings
     gainable_traits = Column(JSONB, nullable=True, default=list)  # List of gainable trait strings
@@ -0,0 +1,26 @@
+from sqlalchemy import BigInteger, Column, String, ForeignKey, DateTime, Index
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+from .base import Base
+
+
+class PlayerNameKey(Base):
+    """
+    Normalized full names already taken inside a game mode.
+
+    Backs the name-uniqueness index (utils/name_index.py): one row per (game_mode, name),
+    written in bulk when prospects are persisted.
+    """
+    __tablename__ = "player_name_keys"
+
+    game_mode_id = Column(UUID(as_uuid=True), ForeignKey("game_modes.id"), primary_key=True)
+    name_key = Column(String, primary_key=True)  # normalize_full_name(name)
+    # Per-game-mode batch number in commit order (incremental refresh; 0 = backfill)
+    seq = Column(BigInteger, nullable=False, server_default="0")
+
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        # Incremental refresh of the in-process index (keys added by other workers)
+        Index("ix_player_name_keys_game_mode_seq", "game_mode_id", "seq"),
+    )
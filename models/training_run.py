@@ -0,0 +1,46 @@
+from uuid import uuid4
+from sqlalchemy import Column, String, Integer, Float, Boolean, ForeignKey, DateTime, Text, Index, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.sql import func
+from .base import Base
+
+
+class TrainingRun(Base):
+    """
+    One season-rollover training job over all players of a game mode (utils/season_rollover.py).
+
+    Players are processed in id order; ``last_player_id`` is committed together with each
+    chunk's updates, so a failed or interrupted run resumes after the last written chunk.
+    At most one pending / running run per game mode.
+    """
+    __tablename__ = "training_runs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    game_mode_id = Column(UUID(as_uuid=True), ForeignKey("game_modes.id"), nullable=False)
+
+    weeks = Column(Integer, nullable=False, default=10)  # training weeks applied to each player
+    offseason = Column(Boolean, nullable=False, default=True)  # +2 months after the weeks
+    chunk_size = Column(Integer, nullable=False, default=5000)
+    training_kwargs = Column(JSONB, nullable=True)  # programme mix etc. (train_weeks_vectorized kwargs)
+
+    status = Column(String, nullable=False, default="pending")  # pending, running, completed, failed
+    last_player_id = Column(UUID(as_uuid=True), nullable=True)  # resume point (players.id order)
+    players_total = Column(Integer, nullable=True)
+    players_processed = Column(Integer, nullable=False, default=0)
+    players_per_sec = Column(Float, nullable=True)
+    error = Column(Text, nullable=True)
+    heartbeat_at = Column(DateTime, nullable=True)  # refreshed while running; stale = interrupted
+
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+    finished_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("ix_training_runs_game_mode_status", "game_mode_id", "status"),
+        Index(
+            "ux_training_runs_active_game_mode",
+            "game_mode_id",
+            unique=True,
+            postgresql_where=text("status IN ('pending', 'running')"),
+        ),
+    )
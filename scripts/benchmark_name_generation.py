@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Benchmark / profile name generation for every nationality (COUNTRY_FEDERATION ∪ HERITAGE_CONFIG).
+
+For each nationality, generates K names (``generate_names_batch`` by default, or K calls to
+``generate_name`` with ``--mode single``) against a shared ``used_names`` set and records:
+
+  - names/sec and ms per name
+  - duplicate retries (extra draws from the ``max_retries`` loop)
+  - fallback paths: surname borrowed from another pool (US custom pools -> country_USA),
+    given-name pool without names, placeholder names (NoFirstName / NoLastName), local core
+    pool missing (nationality falls back to a bare pool id), and the share of heritage origin
+    weight that points at pools without given names (redirected to the group fallback)
+  - peak traced memory per nationality (``--memory``; slows the run)
+
+Writes a CSV (sortable; default reports/name_generation_benchmark.csv) and prints the slowest
+nations. ``--profile`` adds a cProfile summary of the whole run.
+
+Run from repo root:
+  python scripts/benchmark_name_generation.py --count 500 --sort names_per_sec
+"""
+
+from __future__ import annotations
+
+import argparse
+import cProfile
+import csv
+import io
+import pstats
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List, Set
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from utils import name_data  # noqa: E402
+from utils.name_generation import (  # noqa: E402
+    _origin_pool_candidates,
+    generate_name,
+    generate_names_batch,
+    pool_has_names,
+    selection_plan,
+)
+
+DEFAULT_OUT = ROOT / "reports" / "name_generation_benchmark.csv"
+
+COLUMNS = [
+    "nationality",
+    "names",
+    "seconds",
+    "names_per_sec",
+    "ms_per_name",
+    "draws",
+    "retries",
+    "retry_rate",
+    "unique_names",
+    "surname_borrowed",
+    "given_pool_empty",
+    "placeholder_names",
+    "local_pool_fallback",
+    "origin_unusable_weight",
+    "heritage_groups",
+    "peak_kib",
+]
+
+
+class _CountingSet(set):
+    """``used_names`` that counts membership checks (one per draw in the retry loops)."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.checks = 0
+
+    def __contains__(self, item: object) -> bool:
+        self.checks += 1
+        return super().__contains__(item)
+
+
+def _origin_unusable_weight(nationality: str) -> float:
+    """Expected share of heritage origin draws redirected because the pool has no given names."""
+    groups = name_data.HERITAGE_CONFIG.get(nationality) or {}
+    total = 0.0
+    redirected = 0.0
+    for group, cfg in groups.items():
+        gw = float(cfg.get("weight", 0.0))
+        if gw <= 0:
+            continue
+        cands = _origin_pool_candidates(nationality, group)
+        if cands is None:
+            continue
+        pool_ids, weights, usable, _fallback = cands
+        wsum = sum(weights) or 1.0
+        total += gw
+        redirected += gw * sum(w for p, w in zip(pool_ids, weights) if p not in usable) / wsum
+    return redirected / total if total > 0 else 0.0
+
+
+def bench_nationality(nationality: str, count: int, mode: str, track_memory: bool) -> Dict:
+    used = _CountingSet()
+    debugs: List[Dict[str, str]] = []
+    names: List[str] = []
+
+    if track_memory:
+        tracemalloc.start()
+    t0 = time.perf_counter()
+    if mode == "batch":
+        out = generate_names_batch(nationality, count, used_names=used, name_pool_debug=debugs)
+        names = [n.display_full for n in out]
+    else:
+        for _ in range(count):
+            dbg: Dict[str, str] = {}
+            names.append(generate_name(nationality, used_names=used, name_pool_debug=dbg).display_full)
+            debugs.append(dbg)
+    elapsed = time.perf_counter() - t0
+    peak_kib = 0.0
+    if track_memory:
+        _cur, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peak_kib = peak / 1024.0
+
+    draws = used.checks
+    surname_borrowed = sum(1 for d in debugs if "surname_sampled_from_pool_id" in d)
+    given_pool_empty = sum(
+        1
+        for d in debugs
+        if d.get("given_pool_id") and not pool_has_names(d["given_pool_id"], "given_names_male")
+    )
+    placeholders = sum(1 for n in names if "NoFirstName" in n or "NoLastName" in n)
+    plan = selection_plan(nationality)
+    groups = name_data.HERITAGE_CONFIG.get(nationality) or {}
+
+    return {
+        "nationality": nationality,
+        "names": count,
+        "seconds": round(elapsed, 4),
+        "names_per_sec": round(count / elapsed, 1) if elapsed > 0 else 0.0,
+        "ms_per_name": round(1000.0 * elapsed / count, 4) if count else 0.0,
+        "draws": draws,
+        "retries": max(0, draws - count),
+        "retry_rate": round(max(0, draws - count) / count, 4) if count else 0.0,
+        "unique_names": len(set(names)),
+        "surname_borrowed": surname_borrowed,
+        "given_pool_empty": given_pool_empty,
+        "placeholder_names": placeholders,
+        "local_pool_fallback": int(plan.local is None),
+        "origin_unusable_weight": round(_origin_unusable_weight(nationality), 4),
+        "heritage_groups": len(groups),
+        "peak_kib": round(peak_kib, 1),
+    }
+
+
+def _sort_key(column: str):
+    def key(row: Dict):
+        v = row.get(column)
+        return (v is None, v)
+
+    return key
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--count", "-k", type=int, default=200, help="names per nationality")
+    ap.add_argument("--mode", choices=("batch", "single"), default="batch")
+    ap.add_argument("--nationalities", nargs="*", help="subset of nationality codes")
+    ap.add_argument("--seed", type=int, default=None)
+    ap.add_argument("--memory", action="store_true", help="trace peak memory per nationality")
+    ap.add_argument("--profile", action="store_true", help="print cProfile summary")
+    ap.add_argument("--sort", default="names_per_sec", choices=COLUMNS)
+    ap.add_argument("--desc", action="store_true", help="sort descending")
+    ap.add_argument("--top", type=int, default=20, help="rows printed to stdout")
+    ap.add_argument("--out", type=Path, default=DEFAULT_OUT)
+    args = ap.parse_args()
+
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    nations: Set[str] = set(name_data.COUNTRY_FEDERATION.keys()) | set(name_data.HERITAGE_CONFIG.keys())
+    if args.nationalities:
+        nations = {n.strip().upper() for n in args.nationalities if n.strip()}
+    codes = sorted(nations)
+
+    profiler = cProfile.Profile() if args.profile else None
+    rows: List[Dict] = []
+    t0 = time.perf_counter()
+    if profiler:
+        profiler.enable()
+    for code in codes:
+        rows.append(bench_nationality(code, max(1, args.count), args.mode, args.memory))
+    if profiler:
+        profiler.disable()
+    total = time.perf_counter() - t0
+
+    rows.sort(key=_sort_key(args.sort), reverse=args.desc)
+
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.out, "w", newline="", encoding="utf-8") as f:
+        w = csv.DictWriter(f, fieldnames=COLUMNS)
+        w.writeheader()
+        w.writerows(rows)
+
+    total_names = sum(r["names"] for r in rows)
+    total_retries = sum(r["retries"] for r in rows)
+    print(
+        f"{len(rows)} nationalities, {total_names} names ({args.mode}) in {total:.2f}s "
+        f"-> {total_names / total:.0f} names/sec, {total_retries} retries"
+    )
+    print(
+        "fallbacks: "
+        f"surname_borrowed={sum(r['surname_borrowed'] for r in rows)} "
+        f"given_pool_empty={sum(r['given_pool_empty'] for r in rows)} "
+        f"placeholder_names={sum(r['placeholder_names'] for r in rows)} "
+        f"local_pool_fallback={sum(r['local_pool_fallback'] for r in rows)} nations"
+    )
+    shown = ["nationality", "names_per_sec", "ms_per_name", "retries", "surname_borrowed",
+             "placeholder_names", "origin_unusable_weight"]
+    if args.memory:
+        shown.append("peak_kib")
+    print("\n| " + " | ".join(shown) + " |")
+    print("|" + "|".join(["---"] * len(shown)) + "|")
+    for r in rows[: max(0, args.top)]:
+        print("| " + " | ".join(str(r[c]) for c in shown) + " |")
+    print(f"\nWrote {args.out}")
+
+    if profiler:
+        buf = io.StringIO()
+        pstats.Stats(profiler, stream=buf).sort_stats("cumulative").print_stats(25)
+        print(buf.getvalue())
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Build the pre-encoded variants served by /gfx (see utils/gfx_assets.py).
+
+Large PNGs (kit masks, icons, ...) get a lossless WebP and optionally an AVIF; SVG / JSON get
+gzip. Variants are written to GFX_CACHE_DIR/variants (default .gfx_cache/) keyed by the
+source's content hash, so re-running only encodes new or edited assets. Needs Pillow.
+
+Run from repo root:
+  python scripts/build_gfx_assets.py
+  python scripts/build_gfx_assets.py --prefix kit_templates --prefix sponsors --avif
+  python scripts/build_gfx_assets.py --prune
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from utils.gfx_assets import (  # noqa: E402
+    GZIP_VARIANT_SOURCES,
+    IMAGE_VARIANT_SOURCES,
+    VARIANT_DIR,
+    VARIANT_MIN_BYTES,
+    build_variants,
+    iter_gfx_assets,
+    prune_variants,
+)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--prefix", action="append", default=[], help="gfx-relative folder (repeatable; default: all)")
+    ap.add_argument("--no-webp", action="store_true", help="skip WebP variants")
+    ap.add_argument("--avif", action="store_true", help="also build AVIF variants (slow to encode)")
+    ap.add_argument("--avif-quality", type=int, default=80)
+    ap.add_argument("--min-bytes", type=int, default=VARIANT_MIN_BYTES, help="smallest PNG to re-encode")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--force", action="store_true", help="re-encode existing variants")
+    ap.add_argument("--prune", action="store_true", help="delete variants of removed / edited assets")
+    args = ap.parse_args()
+
+    if args.prune:
+        print(f"Pruned {prune_variants()} stale variants from {VARIANT_DIR}")
+
+    rels = [
+        rel
+        for rel in iter_gfx_assets(args.prefix)
+        if rel.lower().endswith(GZIP_VARIANT_SOURCES)
+        or (rel.lower().endswith(IMAGE_VARIANT_SOURCES) and os.path.getsize(ROOT / "gfx" / rel) >= args.min_bytes)
+    ]
+    print(f"{len(rels)} assets to check -> {VARIANT_DIR}", flush=True)
+
+    kwargs = dict(
+        webp=not args.no_webp,
+        avif=args.avif,
+        avif_quality=args.avif_quality,
+        min_bytes=args.min_bytes,
+        force=args.force,
+    )
+    started = time.perf_counter()
+    written = failed = 0
+    with ProcessPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        futures = {pool.submit(build_variants, rel, **kwargs): rel for rel in rels}
+        for fut in as_completed(futures):
+            rel = futures[fut]
+            try:
+                out = fut.result()
+            except Exception as e:
+                failed += 1
+                print(f"  FAILED {rel}: {e}", flush=True)
+                continue
+            if out:
+                written += len(out)
+                print(f"  {rel}: {', '.join(Path(p).suffix for p in out)}", flush=True)
+
+    print(f"Wrote {written} variants ({failed} failed) in {time.perf_counter() - started:.1f}s")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
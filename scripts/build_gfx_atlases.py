@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Build the sprite atlases served by /gfx-atlas (see utils/gfx_atlas.py).
+
+Packs gfx/flags and gfx/crests into WebP atlases and gfx/icons into an SVG symbol sheet,
+each with a JSON coordinate map, under GFX_CACHE_DIR/atlases (default .gfx_cache/).
+Atlases whose sources did not change are left alone. The server rebuilds stale atlases on
+first request anyway; run this at deploy time so no request pays for it. Needs Pillow.
+
+Run from repo root:
+  python scripts/build_gfx_atlases.py
+  python scripts/build_gfx_atlases.py --name flags --force
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from utils.gfx_atlas import ATLAS_DIR, ATLASES, build_atlas  # noqa: E402
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--name", action="append", choices=sorted(ATLASES), help="atlas to build (repeatable; default: all)")
+    ap.add_argument("--force", action="store_true", help="rebuild even if the sources are unchanged")
+    args = ap.parse_args()
+
+    print(f"Building atlases -> {ATLAS_DIR}", flush=True)
+    failed = 0
+    for name in args.name or sorted(ATLASES):
+        started = time.perf_counter()
+        try:
+            atlas = build_atlas(name, force=args.force)
+        except Exception as e:
+            failed += 1
+            print(f"  FAILED {name}: {e}", flush=True)
+            continue
+        size = f" {atlas['width']}x{atlas['height']}" if "width" in atlas else ""
+        print(
+            f"  {name}: {len(atlas['sprites'])} sprites{size} -> {atlas['image']} "
+            f"({time.perf_counter() - started:.1f}s)",
+            flush=True,
+        )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Pre-warm the profile picture thumbnails served by /gfx-thumb (see utils/gfx_thumbs.py).
+
+Encodes the WebP thumbnails of every picture in the given buckets (gfx/player_profile_pics/
+<bucket>) at the given widths into GFX_CACHE_DIR/thumbs (default .gfx_cache/), so the first
+page view of a bucket does not pay for them. Existing thumbnails are left alone; the cache's
+size bound (GFX_THUMB_CACHE_MB) still applies. Needs Pillow.
+
+Run from repo root:
+  python scripts/build_gfx_thumbs.py
+  python scripts/build_gfx_thumbs.py --bucket AfricaEast --bucket Nordic --width 192
+  python scripts/build_gfx_thumbs.py --list
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from utils.gfx_thumbs import (  # noqa: E402
+    THUMB_DIR,
+    THUMB_WIDTHS,
+    iter_bucket_pictures,
+    prewarm_thumbnails,
+    thumb_buckets,
+)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--bucket", action="append", default=[], help="bucket name or gfx-relative folder (repeatable; default: all)")
+    ap.add_argument("--width", action="append", type=int, choices=THUMB_WIDTHS, help="thumbnail width (repeatable; default: all)")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--list", action="store_true", help="list the buckets and exit")
+    args = ap.parse_args()
+
+    if args.list:
+        for bucket in thumb_buckets():
+            print(bucket)
+        return 0
+
+    widths = tuple(args.width or THUMB_WIDTHS)
+    started = time.perf_counter()
+    failed = total = 0
+    print(f"Pre-warming {', '.join(map(str, widths))}px thumbnails -> {THUMB_DIR}", flush=True)
+    with ProcessPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        by_bucket: dict[str, list[str]] = {}
+        for rel in iter_bucket_pictures(args.bucket):
+            by_bucket.setdefault(rel.rpartition("/")[0], []).append(rel)
+        futures = {pool.submit(prewarm_thumbnails, rels, widths): bucket for bucket, rels in by_bucket.items()}
+        for fut in as_completed(futures):
+            bucket = futures[fut]
+            try:
+                count = fut.result()
+            except Exception as e:
+                failed += 1
+                print(f"  FAILED {bucket}: {e}", flush=True)
+                continue
+            total += count
+            print(f"  {bucket}: {count} thumbnails", flush=True)
+
+    print(f"Checked {total} thumbnails ({failed} buckets failed) in {time.perf_counter() - started:.1f}s")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
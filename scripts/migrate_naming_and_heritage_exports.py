@@ -2,7 +2,8 @@
 """
 One-time / repeatable migration:
   - Rename data/name_pools/<CODE>.json -> country_<CODE>.json and add pool_id.
-  - Write data/heritage_composition/local_core_naming_pools_generated.json (regenerated from the .txt).
+  - Write data/heritage_composition/local_core_naming_pools_generated.json (regenerated from the .txt)
+    and data/country_federation.json (the app no longer writes these at import).
     Note: `data/heritage_composition/local_core_naming_pools.json` is treated as frozen manual data
     and will only be created if it does not exist yet.
   - Write data/heritage_composition/heritage_groups_export.json (snapshot from composition).
@@ -27,6 +28,7 @@ if str(_REPO) not in sys.path:
 from utils.heritage_composition import (  # noqa: E402
     build_heritage_groups_from_rows,
     build_local_core_naming_pools,
+    export_composition_json,
     load_composition_rows,
 )
 
@@ -65,22 +67,15 @@ def main() -> None:
     n_migrated = migrate_name_pool_files()
     print(f"Migrated / reconciled name pool files: {n_migrated}")
 
-    local_core = build_local_core_naming_pools(rows)
     out_dir = _REPO / "data" / "heritage_composition"
     out_dir.mkdir(parents=True, exist_ok=True)
-    generated_path = out_dir / "local_core_naming_pools_generated.json"
-    generated_path.write_text(
-        json.dumps(local_core, indent=2, ensure_ascii=False, sort_keys=True) + "\n",
-        encoding="utf-8",
-    )
-    print(f"Wrote {generated_path} ({len(local_core)} nationalities)")
-
     frozen_path = out_dir / "local_core_naming_pools.json"
-    if not frozen_path.is_file() or frozen_path.stat().st_size == 0:
-        frozen_path.write_text(
-            json.dumps(local_core, indent=2, ensure_ascii=False, sort_keys=True) + "\n",
-            encoding="utf-8",
-        )
+    had_frozen = frozen_path.is_file() and frozen_path.stat().st_size > 0
+    export_composition_json(rows)
+    local_core = build_local_core_naming_pools(rows)
+    print(f"Wrote {out_dir / 'local_core_naming_pools_generated.json'} ({len(local_core)} nationalities)")
+    print(f"Wrote {_REPO / 'data' / 'country_federation.json'}")
+    if not had_frozen:
         print(f"Backfilled frozen {frozen_path}")
 
     heritage = build_heritage_groups_from_rows(rows)
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Run background job workers (utils/job_queue.py) as their own process / service.
+
+The API starts JOB_WORKERS workers itself; set JOB_WORKERS=0 there and run this instead to
+scale workers separately (e.g. a second Railway service with the same DATABASE_URL). Without
+DATABASE_URL the workers use the SQLite stand-in queue, but jobs that work on the youth
+academy in-memory store need the API's own workers.
+
+Run from repo root:
+  python scripts/run_job_worker.py
+  python scripts/run_job_worker.py --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import multiprocessing
+import signal
+import sys
+import threading
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from utils.job_queue import run_worker, run_worker_process  # noqa: E402
+
+
+_LOG_FORMAT = "%(asctime)s %(processName)s %(levelname)s %(message)s"
+
+
+def _worker(stop) -> None:
+    # Spawned processes start with default logging
+    logging.basicConfig(level=logging.INFO, format=_LOG_FORMAT)
+    run_worker_process(stop)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--workers", type=int, default=1, help="worker processes")
+    args = ap.parse_args()
+    logging.basicConfig(level=logging.INFO, format=_LOG_FORMAT)
+
+    ctx = multiprocessing.get_context("spawn")
+    # A multiprocessing Event cannot be set from a signal handler interrupting its own wait()
+    # (notify_all waits for the sleeper), so the in-process worker gets a threading Event
+    stop = threading.Event() if args.workers <= 1 else ctx.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    if args.workers <= 1:
+        try:
+            run_worker(stop, follow_name_data=True)
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    workers = [ctx.Process(target=_worker, args=(stop,), name=f"job-worker-{i}") for i in range(args.workers)]
+    for worker in workers:
+        worker.start()
+    try:
+        for worker in workers:
+            worker.join()
+    except KeyboardInterrupt:
+        stop.set()
+        for worker in workers:
+            worker.join()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Season rollover: train every player of a game mode for a week or a season, in bulk.
+
+Streams players from Postgres in chunks, trains them with the vectorized engine and writes
+attributes / age columns back per chunk (see utils/season_rollover.py). Progress is stored in
+training_runs; rerun with --resume <run_id> after a failure or interruption.
+
+Run from repo root (DATABASE_URL must be set):
+  python scripts/run_training_rollover.py --game-mode <uuid> --weeks 10
+  python scripts/run_training_rollover.py --weeks 1 --no-offseason --game-mode <uuid>
+  python scripts/run_training_rollover.py --resume <run_id>   # failed or interrupted run, same programme mix
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from uuid import UUID
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from utils.season_rollover import DEFAULT_CHUNK_SIZE, TrainingRunConflict, run_training_rollover  # noqa: E402
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--game-mode", type=UUID, help="game_modes.id to train")
+    ap.add_argument("--weeks", type=int, default=10, help="training weeks per player (season = 10)")
+    ap.add_argument("--no-offseason", action="store_true", help="skip the +2 month off-season tick")
+    ap.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    ap.add_argument("--resume", type=UUID, help="training run id to continue")
+    args = ap.parse_args()
+
+    if args.resume is None and args.game_mode is None:
+        ap.error("--game-mode is required unless --resume is given")
+
+    def report(summary):
+        total = summary["players_total"] or 0
+        print(
+            f"  {summary['players_processed']}/{total} players "
+            f"({summary['players_per_sec'] or 0:.0f} players/sec)",
+            flush=True,
+        )
+
+    try:
+        summary = run_training_rollover(
+            args.game_mode,
+            weeks=args.weeks,
+            offseason=not args.no_offseason,
+            chunk_size=args.chunk_size,
+            resume_run_id=args.resume,
+            progress=report,
+        )
+    except TrainingRunConflict as e:
+        print(f"Not started: {e}", file=sys.stderr)
+        return 1
+    print(f"Training run {summary['id']}: {summary['status']}, {summary['players_processed']} players")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
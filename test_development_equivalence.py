@@ -0,0 +1,99 @@
+"""
+Vectorized player development against the scalar code it replaces (seeded, so every run is
+identical; the two draw random numbers differently, so distributions are compared):
+
+- birth development: ``apply_birth_development_batch`` vs ``apply_birth_development``
+- training: ``train_one_season_vectorized`` vs ``train_one_season_with_growth``
+
+Run from repo root (no database needed; the suite is also collectable by pytest):
+  python test_development_equivalence.py
+"""
+
+import random
+import statistics
+from types import SimpleNamespace
+
+import numpy as np
+
+from match_engine.constants import GOALKEEPER_ATTRS, OUTFIELD_ATTRS
+from utils.player_development import compile_growth_schedule, train_one_season_with_growth
+from utils.player_generation import apply_birth_development, apply_birth_development_batch
+from utils.training_engine import train_one_season_vectorized
+
+# Means of seeded samples may differ by this much (relative) between the two implementations
+_MEAN_TOLERANCE = 0.03
+
+
+def _close(a: float, b: float, tolerance: float = _MEAN_TOLERANCE) -> bool:
+    return abs(a - b) <= tolerance * max(abs(a), abs(b), 1e-9)
+
+
+def test_batch_birth_development_matches_scalar_distribution():
+    for is_gk, attrs_list in ((False, OUTFIELD_ATTRS), (True, GOALKEEPER_ATTRS)):
+        potentials = [1000 + 5 * i for i in range(400)]
+        random.seed(31)
+        scalar = [apply_birth_development(is_gk, p, 0.2) for p in potentials]
+        attrs, nominal, assigned, names = apply_birth_development_batch(
+            is_gk, potentials, [0.2] * len(potentials), rng=np.random.default_rng(31)
+        )
+        assert names == list(attrs_list)
+        assert attrs.min() >= 1 and attrs.max() <= 20
+        assert _close(statistics.mean(sum(a.values()) for a, _, _ in scalar), float(attrs.sum(axis=1).mean()))
+        assert _close(statistics.mean(n for _, n, _ in scalar), float(nominal.mean()))
+        assert _close(statistics.mean(a for _, _, a in scalar), float(assigned.mean()))
+
+
+def _squad(n: int):
+    players = []
+    for i in range(n):
+        is_gk = i % 10 == 0
+        players.append(SimpleNamespace(
+            id=f"p{i}",
+            potential=1500 + 10 * (i % 50),
+            base_training_pct=0.40,
+            growth_training_pct=0.45,
+            attributes={a: 6 for a in (GOALKEEPER_ATTRS if is_gk else OUTFIELD_ATTRS)},
+            training_age_weeks=1,
+            actual_age_months=16 * 12 + 1,
+            is_goalkeeper=is_gk,
+        ))
+    return players
+
+
+def test_vectorized_training_matches_scalar_distribution():
+    overrides = {
+        f"p{i}": {"primary_program": "Balanced", "primary_share": 0.6, "secondary_program": "Balanced",
+                  "secondary_share": 0.2, "general_share": 0.2}
+        for i in range(0, 300, 3)
+    }
+    results = []
+    for train_season in (train_one_season_with_growth, train_one_season_vectorized):
+        random.seed(33)
+        np.random.seed(33)
+        players = _squad(300)
+        growth = {p.id: compile_growth_schedule(2.0, 22.0, total_weeks=160) for p in players}
+        carries = {}
+        for _ in range(3):
+            totals = train_season(
+                players, growth, carries,
+                primary_program="Balanced", secondary_program="Balanced",
+                training_facilities_level=7, program_overrides=overrides,
+            )
+        assert all(1 <= v <= 20 for p in players for v in p.attributes.values())
+        assert all(p.training_age_weeks == 31 for p in players)
+        results.append((
+            statistics.mean(sum(p.attributes.values()) for p in players),
+            statistics.mean(n for n, _ in totals.values()),
+            statistics.mean(a for _, a in totals.values()),
+        ))
+    for scalar, vectorized in zip(*results):
+        assert _close(scalar, vectorized)
+
+
+if __name__ == "__main__":
+    for test in (
+        test_batch_birth_development_matches_scalar_distribution,
+        test_vectorized_training_matches_scalar_distribution,
+    ):
+        test()
+        print(f"[OK] {test.__name__}")
@@ -0,0 +1,100 @@
+"""
+Latency check: / and /db-check must stay fast while a heavy workbench job runs.
+
+Starts a large test-bench batch simulation (offloaded to the cpu process pool, see
+utils/execution.py) and probes the health endpoints until it finishes. Before the execution
+layer the batch ran on the event loop and every probe waited for the whole batch.
+
+Run from repo root (no database needed; the suite is also collectable by pytest):
+  python test_endpoint_latency.py
+  python test_endpoint_latency.py --matches 500 --max-ms 250
+"""
+
+import argparse
+import statistics
+import threading
+import time
+
+from fastapi.testclient import TestClient
+
+from main import app
+from match_engine.constants import GOALKEEPER_ATTRS, OUTFIELD_ATTRS
+
+_POSITIONS = ["GK", "DL", "DC", "DC", "DR", "ML", "MC", "MC", "MR", "FC", "FC"]
+
+
+def _team(name: str, rating: int) -> dict:
+    players = []
+    for i, position in enumerate(_POSITIONS):
+        is_gk = position == "GK"
+        attrs = GOALKEEPER_ATTRS if is_gk else OUTFIELD_ATTRS
+        players.append({
+            "name": f"{name} Player {i + 1}",
+            "position": position,
+            "attributes": {attr: rating for attr in attrs},
+            "is_goalkeeper": is_gk,
+        })
+    return {"name": name, "players": players}
+
+
+def measure_latency_under_load(num_matches: int = 300, probe_interval: float = 0.05) -> dict:
+    """Probe / and /db-check while a ``num_matches`` batch simulation runs; latencies in ms."""
+    payload = {"home_team": _team("Home", 12), "away_team": _team("Away", 8), "num_matches": num_matches}
+    latencies = {"/": [], "/db-check": []}
+    job = {}
+
+    with TestClient(app) as client:
+        def run_job():
+            started = time.perf_counter()
+            job["status"] = client.post("/api/test-bench/simulate", json=payload).status_code
+            job["seconds"] = time.perf_counter() - started
+
+        worker = threading.Thread(target=run_job)
+        worker.start()
+        time.sleep(0.2)  # let the job get going
+        while worker.is_alive():
+            for path, samples in latencies.items():
+                started = time.perf_counter()
+                assert client.get(path).status_code == 200
+                samples.append((time.perf_counter() - started) * 1000)
+            time.sleep(probe_interval)
+        worker.join()
+
+    return {"job": job, "latencies": latencies}
+
+
+def _p95(samples):
+    return sorted(samples)[max(0, int(len(samples) * 0.95) - 1)]
+
+
+def test_health_endpoints_stay_fast_under_heavy_job(num_matches: int = 300, max_ms: float = 250.0):
+    result = measure_latency_under_load(num_matches)
+    assert result["job"]["status"] == 200, result["job"]
+    for path, samples in result["latencies"].items():
+        assert samples, f"no probes of {path} completed while the job ran"
+        assert _p95(samples) < max_ms, f"{path} p95 {_p95(samples):.0f}ms >= {max_ms:.0f}ms"
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--matches", type=int, default=300, help="batch size of the heavy job")
+    ap.add_argument("--max-ms", type=float, default=250.0, help="p95 budget for the health endpoints")
+    args = ap.parse_args()
+
+    result = measure_latency_under_load(args.matches)
+    job = result["job"]
+    print(f"Batch of {args.matches} matches: HTTP {job['status']} in {job['seconds']:.1f}s")
+    failed = job["status"] != 200
+    for path, samples in result["latencies"].items():
+        if not samples:
+            print(f"  {path}: no probes completed while the job ran")
+            failed = True
+            continue
+        p95 = _p95(samples)
+        print(
+            f"  {path}: {len(samples)} probes, median {statistics.median(samples):.1f}ms, "
+            f"p95 {p95:.1f}ms, max {max(samples):.1f}ms"
+        )
+        failed = failed or p95 >= args.max_ms
+    print("FAIL" if failed else "OK")
+    raise SystemExit(1 if failed else 0)
@@ -0,0 +1,93 @@
+"""
+Precomputed gfx lookups against the filesystem scans they replace, on the real gfx/ tree:
+
+- the asset catalog (utils/gfx_catalog.py) vs os.walk / os.listdir
+- the heritage picture-folder table vs the slow resolution on a fresh scan
+- the profile-picture filename index vs os.path.isfile over every bucket
+
+Run from repo root (no database needed; the suite is also collectable by pytest):
+  python test_gfx_lookups.py
+"""
+
+import os
+import random
+
+from utils.gfx_catalog import GFX_ROOT, build_gfx_catalog, get_gfx_catalog, is_profile_image
+from utils.youth_academy import (
+    _build_gfx_folder_map,
+    _resolve_picture_folder,
+    _true_player_profile_pics_rel,
+    get_picture_folder_table,
+    get_profile_pic_file_index,
+    get_profile_picture_folder,
+    resolve_profile_pic_folder_for_display,
+    resolve_profile_pic_folders_for_display,
+)
+
+
+def test_catalog_matches_listdir():
+    catalog = get_gfx_catalog()
+    for dirpath, dirnames, filenames in os.walk(GFX_ROOT):
+        key = os.path.relpath(dirpath, GFX_ROOT).replace(os.sep, "/")
+        key = "" if key == "." else key
+        assert catalog.files[key] == tuple(sorted(filenames)), key
+        assert catalog.folder_subfolders(key) == tuple(sorted(dirnames)), key
+        assert catalog.folder_images(key) == tuple(sorted(f for f in filenames if is_profile_image(f))), key
+
+
+def test_picture_folder_table_matches_slow_resolution():
+    from utils import name_data
+    from utils.profile_picture_hairstyles import roll_player_profile_pics_rel
+
+    fresh = build_gfx_catalog(GFX_ROOT)
+    folder_map = _build_gfx_folder_map()
+    table = get_picture_folder_table()
+    for hg, picture_folder in name_data.HERITAGE_PICTURE_FOLDER_MAP.items():
+        expected, roll = _resolve_picture_folder(picture_folder, fresh, folder_map) if picture_folder else (None, False)
+        assert get_profile_picture_folder(hg) == expected, hg
+        if expected is None:
+            assert hg in table.unmatched
+            continue
+        assert any(is_profile_image(f) for f in os.listdir(os.path.join(GFX_ROOT, *expected.split("/")))), expected
+        if not roll:
+            continue
+        for seed, nationality in enumerate(("NGA", "BRA", "USA")):
+            random.seed(seed)
+            state = random.getstate()
+            got = get_profile_picture_folder(hg, nationality)
+            random.setstate(state)
+            rolled = roll_player_profile_pics_rel(expected, nationality)
+            mapped = _true_player_profile_pics_rel(GFX_ROOT, rolled) or rolled
+            assert got == (mapped if rolled != expected and fresh.has_images(mapped) else expected), (hg, nationality)
+
+
+def test_filename_index_matches_isfile_scan():
+    pics = os.path.join(GFX_ROOT, "player_profile_pics")
+    buckets = sorted(d for d in os.listdir(pics) if os.path.isdir(os.path.join(pics, d)))
+    names = {f for b in buckets for f in os.listdir(os.path.join(pics, b)) if is_profile_image(f)}
+    index = get_profile_pic_file_index()
+    for name in names:
+        found = [f"player_profile_pics/{b}" for b in buckets if os.path.isfile(os.path.join(pics, b, name))]
+        if len(found) == 1:
+            assert index.folder_by_file.get(name) == found[0], name
+        else:
+            assert name not in index.folder_by_file and index.collisions[name] == tuple(found), name
+
+    # The list resolution gives the per-row answers (stored folder right, wrong or missing)
+    sample = sorted(names)[::25]
+    rows = []
+    for i, name in enumerate(sample):
+        stored = [None, index.folder_by_file.get(name), "player_profile_pics/Nowhere"][i % 3]
+        rows.append(("BritishIsles" if i % 2 else None, name, stored))
+    rows.append((None, None, None))
+    assert resolve_profile_pic_folders_for_display(rows) == [resolve_profile_pic_folder_for_display(*r) for r in rows]
+
+
+if __name__ == "__main__":
+    for test in (
+        test_catalog_matches_listdir,
+        test_picture_folder_table_matches_slow_resolution,
+        test_filename_index_matches_isfile_scan,
+    ):
+        test()
+        print(f"[OK] {test.__name__}")
@@ -0,0 +1,184 @@
+"""
+Job queue checks (utils/job_queue.py): claiming, re-queueing a job whose worker was lost
+(its partial results continue after the earlier attempt's), cancelling queued and running
+jobs, and a spawned worker process whose handler uses the ``cpu`` process pool.
+
+Runs against a throwaway SQLite queue (no database needed; the suite is also collectable by
+pytest). Run from repo root:
+  python test_job_queue.py
+"""
+
+import os
+import tempfile
+import time
+from datetime import timedelta
+from uuid import UUID, uuid4
+
+from utils import job_queue
+
+_HANDLER_MODULE = __name__ if __name__ != "__main__" else "test_job_queue"
+# Removed at exit; every test gets its own queue file in it
+_TMP_DIR = tempfile.TemporaryDirectory(prefix="job-queue-test-")
+
+
+def handle_partials(params, db):
+    """Reports ``params["partials"]`` partial results, then returns how many it reported."""
+    for i in range(params["partials"]):
+        job_queue.report_progress(i + 1, params["partials"], partial={"step": i + 1})
+    return {"reported": params["partials"]}
+
+
+def handle_cpu_pool(params, db):
+    """Runs one call on the cpu process pool (needs a non-daemonic worker process)."""
+    from utils.execution import get_executor
+
+    return {"value": get_executor("cpu").submit(abs, params["value"]).result()}
+
+
+def _use_temp_queue() -> str:
+    """Point the queue at a fresh SQLite file and register the test handlers."""
+    path = os.path.join(_TMP_DIR.name, f"jobs-{uuid4().hex}.sqlite3")
+    os.environ["JOB_QUEUE_SQLITE_PATH"] = path  # for spawned workers
+    job_queue.JOB_QUEUE_SQLITE_PATH = path
+    job_queue._ENGINE = None
+    job_queue._SESSION_FACTORY = None
+    job_queue.JOB_HANDLERS["test_partials"] = f"{_HANDLER_MODULE}:handle_partials"
+    job_queue.JOB_HANDLERS["test_cpu_pool"] = f"{_HANDLER_MODULE}:handle_cpu_pool"
+    return path
+
+
+def _make_stale(job_id) -> None:
+    """What a worker that died mid-job leaves behind: running, with an old heartbeat."""
+    from models import Job
+
+    db = job_queue._session()
+    try:
+        db.query(Job).filter(Job.id == job_id).update(
+            {"status": "running", "heartbeat_at": job_queue._now() - job_queue._STALE_AFTER - timedelta(seconds=1)},
+            synchronize_session=False,
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def _drain() -> None:
+    while job_queue._claim("drain") is not None:
+        pass
+
+
+def test_claim_takes_oldest_queued_job_once():
+    _use_temp_queue()
+    first = job_queue.submit_job("test_partials", {"partials": 0})
+    time.sleep(0.01)
+    second = job_queue.submit_job("test_partials", {"partials": 0})
+
+    claimed = [job_queue._claim("w1"), job_queue._claim("w2")]
+    assert [str(c[0]) for c in claimed] == [first["job_id"], second["job_id"]]
+    assert job_queue._claim("w3") is None
+    job = job_queue.get_job(claimed[0][0])
+    assert job["status"] == "running" and job["attempts"] == 1
+
+
+def test_requeued_job_continues_partials():
+    _use_temp_queue()
+    job_queue.submit_job("test_partials", {"partials": 2})
+    job_id, kind, params, partials_count = job_queue._claim("w1")
+    assert partials_count == 0
+    job_queue.run_job(job_id, kind, params, partials_count)
+
+    # The worker "dies": the job is re-queued and runs again from the start
+    _make_stale(job_id)
+    job_queue._maintenance()
+    assert job_queue.get_job(job_id)["status"] == "queued"
+    claimed = job_queue._claim("w2")
+    assert claimed[0] == job_id and claimed[3] == 2
+    job_queue.run_job(*claimed)
+
+    job = job_queue.get_job(job_id, since=0)
+    assert job["status"] == "completed", job["error"]
+    assert job["attempts"] == 2
+    assert [p["seq"] for p in job["partials"]] == [1, 2, 3, 4]
+    assert [p["seq"] for p in job_queue.get_job(job_id, since=2)["partials"]] == [3, 4]
+
+    # Lost again after the last attempt: failed, not re-queued
+    _make_stale(job_id)
+    job_queue._maintenance()
+    job = job_queue.get_job(job_id)
+    assert job["status"] == "failed" and job["error"] == "Worker lost"
+
+
+def test_cancel_queued_and_running_jobs():
+    _use_temp_queue()
+    queued = job_queue.submit_job("test_partials", {"partials": 1})
+    assert job_queue.cancel_job(UUID(queued["job_id"]))["status"] == "cancelled"
+    assert job_queue._claim("w1") is None
+
+    job_queue.submit_job("test_partials", {"partials": 3})
+    job_id, kind, params, partials_count = job_queue._claim("w1")
+    assert job_queue.cancel_job(job_id)["status"] == "running"
+    # The handler stops at its first progress report
+    job_queue.run_job(job_id, kind, params, partials_count)
+    job = job_queue.get_job(job_id, since=0)
+    assert job["status"] == "cancelled"
+    assert job["result"] is None
+    assert [p["seq"] for p in job["partials"]] == [1]
+    _drain()
+
+
+def _test_worker_process(stop, queue_path: str) -> None:
+    """``run_worker_process`` in a spawned child that also knows the test handlers."""
+    job_queue.JOB_QUEUE_SQLITE_PATH = queue_path
+    job_queue.JOB_HANDLERS["test_cpu_pool"] = f"{_HANDLER_MODULE}:handle_cpu_pool"
+    job_queue.run_worker_process(stop)
+
+
+def test_worker_process_can_use_cpu_pool(timeout: float = 120.0):
+    import multiprocessing
+
+    import database
+
+    path = _use_temp_queue()
+    job_queue._session().close()
+    # The API's process workers (as with a database; the queue stays on SQLite)
+    engine, database.engine = database.engine, object()
+    try:
+        assert job_queue.start_job_workers(1) == 1
+    finally:
+        database.engine = engine
+    api_worker = job_queue._WORKERS[0]
+    started = time.monotonic()
+    job_queue.stop_job_workers(timeout=30.0)
+    assert time.monotonic() - started < 30.0, "worker process did not exit after stop"
+
+    # The same kind of process running a handler that uses the cpu pool
+    submitted = job_queue.submit_job("test_cpu_pool", {"value": -7})
+    ctx = multiprocessing.get_context("spawn")
+    stop = ctx.Event()
+    worker = ctx.Process(target=_test_worker_process, args=(stop, path), daemon=api_worker.daemon)
+    worker.start()
+    try:
+        deadline = time.monotonic() + timeout
+        job = job_queue.get_job(UUID(submitted["job_id"]))
+        while job["status"] in ("queued", "running") and time.monotonic() < deadline:
+            time.sleep(0.5)
+            job = job_queue.get_job(UUID(submitted["job_id"]))
+    finally:
+        stop.set()
+        worker.join(30.0)
+        if worker.is_alive():
+            worker.terminate()
+    assert job["status"] == "completed", job["error"]
+    assert job["result"] == {"value": 7}
+    assert worker.exitcode == 0, "worker process did not exit after stop"
+
+
+if __name__ == "__main__":
+    for test in (
+        test_claim_takes_oldest_queued_job_once,
+        test_requeued_job_continues_partials,
+        test_cancel_queued_and_running_jobs,
+        test_worker_process_can_use_cpu_pool,
+    ):
+        test()
+        print(f"[OK] {test.__name__}")
@@ -0,0 +1,100 @@
+"""
+Incremental attribute-range reveal against the per-attribute scalar code it replaces (small,
+seeded, so every run is identical):
+
+- ``reveal_attribute_ranges`` / ``narrow_attribute_ranges`` vs the per-attribute week 1+
+  narrowing (exhaustive over values, stored ranges and weeks)
+
+Run from repo root (no database needed; the suite is also collectable by pytest):
+  python test_vectorized_equivalence.py
+"""
+
+import random
+
+import numpy as np
+
+from match_engine.constants import GOALKEEPER_ATTRS, OUTFIELD_ATTRS
+from utils.youth_academy import (
+    DEFAULT_REVEAL_WIDTHS,
+    calculate_attribute_ranges,
+    narrow_attribute_ranges,
+    reveal_attribute_ranges,
+)
+
+
+def _scalar_week_range(actual_value, weeks_in_academy, initial_range, reveal_widths=DEFAULT_REVEAL_WIDTHS):
+    """Week 1+ range of one attribute, as the per-attribute loop computed it."""
+    week_idx = min(weeks_in_academy, len(reveal_widths) - 1)
+    width_pct = reveal_widths[week_idx]
+    if initial_range:
+        initial_min, initial_max = initial_range["min"], initial_range["max"]
+    else:
+        max_width = int((20 - 1) * reveal_widths[0])
+        initial_min = max(1, actual_value - max_width // 2)
+        initial_max = min(20, actual_value + max_width // 2)
+    total_weeks = len(reveal_widths) - 1
+    progress = week_idx / total_weeks if total_weeks > 0 else 1.0
+    if progress >= 1.0 or width_pct == 0:
+        return {"min": actual_value, "max": actual_value}
+    min_val = int(initial_min + (actual_value - initial_min) * progress)
+    max_val = int(initial_max - (initial_max - actual_value) * progress)
+    min_val = max(1, min(min_val, actual_value))
+    max_val = min(20, max(max_val, actual_value))
+    return {"min": min(min_val, actual_value), "max": max(max_val, actual_value)}
+
+
+def test_narrowing_matches_scalar_exhaustively():
+    actual, lo, hi, weeks, expected = [], [], [], [], []
+    for value in range(1, 21):
+        for low in range(max(1, value - 6), value + 1):
+            for high in range(value, min(20, low + 6) + 1):
+                for week in range(1, 7):
+                    actual.append(value)
+                    lo.append(low)
+                    hi.append(high)
+                    weeks.append(week)
+                    expected.append(_scalar_week_range(value, week, {"min": low, "max": high}))
+    mins, maxs = narrow_attribute_ranges(
+        np.asarray(actual), np.asarray(lo, dtype=np.float64), np.asarray(hi, dtype=np.float64), np.asarray(weeks)
+    )
+    got = [{"min": a, "max": b} for a, b in zip(mins.tolist(), maxs.tolist())]
+    assert got == expected
+
+
+def test_reveal_matches_scalar_per_player():
+    rng = random.Random(39)
+    players, initials, weeks = [], [], []
+    for i in range(200):
+        attrs = {a: rng.randint(1, 20) for a in (GOALKEEPER_ATTRS if i % 7 == 0 else OUTFIELD_ATTRS)}
+        players.append(attrs)
+        # Some players have no stored initial ranges (symmetric fallback), some only partly
+        initial = None if i % 5 == 0 else calculate_attribute_ranges(attrs, 0)
+        if initial and i % 3 == 0:
+            initial.pop(next(iter(initial)))
+        initials.append(initial)
+        weeks.append(rng.randint(1, 8))
+
+    batch = reveal_attribute_ranges(players, initials, weeks)
+    for attrs, initial, week, got in zip(players, initials, weeks, batch):
+        expected = {a: _scalar_week_range(v, week, (initial or {}).get(a)) for a, v in attrs.items()}
+        assert got == expected
+        assert calculate_attribute_ranges(attrs, week, initial_ranges=initial) == expected
+
+
+def test_initial_ranges_contain_actual_and_are_at_most_6_wide():
+    random.seed(39)
+    for value in range(1, 21):
+        for _ in range(50):
+            r = calculate_attribute_ranges({"x": value}, 0)["x"]
+            assert 1 <= r["min"] <= value <= r["max"] <= 20
+            assert r["max"] - r["min"] <= 6
+
+
+if __name__ == "__main__":
+    for test in (
+        test_narrowing_matches_scalar_exhaustively,
+        test_reveal_matches_scalar_per_player,
+        test_initial_ranges_contain_actual_and_are_at_most_6_wide,
+    ):
+        test()
+        print(f"[OK] {test.__name__}")
@@ -0,0 +1,275 @@
+"""
+Fast development projection: expected attribute curve per season (plus optional percentile
+bands) without running the full chunk-by-chunk training simulation.
+
+The weekly DP budget is deterministic (base pool + growth schedule, times the facility
+multiplier), so only its allocation is random. ``project_development`` propagates the
+expectation: each week's DP is split over attributes by the compiled programme mix (capped
+attributes masked) and scaled by the expected efficiency of the attribute's band
+(1-5: x1.5, 6-15: x1, 16-17: x0.5, 18-19: x0.33). Attribute state is kept as
+value + carry / DP_PER_ATTR_POINT and reported as expected whole points.
+
+Percentile bands come from a Monte Carlo surrogate: per week, chunk counts per attribute are
+one multinomial draw per sample and the band outcomes binomial draws, instead of individual
+chunks. Only the per-season percentiles are cached (per input signature), so repeated UI
+requests are lookups without keeping the sample paths alive.
+
+The projection starts from the player's stored ``train_carry`` (fractional DP not yet turned
+into points) when one is given.
+"""
+
+import math
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from match_engine.constants import GOALKEEPER_ATTRS, OUTFIELD_ATTRS
+
+from .player_development import (
+    compile_growth_schedule,
+    compiled_program_mix,
+    load_train_carry,
+    training_facility_multiplier,
+)
+
+# Week substeps of at most this much DP, so band changes / caps inside big growth weeks count
+_SUBSTEP_DP = 5.0
+_MEAN_CHUNK = 0.3  # mean of uniform(0.1, 0.5) chunks in train_player_week
+
+
+def _expected_efficiency(values: np.ndarray) -> np.ndarray:
+    v = np.floor(values)
+    return np.select([v <= 5, v <= 15, v <= 17, v <= 19], [1.5, 1.0, 0.5, 0.33], default=0.0)
+
+
+def _weekly_dp(
+    potential: float,
+    base_training_pct: float,
+    growth_training_pct: float,
+    growth_shape: float,
+    growth_peak_age: float,
+    training_age_weeks: int,
+    training_facilities_level: int,
+    years: int,
+    season_weeks: int,
+    total_weeks: int,
+) -> np.ndarray:
+    """(years, season_weeks) DP budgets, same pools as train_player_week."""
+    sched = np.asarray(compile_growth_schedule(growth_shape, growth_peak_age, total_weeks=total_weeks))
+    weeks = training_age_weeks + np.arange(years * season_weeks)
+    in_window = weeks < total_weeks
+    idx = np.clip(weeks, 0, total_weeks - 1)
+    dp = np.where(
+        in_window,
+        potential * base_training_pct / total_weeks + potential * growth_training_pct * sched[idx],
+        0.0,
+    )
+    return (dp * training_facility_multiplier(training_facilities_level)).reshape(years, season_weeks)
+
+
+def _expected_path(
+    start: np.ndarray,
+    weights: np.ndarray,
+    dp: np.ndarray,
+    dp_per_point: float,
+) -> np.ndarray:
+    """Expected value + carry/dp_per_point per attribute after each season: (years, A)."""
+    x = start.astype(np.float64).copy()
+    out = np.empty((dp.shape[0], x.size))
+    for y in range(dp.shape[0]):
+        for budget in dp[y]:
+            if budget <= 0:
+                continue
+            n_sub = max(1, int(math.ceil(budget / _SUBSTEP_DP)))
+            step = budget / n_sub
+            for _ in range(n_sub):
+                open_ = x < 20
+                w = np.where(open_, weights, 0.0)
+                total = w.sum()
+                if total <= 0:
+                    if not open_.any():
+                        break
+                    w, total = open_.astype(np.float64), float(open_.sum())
+                x = np.minimum(20.0, x + step * (w / total) * _expected_efficiency(x) / dp_per_point)
+        out[y] = x
+    return out
+
+
+def _sampled_paths(
+    start: Tuple[int, ...],
+    start_carry: Tuple[float, ...],
+    weights: Tuple[float, ...],
+    dp_rows: Tuple[Tuple[float, ...], ...],
+    dp_per_point: float,
+    samples: int,
+    seed: int,
+) -> np.ndarray:
+    """Monte Carlo surrogate: integer attributes after each season, (samples, years, A)."""
+    rng = np.random.default_rng(seed)
+    n_attrs = len(start)
+    attrs = np.tile(np.asarray(start, dtype=np.int64), (samples, 1))
+    carry = np.tile(np.asarray(start_carry, dtype=np.float64), (samples, 1))
+    base_w = np.asarray(weights, dtype=np.float64)
+    out = np.empty((samples, len(dp_rows), n_attrs), dtype=np.int16)
+
+    for y, season in enumerate(dp_rows):
+        for budget in season:
+            if budget < 0.1:
+                continue
+            n_sub = max(1, int(math.ceil(budget / _SUBSTEP_DP)))
+            for _ in range(n_sub):
+                sub = budget / n_sub
+                n_chunks = max(1, int(round(sub / _MEAN_CHUNK)))
+                chunk = sub / n_chunks
+                open_ = attrs < 20
+                w = np.where(open_, base_w, 0.0)
+                tot = w.sum(axis=1, keepdims=True)
+                zero = tot[:, 0] <= 0
+                if zero.any():
+                    w[zero] = open_[zero]
+                    tot = w.sum(axis=1, keepdims=True)
+                live = tot[:, 0] > 0
+                if not live.any():
+                    break
+                p = np.where(live[:, None], w / np.where(tot > 0, tot, 1.0), 1.0 / n_attrs)
+                counts = rng.multinomial(n_chunks, p)
+                counts[~live] = 0
+                hits_half = rng.binomial(counts, 0.5)
+                hits_third = rng.binomial(counts, 0.33)
+                units = np.select(
+                    [attrs <= 5, attrs <= 15, attrs <= 17, attrs <= 19],
+                    [counts + hits_half, counts, hits_half, hits_third],
+                    default=0,
+                )
+                carry += units * chunk
+                points = np.minimum(np.floor(carry / dp_per_point), 20 - attrs).clip(min=0).astype(np.int64)
+                attrs += points
+                carry -= points * dp_per_point
+        out[:, y] = attrs
+    return out
+
+
+@lru_cache(maxsize=512)
+def _sampled_percentiles(
+    start: Tuple[int, ...],
+    start_carry: Tuple[float, ...],
+    weights: Tuple[float, ...],
+    dp_rows: Tuple[Tuple[float, ...], ...],
+    dp_per_point: float,
+    samples: int,
+    seed: int,
+    qs: Tuple[float, ...],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Percentiles ``qs`` of the sampled paths: per attribute (years, Q, A) and of the total (years, Q)."""
+    sampled = _sampled_paths(start, start_carry, weights, dp_rows, dp_per_point, samples, seed)
+    per_attr = np.percentile(sampled, qs, axis=0).transpose(1, 0, 2)
+    totals = np.percentile(sampled.sum(axis=2), qs, axis=0).T
+    per_attr.setflags(write=False)
+    totals.setflags(write=False)
+    return per_attr, totals
+
+
+def project_development(
+    *,
+    potential: float,
+    base_training_pct: float,
+    growth_training_pct: float,
+    growth_shape: float,
+    growth_peak_age: float,
+    is_goalkeeper: bool,
+    attributes: Dict[str, int],
+    train_carry: Optional[Dict[str, float]] = None,
+    training_age_weeks: int = 1,
+    actual_age_months: int = 16 * 12 + 1,
+    training_facilities_level: int = 10,
+    primary_program: Optional[str] = "Balanced",
+    primary_share: float = 0.4,
+    primary_individual_attr: Optional[str] = None,
+    secondary_program: Optional[str] = "Balanced",
+    secondary_share: float = 0.2,
+    secondary_individual_attr: Optional[str] = None,
+    general_share: float = 0.4,
+    years: int = 15,
+    season_weeks: int = 10,
+    total_weeks: int = 160,
+    DP_PER_ATTR_POINT: float = 10.0,
+    percentiles: Optional[Sequence[float]] = None,
+    samples: int = 400,
+    seed: int = 0,
+) -> Dict:
+    """
+    Expected attribute curve per season (snapshot after each season + off-season, like
+    ``train_one_season_with_growth``), optionally with percentile bands.
+
+    Returns {"attributes": [...], "years": [{"year", "age_months", "training_weeks",
+    "expected": {attr: float}, "expected_total": float, ["percentiles": {p: {attr: float}},
+    "total_percentiles": {p: float}]}, ...]}. Percentiles are interpolated, so not whole
+    attribute values; ``p`` is the percentile as a string ("10", "50", ...).
+    """
+    attrs_list = GOALKEEPER_ATTRS if is_goalkeeper else OUTFIELD_ATTRS
+    mix = compiled_program_mix(
+        attrs_list,
+        is_goalkeeper,
+        primary_name=primary_program,
+        primary_share=primary_share,
+        primary_individual_attr=primary_individual_attr,
+        secondary_name=secondary_program,
+        secondary_share=secondary_share,
+        secondary_individual_attr=secondary_individual_attr,
+        general_share=general_share,
+    )
+    start = np.array([int((attributes or {}).get(a, 1)) for a in attrs_list])
+    carry = load_train_carry(train_carry, attrs_list)
+    start_carry = np.array([carry[a] if v < 20 else 0.0 for a, v in zip(attrs_list, start)])
+    dp = _weekly_dp(
+        float(potential),
+        float(base_training_pct),
+        float(growth_training_pct),
+        float(growth_shape),
+        float(growth_peak_age),
+        int(training_age_weeks),
+        int(training_facilities_level),
+        int(years),
+        int(season_weeks),
+        int(total_weeks),
+    )
+    progress = _expected_path(start + start_carry / DP_PER_ATTR_POINT, np.asarray(mix.weights), dp, DP_PER_ATTR_POINT)
+    # Displayed attributes are whole points: once an attribute has trained for a while its
+    # carry averages half a point, so expected value ~ progress - 0.5 (never below start).
+    expected = np.where(progress >= 20, 20.0, np.maximum(start, progress - 0.5))
+
+    sampled = None
+    if percentiles:
+        qs = tuple(float(q) for q in percentiles)
+        sampled = _sampled_percentiles(
+            tuple(start.tolist()),
+            tuple(round(v, 3) for v in start_carry.tolist()),
+            mix.weights,
+            tuple(tuple(round(v, 6) for v in row) for row in dp.tolist()),
+            float(DP_PER_ATTR_POINT),
+            int(samples),
+            int(seed),
+            qs,
+        )
+
+    out_years: List[Dict] = []
+    season_months = season_weeks + 2  # training weeks + off-season
+    start_year = actual_age_months // 12
+    for y in range(int(years)):
+        row = {
+            "year": start_year + y + 1,
+            "age_months": int(actual_age_months) + (y + 1) * season_months,
+            "training_weeks": int(training_age_weeks) + (y + 1) * season_weeks,
+            "expected": {a: round(float(v), 2) for a, v in zip(attrs_list, expected[y])},
+            "expected_total": round(float(expected[y].sum()), 2),
+        }
+        if sampled is not None:
+            per_attr, totals = sampled[0][y], sampled[1][y]
+            row["percentiles"] = {
+                f"{q:g}": {a: float(v) for a, v in zip(attrs_list, per_attr[i])} for i, q in enumerate(qs)
+            }
+            row["total_percentiles"] = {f"{q:g}": float(totals[i]) for i, q in enumerate(qs)}
+        out_years.append(row)
+
+    return {"attributes": list(attrs_list), "years": out_years}
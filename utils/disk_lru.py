@@ -0,0 +1,101 @@
+"""
+Size-bounded on-disk caches under ``GFX_CACHE_DIR`` (picture thumbnails, kit renders / layers).
+
+``DiskLRU`` keeps an in-process LRU index of one cache directory (seeded from the files'
+mtimes, which are bumped on every hit) and evicts the least recently used files once the
+total is over ``max_bytes``. The index is re-read from disk every ``index_ttl`` seconds so
+files written by other workers / processes are accounted for. Writers use ``write_atomic``.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+
+def write_atomic(path: str, data: bytes) -> None:
+    """Write ``path`` via a temp file + rename (unique per process and thread)."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}-{threading.get_ident()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class DiskLRU:
+    """LRU size bound for the files below ``root``."""
+
+    def __init__(self, root: str, max_bytes: int, index_ttl: float = 600.0, label: str = "files"):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.index_ttl = index_ttl
+        self.label = label
+        self._index: "OrderedDict[str, int]" = OrderedDict()  # path -> size, least recently used first
+        self._bytes = 0
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def total_bytes(self) -> int:
+        return self._bytes
+
+    def _load(self) -> None:
+        """Rebuild the index from disk (oldest mtime first). Holds the lock."""
+        entries: List[Tuple[float, str, int]] = []
+        for dirpath, _, filenames in os.walk(self.root):
+            for fname in filenames:
+                path = os.path.join(dirpath, fname)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                if fname.endswith(".tmp"):
+                    # Left behind by an interrupted write
+                    if time.time() - st.st_mtime > self.index_ttl:
+                        _remove(path)
+                    continue
+                entries.append((st.st_mtime, path, st.st_size))
+        entries.sort()
+        self._index.clear()
+        self._index.update((path, size) for _, path, size in entries)
+        self._bytes = sum(size for _, _, size in entries)
+        self._loaded_at = time.monotonic()
+
+    def touch(self, path: str, size: Optional[int] = None) -> None:
+        """Record a use of ``path`` (new or hit) and evict least recently used files over budget."""
+        if size is None:
+            try:
+                size = os.path.getsize(path)
+            except OSError:
+                return
+        evict: List[str] = []
+        with self._lock:
+            if self._loaded_at is None or time.monotonic() - self._loaded_at > self.index_ttl:
+                self._load()
+            old = self._index.pop(path, None)
+            if old is not None:
+                self._bytes -= old
+            self._index[path] = size
+            self._bytes += size
+            while self._bytes > self.max_bytes and len(self._index) > 1:
+                victim, victim_size = self._index.popitem(last=False)
+                self._bytes -= victim_size
+                evict.append(victim)
+        for victim in evict:
+            _remove(victim)
+        if evict:
+            logging.info("evicted %d %s (cache over %d bytes)", len(evict), self.label, self.max_bytes)
+        try:
+            # mtime is the persisted recency (atime is often disabled)
+            os.utime(path)
+        except OSError:
+            pass
@@ -0,0 +1,237 @@
+"""
+Execution layer for the blocking workbench endpoints.
+
+Most workbench handlers do synchronous SQLAlchemy work or long CPU loops (match simulation,
+training, prospect generation). Declared ``async def``, they ran on the event loop and stalled
+every other request on the worker, health checks included. ``@offload("<class>")`` turns a
+plain ``def`` handler into an async endpoint that runs on the executor of its endpoint class:
+
+- ``db``: thread pool for short DB reads / writes;
+- ``heavy``: small thread pool for long DB-bound work (training, prospect generation), so a
+  few big requests cannot take every DB connection or starve the short ones;
+- ``cpu``: process pool (spawned workers) for pure CPU work that needs no DB session or
+  shared state; arguments and results must pickle.
+
+Each class runs at most ``max_workers`` calls and queues at most ``max_queued`` more; beyond
+that the endpoint answers 503 with ``Retry-After`` instead of piling up work. Sizes come from
+``WORKBENCH_<CLASS>_WORKERS`` / ``WORKBENCH_<CLASS>_QUEUE``. Keep ``db`` + ``heavy`` workers
+within the SQLAlchemy pool (5 + 10 overflow by default).
+
+Spawned workers load the name pools once, so process pools are replaced after a name data
+hot reload (``utils.name_data.register_reload_hook``).
+"""
+
+import asyncio
+import contextvars
+import functools
+import importlib
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Tuple
+
+from fastapi import HTTPException
+
+RETRY_AFTER_SECONDS = 2
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.getenv(name, "")))
+    except ValueError:
+        return default
+
+
+@dataclass(frozen=True)
+class ExecutionClass:
+    name: str
+    kind: str          # thread | process
+    max_workers: int
+    max_queued: int
+
+
+def _execution_class(name: str, kind: str, workers: int, queued: int) -> ExecutionClass:
+    env = f"WORKBENCH_{name.upper()}"
+    return ExecutionClass(
+        name=name,
+        kind=kind,
+        max_workers=_env_int(f"{env}_WORKERS", workers),
+        max_queued=_env_int(f"{env}_QUEUE", queued),
+    )
+
+
+EXECUTION_CLASSES: Dict[str, ExecutionClass] = {
+    "db": _execution_class("db", "thread", 8, 64),
+    "heavy": _execution_class("heavy", "thread", 2, 8),
+    "cpu": _execution_class("cpu", "process", max(1, min(4, os.cpu_count() or 1)), 16),
+}
+
+_EXECUTORS: Dict[str, Executor] = {}
+_IN_FLIGHT: Dict[str, int] = {name: 0 for name in EXECUTION_CLASSES}
+_LOCK = threading.Lock()
+_RELOAD_HOOK_REGISTERED = False
+
+
+def get_executor(class_name: str) -> Executor:
+    """Executor of an endpoint class (created on first use)."""
+    spec = EXECUTION_CLASSES[class_name]
+    if spec.kind == "process":
+        _register_reload_hook()
+    with _LOCK:
+        executor = _EXECUTORS.get(class_name)
+        if executor is None:
+            if spec.kind == "process":
+                # spawn: the API process is multi-threaded, so don't fork it
+                executor = ProcessPoolExecutor(
+                    max_workers=spec.max_workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            else:
+                executor = ThreadPoolExecutor(
+                    max_workers=spec.max_workers, thread_name_prefix=f"workbench-{class_name}"
+                )
+            _EXECUTORS[class_name] = executor
+        return executor
+
+
+def recycle_executor(class_name: str) -> None:
+    """
+    Replace the executor of a class: later calls get a new one, the old one finishes the work
+    already submitted to it and exits.
+    """
+    with _LOCK:
+        executor = _EXECUTORS.pop(class_name, None)
+    if executor is not None:
+        executor.shutdown(wait=False)
+
+
+def _recycle_process_pools(_state=None) -> None:
+    for name, spec in EXECUTION_CLASSES.items():
+        if spec.kind == "process":
+            recycle_executor(name)
+
+
+def _register_reload_hook() -> None:
+    global _RELOAD_HOOK_REGISTERED
+    with _LOCK:
+        if _RELOAD_HOOK_REGISTERED:
+            return
+        _RELOAD_HOOK_REGISTERED = True
+    from utils import name_data
+
+    name_data.register_reload_hook(_recycle_process_pools)
+
+
+def shutdown_executors(wait: bool = False) -> None:
+    with _LOCK:
+        executors = list(_EXECUTORS.values())
+        _EXECUTORS.clear()
+    for executor in executors:
+        executor.shutdown(wait=wait, cancel_futures=True)
+
+
+def execution_stats() -> Dict[str, Dict[str, int]]:
+    """Running + queued calls per endpoint class, with the class limits."""
+    with _LOCK:
+        return {
+            name: {"in_flight": _IN_FLIGHT[name], "max_workers": spec.max_workers, "max_queued": spec.max_queued}
+            for name, spec in EXECUTION_CLASSES.items()
+        }
+
+
+def _call_locked(lock, fn: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+    with lock:
+        return fn(*args, **kwargs)
+
+
+def _call_in_process(module: str, qualname: str, args: tuple, kwargs: dict) -> Tuple[bool, Any]:
+    """Process-pool entry point: look the handler up by name (the module attribute is the
+    ``@offload`` wrapper, so the plain function cannot be pickled by reference) and call it."""
+    fn: Any = importlib.import_module(module)
+    for part in qualname.split("."):
+        fn = getattr(fn, part)
+    fn = getattr(fn, "__wrapped__", fn)
+    try:
+        return True, fn(*args, **kwargs)
+    except HTTPException as e:
+        # Starlette's HTTPException does not pickle; it is rebuilt in the API process
+        return False, (e.status_code, e.detail, e.headers)
+
+
+def _release(class_name: str, _future=None) -> None:
+    with _LOCK:
+        _IN_FLIGHT[class_name] -= 1
+
+
+async def run_offloaded(
+    class_name: str, fn: Callable[..., Any], *args: Any, lock=None, **kwargs: Any
+) -> Any:
+    """
+    Run ``fn(*args, **kwargs)`` on the executor of ``class_name`` and await the result.
+    ``lock`` (thread classes only) is held around the call. Raises HTTPException(503) when
+    the class is saturated.
+    """
+    spec = EXECUTION_CLASSES[class_name]
+    with _LOCK:
+        if _IN_FLIGHT[class_name] >= spec.max_workers + spec.max_queued:
+            raise HTTPException(
+                status_code=503,
+                detail=f"Server busy ({class_name} workers); retry shortly",
+                headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+            )
+        _IN_FLIGHT[class_name] += 1
+
+    try:
+        executor = get_executor(class_name)
+        if spec.kind == "process":
+            future = executor.submit(_call_in_process, fn.__module__, fn.__qualname__, args, kwargs)
+        elif lock is not None:
+            future = executor.submit(contextvars.copy_context().run, _call_locked, lock, fn, args, kwargs)
+        else:
+            future = executor.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+    except BaseException:
+        _release(class_name)
+        raise
+    # Released when the work finishes, not when the request goes away (a disconnected
+    # client does not stop a running call)
+    future.add_done_callback(functools.partial(_release, class_name))
+
+    try:
+        result = await asyncio.wrap_future(future)
+    except BrokenProcessPool:
+        logging.exception("%s process pool broke; it is recreated on the next call", class_name)
+        with _LOCK:
+            if _EXECUTORS.get(class_name) is executor:
+                del _EXECUTORS[class_name]
+        raise HTTPException(status_code=503, detail=f"{class_name} worker crashed; retry shortly")
+
+    if spec.kind == "process":
+        ok, value = result
+        if not ok:
+            status_code, detail, headers = value
+            raise HTTPException(status_code=status_code, detail=detail, headers=headers)
+        return value
+    return result
+
+
+def offload(class_name: str, lock=None) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Decorator for a plain ``def`` endpoint: the route gets an async wrapper (same signature,
+    so FastAPI resolves parameters and dependencies as before) that runs the handler on the
+    ``class_name`` executor. Apply it below ``@router.<method>``.
+    """
+    spec = EXECUTION_CLASSES[class_name]
+    if spec.kind == "process" and lock is not None:
+        raise ValueError("a lock cannot be held across processes")
+
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(fn)
+        async def endpoint(*args: Any, **kwargs: Any) -> Any:
+            return await run_offloaded(class_name, fn, *args, lock=lock, **kwargs)
+
+        return endpoint
+
+    return decorator
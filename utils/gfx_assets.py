@@ -0,0 +1,314 @@
+"""
+Cache-friendly serving of the gfx/ asset tree.
+
+Every asset gets a content hash (sha256 prefix, cached per path and invalidated on size /
+mtime change). ``GfxStaticFiles`` serves ``/gfx`` with that hash as the ETag and:
+
+- ``Cache-Control: public, max-age=31536000, immutable`` when the URL carries the current
+  hash (``?v=<hash>``, as handed out by ``gfx_manifest``), ``public, no-cache`` otherwise
+  (the browser revalidates and gets a 304);
+- a pre-built variant instead of the original when the client accepts it and the variant
+  is smaller: AVIF / WebP for large PNGs, gzip for SVG / JSON.
+
+Variants live outside gfx/ (``GFX_CACHE_DIR``, default ``.gfx_cache/``) under
+``variants/<gfx-relative path>.<hash><ext>``, so an edited source simply stops matching its
+old variants. They are produced by ``scripts/build_gfx_assets.py`` (Pillow, imported lazily);
+without them the originals are served.
+"""
+
+import gzip
+import hashlib
+import os
+import shutil
+import stat
+import threading
+from mimetypes import guess_type
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from starlette.datastructures import Headers, QueryParams
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+
+from .gfx_catalog import GFX_ROOT, get_gfx_catalog, normalize_folder_key
+
+GFX_CACHE_DIR = os.getenv("GFX_CACHE_DIR") or os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), ".gfx_cache"
+)
+VARIANT_DIR = os.path.join(GFX_CACHE_DIR, "variants")
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "public, no-cache"
+
+# PNGs smaller than this are not worth a second encoding
+VARIANT_MIN_BYTES = 64 * 1024
+
+IMAGE_VARIANT_SOURCES = (".png",)
+GZIP_VARIANT_SOURCES = (".svg", ".json")
+
+# (variant extension, media type) in preference order
+_IMAGE_VARIANTS = ((".avif", "image/avif"), (".webp", "image/webp"))
+
+_HASH_LEN = 16
+_HASH_CHUNK = 1 << 20
+
+_HASHES: Dict[str, Tuple[int, int, str]] = {}
+_HASHES_LOCK = threading.Lock()
+
+
+def _source_path(rel: str, root: str = GFX_ROOT) -> str:
+    return os.path.join(root, *normalize_folder_key(rel).split("/"))
+
+
+def asset_hash(rel: str, stat_result: Optional[os.stat_result] = None, root: str = GFX_ROOT) -> Optional[str]:
+    """Content hash of gfx asset ``rel`` (re-read only when its size or mtime changed)."""
+    key = normalize_folder_key(rel)
+    path = _source_path(key, root)
+    try:
+        st = stat_result or os.stat(path)
+    except OSError:
+        return None
+    cached = _HASHES.get(key)
+    if cached is not None and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+        return cached[2]
+    h = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+                h.update(chunk)
+    except OSError:
+        return None
+    digest = h.hexdigest()[:_HASH_LEN]
+    with _HASHES_LOCK:
+        _HASHES[key] = (st.st_size, st.st_mtime_ns, digest)
+    return digest
+
+
+def variant_path(rel: str, digest: str, ext: str) -> str:
+    """Where the ``ext`` variant of ``rel`` at content hash ``digest`` is stored."""
+    key = normalize_folder_key(rel)
+    return os.path.join(VARIANT_DIR, *key.split("/")) + f".{digest}{ext}"
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """True when an ``If-None-Match`` header value lists ``etag`` (or ``*``)."""
+    tags = [t.strip() for t in (if_none_match or "").split(",")]
+    return etag in tags or "*" in tags
+
+
+def _accepts(header: str, token: str) -> bool:
+    for part in header.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        if name.strip() == token:
+            return params.replace(" ", "") not in ("q=0", "q=0.0")
+    return False
+
+
+def pick_variant(
+    rel: str,
+    digest: str,
+    source_size: int,
+    accept: str = "",
+    accept_encoding: str = "",
+) -> Optional[Tuple[str, os.stat_result, str, Optional[str]]]:
+    """
+    Best pre-built variant of ``rel`` for the request headers, or None for the original.
+    Returns ``(path, stat, suffix used in the ETag, content-encoding)``.
+    """
+    lower = rel.lower()
+    candidates: List[Tuple[str, str, Optional[str]]] = []
+    if lower.endswith(IMAGE_VARIANT_SOURCES):
+        candidates = [
+            (ext, ext[1:], None) for ext, media_type in _IMAGE_VARIANTS if _accepts(accept, media_type)
+        ]
+    elif lower.endswith(GZIP_VARIANT_SOURCES) and _accepts(accept_encoding, "gzip"):
+        candidates = [(".gz", "gz", "gzip")]
+    for ext, tag, encoding in candidates:
+        path = variant_path(rel, digest, ext)
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        if 0 < st.st_size < source_size:
+            return path, st, tag, encoding
+    return None
+
+
+def _vary_for(rel: str) -> Optional[str]:
+    lower = rel.lower()
+    if lower.endswith(IMAGE_VARIANT_SOURCES):
+        return "Accept"
+    if lower.endswith(GZIP_VARIANT_SOURCES):
+        return "Accept-Encoding"
+    return None
+
+
+class GfxStaticFiles(StaticFiles):
+    """``StaticFiles`` for gfx/: content-hash ETags, long-lived caching of versioned URLs, variants."""
+
+    def lookup_path(self, path: str):
+        full_path, stat_result = super().lookup_path(path)
+        # Runs on a worker thread: hash here so the event loop never reads whole files
+        if stat_result is not None and stat.S_ISREG(stat_result.st_mode):
+            asset_hash(self._rel(full_path), stat_result, root=self._root())
+        return full_path, stat_result
+
+    def _root(self) -> str:
+        return os.path.realpath(str(self.directory))
+
+    def _rel(self, full_path) -> str:
+        return os.path.relpath(os.path.realpath(full_path), self._root()).replace(os.sep, "/")
+
+    def file_response(self, full_path, stat_result, scope, status_code: int = 200) -> Response:
+        request_headers = Headers(scope=scope)
+        rel = self._rel(full_path)
+        digest = asset_hash(rel, stat_result, root=self._root())
+        if digest is None:
+            return super().file_response(full_path, stat_result, scope, status_code)
+
+        versioned = QueryParams(scope.get("query_string", b"")).get("v") == digest
+        headers = {
+            "Cache-Control": IMMUTABLE_CACHE_CONTROL if versioned else REVALIDATE_CACHE_CONTROL,
+            "ETag": f'"{digest}"',
+        }
+        vary = _vary_for(rel)
+        if vary:
+            headers["Vary"] = vary
+
+        media_type = None
+        path, st = full_path, stat_result
+        variant = pick_variant(
+            rel,
+            digest,
+            stat_result.st_size,
+            accept=request_headers.get("accept", ""),
+            accept_encoding=request_headers.get("accept-encoding", ""),
+        )
+        if variant is not None:
+            path, st, tag, encoding = variant
+            headers["ETag"] = f'"{digest}-{tag}"'
+            if encoding:
+                headers["Content-Encoding"] = encoding
+                media_type = guess_type(rel)[0]
+            else:
+                media_type = f"image/{tag}"
+
+        response = FileResponse(path, status_code=status_code, headers=headers, media_type=media_type, stat_result=st)
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+
+def _prefix_keys(catalog, prefixes: Sequence[str]) -> List[str]:
+    wanted = [normalize_folder_key(p) for p in prefixes] or [""]
+    return sorted(
+        key
+        for key in catalog.files
+        if any(not p or key == p or key.startswith(p + "/") for p in wanted)
+    )
+
+
+def gfx_manifest(prefixes: Sequence[str] = ()) -> Dict[str, object]:
+    """
+    ``{"version", "base", "assets": {gfx-relative path: content hash}}`` for every asset under
+    ``prefixes`` (folder keys; all of gfx/ when empty). Templates append ``?v=<hash>`` to get
+    immutable caching. ``version`` changes whenever any listed asset does (use it as ETag).
+    """
+    assets: Dict[str, str] = {}
+    for rel in iter_gfx_assets(prefixes):
+        digest = asset_hash(rel)
+        if digest is not None:
+            assets[rel] = digest
+    version = hashlib.sha256(
+        "\n".join(f"{rel} {digest}" for rel, digest in assets.items()).encode("utf-8")
+    ).hexdigest()[:_HASH_LEN]
+    return {"version": version, "base": "/gfx/", "assets": assets}
+
+
+def iter_gfx_assets(prefixes: Sequence[str] = ()) -> Iterable[str]:
+    """gfx-relative paths of the assets under ``prefixes`` (all of gfx/ when empty), sorted."""
+    catalog = get_gfx_catalog()
+    for key in _prefix_keys(catalog, prefixes):
+        for name in catalog.files[key]:
+            if not name.startswith("."):
+                yield f"{key}/{name}" if key else name
+
+
+def build_variants(
+    rel: str,
+    *,
+    webp: bool = True,
+    avif: bool = False,
+    avif_quality: int = 80,
+    min_bytes: int = VARIANT_MIN_BYTES,
+    force: bool = False,
+    root: str = GFX_ROOT,
+) -> List[str]:
+    """
+    Write the missing variants of gfx asset ``rel``; returns the paths written.
+
+    PNGs of at least ``min_bytes`` get a lossless WebP (mask edges must stay exact) and, with
+    ``avif``, an AVIF at ``avif_quality``; SVG / JSON get gzip. Variants that come out larger
+    than the source are kept (so they are not rebuilt) but never served.
+    """
+    src = _source_path(rel, root)
+    digest = asset_hash(rel, root=root)
+    if digest is None:
+        return []
+    lower = rel.lower()
+    written: List[str] = []
+
+    if lower.endswith(GZIP_VARIANT_SOURCES):
+        out = variant_path(rel, digest, ".gz")
+        if force or not os.path.exists(out):
+            os.makedirs(os.path.dirname(out), exist_ok=True)
+            tmp = out + ".tmp"
+            with open(src, "rb") as f_in, gzip.open(tmp, "wb", compresslevel=9) as f_out:
+                shutil.copyfileobj(f_in, f_out)
+            os.replace(tmp, out)
+            written.append(out)
+        return written
+
+    if not lower.endswith(IMAGE_VARIANT_SOURCES) or os.path.getsize(src) < min_bytes:
+        return written
+
+    todo = []
+    if webp:
+        todo.append((".webp", "WEBP", {"lossless": True, "method": 4}))
+    if avif:
+        todo.append((".avif", "AVIF", {"quality": int(avif_quality)}))
+    todo = [t for t in todo if force or not os.path.exists(variant_path(rel, digest, t[0]))]
+    if not todo:
+        return written
+
+    from PIL import Image
+
+    with Image.open(src) as im:
+        im.load()
+        if im.mode not in ("RGB", "RGBA", "L", "LA"):
+            im = im.convert("RGBA")
+        for ext, fmt, kwargs in todo:
+            out = variant_path(rel, digest, ext)
+            os.makedirs(os.path.dirname(out), exist_ok=True)
+            tmp = out + ".tmp"
+            im.save(tmp, fmt, **kwargs)
+            os.replace(tmp, out)
+            written.append(out)
+    return written
+
+
+def prune_variants() -> int:
+    """Delete variants whose source is gone or whose hash no longer matches; returns the count."""
+    removed = 0
+    if not os.path.isdir(VARIANT_DIR):
+        return removed
+    for dirpath, _, filenames in os.walk(VARIANT_DIR):
+        for fname in filenames:
+            path = os.path.join(dirpath, fname)
+            stem, ext = os.path.splitext(fname)
+            source_name, _, digest = stem.rpartition(".")
+            rel_dir = os.path.relpath(dirpath, VARIANT_DIR).replace(os.sep, "/")
+            rel = source_name if rel_dir == "." else f"{rel_dir}/{source_name}"
+            if ext == ".tmp" or asset_hash(rel) != digest:
+                os.remove(path)
+                removed += 1
+    return removed
@@ -0,0 +1,232 @@
+"""
+Sprite atlases for small, list-heavy gfx folders (flags, crests, icons).
+
+Each atlas packs one gfx/ folder into a single image plus a JSON coordinate map, so a page
+showing hundreds of flags makes two requests instead of hundreds:
+
+- raster atlases (flags, crests): every PNG / WebP / JPG scaled to ``cell_height`` and
+  shelf-packed into a WebP with ``_PADDING`` px gutters; the map gives ``x, y, w, h`` per
+  sprite (file stem);
+- SVG atlas (icons): every SVG wrapped in a ``<symbol id="<stem>">`` of one sprite sheet,
+  used as ``<svg><use href="/gfx-atlas/icons.<hash>.svg#<stem>"/></svg>``.
+
+Atlas images are written to ``GFX_CACHE_DIR/atlases`` under content-hashed names (immutable
+URLs); ``<name>.json`` points at the current one. ``get_atlas_map`` rebuilds an atlas when
+its source folder changed (content hashes of the sources are recorded in the map), so the
+build script (scripts/build_gfx_atlases.py) is an optimisation, not a requirement.
+Pillow is imported lazily.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from .disk_lru import write_atomic
+from .gfx_assets import GFX_CACHE_DIR, asset_hash
+from .gfx_catalog import GFX_ROOT, get_gfx_catalog
+
+ATLAS_DIR = os.path.join(GFX_CACHE_DIR, "atlases")
+
+_RASTER_EXTENSIONS = (".png", ".webp", ".jpg", ".jpeg")
+_SVG_NS = "http://www.w3.org/2000/svg"
+_PADDING = 2
+_MAX_ATLAS_WIDTH = 2048
+
+
+@dataclass(frozen=True)
+class AtlasSpec:
+    folder: str                 # gfx-relative source folder
+    kind: str = "raster"        # raster | svg
+    cell_height: int = 48       # raster: sprite height in the atlas (2x the usual display size)
+    quality: int = 90           # raster: WebP quality
+
+
+ATLASES: Dict[str, AtlasSpec] = {
+    "flags": AtlasSpec(folder="flags", cell_height=48),
+    "crests": AtlasSpec(folder="crests", cell_height=128),
+    "icons": AtlasSpec(folder="icons", kind="svg"),
+}
+
+_LOCK = threading.Lock()
+_MAPS: Dict[str, Tuple[Any, Dict[str, Any]]] = {}  # name -> (catalog checked against, map)
+
+
+def _sources(spec: AtlasSpec, catalog) -> List[str]:
+    """Source files of an atlas, one per stem (sprites are keyed by stem; the first name wins)."""
+    exts = (".svg",) if spec.kind == "svg" else _RASTER_EXTENSIONS
+    files: Dict[str, str] = {}
+    for f in catalog.files.get(spec.folder, ()):
+        if not f.lower().endswith(exts):
+            continue
+        stem = os.path.splitext(f)[0]
+        if stem in files:
+            logging.warning("skipping %s/%s in gfx atlas: same sprite name as %s", spec.folder, f, files[stem])
+            continue
+        files[stem] = f
+    return list(files.values())
+
+
+def _source_hash(spec: AtlasSpec, files: List[str]) -> str:
+    h = hashlib.sha256(json.dumps([spec.kind, spec.cell_height, spec.quality]).encode("utf-8"))
+    for f in files:
+        h.update(f"{f}:{asset_hash(f'{spec.folder}/{f}')}\n".encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+def _map_path(name: str) -> str:
+    return os.path.join(ATLAS_DIR, f"{name}.json")
+
+
+def _shelf_pack(sizes: List[Tuple[int, int]], max_width: int) -> Tuple[List[Tuple[int, int]], int, int]:
+    """Shelf placement of (w, h) boxes, tallest / widest first; returns positions (input order) and atlas size."""
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    total = sum((w + _PADDING) * (h + _PADDING) for w, h in sizes)
+    widest = max((w for w, _ in sizes), default=0) + _PADDING
+    # Roughly square, but never narrower than the widest sprite
+    width = min(max_width, max(widest, int(total ** 0.5) + 1))
+    positions: List[Tuple[int, int]] = [(0, 0)] * len(sizes)
+    x = y = row_h = used_w = 0
+    for i in order:
+        w, h = sizes[i]
+        if x and x + w + _PADDING > width:
+            y += row_h
+            x = row_h = 0
+        positions[i] = (x + _PADDING // 2, y + _PADDING // 2)
+        x += w + _PADDING
+        row_h = max(row_h, h + _PADDING)
+        used_w = max(used_w, x)
+    return positions, used_w, y + row_h
+
+
+def _build_raster(name: str, spec: AtlasSpec, files: List[str]) -> Dict[str, Any]:
+    import io
+
+    from PIL import Image
+
+    images = []
+    for f in files:
+        with Image.open(os.path.join(GFX_ROOT, spec.folder, f)) as im:
+            im = im.convert("RGBA")
+            w = max(1, round(im.width * spec.cell_height / im.height))
+            images.append(im.resize((w, spec.cell_height), Image.Resampling.LANCZOS))
+    positions, width, height = _shelf_pack([im.size for im in images], _MAX_ATLAS_WIDTH)
+
+    atlas = Image.new("RGBA", (max(1, width), max(1, height)), (0, 0, 0, 0))
+    sprites: Dict[str, Dict[str, int]] = {}
+    for f, im, (x, y) in zip(files, images, positions):
+        atlas.paste(im, (x, y))
+        sprites[os.path.splitext(f)[0]] = {"x": x, "y": y, "w": im.width, "h": im.height}
+
+    buf = io.BytesIO()
+    atlas.save(buf, "WEBP", quality=spec.quality, method=6)
+    data = buf.getvalue()
+    image = f"{name}.{hashlib.sha256(data).hexdigest()[:16]}.webp"
+    write_atomic(os.path.join(ATLAS_DIR, image), data)
+    return {
+        "name": name,
+        "kind": spec.kind,
+        "image": image,
+        "width": atlas.width,
+        "height": atlas.height,
+        "cell_height": spec.cell_height,
+        "sprites": sprites,
+    }
+
+
+def _build_svg(name: str, spec: AtlasSpec, files: List[str]) -> Dict[str, Any]:
+    ET.register_namespace("", _SVG_NS)
+    sheet = ET.Element(f"{{{_SVG_NS}}}svg", {"style": "display:none"})
+    sprites: Dict[str, Dict[str, Any]] = {}
+    for f in files:
+        try:
+            root = ET.parse(os.path.join(GFX_ROOT, spec.folder, f)).getroot()
+        except (ET.ParseError, OSError) as e:
+            logging.warning("skipping %s/%s in gfx atlas %s: %s", spec.folder, f, name, e)
+            continue
+        stem = os.path.splitext(f)[0]
+        sprite_id = "".join(c if c.isalnum() or c in "-_" else "_" for c in stem)
+        view_box = root.get("viewBox") or f"0 0 {root.get('width', '0')} {root.get('height', '0')}"
+        symbol = ET.SubElement(sheet, f"{{{_SVG_NS}}}symbol", {"id": sprite_id, "viewBox": view_box})
+        symbol.extend(list(root))
+        sprites[stem] = {"id": sprite_id, "viewBox": view_box}
+
+    data = ET.tostring(sheet, encoding="utf-8")
+    image = f"{name}.{hashlib.sha256(data).hexdigest()[:16]}.svg"
+    write_atomic(os.path.join(ATLAS_DIR, image), data)
+    return {"name": name, "kind": spec.kind, "image": image, "sprites": sprites}
+
+
+def build_atlas(name: str, force: bool = False) -> Dict[str, Any]:
+    """(Re)build atlas ``name`` if its sources changed (or ``force``); returns its map."""
+    spec = ATLASES.get(name)
+    if spec is None:
+        raise KeyError(name)
+    files = _sources(spec, get_gfx_catalog())
+    source_hash = _source_hash(spec, files)
+    current = _read_map(name)
+    if not force and current and current.get("source_hash") == source_hash and os.path.exists(
+        os.path.join(ATLAS_DIR, current["image"])
+    ):
+        return current
+
+    started = time.perf_counter()
+    builder = _build_svg if spec.kind == "svg" else _build_raster
+    atlas = builder(name, spec, files)
+    atlas["source_hash"] = source_hash
+    atlas["url"] = f"/gfx-atlas/{atlas['image']}"
+    write_atomic(_map_path(name), json.dumps(atlas, sort_keys=True).encode("utf-8"))
+    # Keep the previous image for pages still holding the old map
+    keep = {atlas["image"], (current or {}).get("image")}
+    for fname in os.listdir(ATLAS_DIR):
+        if fname.startswith(f"{name}.") and not fname.endswith(".json") and fname not in keep:
+            try:
+                os.remove(os.path.join(ATLAS_DIR, fname))
+            except OSError:
+                pass
+    logging.info(
+        "built gfx atlas %s: %d sprites in %.2fs", name, len(atlas["sprites"]), time.perf_counter() - started
+    )
+    return atlas
+
+
+def _read_map(name: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(_map_path(name), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def get_atlas_map(name: str) -> Dict[str, Any]:
+    """
+    Coordinate map of atlas ``name`` (``url``, sizes, ``sprites``). Checked against the gfx
+    catalog whenever that is rebuilt (a source folder changed) and rebuilt if stale.
+    Raises KeyError for unknown atlases.
+    """
+    if name not in ATLASES:
+        raise KeyError(name)
+    catalog = get_gfx_catalog()
+    cached = _MAPS.get(name)
+    if cached is not None and cached[0] is catalog:
+        return cached[1]
+    with _LOCK:
+        cached = _MAPS.get(name)
+        if cached is None or cached[0] is not catalog:
+            cached = (catalog, build_atlas(name))
+            _MAPS[name] = cached
+        return cached[1]
+
+
+def atlas_image_path(filename: str) -> Optional[str]:
+    """Path of a built atlas image (``<name>.<hash>.<ext>``), or None if unknown / missing."""
+    name, _, rest = filename.partition(".")
+    if name not in ATLASES or "/" in filename or "\\" in filename or not rest:
+        return None
+    path = os.path.join(ATLAS_DIR, filename)
+    return path if os.path.isfile(path) else None
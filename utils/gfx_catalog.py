@@ -0,0 +1,190 @@
+"""
+In-memory catalog of the gfx/ asset tree.
+
+One scan of ``gfx/`` builds, per folder key (gfx-relative, forward slashes, ``""`` for the
+root): its files, its profile images (.png / .webp) and its subfolders, plus a reverse map
+image filename -> folder keys. Lookups are dict reads.
+
+The catalog is rebuilt when a directory changes: directory mtimes (which change when
+entries are added, removed or renamed) are re-checked at most every
+``_CHECK_INTERVAL_S`` seconds; ``invalidate_gfx_catalog`` forces a rescan. Readers hold a
+reference to an immutable snapshot, so a rebuild is one reference swap.
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+
+GFX_ROOT = os.path.join(os.path.dirname(os.path.dirname(__file__)), "gfx")
+PROFILE_IMAGE_EXTENSIONS = (".png", ".webp")
+
+_CHECK_INTERVAL_S = 2.0
+
+
+def is_profile_image(fname: str) -> bool:
+    return fname.lower().endswith(PROFILE_IMAGE_EXTENSIONS)
+
+
+def normalize_folder_key(rel: Optional[str]) -> str:
+    """gfx-relative folder path -> catalog key (forward slashes, no leading/trailing slash)."""
+    return (rel or "").replace("\\", "/").strip("/")
+
+
+@dataclass(frozen=True)
+class GfxCatalog:
+    root: str
+    files: Mapping[str, Tuple[str, ...]]
+    images: Mapping[str, Tuple[str, ...]]
+    subfolders: Mapping[str, Tuple[str, ...]]
+    file_folders: Mapping[str, Tuple[str, ...]]
+    dir_mtimes: Mapping[str, int]
+    built_at: float
+
+    def has_folder(self, rel: Optional[str]) -> bool:
+        return normalize_folder_key(rel) in self.files
+
+    def folder_images(self, rel: Optional[str]) -> Tuple[str, ...]:
+        """Profile images directly in folder ``rel`` (sorted; empty if missing)."""
+        return self.images.get(normalize_folder_key(rel), ())
+
+    def has_images(self, rel: Optional[str]) -> bool:
+        return bool(self.images.get(normalize_folder_key(rel)))
+
+    def folder_subfolders(self, rel: Optional[str]) -> Tuple[str, ...]:
+        """Names of the immediate subfolders of ``rel`` (sorted)."""
+        return self.subfolders.get(normalize_folder_key(rel), ())
+
+    def has_file(self, rel: Optional[str], filename: str) -> bool:
+        key = normalize_folder_key(rel)
+        if is_profile_image(filename):
+            return key in self.file_folders.get(filename, ())
+        return filename in self.files.get(key, ())
+
+    def folders_for_file(self, filename: Optional[str]) -> Tuple[str, ...]:
+        """Folder keys holding a profile image named ``filename``."""
+        if not filename:
+            return ()
+        return self.file_folders.get(filename, ())
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "folders": len(self.files),
+            "files": sum(len(v) for v in self.files.values()),
+            "images": sum(len(v) for v in self.images.values()),
+            "image_names": len(self.file_folders),
+        }
+
+
+def build_gfx_catalog(root: str = GFX_ROOT) -> GfxCatalog:
+    """Scan ``root`` once (os.scandir, no per-file stat) into a ``GfxCatalog``."""
+    files: Dict[str, Tuple[str, ...]] = {}
+    images: Dict[str, Tuple[str, ...]] = {}
+    subfolders: Dict[str, Tuple[str, ...]] = {}
+    file_folders: Dict[str, List[str]] = {}
+    dir_mtimes: Dict[str, int] = {}
+
+    stack = [""]
+    while stack:
+        key = stack.pop()
+        path = os.path.join(root, *key.split("/")) if key else root
+        try:
+            mtime = os.stat(path).st_mtime_ns
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        dir_mtimes[key] = mtime
+        names: List[str] = []
+        subs: List[str] = []
+        for entry in entries:
+            try:
+                if entry.is_dir():
+                    subs.append(entry.name)
+                elif entry.is_file():
+                    names.append(entry.name)
+            except OSError:
+                continue
+        names.sort()
+        subs.sort()
+        files[key] = tuple(names)
+        subfolders[key] = tuple(subs)
+        imgs = tuple(n for n in names if is_profile_image(n))
+        images[key] = imgs
+        for n in imgs:
+            file_folders.setdefault(n, []).append(key)
+        stack.extend(f"{key}/{s}" if key else s for s in subs)
+
+    return GfxCatalog(
+        root=root,
+        files=files,
+        images=images,
+        subfolders=subfolders,
+        file_folders={k: tuple(sorted(v)) for k, v in file_folders.items()},
+        dir_mtimes=dir_mtimes,
+        built_at=time.time(),
+    )
+
+
+def _dirs_changed(catalog: GfxCatalog) -> bool:
+    for key, mtime in catalog.dir_mtimes.items():
+        path = os.path.join(catalog.root, *key.split("/")) if key else catalog.root
+        try:
+            if os.stat(path).st_mtime_ns != mtime:
+                return True
+        except OSError:
+            return True
+    # gfx/ created after an empty scan
+    return not catalog.dir_mtimes and os.path.isdir(catalog.root)
+
+
+_CATALOG: Optional[GfxCatalog] = None
+_LAST_CHECK = 0.0
+_LOCK = threading.Lock()
+_REBUILD_HOOKS: List[Callable[[GfxCatalog], None]] = []
+
+
+def register_rebuild_hook(hook: Callable[[GfxCatalog], None]) -> None:
+    """Call ``hook(new_catalog)`` after each rebuild (for caches derived from the catalog)."""
+    _REBUILD_HOOKS.append(hook)
+
+
+def _publish(catalog: GfxCatalog) -> GfxCatalog:
+    global _CATALOG
+    _CATALOG = catalog
+    for hook in list(_REBUILD_HOOKS):
+        try:
+            hook(catalog)
+        except Exception as e:
+            print(f"Warning: gfx catalog rebuild hook failed: {e}")
+    return catalog
+
+
+def get_gfx_catalog() -> GfxCatalog:
+    """
+    Current catalog, built on first use. At most every ``_CHECK_INTERVAL_S`` seconds the
+    directory mtimes are compared and the catalog is rebuilt if anything changed.
+    """
+    global _LAST_CHECK
+    catalog = _CATALOG
+    now = time.monotonic()
+    if catalog is not None and now - _LAST_CHECK < _CHECK_INTERVAL_S:
+        return catalog
+    with _LOCK:
+        catalog = _CATALOG
+        if catalog is not None and now - _LAST_CHECK < _CHECK_INTERVAL_S:
+            return catalog
+        if catalog is None or _dirs_changed(catalog):
+            catalog = _publish(build_gfx_catalog())
+        _LAST_CHECK = time.monotonic()
+        return catalog
+
+
+def invalidate_gfx_catalog() -> GfxCatalog:
+    """Rescan gfx/ now (e.g. after writing assets) and return the new catalog."""
+    global _LAST_CHECK
+    with _LOCK:
+        catalog = _publish(build_gfx_catalog())
+        _LAST_CHECK = time.monotonic()
+        return catalog
@@ -0,0 +1,134 @@
+"""
+Downscaled WebP thumbnails of gfx/ pictures (profile pictures), served by /gfx-thumb.
+
+Lists of hundreds of prospects show 180px avatars of 512px sources; ``get_thumbnail`` encodes
+a thumbnail at one of ``THUMB_WIDTHS`` on first request and keeps it on disk under
+``GFX_CACHE_DIR/thumbs/<width>/<gfx-relative path>.<source hash>.webp``, so an edited source
+simply stops matching its old thumbnails.
+
+The thumbnail directory is bounded (``GFX_THUMB_CACHE_MB``, default 256) by a ``DiskLRU``
+(utils/disk_lru.py): least recently used thumbnails are evicted once the total is over
+budget, including thumbnails written by other workers or by ``scripts/build_gfx_thumbs.py``
+(``prewarm_thumbnails``, batch per bucket).
+Pillow is imported lazily.
+"""
+
+import io
+import os
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .disk_lru import DiskLRU, write_atomic
+from .gfx_assets import GFX_CACHE_DIR, asset_hash
+from .gfx_catalog import GFX_ROOT, get_gfx_catalog, normalize_folder_key
+
+THUMB_DIR = os.path.join(GFX_CACHE_DIR, "thumbs")
+
+# Fixed buckets so the cache cannot be filled with arbitrary sizes (180px avatars at 1x / 2x)
+THUMB_WIDTHS = (48, 96, 192, 384)
+THUMB_PREFIXES = ("player_profile_pics",)
+THUMB_SOURCES = (".webp", ".png", ".jpg", ".jpeg")
+THUMB_QUALITY = 82
+
+THUMB_CACHE_MAX_BYTES = int(os.getenv("GFX_THUMB_CACHE_MB", "256")) * 1024 * 1024
+
+_CACHE = DiskLRU(THUMB_DIR, THUMB_CACHE_MAX_BYTES, label="gfx thumbnails")
+_KEY_LOCKS: Dict[str, threading.Lock] = {}
+_KEY_LOCKS_LOCK = threading.Lock()
+
+
+def thumb_source(rel: str) -> Optional[str]:
+    """Normalised gfx-relative path of ``rel`` if it may be thumbnailed (and exists), else None."""
+    key = normalize_folder_key(rel)
+    folder, _, name = key.rpartition("/")
+    if not name.lower().endswith(THUMB_SOURCES):
+        return None
+    if not any(folder == p or folder.startswith(p + "/") for p in THUMB_PREFIXES):
+        return None
+    if name not in get_gfx_catalog().files.get(folder, ()):
+        return None
+    return key
+
+
+def thumb_path(rel: str, width: int, digest: str) -> str:
+    return os.path.join(THUMB_DIR, str(width), *rel.split("/")) + f".{digest}.webp"
+
+
+def _encode(src: str, width: int) -> bytes:
+    from PIL import Image
+
+    with Image.open(src) as im:
+        im.load()
+        if im.mode not in ("RGB", "RGBA"):
+            im = im.convert("RGBA" if "A" in im.getbands() or "transparency" in im.info else "RGB")
+        if im.width > width:
+            height = max(1, round(im.height * width / im.width))
+            im = im.resize((width, height), Image.Resampling.LANCZOS)
+        buf = io.BytesIO()
+        im.save(buf, "WEBP", quality=THUMB_QUALITY, method=4)
+    return buf.getvalue()
+
+
+def get_thumbnail(rel: str, width: int) -> Optional[Tuple[str, str]]:
+    """
+    ``(path, source hash)`` of the ``width`` px WebP thumbnail of gfx picture ``rel``, encoding
+    it on first use; None if ``rel`` is not a thumbnailable picture. Sources narrower than
+    ``width`` are re-encoded at their own size (never upscaled). Raises ValueError for a
+    width outside ``THUMB_WIDTHS``.
+    """
+    if width not in THUMB_WIDTHS:
+        raise ValueError(f"width must be one of {', '.join(map(str, THUMB_WIDTHS))}")
+    key = thumb_source(rel)
+    digest = asset_hash(key) if key else None
+    if digest is None:
+        return None
+    path = thumb_path(key, width, digest)
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        size = None
+    if size is None:
+        with _KEY_LOCKS_LOCK:
+            key_lock = _KEY_LOCKS.setdefault(path, threading.Lock())
+        with key_lock:
+            # Another request may have encoded it while we waited
+            if not os.path.exists(path):
+                write_atomic(path, _encode(os.path.join(GFX_ROOT, *key.split("/")), width))
+        with _KEY_LOCKS_LOCK:
+            _KEY_LOCKS.pop(path, None)
+        size = os.path.getsize(path)
+    _CACHE.touch(path, size)
+    return path, digest
+
+
+def thumb_buckets() -> List[str]:
+    """gfx-relative folders holding thumbnailable pictures (e.g. ``player_profile_pics/AfricaEast``)."""
+    catalog = get_gfx_catalog()
+    return sorted(
+        key
+        for key, files in catalog.files.items()
+        if any(key == p or key.startswith(p + "/") for p in THUMB_PREFIXES)
+        and any(f.lower().endswith(THUMB_SOURCES) for f in files)
+    )
+
+
+def iter_bucket_pictures(buckets: Sequence[str] = ()) -> Iterable[str]:
+    """gfx-relative paths of the thumbnailable pictures in ``buckets`` (all buckets when empty)."""
+    catalog = get_gfx_catalog()
+    wanted = {normalize_folder_key(b) for b in buckets}
+    for key in thumb_buckets():
+        if wanted and key not in wanted and key.rpartition("/")[2] not in wanted:
+            continue
+        for name in catalog.files[key]:
+            if name.lower().endswith(THUMB_SOURCES):
+                yield f"{key}/{name}"
+
+
+def prewarm_thumbnails(rels: Iterable[str], widths: Sequence[int] = THUMB_WIDTHS) -> int:
+    """Make sure ``rels`` have thumbnails at ``widths``; returns how many were checked."""
+    count = 0
+    for rel in rels:
+        for width in widths:
+            if get_thumbnail(rel, width) is not None:
+                count += 1
+    return count
@@ -681,52 +681,61 @@ def build_heritage_groups_from_rows(rows: List[Dict[str, Any]]) -> Dict[str, Dic
     return heritage
 
 
-def apply_to_name_data() -> Tuple[int, int]:
+def apply_to_name_data(state) -> Tuple[int, int]:
     """
-    Merge composition into globals in utils.name_data.
+    Merge composition into a ``name_data.NameDataState`` that is being built (not yet published).
+    Reads files only; see ``export_composition_json`` for the JSON mirrors.
     Returns (countries_updated, rows_loaded).
     """
-    from . import name_data
-
     rows = load_composition_rows()
     if not rows:
         return 0, 0
 
     fed = build_country_federation(rows)
-    name_data.COUNTRY_FEDERATION.clear()
-    name_data.COUNTRY_FEDERATION.update(fed)
+    state.COUNTRY_FEDERATION.clear()
+    state.COUNTRY_FEDERATION.update(fed)
 
     groups_by_nat = build_heritage_groups_from_rows(rows)
     n = 0
     for nat, groups in groups_by_nat.items():
-        name_data.HERITAGE_CONFIG[nat] = groups
+        state.HERITAGE_CONFIG[nat] = groups
         n += 1
 
     # Refresh picture-folder map so replaced nationalities do not leave stale group keys
-    name_data.HERITAGE_PICTURE_FOLDER_MAP.clear()
-    for _nat, groups in name_data.HERITAGE_CONFIG.items():
+    state.HERITAGE_PICTURE_FOLDER_MAP.clear()
+    for _nat, groups in state.HERITAGE_CONFIG.items():
         for gkey, cfg in groups.items():
             if cfg.get("picture_folder"):
-                name_data.HERITAGE_PICTURE_FOLDER_MAP[gkey] = cfg["picture_folder"]
-
-    _write_country_federation_json(fed)
-
-    # LOCAL core naming pools:
-    # - Treat the existing on-disk `local_core_naming_pools.json` as "frozen" manual data.
-    # - Route freshly regenerated results into `local_core_naming_pools_generated.json`.
-    # - Only backfill `local_core_naming_pools.json` if it does not exist (or is empty),
-    #   so first-time setups still work.
-    local_core = build_local_core_naming_pools(rows)
-    _write_local_core_naming_pools_json(local_core)
+                state.HERITAGE_PICTURE_FOLDER_MAP[gkey] = cfg["picture_folder"]
 
+    # LOCAL core naming pools: the on-disk `local_core_naming_pools.json` is "frozen" manual
+    # data; only fall back to the regenerated pools when it does not exist (or is empty).
     local_path = _COMPOSITION_DIR / "local_core_naming_pools.json"
     if not local_path.is_file() or local_path.stat().st_size == 0:
-        name_data.LOCAL_CORE_NAMING_POOLS.clear()
-        name_data.LOCAL_CORE_NAMING_POOLS.update(local_core)
+        local_core = build_local_core_naming_pools(rows)
+        state.LOCAL_CORE_NAMING_POOLS.clear()
+        state.LOCAL_CORE_NAMING_POOLS.update(local_core)
 
     return n, len(rows)
 
 
+def export_composition_json(rows: Optional[List[Dict[str, Any]]] = None) -> int:
+    """
+    Write the JSON mirrors derived from the composition file:
+      - `data/country_federation.json`
+      - `data/heritage_composition/local_core_naming_pools_generated.json`
+        (and `local_core_naming_pools.json` only if missing/empty)
+    Returns rows used (0 = nothing written).
+    """
+    if rows is None:
+        rows = load_composition_rows()
+    if not rows:
+        return 0
+    _write_country_federation_json(build_country_federation(rows))
+    _write_local_core_naming_pools_json(build_local_core_naming_pools(rows))
+    return len(rows)
+
+
 def _write_local_core_naming_pools_json(local_core: Dict[str, List[Dict[str, Any]]]) -> None:
     """
     Write:
@@ -0,0 +1,491 @@
+"""
+Background job queue for long workbench operations (batch simulation, multi-year training,
+prospect generation) that outgrow a single HTTP request (Railway proxy timeouts).
+
+Jobs are rows of the ``jobs`` table (models/job.py): in Postgres when DATABASE_URL is set,
+otherwise in a local SQLite file (``JOB_QUEUE_SQLITE_PATH``, default ``.jobs.sqlite3``).
+``submit_job`` inserts a ``queued`` row and returns its summary; workers claim the oldest
+queued row with a guarded UPDATE (safe with any number of workers on either backend), run
+the handler registered for its ``kind`` in ``JOB_HANDLERS`` and store the result.
+
+Handlers are ``fn(params, db) -> JSON-able result``; ``db`` is a fresh session (None without
+a database). While running they call ``report_progress(done, total, message, partial)``:
+progress is written at most every ``_PROGRESS_INTERVAL`` seconds, ``partial`` results are
+appended to ``job_partials`` so clients can poll (``get_job(id, since=seq)``) or stream them.
+``report_progress`` raises ``JobCancelled`` once a cancel was requested; outside a job it
+does nothing, so handlers stay usable as plain request handlers.
+
+Workers: ``start_job_workers`` runs ``JOB_WORKERS`` (default 2) worker processes next to the
+API (spawned, so each has its own DB connections; not daemonic, because handlers use the
+``cpu`` process pool, and stopped by ``stop_job_workers``); without a database they are threads of
+the API process instead, because the handlers then work on its in-memory store. Workers can
+also run as a separate service (scripts/run_job_worker.py, with JOB_WORKERS=0 on the API).
+A running job's heartbeat is refreshed every ``_HEARTBEAT_INTERVAL`` seconds; jobs whose
+worker died are re-queued (once) by the other workers.
+"""
+
+import atexit
+import contextvars
+import importlib
+import logging
+import multiprocessing
+import os
+import socket
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+from uuid import UUID, uuid4
+
+# kind -> "module:function" (imported lazily, in the worker)
+JOB_HANDLERS: Dict[str, str] = {
+    "batch_simulation": "api.test_bench:run_batch_simulation_job",
+    "train_promoted_players": "api.youth_academy:run_train_promoted_players_job",
+    "generate_prospects_all_nations": "api.youth_academy:run_generate_prospects_all_nations_job",
+}
+
+JOB_STATUSES = ("queued", "running", "completed", "failed", "cancelled")
+FINISHED_STATUSES = ("completed", "failed", "cancelled")
+
+JOB_QUEUE_SQLITE_PATH = os.getenv("JOB_QUEUE_SQLITE_PATH") or os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), ".jobs.sqlite3"
+)
+
+_POLL_INTERVAL = 1.0
+_PROGRESS_INTERVAL = 0.5
+_HEARTBEAT_INTERVAL = 15.0
+_STALE_AFTER = timedelta(minutes=2)
+_MAX_ATTEMPTS = 2
+_RETENTION = timedelta(hours=int(os.getenv("JOB_RETENTION_HOURS", "72")))
+_MAINTENANCE_INTERVAL = 60.0
+
+_ENGINE = None
+_SESSION_FACTORY = None
+_ENGINE_LOCK = threading.Lock()
+
+_CURRENT_JOB: contextvars.ContextVar[Optional["_JobContext"]] = contextvars.ContextVar("current_job", default=None)
+
+_WORKERS: List[Any] = []
+_STOP: Optional[Any] = None
+
+
+class JobCancelled(BaseException):
+    """
+    Raised by ``report_progress`` inside a job whose cancellation was requested. A
+    BaseException (like asyncio.CancelledError) so handlers' ``except Exception`` blocks
+    don't turn it into an error.
+    """
+
+
+def _now() -> datetime:
+    return datetime.utcnow()
+
+
+def _session():
+    """Session on the queue's backend (the app database, or the SQLite stand-in)."""
+    global _ENGINE, _SESSION_FACTORY
+    if _SESSION_FACTORY is None:
+        with _ENGINE_LOCK:
+            if _SESSION_FACTORY is None:
+                from sqlalchemy import create_engine, event
+                from sqlalchemy.orm import sessionmaker
+
+                from database import engine
+                from models import Job, JobPartial
+
+                if engine is None:
+                    engine = create_engine(
+                        f"sqlite:///{JOB_QUEUE_SQLITE_PATH}",
+                        connect_args={"check_same_thread": False, "timeout": 30},
+                    )
+
+                    @event.listens_for(engine, "connect")
+                    def _sqlite_pragmas(dbapi_connection, _record):
+                        cursor = dbapi_connection.cursor()
+                        # Readers (pollers) don't block the writing worker
+                        cursor.execute("PRAGMA journal_mode=WAL")
+                        cursor.execute("PRAGMA foreign_keys=ON")
+                        cursor.close()
+
+                Job.metadata.create_all(engine, tables=[Job.__table__, JobPartial.__table__])
+                _ENGINE = engine
+                _SESSION_FACTORY = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+    return _SESSION_FACTORY()
+
+
+def job_summary(job, partials: Optional[List[Dict[str, Any]]] = None, include_result: bool = True) -> Dict[str, Any]:
+    out = {
+        "job_id": str(job.id),
+        "kind": job.kind,
+        "status": job.status,
+        "progress": job.progress,
+        "message": job.message,
+        "partials_count": job.partials_count,
+        "error": job.error,
+        "attempts": job.attempts,
+        "created_at": job.created_at.isoformat() if job.created_at else None,
+        "started_at": job.started_at.isoformat() if job.started_at else None,
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+        "status_url": f"/api/jobs/{job.id}",
+        "stream_url": f"/api/jobs/{job.id}/stream",
+    }
+    if include_result:
+        out["result"] = job.result
+    if partials is not None:
+        out["partials"] = partials
+    return out
+
+
+def submit_job(kind: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Queue a job (``params`` must be JSON-able); returns its summary. Raises KeyError for an unknown kind."""
+    from models import Job
+
+    if kind not in JOB_HANDLERS:
+        raise KeyError(kind)
+    db = _session()
+    try:
+        job = Job(id=uuid4(), kind=kind, params=params, status="queued", created_at=_now())
+        db.add(job)
+        db.commit()
+        return job_summary(job)
+    finally:
+        db.close()
+
+
+def get_job(job_id: UUID, since: Optional[int] = None, include_result: bool = True) -> Optional[Dict[str, Any]]:
+    """Job summary; with ``since``, also the partial results with ``seq > since`` (``[{seq, data}]``)."""
+    from models import Job, JobPartial
+
+    db = _session()
+    try:
+        job = db.get(Job, job_id)
+        if job is None:
+            return None
+        partials = None
+        if since is not None:
+            rows = (
+                db.query(JobPartial)
+                .filter(JobPartial.job_id == job_id, JobPartial.seq > since)
+                .order_by(JobPartial.seq)
+                .all()
+            )
+            partials = [{"seq": r.seq, "data": r.data} for r in rows]
+        return job_summary(job, partials, include_result=include_result)
+    finally:
+        db.close()
+
+
+def list_jobs(kind: Optional[str] = None, status: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+    """Most recent jobs first (without results)."""
+    from models import Job
+
+    db = _session()
+    try:
+        query = db.query(Job)
+        if kind:
+            query = query.filter(Job.kind == kind)
+        if status:
+            query = query.filter(Job.status == status)
+        jobs = query.order_by(Job.created_at.desc()).limit(max(1, min(500, limit))).all()
+        return [job_summary(job, include_result=False) for job in jobs]
+    finally:
+        db.close()
+
+
+def cancel_job(job_id: UUID) -> Optional[Dict[str, Any]]:
+    """Cancel a queued job now, or ask a running one to stop at its next progress report."""
+    from models import Job
+
+    db = _session()
+    try:
+        job = db.get(Job, job_id)
+        if job is None:
+            return None
+        if job.status == "queued":
+            job.status = "cancelled"
+            job.finished_at = _now()
+        elif job.status == "running":
+            job.cancel_requested = True
+        db.commit()
+        return job_summary(job, include_result=False)
+    finally:
+        db.close()
+
+
+# ── inside a job ──────────────────────────────────────────────────────────────
+
+class _JobContext:
+    def __init__(self, job_id: UUID, partials: int = 0):
+        self.job_id = job_id
+        # A re-queued job continues after the partials of its earlier attempt (clients keep their ``since``)
+        self.partials = partials
+        self.last_write = 0.0
+        self.pending: Optional[Dict[str, Any]] = None
+
+
+def report_progress(
+    done: float,
+    total: float,
+    message: Optional[str] = None,
+    partial: Optional[Any] = None,
+) -> None:
+    """
+    Record progress (``done`` of ``total``) and optionally a JSON-able partial result of the
+    current job. No-op outside a job. Raises ``JobCancelled`` if the job was cancelled.
+    """
+    ctx = _CURRENT_JOB.get()
+    if ctx is None:
+        return
+    from fastapi.encoders import jsonable_encoder
+
+    from models import Job, JobPartial
+
+    values: Dict[str, Any] = {"progress": min(1.0, max(0.0, done / total)) if total else 0.0, "heartbeat_at": _now()}
+    if message is not None:
+        values["message"] = message
+    now = time.monotonic()
+    if partial is None and now - ctx.last_write < _PROGRESS_INTERVAL:
+        return
+    ctx.last_write = now
+
+    db = _session()
+    try:
+        if partial is not None:
+            ctx.partials += 1
+            db.add(JobPartial(job_id=ctx.job_id, seq=ctx.partials, data=jsonable_encoder(partial), created_at=_now()))
+            values["partials_count"] = ctx.partials
+        db.query(Job).filter(Job.id == ctx.job_id).update(values, synchronize_session=False)
+        db.commit()
+        cancelled = db.query(Job.cancel_requested).filter(Job.id == ctx.job_id).scalar()
+    finally:
+        db.close()
+    if cancelled:
+        raise JobCancelled()
+
+
+# ── workers ───────────────────────────────────────────────────────────────────
+
+def _resolve(kind: str) -> Callable[[Dict[str, Any], Any], Any]:
+    module, _, name = JOB_HANDLERS[kind].partition(":")
+    return getattr(importlib.import_module(module), name)
+
+
+def _claim(worker_id: str):
+    """Claim the oldest queued job; returns ``(id, kind, params, partials_count)`` or None."""
+    from models import Job
+
+    db = _session()
+    try:
+        for _ in range(5):
+            candidate = (
+                db.query(Job.id)
+                .filter(Job.status == "queued")
+                .order_by(Job.created_at)
+                .limit(1)
+                .scalar()
+            )
+            if candidate is None:
+                return None
+            now = _now()
+            claimed = (
+                db.query(Job)
+                .filter(Job.id == candidate, Job.status == "queued")
+                .update(
+                    {
+                        "status": "running",
+                        "worker_id": worker_id,
+                        "started_at": now,
+                        "heartbeat_at": now,
+                        "attempts": Job.attempts + 1,
+                    },
+                    synchronize_session=False,
+                )
+            )
+            db.commit()
+            if claimed:
+                job = db.get(Job, candidate)
+                return job.id, job.kind, job.params, job.partials_count or 0
+            # Another worker got it first
+        return None
+    finally:
+        db.close()
+
+
+def _finish(job_id: UUID, **values: Any) -> None:
+    from models import Job
+
+    db = _session()
+    try:
+        values.setdefault("finished_at", _now())
+        db.query(Job).filter(Job.id == job_id).update(values, synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+def _heartbeat(job_id: UUID, done: threading.Event) -> None:
+    from models import Job
+
+    while not done.wait(_HEARTBEAT_INTERVAL):
+        db = _session()
+        try:
+            db.query(Job).filter(Job.id == job_id).update({"heartbeat_at": _now()}, synchronize_session=False)
+            db.commit()
+        except Exception:
+            logging.exception("job %s heartbeat failed", job_id)
+        finally:
+            db.close()
+
+
+def run_job(job_id: UUID, kind: str, params: Dict[str, Any], partials_count: int = 0) -> None:
+    """Run a claimed job to completion and record the outcome on its row."""
+    from fastapi import HTTPException
+    from fastapi.encoders import jsonable_encoder
+
+    from database import SessionLocal, engine
+
+    started = time.perf_counter()
+    done = threading.Event()
+    threading.Thread(target=_heartbeat, args=(job_id, done), name=f"job-heartbeat-{job_id}", daemon=True).start()
+    token = _CURRENT_JOB.set(_JobContext(job_id, partials_count))
+    db = SessionLocal() if engine is not None else None
+    try:
+        result = _resolve(kind)(params, db)
+        _finish(job_id, status="completed", progress=1.0, result=jsonable_encoder(result), message=None)
+        logging.info("job %s (%s) completed in %.1fs", job_id, kind, time.perf_counter() - started)
+    except JobCancelled:
+        _finish(job_id, status="cancelled", message="Cancelled")
+    except HTTPException as e:
+        _finish(job_id, status="failed", error=str(e.detail))
+    except Exception as e:
+        logging.exception("job %s (%s) failed", job_id, kind)
+        _finish(job_id, status="failed", error=str(e) or type(e).__name__)
+    finally:
+        if db is not None:
+            db.close()
+        _CURRENT_JOB.reset(token)
+        done.set()
+
+
+def _maintenance() -> None:
+    """Re-queue (or fail) jobs whose worker stopped heartbeating; drop old finished jobs."""
+    from models import Job, JobPartial
+
+    db = _session()
+    try:
+        now = _now()
+        stale = db.query(Job).filter(Job.status == "running", Job.heartbeat_at < now - _STALE_AFTER).all()
+        for job in stale:
+            if job.attempts < _MAX_ATTEMPTS:
+                job.status = "queued"
+                job.message = "Re-queued (worker lost)"
+            else:
+                job.status = "failed"
+                job.error = "Worker lost"
+                job.finished_at = now
+        old_ids = [
+            job_id
+            for (job_id,) in db.query(Job.id)
+            .filter(Job.status.in_(FINISHED_STATUSES), Job.finished_at < now - _RETENTION)
+            .all()
+        ]
+        if old_ids:
+            db.query(JobPartial).filter(JobPartial.job_id.in_(old_ids)).delete(synchronize_session=False)
+            db.query(Job).filter(Job.id.in_(old_ids)).delete(synchronize_session=False)
+        db.commit()
+        if stale:
+            logging.warning("recovered %d stale job(s)", len(stale))
+    finally:
+        db.close()
+
+
+def run_worker(stop=None, worker_id: Optional[str] = None, follow_name_data: bool = False) -> None:
+    """
+    Claim and run jobs until ``stop`` (a threading / multiprocessing Event) is set. With
+    ``follow_name_data`` (worker processes, which do not see the API's name data hot
+    reloads) name pools edited on disk are reloaded before each job.
+    """
+    worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+    next_maintenance = 0.0
+    logging.info("job worker %s started", worker_id)
+    while stop is None or not stop.is_set():
+        try:
+            if time.monotonic() >= next_maintenance:
+                _maintenance()
+                next_maintenance = time.monotonic() + _MAINTENANCE_INTERVAL
+            claimed = _claim(worker_id)
+        except Exception:
+            logging.exception("job worker %s could not reach the queue", worker_id)
+            claimed = None
+        if claimed is None:
+            if stop is not None:
+                stop.wait(_POLL_INTERVAL)
+            else:
+                time.sleep(_POLL_INTERVAL)
+            continue
+        if follow_name_data:
+            from utils import name_data
+
+            try:
+                name_data.reload_name_data_if_changed()
+            except Exception:
+                logging.exception("job worker %s could not reload name data; keeping the loaded pools", worker_id)
+        run_job(*claimed)
+
+
+def run_worker_process(stop) -> None:
+    """
+    Entry point of a spawned worker process: ``run_worker`` (following name data reloads),
+    then shut down the process's own ``cpu`` pool. Its pool workers are non-daemonic
+    children, which multiprocessing joins on exit before the pool would stop them.
+    """
+    from utils.execution import shutdown_executors
+
+    try:
+        run_worker(stop, follow_name_data=True)
+    finally:
+        shutdown_executors(wait=True)
+
+
+def start_job_workers(count: Optional[int] = None) -> int:
+    """
+    Start ``count`` workers (default ``JOB_WORKERS``, 2) for this API process: spawned
+    processes with a database, threads of this process without one. Returns how many started.
+    """
+    global _STOP
+    from database import engine
+
+    if count is None:
+        count = int(os.getenv("JOB_WORKERS", "2"))
+    if count <= 0 or _WORKERS:
+        return 0
+    _session()  # create the tables before the workers race to
+    if engine is None:
+        _STOP = threading.Event()
+        for i in range(count):
+            worker = threading.Thread(target=run_worker, args=(_STOP,), name=f"job-worker-{i}", daemon=True)
+            worker.start()
+            _WORKERS.append(worker)
+    else:
+        ctx = multiprocessing.get_context("spawn")
+        _STOP = ctx.Event()
+        # multiprocessing joins non-daemonic children at exit; make sure they were told to stop
+        atexit.register(stop_job_workers)
+        for i in range(count):
+            worker = ctx.Process(target=run_worker_process, args=(_STOP,), name=f"job-worker-{i}")
+            worker.start()
+            _WORKERS.append(worker)
+    return count
+
+
+def stop_job_workers(timeout: float = 5.0) -> None:
+    """Ask the workers to stop after their current job; terminate processes still busy after ``timeout``."""
+    if _STOP is not None:
+        _STOP.set()
+    deadline = time.monotonic() + timeout
+    for worker in _WORKERS:
+        worker.join(max(0.0, deadline - time.monotonic()))
+        if isinstance(worker, multiprocessing.process.BaseProcess) and worker.is_alive():
+            # Its job is re-queued by the next worker's stale-job check
+            worker.terminate()
+    _WORKERS.clear()
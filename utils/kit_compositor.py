@@ -0,0 +1,700 @@
+"""
+Server-side kit rendering (same layer pipeline as templates/kit_designer.html).
+
+``render_kit(spec, width, fmt)`` takes the kit designer's config JSON ("Show JSON": part
+colors / transparency, kitName, shortsStyleName, socksStyleName, collarName, patternLayers,
+sponsor and crest settings) and returns an encoded PNG / WebP of the full kit at ``width``
+pixels wide. Layer order and blend maths follow ``renderPipeline``: tinted body masks and
+patterns per role, sponsor + crest, body shadows (multiply) and highlights (screen), collar
+under-shadow, collar colors / shadows / highlights, boots.
+
+Every mask is decoded once per content hash and kept downscaled: on disk at the designer's
+preview width (``LAYER_BASE_WIDTH``) and in an in-memory LRU per render size (bounded by
+bytes), so thumbnails never touch the 4000px originals after the first render. Finished
+renders are cached by a key that hashes the normalized spec, the size / format and the
+content hashes of every layer used: in memory (bounded by bytes) and on disk under
+``GFX_CACHE_DIR/kits``. Editing a mask changes its hash and therefore every affected key.
+
+Widths are limited to ``RENDER_WIDTHS`` and both disk caches are LRU-bounded
+(``KIT_RENDER_CACHE_MB`` / ``KIT_LAYER_CACHE_MB``, see utils/disk_lru.py), like the gfx
+thumbnails. Pillow is imported lazily.
+"""
+
+import hashlib
+import io
+import json
+import math
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .disk_lru import DiskLRU, write_atomic
+from .gfx_assets import GFX_CACHE_DIR, asset_hash
+from .gfx_catalog import GFX_ROOT, get_gfx_catalog
+
+KIT_RENDER_DIR = os.path.join(GFX_CACHE_DIR, "kits")
+KIT_LAYER_DIR = os.path.join(GFX_CACHE_DIR, "kit_layers")
+
+RENDER_FORMATS = {"png": "image/png", "webp": "image/webp"}
+# Fixed buckets so the caches cannot be filled with arbitrary sizes
+RENDER_WIDTHS = (64, 128, 256, 512, 800, 1600)
+LAYER_BASE_WIDTH = 800  # kit designer preview width (CW); layer sizes scale from it
+
+_MEMORY_CACHE_BYTES = 64 * 1024 * 1024
+_LAYER_CACHE_BYTES = 256 * 1024 * 1024
+
+KIT_RENDER_CACHE_MAX_BYTES = int(os.getenv("KIT_RENDER_CACHE_MB", "256")) * 1024 * 1024
+KIT_LAYER_CACHE_MAX_BYTES = int(os.getenv("KIT_LAYER_CACHE_MB", "128")) * 1024 * 1024
+
+TEMPLATES_REL = "kit_templates"
+FULLKIT_REL = "kit_templates/fullkit"
+PATTERNS_REL = "kit_templates/patterns"
+SPONSORS_REL = "sponsors"
+CRESTS_REL = "crests"
+
+ROLES = ("primary", "secondary", "tertiary", "quaternary")
+BODY_PARTS = ("shirt", "shorts", "socks")
+
+_FULLKIT_FILES = {
+    ("shirt", "primary"): "mask_shirt_primary.png",
+    ("shorts", "primary"): "mask_shorts_primary.png",
+    ("shorts", "secondary"): "mask_shorts_secondary.png",
+    ("shorts", "tertiary"): "mask_shorts_tertiary.png",
+    ("socks", "primary"): "mask_socks_primary.png",
+    ("socks", "secondary"): "mask_socks_secondary.png",
+    ("socks", "tertiary"): "mask_socks_tertiary.png",
+}
+_FULLKIT_OVERLAYS = {
+    "shirt_shadows": "shirt_overlay_shadows_mul.png",
+    "shirt_highlights": "shirt_overlay_highlights.png",
+    "shorts_socks_shadows": "shorts_socks_overlay_shadows_mul.png",
+    "shorts_socks_highlights": "shorts_socks_overlay_highlights.png",
+    "boots": "boots.png",
+}
+_COLLAR_FILES = {
+    "primary": "mask_primary.png",
+    "secondary": "mask_secondary.png",
+    "tertiary": "mask_tertiary.png",
+    "shadows": "overlay_shadows_mul.png",
+    "highlights": "overlay_highlights.png",
+    "under_shadows": "overlay_shadows_under_mul.png",
+}
+
+# Kit designer DEFAULTS (templates/kit_designer.html); specs are merged over these
+_PATTERN_LAYER_DEFAULTS = {"file": "", "color": "#FFFFFF", "targets": [], "scale": 1.0, "offsetX": 0.0, "offsetY": 0.0, "rotateDeg": 0.0}
+KIT_SPEC_DEFAULTS: Dict[str, Any] = {
+    "shirtPrimaryColor": "#CC0000",
+    "shirtSecondaryColor": "#FFFFFF",
+    "shirtTertiaryColor": "#000000",
+    "shirtQuaternaryColor": "#FFCC00",
+    "shortsPrimaryColor": "#FFFFFF",
+    "shortsSecondaryColor": "#CC0000",
+    "shortsTertiaryColor": "#000000",
+    "socksPrimaryColor": "#CC0000",
+    "socksSecondaryColor": "#FFFFFF",
+    "socksTertiaryColor": "#000000",
+    "collarPrimaryColor": "#FFFFFF",
+    "collarSecondaryColor": "#CC0000",
+    "collarTertiaryColor": "#000000",
+    "shirtSecondaryTransparent": False,
+    "shirtTertiaryTransparent": False,
+    "shirtQuaternaryTransparent": False,
+    "shortsSecondaryTransparent": False,
+    "shortsTertiaryTransparent": False,
+    "socksSecondaryTransparent": False,
+    "socksTertiaryTransparent": False,
+    "collarSecondaryTransparent": False,
+    "collarTertiaryTransparent": False,
+    "patternLayers": [dict(_PATTERN_LAYER_DEFAULTS) for _ in range(3)],
+    "sponsorScale": 0.55,
+    "sponsorX": 0.50,
+    "sponsorY": 0.31,
+    "sponsorBg": "transparent",
+    "sponsorBgScaleX": 1.0,
+    "sponsorBgScaleY": 1.0,
+    "sponsorDesignName": "",
+    "sponsorMaskPrimaryColor": "#FFFFFF",
+    "sponsorMaskSecondaryColor": "#000000",
+    "sponsorMaskTertiaryColor": "#FFD700",
+    "sponsorMaskSecondaryTransparent": False,
+    "sponsorMaskTertiaryTransparent": False,
+    "crestFile": "",
+    "crestVisible": True,
+    "sponsorVisible": True,
+    "crestScale": 0.08,
+    "crestX": 0.59,
+    "crestY": 0.26,
+    "collarName": "",
+    "kitName": "",
+    "shortsStyleName": "",
+    "socksStyleName": "",
+}
+_SPONSOR_BG_VALUES = ("transparent", "primary", "secondary")
+
+
+def _parse_color(value: Any, key: str) -> str:
+    s = str(value or "").strip().lstrip("#")
+    if len(s) == 3:
+        s = "".join(c * 2 for c in s)
+    if len(s) != 6 or any(c not in "0123456789abcdefABCDEF" for c in s):
+        raise ValueError(f"{key}: expected a #RRGGBB color, got {value!r}")
+    return "#" + s.upper()
+
+
+def _rgb(color: str) -> np.ndarray:
+    return np.array([int(color[i:i + 2], 16) for i in (1, 3, 5)], dtype=np.float32) / 255.0
+
+
+def normalize_kit_spec(config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Designer config -> canonical spec: defaults filled in, colors as ``#RRGGBB``, numbers as
+    floats, unknown keys (loaded images etc.) dropped. Raises ValueError on bad values.
+    """
+    if not isinstance(config, dict):
+        raise ValueError("kit spec must be a JSON object")
+    spec: Dict[str, Any] = {}
+    for key, default in KIT_SPEC_DEFAULTS.items():
+        value = config.get(key, default)
+        if key == "patternLayers":
+            continue
+        if key.endswith("Color"):
+            spec[key] = _parse_color(value, key)
+        elif isinstance(default, bool):
+            spec[key] = bool(value)
+        elif isinstance(default, float):
+            try:
+                spec[key] = float(value)
+            except (TypeError, ValueError):
+                raise ValueError(f"{key}: expected a number, got {value!r}")
+        else:
+            spec[key] = str(value or "")
+    if spec["sponsorBg"] not in _SPONSOR_BG_VALUES:
+        raise ValueError(f"sponsorBg must be one of {', '.join(_SPONSOR_BG_VALUES)}")
+
+    layers = config.get("patternLayers") or []
+    if not isinstance(layers, list):
+        raise ValueError("patternLayers must be a list")
+    spec["patternLayers"] = []
+    for i in range(3):
+        raw = layers[i] if i < len(layers) and isinstance(layers[i], dict) else {}
+        layer = dict(_PATTERN_LAYER_DEFAULTS, **{k: v for k, v in raw.items() if k in _PATTERN_LAYER_DEFAULTS})
+        try:
+            spec["patternLayers"].append({
+                "file": str(layer["file"] or ""),
+                "color": _parse_color(layer["color"], f"patternLayers[{i}].color"),
+                "targets": sorted(str(t) for t in (layer["targets"] or [])),
+                "scale": float(layer["scale"]),
+                "offsetX": float(layer["offsetX"]),
+                "offsetY": float(layer["offsetY"]),
+                "rotateDeg": float(layer["rotateDeg"]),
+            })
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"patternLayers[{i}]: {e}")
+    return spec
+
+
+def _spec_color(spec: Dict[str, Any], part: str, role: str) -> Optional[str]:
+    """``getColor``: None when the layer is transparent or the part has no such color."""
+    key = part + role.capitalize()
+    if spec.get(key + "Transparent"):
+        return None
+    return spec.get(key + "Color")
+
+
+def _find_file(files: Sequence[str], candidates: Sequence[str]) -> Optional[str]:
+    by_lower = {f.lower(): f for f in files}
+    for c in candidates:
+        if c in by_lower:
+            return by_lower[c]
+    return None
+
+
+def resolve_kit_layers(spec: Dict[str, Any], catalog=None) -> Dict[str, Any]:
+    """
+    gfx-relative paths of every layer a spec uses, resolved like the designer does (kit /
+    shorts / socks folders override fullkit masks; the first collar when none is chosen).
+    Raises ValueError for a named kit / style / collar / sponsor design folder or pattern /
+    crest file that does not exist.
+    """
+    catalog = catalog or get_gfx_catalog()
+
+    def folder_file(folder: str, name: str) -> Optional[str]:
+        return f"{folder}/{name}" if catalog.has_file(folder, name) else None
+
+    def named_folder(parent: str, name: str, key: str) -> str:
+        if name not in catalog.folder_subfolders(parent):
+            raise ValueError(f"{key}: unknown {name!r}")
+        return f"{parent}/{name}"
+
+    def named_file(folder: str, name: str, key: str) -> str:
+        rel = folder_file(folder, name)
+        if rel is None:
+            raise ValueError(f"{key}: unknown {name!r}")
+        return rel
+
+    masks: Dict[Tuple[str, str], Optional[str]] = {
+        (part, role): None for part in (*BODY_PARTS, "collar") for role in ROLES
+    }
+    for (part, role), name in _FULLKIT_FILES.items():
+        masks[(part, role)] = folder_file(FULLKIT_REL, name)
+    overlays = {k: folder_file(FULLKIT_REL, name) for k, name in _FULLKIT_OVERLAYS.items()}
+
+    kit = spec["kitName"]
+    if kit:
+        folder = named_folder(TEMPLATES_REL, kit, "kitName")
+        files = catalog.files.get(folder, ())
+        for role in ROLES:
+            name = _find_file(files, (f"mask_shirt_{role}.png", f"mask_{role}.png"))
+            if name:
+                masks[("shirt", role)] = f"{folder}/{name}"
+
+    for part, key in (("shorts", "shortsStyleName"), ("socks", "socksStyleName")):
+        if not spec[key]:
+            continue
+        folder = named_folder(TEMPLATES_REL, spec[key], key)
+        files = catalog.files.get(folder, ())
+        for role in ROLES[1:]:
+            name = _find_file(files, (f"mask_{part}_{role}.png", f"mask_{role}.png"))
+            if name:
+                masks[(part, role)] = f"{folder}/{name}"
+
+    if spec["collarName"]:
+        named_folder(TEMPLATES_REL, spec["collarName"], "collarName")
+    collar = spec["collarName"] or next(
+        (d for d in catalog.folder_subfolders(TEMPLATES_REL) if d.lower().startswith("collar")), ""
+    )
+    collar_layers: Dict[str, Optional[str]] = {}
+    if collar:
+        folder = f"{TEMPLATES_REL}/{collar}"
+        for key, name in _COLLAR_FILES.items():
+            collar_layers[key] = folder_file(folder, name)
+        for role in ("primary", "secondary", "tertiary"):
+            masks[("collar", role)] = collar_layers[role]
+
+    patterns = [
+        named_file(PATTERNS_REL, layer["file"], f"patternLayers[{i}].file") if layer["file"] else None
+        for i, layer in enumerate(spec["patternLayers"])
+    ]
+
+    sponsor: Dict[str, Optional[str]] = {}
+    design = spec["sponsorDesignName"]
+    if design:
+        folder = named_folder(SPONSORS_REL, design, "sponsorDesignName")
+        files = catalog.files.get(folder, ())
+        name = _find_file(files, ("fixed_color.png", "sponsor_fixed.png"))
+        sponsor["fixed"] = f"{folder}/{name}" if name else None
+        for role in ("primary", "secondary", "tertiary"):
+            name = _find_file(files, (f"mask_{role}.png", f"sponsor_{role}.png"))
+            sponsor[role] = f"{folder}/{name}" if name else None
+
+    crest = named_file(CRESTS_REL, spec["crestFile"], "crestFile") if spec["crestFile"] else None
+
+    return {
+        "masks": masks,
+        "overlays": overlays,
+        "collar_under_shadows": collar_layers.get("under_shadows"),
+        "collar_shadows": collar_layers.get("shadows"),
+        "collar_highlights": collar_layers.get("highlights"),
+        "patterns": patterns,
+        "sponsor": sponsor,
+        "crest": crest,
+    }
+
+
+def _layer_rels(layers: Dict[str, Any]) -> List[str]:
+    rels = list(layers["masks"].values()) + list(layers["overlays"].values()) + list(layers["patterns"])
+    rels += [layers["collar_under_shadows"], layers["collar_shadows"], layers["collar_highlights"], layers["crest"]]
+    rels += list(layers["sponsor"].values())
+    return sorted({r for r in rels if r})
+
+
+def render_key(spec: Dict[str, Any], width: int, fmt: str, layers: Optional[Dict[str, Any]] = None) -> str:
+    """Cache key: normalized spec + size / format + content hash of every layer used."""
+    layers = layers or resolve_kit_layers(spec)
+    payload = {
+        "spec": spec,
+        "width": int(width),
+        "format": fmt,
+        "layers": {rel: asset_hash(rel) for rel in _layer_rels(layers)},
+    }
+    blob = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(blob).hexdigest()[:32]
+
+
+# ── layer loading ─────────────────────────────────────────────────────────────
+
+_LAYERS: "OrderedDict[Tuple[str, str, int, int], np.ndarray]" = OrderedDict()
+_LAYERS_BYTES = 0
+_LAYERS_LOCK = threading.Lock()
+_LAYER_DISK = DiskLRU(KIT_LAYER_DIR, KIT_LAYER_CACHE_MAX_BYTES, label="kit layers")
+
+
+def _to_premultiplied(im) -> np.ndarray:
+    arr = np.asarray(im.convert("RGBA"), dtype=np.float32) / 255.0
+    arr[..., :3] *= arr[..., 3:4]
+    return arr
+
+
+def _base_layer_image(rel: str, digest: str):
+    """Layer at LAYER_BASE_WIDTH, from the disk cache or decoded from the original once."""
+    from PIL import Image
+
+    cached = os.path.join(KIT_LAYER_DIR, *rel.split("/")) + f".{digest}.w{LAYER_BASE_WIDTH}.png"
+    if os.path.exists(cached):
+        with Image.open(cached) as im:
+            im = im.convert("RGBA")
+        _LAYER_DISK.touch(cached)
+        return im
+    with Image.open(os.path.join(GFX_ROOT, *rel.split("/"))) as src:
+        im = src.convert("RGBA")
+    if im.width > LAYER_BASE_WIDTH:
+        h = max(1, round(im.height * LAYER_BASE_WIDTH / im.width))
+        im = im.resize((LAYER_BASE_WIDTH, h), Image.Resampling.BOX)
+    buf = io.BytesIO()
+    im.save(buf, "PNG")
+    write_atomic(cached, buf.getvalue())
+    _LAYER_DISK.touch(cached, buf.tell())
+    return im
+
+
+def _load_layer(rel: Optional[str], w: int, h: int) -> Optional[np.ndarray]:
+    """Premultiplied float32 RGBA of ``rel`` stretched to w x h (like drawImage(img, 0, 0, w, h))."""
+    if not rel:
+        return None
+    digest = asset_hash(rel)
+    if digest is None:
+        return None
+    key = (rel, digest, w, h)
+    with _LAYERS_LOCK:
+        arr = _LAYERS.get(key)
+        if arr is not None:
+            _LAYERS.move_to_end(key)
+            return arr
+
+    from PIL import Image
+
+    if w <= LAYER_BASE_WIDTH:
+        im = _base_layer_image(rel, digest)
+    else:
+        with Image.open(os.path.join(GFX_ROOT, *rel.split("/"))) as src:
+            im = src.convert("RGBA")
+    if im.size != (w, h):
+        im = im.resize((w, h), Image.Resampling.BOX if im.width > w else Image.Resampling.BILINEAR)
+    arr = _to_premultiplied(im)
+    global _LAYERS_BYTES
+    with _LAYERS_LOCK:
+        if key not in _LAYERS:
+            _LAYERS[key] = arr
+            _LAYERS_BYTES += arr.nbytes
+        while _LAYERS_BYTES > _LAYER_CACHE_BYTES and len(_LAYERS) > 1:
+            _, old = _LAYERS.popitem(last=False)
+            _LAYERS_BYTES -= old.nbytes
+    return arr
+
+
+def _load_image(rel: Optional[str]):
+    if not rel:
+        return None
+    from PIL import Image
+
+    with Image.open(os.path.join(GFX_ROOT, *rel.split("/"))) as im:
+        return im.convert("RGBA")
+
+
+# ── compositing (premultiplied float32 H x W x 4) ─────────────────────────────
+
+def _over(dst: np.ndarray, src: np.ndarray) -> None:
+    dst *= 1.0 - src[..., 3:4]
+    dst += src
+
+
+def _over_at(dst: np.ndarray, src: np.ndarray, x: int, y: int) -> None:
+    """Source-over ``src`` onto ``dst`` with its top-left at (x, y), clipped to ``dst``."""
+    H, W = dst.shape[:2]
+    h, w = src.shape[:2]
+    x0, y0 = max(0, x), max(0, y)
+    x1, y1 = min(W, x + w), min(H, y + h)
+    if x0 >= x1 or y0 >= y1:
+        return
+    _over(dst[y0:y1, x0:x1], src[y0 - y:y1 - y, x0 - x:x1 - x])
+
+
+def _tinted(alpha: np.ndarray, color: str) -> np.ndarray:
+    """fillRect(color) + destination-in mask: the color with the mask's alpha."""
+    out = np.empty(alpha.shape + (4,), dtype=np.float32)
+    out[..., :3] = alpha[..., None] * _rgb(color)
+    out[..., 3] = alpha
+    return out
+
+
+def _blend(dst: np.ndarray, src: np.ndarray, mode: str) -> np.ndarray:
+    """Canvas separable blend (``multiply`` / ``screen``) of src over dst."""
+    sa, da = src[..., 3:4], dst[..., 3:4]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cs = np.where(sa > 0, src[..., :3] / sa, 0.0)
+        cb = np.where(da > 0, dst[..., :3] / da, 0.0)
+    mixed = cs * cb if mode == "multiply" else cs + cb - cs * cb
+    out = np.empty_like(dst)
+    out[..., :3] = src[..., :3] * (1.0 - da) + dst[..., :3] * (1.0 - sa) + sa * da * mixed
+    out[..., 3:4] = sa + da - sa * da
+    return out
+
+
+def _apply_shadow(comp: np.ndarray, shadow: Optional[np.ndarray]) -> np.ndarray:
+    """Multiply, then destination-in the original composite (shadows never add coverage)."""
+    if shadow is None:
+        return comp
+    return _blend(comp, shadow, "multiply") * comp[..., 3:4]
+
+
+def _apply_highlight(comp: np.ndarray, highlight: Optional[np.ndarray]) -> np.ndarray:
+    if highlight is None:
+        return comp
+    return _blend(comp, highlight, "screen")
+
+
+def _pattern_alpha(img, layer: Dict[str, Any], w: int, h: int) -> np.ndarray:
+    """``buildPatternAt`` coverage: tiled, offset and rotated about the canvas centre."""
+    from PIL import Image
+
+    res_factor = w / LAYER_BASE_WIDTH
+    tw = max(1, round(img.width * layer["scale"] * res_factor))
+    th = max(1, round(img.height * layer["scale"] * res_factor))
+    tile = np.asarray(img.resize((tw, th), Image.Resampling.BILINEAR).getchannel("A"), dtype=np.float32) / 255.0
+    ox, oy = layer["offsetX"] * tw, layer["offsetY"] * th
+    theta = math.radians(layer["rotateDeg"] or 0.0)
+    cos_t, sin_t = math.cos(theta), math.sin(theta)
+
+    ys, xs = np.mgrid[0:h, 0:w].astype(np.float32)
+    u, v = xs + 0.5 - w * 0.5, ys + 0.5 - h * 0.5
+    px = cos_t * u + sin_t * v + w * 0.5 - ox
+    py = -sin_t * u + cos_t * v + h * 0.5 - oy
+    covered = (px >= -ox) & (px < w - ox) & (py >= -oy) & (py < h - oy)
+    alpha = tile[np.floor(py).astype(np.int64) % th, np.floor(px).astype(np.int64) % tw]
+    return np.where(covered, alpha, 0.0).astype(np.float32)
+
+
+def _rounded_rect(w: int, h: int, box: Tuple[float, float, float, float], radius: float, color: str) -> np.ndarray:
+    from PIL import Image, ImageDraw
+
+    mask = Image.new("L", (w, h), 0)
+    x, y, bw, bh = box
+    ImageDraw.Draw(mask).rounded_rectangle(
+        (round(x), round(y), round(x + bw) - 1, round(y + bh) - 1), radius=max(0, round(radius)), fill=255
+    )
+    return _tinted(np.asarray(mask, dtype=np.float32) / 255.0, color)
+
+
+def _draw_overlays(comp: np.ndarray, spec: Dict[str, Any], layers: Dict[str, Any]) -> None:
+    """``drawOverlays``: sponsor background, sponsor art / tinted masks, crest."""
+    from PIL import Image
+
+    H, W = comp.shape[:2]
+    px = W / LAYER_BASE_WIDTH
+    chest_w = W * 0.72
+    cx, cy = W * spec["sponsorX"], H * spec["sponsorY"]
+    max_w = chest_w * spec["sponsorScale"]
+    max_h = max_w * 0.35
+    bg_sx = max(0.60, min(1.20, spec["sponsorBgScaleX"] or 1))
+    bg_sy = max(0.60, min(1.20, spec["sponsorBgScaleY"] or 1))
+    bg_color = spec["shirtPrimaryColor"] if spec["sponsorBg"] == "primary" else spec["shirtSecondaryColor"]
+
+    sponsor = {k: _load_image(v) for k, v in layers["sponsor"].items()}
+    base = sponsor.get("fixed") or sponsor.get("primary") or sponsor.get("secondary") or sponsor.get("tertiary")
+    if spec["sponsorVisible"] and base is not None:
+        scale = min(max_w / base.width, max_h / base.height)
+        sw, sh = base.width * scale, base.height * scale
+        sx, sy = round(cx - sw / 2), round(cy - sh / 2)
+        if spec["sponsorBg"] != "transparent":
+            pad = 4 * px
+            bw, bh = sw * bg_sx, sh * bg_sy
+            box = (cx - bw / 2 - pad, cy - bh / 2 - pad, bw + pad * 2, bh + pad * 2)
+            _over(comp, _rounded_rect(W, H, box, 4 * px, bg_color))
+        size = (max(1, round(sw)), max(1, round(sh)))
+        if sponsor.get("fixed") is not None:
+            _over_at(comp, _to_premultiplied(sponsor["fixed"].resize(size, Image.Resampling.LANCZOS)), sx, sy)
+        for role in ("primary", "secondary", "tertiary"):
+            img = sponsor.get(role)
+            if img is None or (role != "primary" and spec[f"sponsorMask{role.capitalize()}Transparent"]):
+                continue
+            alpha = np.asarray(img.resize(size, Image.Resampling.LANCZOS).getchannel("A"), dtype=np.float32) / 255.0
+            _over_at(comp, _tinted(alpha, spec[f"sponsorMask{role.capitalize()}Color"]), sx, sy)
+    elif spec["sponsorBg"] != "transparent":
+        bw, bh = max_w * bg_sx, max_h * bg_sy
+        _over(comp, _rounded_rect(W, H, (cx - bw / 2, cy - bh / 2, bw, bh), 4 * px, bg_color))
+
+    crest = _load_image(layers["crest"]) if spec["crestVisible"] else None
+    if crest is not None:
+        max_s = H * spec["crestScale"]
+        scale = min(max_s / crest.width, max_s / crest.height)
+        cw, ch = max(1, round(crest.width * scale)), max(1, round(crest.height * scale))
+        img = _to_premultiplied(crest.resize((cw, ch), Image.Resampling.LANCZOS))
+        _over_at(comp, img, round(W * spec["crestX"] - cw / 2), round(H * spec["crestY"] - ch / 2))
+
+
+def _render_parts_for_role(comp, spec, layers, parts, role, w, h, patterns) -> None:
+    masks = layers["masks"]
+    for part in parts:
+        color = _spec_color(spec, part, role)
+        mask = _load_layer(masks.get((part, role)), w, h) if color else None
+        if mask is not None:
+            _over(comp, _tinted(mask[..., 3], color))
+
+    for layer, img in zip(spec["patternLayers"], patterns):
+        if img is None or not layer["targets"]:
+            continue
+        clip = None
+        for target in layer["targets"]:
+            t_part, _, t_role = target.partition("_")
+            if t_role != role or t_part not in parts:
+                continue
+            mask = _load_layer(masks.get((t_part, role)), w, h)
+            if mask is not None:
+                a = mask[..., 3]
+                clip = a if clip is None else clip + a * (1.0 - clip)
+        if clip is not None:
+            _over(comp, _tinted(_pattern_alpha(img, layer, w, h) * clip, layer["color"]))
+
+
+def _combined(rels: Sequence[Optional[str]], w: int, h: int) -> Optional[np.ndarray]:
+    out = None
+    for rel in rels:
+        layer = _load_layer(rel, w, h)
+        if layer is None:
+            continue
+        if out is None:
+            out = layer.copy()
+        else:
+            _over(out, layer)
+    return out
+
+
+def _composite(spec: Dict[str, Any], layers: Dict[str, Any], width: int) -> np.ndarray:
+    from PIL import Image
+
+    shirt = layers["masks"][("shirt", "primary")]
+    if not shirt:
+        raise ValueError("no shirt primary mask (kit_templates/fullkit/mask_shirt_primary.png)")
+    # Canvas aspect ratio from the shirt primary mask, like the designer's CH
+    with Image.open(os.path.join(GFX_ROOT, *shirt.split("/"))) as im:
+        nw, nh = im.size
+    w, h = width, max(1, round(width * nh / nw))
+
+    comp = np.zeros((h, w, 4), dtype=np.float32)
+    patterns = [_load_image(rel) for rel in layers["patterns"]]
+    overlays = layers["overlays"]
+
+    for role in ROLES:
+        _render_parts_for_role(comp, spec, layers, BODY_PARTS, role, w, h, patterns)
+    _draw_overlays(comp, spec, layers)
+    comp = _apply_shadow(comp, _combined([overlays["shirt_shadows"], overlays["shorts_socks_shadows"]], w, h))
+    comp = _apply_highlight(comp, _combined([overlays["shirt_highlights"], overlays["shorts_socks_highlights"]], w, h))
+    comp = _apply_shadow(comp, _load_layer(layers["collar_under_shadows"], w, h))
+    for role in ROLES:
+        _render_parts_for_role(comp, spec, layers, ("collar",), role, w, h, patterns)
+    comp = _apply_shadow(comp, _load_layer(layers["collar_shadows"], w, h))
+    comp = _apply_highlight(comp, _load_layer(layers["collar_highlights"], w, h))
+    boots = _load_layer(overlays["boots"], w, h)
+    if boots is not None:
+        _over(comp, boots)
+    return comp
+
+
+def _encode(comp: np.ndarray, fmt: str) -> bytes:
+    from PIL import Image
+
+    alpha = comp[..., 3:4]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rgb = np.where(alpha > 0, comp[..., :3] / alpha, 0.0)
+    rgba = np.concatenate([rgb, alpha], axis=2)
+    im = Image.fromarray(np.clip(rgba * 255.0 + 0.5, 0, 255).astype(np.uint8), "RGBA")
+    buf = io.BytesIO()
+    if fmt == "webp":
+        im.save(buf, "WEBP", quality=90, method=4)
+    else:
+        im.save(buf, "PNG", optimize=False, compress_level=6)
+    return buf.getvalue()
+
+
+# ── render cache ──────────────────────────────────────────────────────────────
+
+_RENDERS: "OrderedDict[str, bytes]" = OrderedDict()
+_RENDERS_BYTES = 0
+_RENDERS_LOCK = threading.Lock()
+_KEY_LOCKS: Dict[str, threading.Lock] = {}
+_RENDER_DISK = DiskLRU(KIT_RENDER_DIR, KIT_RENDER_CACHE_MAX_BYTES, label="kit renders")
+
+
+def render_path(key: str, fmt: str) -> str:
+    return os.path.join(KIT_RENDER_DIR, key[:2], f"{key}.{fmt}")
+
+
+def _remember(key: str, data: bytes) -> None:
+    global _RENDERS_BYTES
+    with _RENDERS_LOCK:
+        if key in _RENDERS:
+            _RENDERS.move_to_end(key)
+            return
+        _RENDERS[key] = data
+        _RENDERS_BYTES += len(data)
+        while _RENDERS_BYTES > _MEMORY_CACHE_BYTES and len(_RENDERS) > 1:
+            _, old = _RENDERS.popitem(last=False)
+            _RENDERS_BYTES -= len(old)
+
+
+def cached_render(key: str, fmt: str) -> Optional[bytes]:
+    """A finished render by key (memory, then disk), or None."""
+    if fmt not in RENDER_FORMATS:
+        return None
+    mem_key = f"{key}.{fmt}"
+    with _RENDERS_LOCK:
+        data = _RENDERS.get(mem_key)
+        if data is not None:
+            _RENDERS.move_to_end(mem_key)
+            return data
+    path = render_path(key, fmt)
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    _RENDER_DISK.touch(path, len(data))
+    _remember(mem_key, data)
+    return data
+
+
+def render_kit(config: Dict[str, Any], width: int = 256, fmt: str = "png") -> Tuple[str, bytes]:
+    """
+    Render a kit designer config at ``width`` px wide as ``fmt`` (png / webp).
+    Returns ``(cache key, encoded image)``; the same spec and assets give the same key.
+    Raises ValueError on a bad spec (values, unknown kit / pattern / ... names), width or format.
+    """
+    if fmt not in RENDER_FORMATS:
+        raise ValueError(f"format must be one of {', '.join(RENDER_FORMATS)}")
+    width = int(width)
+    if width not in RENDER_WIDTHS:
+        raise ValueError(f"width must be one of {', '.join(map(str, RENDER_WIDTHS))}")
+    spec = normalize_kit_spec(config)
+    layers = resolve_kit_layers(spec)
+    key = render_key(spec, width, fmt, layers)
+
+    data = cached_render(key, fmt)
+    if data is not None:
+        return key, data
+    with _RENDERS_LOCK:
+        key_lock = _KEY_LOCKS.setdefault(key, threading.Lock())
+    with key_lock:
+        # Another request may have rendered it while we waited
+        data = cached_render(key, fmt)
+        if data is None:
+            data = _encode(_composite(spec, layers, width), fmt)
+            path = render_path(key, fmt)
+            write_atomic(path, data)
+            _RENDER_DISK.touch(path, len(data))
+            _remember(f"{key}.{fmt}", data)
+    with _RENDERS_LOCK:
+        _KEY_LOCKS.pop(key, None)
+    return key, data
@@ -9,17 +9,25 @@ Custom pools may set `surname_inherit_pool_id` (e.g. country_XXX) instead of dup
 `custom_us_modern`, `custom_african_american`) use empty `surnames` tiers in JSON and rely on
 runtime sampling from `country_USA` (see `effective_surname_pool_for_sampling` in name_generation).
 
-Heritage, federation, and optional JSON mirrors come from
+Heritage and federation data come from
 data/heritage_composition/FullHeritageAndNamingComposition.txt at import
 (heritage_composition.apply_to_name_data): HERITAGE_CONFIG, COUNTRY_FEDERATION,
-LOCAL_CORE_NAMING_POOLS, HERITAGE_PICTURE_FOLDER_MAP.
+LOCAL_CORE_NAMING_POOLS, HERITAGE_PICTURE_FOLDER_MAP. Import only reads files; the JSON
+mirrors (country_federation.json, local_core_naming_pools_generated.json) are written by
+heritage_composition.export_composition_json / scripts/migrate_naming_and_heritage_exports.py.
+
+All registries live on a ``NameDataState``; ``reload_name_data()`` rebuilds one from disk
+and publishes it with a single reference swap, so edited pool JSON or composition files can be
+picked up without restarting workers. Read registries as ``name_data.HERITAGE_CONFIG`` (or via
+``current_state()``) rather than binding them with ``from name_data import ...`` at module
+level, which would keep the pre-reload dicts.
 
 The composition file is tab-separated; preferred columns are:
 Region, NationalityCode (FIFA 3-letter), Country (display name), VisualBucket, percent,
 naming pool, naming split. See utils/heritage_composition.py module docstring.
 
 To support manual edits of `data/heritage_composition/local_core_naming_pools.json`, the app
-loads that frozen file first, and regenerated results are routed into
+loads that frozen file first; regenerated results are exported to
 `data/heritage_composition/local_core_naming_pools_generated.json` instead of overwriting the
 frozen file.
 
@@ -29,8 +37,10 @@ Optional: heritage_groups_export.json from scripts/migrate_naming_and_heritage_e
 import copy
 import json
 import re
+import threading
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 # ── Paths ─────────────────────────────────────────────────────────────────────
 _BASE_DIR = Path(__file__).resolve().parent.parent
@@ -148,22 +158,62 @@ def _normalize_tier_probs(data: dict) -> Optional[Dict[str, Dict[str, float]]]:
 # Deprecated: old pair-based compound bias (7-tier compound uses simplified roll in name_generation).
 COMPOUND_SURNAME_TIER_BIAS: Dict[Tuple[str, str], float] = {}
 
-# ── Load name pools from JSON ─────────────────────────────────────────────────
-# Primary key: FIFA-style country code (e.g. ENG). Also indexed by pool_id in NAME_POOLS_BY_ID.
-COUNTRY_NAME_POOLS: Dict[str, Dict] = {}
-NAME_POOLS_BY_ID: Dict[str, Dict] = {}
-# pool_id (country_* / custom_*) -> FIFA code from JSON (tier probs / connectors)
-POOL_ID_TO_COUNTRY_CODE: Dict[str, str] = {}
-COUNTRY_TIER_PROBS: Dict[str, Dict[str, Dict[str, float]]] = {}
-# pool_id -> {"given": {...7 tiers...}, "surname": {...}} (normalized); includes custom_*.
-POOL_TIER_PROBS: Dict[str, Dict[str, Dict[str, float]]] = {}
+
+class NameDataState:
+    """
+    One complete set of name / heritage registries.
+
+    Built off to the side by ``build_name_data`` and published with a single assignment to
+    ``_STATE``; a published state is never mutated again. The upper-case module attributes
+    (``name_data.HERITAGE_CONFIG`` etc.) resolve against the active state.
+    """
+
+    def __init__(self, generation: int = 0):
+        # ── Name pools from JSON ──
+        # Primary key: FIFA-style country code (e.g. ENG). Also indexed by pool_id in NAME_POOLS_BY_ID.
+        self.COUNTRY_NAME_POOLS: Dict[str, Dict] = {}
+        self.NAME_POOLS_BY_ID: Dict[str, Dict] = {}
+        # pool_id (country_* / custom_*) -> FIFA code from JSON (tier probs / connectors)
+        self.POOL_ID_TO_COUNTRY_CODE: Dict[str, str] = {}
+        self.COUNTRY_TIER_PROBS: Dict[str, Dict[str, Dict[str, float]]] = {}
+        # pool_id -> {"given": {...7 tiers...}, "surname": {...}} (normalized); includes custom_*.
+        self.POOL_TIER_PROBS: Dict[str, Dict[str, Dict[str, float]]] = {}
+
+        self.MIDDLE_NAME_PROBS: Dict[str, float] = {"default": 0.15}
+        self.COMPOUND_SURNAME_PROBS: Dict[str, float] = {"default": 0.05}
+        self.SURNAME_CONNECTORS: Dict[str, str] = {"default": "-"}
+        # Per pool_id (country_* / custom_*): optional fields from each JSON; used by name_generation.
+        self.POOL_MIDDLE_NAME_PROBS: Dict[str, float] = {}
+        self.POOL_COMPOUND_SURNAME_PROBS: Dict[str, float] = {}
+        self.POOL_SURNAME_CONNECTORS: Dict[str, str] = {}
+
+        # nationality_code -> [{ "pool_id": "country_XXX", "weight": float }, ...]
+        self.LOCAL_CORE_NAMING_POOLS: Dict[str, List[Dict[str, Any]]] = {}
+
+        # ── Heritage (filled only from FullHeritageAndNamingComposition.txt) ──
+        self.HERITAGE_CONFIG: Dict[str, Dict] = {}
+        self.HERITAGE_PICTURE_FOLDER_MAP: Dict[str, str] = {}
+        # Legacy alias — some code references this; it's now a subset of COUNTRY_NAME_POOLS
+        self.HERITAGE_NAME_POOLS: Dict[str, Dict] = {}
+        # Country code -> confederation (UEFA, CONMEBOL, …) from heritage composition
+        self.COUNTRY_FEDERATION: Dict[str, str] = {}
+
+        # Incremented on every reload; consumers that compile derived tables (name_generation
+        # selection plans) compare it to drop stale caches.
+        self.COMPOSITION_GENERATION = generation
+        # (name, mtime, size) of the source files this state was read from
+        self.SOURCE_FINGERPRINT: Tuple = ()
+
+
+_STATE_ATTRS = frozenset(vars(NameDataState()).keys())
 
 
 def tier_probs_for_pool(pool_id: str, country_code: str, branch: str) -> Dict[str, float]:
     """Resolve normalized 7-tier probs: prefer ``POOL_TIER_PROBS[pool_id]``, else FIFA code, else uniform."""
+    st = _STATE
     b = "surname" if (branch or "").strip().lower() == "surname" else "given"
     default = DEFAULT_GIVEN_NAME_TIER_PROBS if b == "given" else DEFAULT_SURNAME_TIER_PROBS
-    pt = POOL_TIER_PROBS.get(pool_id)
+    pt = st.POOL_TIER_PROBS.get(pool_id)
     if isinstance(pt, dict):
         row = pt.get(b)
         if isinstance(row, dict) and set(row.keys()) == set(NAME_POOL_TIER_KEYS):
@@ -171,7 +221,7 @@ def tier_probs_for_pool(pool_id: str, country_code: str, branch: str) -> Dict[st
             if s > 0:
                 return {k: float(row[k]) / s for k in NAME_POOL_TIER_KEYS}
     cc = (country_code or "").strip()
-    row = COUNTRY_TIER_PROBS.get(cc, {}).get(b)
+    row = st.COUNTRY_TIER_PROBS.get(cc, {}).get(b)
     if isinstance(row, dict) and set(row.keys()) == set(NAME_POOL_TIER_KEYS):
         s = sum(float(row[k]) for k in NAME_POOL_TIER_KEYS)
         if s > 0:
@@ -179,28 +229,19 @@ def tier_probs_for_pool(pool_id: str, country_code: str, branch: str) -> Dict[st
     return dict(default)
 
 
-def _register_pool_tier_probs(pool_id: str, country_code: str, data: dict, is_custom: bool) -> None:
+def _register_pool_tier_probs(
+    st: NameDataState, pool_id: str, country_code: str, data: dict, is_custom: bool
+) -> None:
     if "tier_probs" not in data:
         return
     tp = _normalize_tier_probs(data)
     if tp is None:
         return
-    POOL_TIER_PROBS[pool_id] = tp
+    st.POOL_TIER_PROBS[pool_id] = tp
     if not is_custom:
-        COUNTRY_TIER_PROBS[str(country_code)] = tp
+        st.COUNTRY_TIER_PROBS[str(country_code)] = tp
 
 
-MIDDLE_NAME_PROBS: Dict[str, float] = {"default": 0.15}
-COMPOUND_SURNAME_PROBS: Dict[str, float] = {"default": 0.05}
-SURNAME_CONNECTORS: Dict[str, str] = {"default": "-"}
-# Per pool_id (country_* / custom_*): optional fields from each JSON; used by name_generation.
-POOL_MIDDLE_NAME_PROBS: Dict[str, float] = {}
-POOL_COMPOUND_SURNAME_PROBS: Dict[str, float] = {}
-POOL_SURNAME_CONNECTORS: Dict[str, str] = {}
-
-# nationality_code -> [{ "pool_id": "country_XXX", "weight": float }, ...]
-LOCAL_CORE_NAMING_POOLS: Dict[str, List[Dict[str, Any]]] = {}
-
 # Remap legacy / removed pool_id strings from local_core_naming_pools.json to pools that exist on disk.
 _LOCAL_CORE_POOL_ID_ALIASES: Dict[str, str] = {
     "custom_wales": "country_WAL",
@@ -240,56 +281,61 @@ def _alias_local_core_pool_id(pool_id: str) -> str:
     return _LOCAL_CORE_POOL_ID_ALIASES.get(pool_id, pool_id)
 
 
-def _register_pool_optional_fields(pool_id: str, data: dict) -> None:
+def _register_pool_optional_fields(st: NameDataState, pool_id: str, data: dict) -> None:
     """Middle / compound / connector from pool JSON, keyed by pool_id; also mirror country_* into legacy dicts."""
     code = data.get("country_code")
     is_custom = pool_id.startswith("custom_")
     if "middle_name_prob" in data:
-        POOL_MIDDLE_NAME_PROBS[pool_id] = float(data["middle_name_prob"])
+        st.POOL_MIDDLE_NAME_PROBS[pool_id] = float(data["middle_name_prob"])
         if code and not is_custom:
-            MIDDLE_NAME_PROBS[str(code)] = data["middle_name_prob"]
+            st.MIDDLE_NAME_PROBS[str(code)] = data["middle_name_prob"]
     if "compound_surname_prob" in data:
-        POOL_COMPOUND_SURNAME_PROBS[pool_id] = float(data["compound_surname_prob"])
+        st.POOL_COMPOUND_SURNAME_PROBS[pool_id] = float(data["compound_surname_prob"])
         if code and not is_custom:
-            COMPOUND_SURNAME_PROBS[str(code)] = data["compound_surname_prob"]
+            st.COMPOUND_SURNAME_PROBS[str(code)] = data["compound_surname_prob"]
     if "surname_connector" in data:
-        POOL_SURNAME_CONNECTORS[pool_id] = str(data["surname_connector"])
+        st.POOL_SURNAME_CONNECTORS[pool_id] = str(data["surname_connector"])
         if code and not is_custom:
-            SURNAME_CONNECTORS[str(code)] = data["surname_connector"]
+            st.SURNAME_CONNECTORS[str(code)] = data["surname_connector"]
 
 
 def middle_name_prob_for_pool(pool_id: str, nationality: str) -> float:
-    v = POOL_MIDDLE_NAME_PROBS.get(pool_id)
+    st = _STATE
+    v = st.POOL_MIDDLE_NAME_PROBS.get(pool_id)
     if v is not None:
         return float(v)
-    cc = POOL_ID_TO_COUNTRY_CODE.get(pool_id, nationality)
-    return float(MIDDLE_NAME_PROBS.get(cc, MIDDLE_NAME_PROBS.get("default", 0.15)))
+    cc = st.POOL_ID_TO_COUNTRY_CODE.get(pool_id, nationality)
+    return float(st.MIDDLE_NAME_PROBS.get(cc, st.MIDDLE_NAME_PROBS.get("default", 0.15)))
 
 
 def compound_surname_prob_for_pool(pool_id: str, nationality: str) -> float:
-    v = POOL_COMPOUND_SURNAME_PROBS.get(pool_id)
+    st = _STATE
+    v = st.POOL_COMPOUND_SURNAME_PROBS.get(pool_id)
     if v is not None:
         return float(v)
-    cc = POOL_ID_TO_COUNTRY_CODE.get(pool_id, nationality)
-    return float(COMPOUND_SURNAME_PROBS.get(cc, COMPOUND_SURNAME_PROBS.get("default", 0.05)))
+    cc = st.POOL_ID_TO_COUNTRY_CODE.get(pool_id, nationality)
+    return float(st.COMPOUND_SURNAME_PROBS.get(cc, st.COMPOUND_SURNAME_PROBS.get("default", 0.05)))
 
 
 def surname_connector_for_pool(pool_id: str, nationality: str) -> str:
-    v = POOL_SURNAME_CONNECTORS.get(pool_id)
+    st = _STATE
+    v = st.POOL_SURNAME_CONNECTORS.get(pool_id)
     if v is not None:
         return str(v)
-    cc = POOL_ID_TO_COUNTRY_CODE.get(pool_id, nationality)
-    return str(SURNAME_CONNECTORS.get(cc, SURNAME_CONNECTORS.get("default", "-")))
+    cc = st.POOL_ID_TO_COUNTRY_CODE.get(pool_id, nationality)
+    return str(st.SURNAME_CONNECTORS.get(cc, st.SURNAME_CONNECTORS.get("default", "-")))
 
 
-def _register_tiered_pool(pool_id: str, code: str, tiered: Dict[str, Any], is_custom: bool) -> None:
-    NAME_POOLS_BY_ID[pool_id] = tiered
-    POOL_ID_TO_COUNTRY_CODE[pool_id] = code
+def _register_tiered_pool(
+    st: NameDataState, pool_id: str, code: str, tiered: Dict[str, Any], is_custom: bool
+) -> None:
+    st.NAME_POOLS_BY_ID[pool_id] = tiered
+    st.POOL_ID_TO_COUNTRY_CODE[pool_id] = code
     if not is_custom:
-        COUNTRY_NAME_POOLS[code] = tiered
+        st.COUNTRY_NAME_POOLS[code] = tiered
 
 
-def _ingest_surname_inherit_pool(data: dict) -> None:
+def _ingest_surname_inherit_pool(st: NameDataState, data: dict) -> None:
     """Finish loading a pool that lists `surname_inherit_pool_id` instead of inline `surnames`."""
     code = data.get("country_code")
     if not code:
@@ -298,7 +344,7 @@ def _ingest_surname_inherit_pool(data: dict) -> None:
     ref_id = (data.get("surname_inherit_pool_id") or "").strip()
     if not ref_id:
         return
-    ref = NAME_POOLS_BY_ID.get(ref_id)
+    ref = st.NAME_POOLS_BY_ID.get(ref_id)
     if not ref or not ref.get("surnames"):
         print(
             f"Warning: surname_inherit_pool_id {ref_id!r} missing or has no surnames "
@@ -310,12 +356,12 @@ def _ingest_surname_inherit_pool(data: dict) -> None:
         "surnames": _normalize_tiered_block(copy.deepcopy(ref.get("surnames"))),
     }
     is_custom = pool_id.startswith("custom_")
-    _register_tiered_pool(pool_id, code, tiered, is_custom)
-    _register_pool_optional_fields(pool_id, data)
-    _register_pool_tier_probs(pool_id, str(code), data, is_custom)
+    _register_tiered_pool(st, pool_id, code, tiered, is_custom)
+    _register_pool_optional_fields(st, pool_id, data)
+    _register_pool_tier_probs(st, pool_id, str(code), data, is_custom)
 
 
-def _ingest_name_pool_file(json_file: Path, data: dict) -> None:
+def _ingest_name_pool_file(st: NameDataState, json_file: Path, data: dict) -> None:
     code = data.get("country_code")
     if not code:
         print(f"Warning: No country_code in {json_file}, skipping")
@@ -331,18 +377,16 @@ def _ingest_name_pool_file(json_file: Path, data: dict) -> None:
             "given_names_male": _normalize_tiered_block(data.get("given_names_male")),
             "surnames": _normalize_tiered_block(data.get("surnames")),
         }
-        _register_tiered_pool(pool_id, code, tiered, is_custom)
-        _register_pool_optional_fields(pool_id, data)
-        _register_pool_tier_probs(pool_id, str(code), data, is_custom)
+        _register_tiered_pool(st, pool_id, code, tiered, is_custom)
+        _register_pool_optional_fields(st, pool_id, data)
+        _register_pool_tier_probs(st, pool_id, str(code), data, is_custom)
 
 
-def _load_name_pools():
+def _load_name_pools(st: NameDataState) -> None:
     """Load name pools: country_*.json, custom_*.json, legacy <CCC>.json."""
     if not _NAME_POOLS_DIR.exists():
         return
 
-    POOL_TIER_PROBS.clear()
-
     seen: set[Path] = set()
     globs: List[Path] = []
     for pattern in ("country_*.json", "custom_*.json"):
@@ -356,6 +400,8 @@ def _load_name_pools():
         if _LEGACY_POOL_FILENAME.match(fp.name):
             globs.append(fp)
 
+    # Parse each file once; the second pass resolves surname_inherit_pool_id references.
+    loaded: List[Dict[str, Any]] = []
     for json_file in globs:
         try:
             with open(json_file, "r", encoding="utf-8") as f:
@@ -363,19 +409,15 @@ def _load_name_pools():
         except (json.JSONDecodeError, IOError) as e:
             print(f"Warning: Could not load name pool {json_file}: {e}")
             continue
-        _ingest_name_pool_file(json_file, data)
+        _ingest_name_pool_file(st, json_file, data)
+        loaded.append(data)
 
-    for json_file in globs:
-        try:
-            with open(json_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, IOError):
-            continue
+    for data in loaded:
         if (data.get("surname_inherit_pool_id") or "").strip() and "surnames" not in data:
-            _ingest_surname_inherit_pool(data)
+            _ingest_surname_inherit_pool(st, data)
 
 
-def _load_local_core_naming_pools() -> None:
+def _load_local_core_naming_pools(st: NameDataState) -> None:
     if not _LOCAL_CORE_FILE.is_file():
         return
     try:
@@ -399,48 +441,29 @@ def _load_local_core_naming_pools() -> None:
                 fixed.append(ne)
             else:
                 fixed.append(e)
-        LOCAL_CORE_NAMING_POOLS[str(nat)] = fixed
-
-
-# ── Heritage (filled only from FullHeritageAndNamingComposition.txt) ───────────
-HERITAGE_CONFIG: Dict[str, Dict] = {}
-HERITAGE_PICTURE_FOLDER_MAP: Dict[str, str] = {}
-
-# Legacy alias — some code references this; it's now a subset of COUNTRY_NAME_POOLS
-HERITAGE_NAME_POOLS: Dict[str, Dict] = {}
-
-# Country code -> confederation (UEFA, CONMEBOL, …) from heritage composition
-COUNTRY_FEDERATION: Dict[str, str] = {}
+        st.LOCAL_CORE_NAMING_POOLS[str(nat)] = fixed
 
 
-# ── Initialize on import ──────────────────────────────────────────────────────
-_load_name_pools()
-
-
-def _apply_heritage_composition_file():
+def _apply_heritage_composition_file(st: NameDataState) -> None:
     """Load FullHeritageAndNamingComposition.txt into heritage + local core; fallback JSON if empty."""
     try:
         from utils import heritage_composition
 
         # Load LOCAL core pools from the (potentially manually edited) frozen JSON first.
         # `heritage_composition.apply_to_name_data()` will only backfill it if missing/empty.
-        _load_local_core_naming_pools()
+        _load_local_core_naming_pools(st)
 
-        n, _rows = heritage_composition.apply_to_name_data()
+        n, _rows = heritage_composition.apply_to_name_data(st)
         if n == 0:
             # If the composition overlay isn't available, just keep whatever we loaded from disk.
-            _load_local_core_naming_pools()
+            _load_local_core_naming_pools(st)
     except Exception as e:
         print(f"Warning: heritage composition overlay skipped: {e}")
-        _load_local_core_naming_pools()
-
+        _load_local_core_naming_pools(st)
 
-_apply_heritage_composition_file()
 
-# Build HERITAGE_NAME_POOLS for backward compatibility
-# Any country referenced in heritage groups but not a "main" nationality gets added here
-def _fifa_from_origin_pool_id(pool_id: str) -> Optional[str]:
-    cc = POOL_ID_TO_COUNTRY_CODE.get(pool_id)
+def _fifa_from_origin_pool_id(st: NameDataState, pool_id: str) -> Optional[str]:
+    cc = st.POOL_ID_TO_COUNTRY_CODE.get(pool_id)
     if cc:
         return cc
     if pool_id.startswith("country_") and len(pool_id) > len("country_"):
@@ -448,17 +471,140 @@ def _fifa_from_origin_pool_id(pool_id: str) -> Optional[str]:
     return None
 
 
-for _nat_code, _groups in HERITAGE_CONFIG.items():
-    for _group_name, _group_config in _groups.items():
-        _pool_w = _group_config.get("origin_pool_weights") or {}
-        _fifa_keys: Set[str] = set()
-        for _pid in _pool_w.keys():
-            _f = _fifa_from_origin_pool_id(_pid)
-            if _f:
-                _fifa_keys.add(_f)
-        for _origin_code in _group_config.get("origin_country_weights", {}).keys():
-            if len(_origin_code) == 3 and _origin_code.isupper():
-                _fifa_keys.add(_origin_code)
-        for _origin_code in _fifa_keys:
-            if _origin_code in COUNTRY_NAME_POOLS and _origin_code != _nat_code:
-                HERITAGE_NAME_POOLS[_origin_code] = COUNTRY_NAME_POOLS[_origin_code]
+def _build_heritage_name_pools(st: NameDataState) -> None:
+    """
+    HERITAGE_NAME_POOLS for backward compatibility: any country referenced in heritage groups
+    but not a "main" nationality gets added here.
+    """
+    for nat_code, groups in st.HERITAGE_CONFIG.items():
+        for _group_name, group_config in groups.items():
+            pool_w = group_config.get("origin_pool_weights") or {}
+            fifa_keys: Set[str] = set()
+            for pid in pool_w.keys():
+                f = _fifa_from_origin_pool_id(st, pid)
+                if f:
+                    fifa_keys.add(f)
+            for origin_code in group_config.get("origin_country_weights", {}).keys():
+                if len(origin_code) == 3 and origin_code.isupper():
+                    fifa_keys.add(origin_code)
+            for origin_code in fifa_keys:
+                if origin_code in st.COUNTRY_NAME_POOLS and origin_code != nat_code:
+                    st.HERITAGE_NAME_POOLS[origin_code] = st.COUNTRY_NAME_POOLS[origin_code]
+
+
+def source_fingerprint() -> Tuple:
+    """Cheap signature of the name pool / composition files (a few ms for ~200 files)."""
+    out = []
+    for folder in (_NAME_POOLS_DIR, _COMPOSITION_DIR):
+        if not folder.exists():
+            continue
+        for fp in sorted(folder.iterdir()):
+            try:
+                st = fp.stat()
+            except OSError:
+                continue
+            out.append((folder.name, fp.name, st.st_mtime_ns, st.st_size))
+    return tuple(out)
+
+
+def build_name_data(generation: int = 0) -> NameDataState:
+    """Read pools + composition from disk into a fresh, unpublished state (no file writes)."""
+    st = NameDataState(generation)
+    # Taken first: a file edited while we read it makes the next check reload again
+    st.SOURCE_FINGERPRINT = source_fingerprint()
+    _load_name_pools(st)
+    _apply_heritage_composition_file(st)
+    _build_heritage_name_pools(st)
+    return st
+
+
+# ── Active state ──────────────────────────────────────────────────────────────
+_STATE: NameDataState = build_name_data()
+_RELOAD_LOCK = threading.Lock()
+_RELOAD_HOOKS: List[Callable[[NameDataState], None]] = []
+_RELOAD_STATUS: Dict[str, Any] = {
+    "in_progress": False,
+    "generation": _STATE.COMPOSITION_GENERATION,
+    "last_reload_at": None,
+    "last_duration_s": None,
+    "last_error": None,
+}
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562: registry names resolve against the active state at access time.
+    if name in _STATE_ATTRS:
+        return getattr(_STATE, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def current_state() -> NameDataState:
+    """Active registries; hold the returned object to read one consistent snapshot."""
+    return _STATE
+
+
+def register_reload_hook(hook: Callable[[NameDataState], None]) -> None:
+    """Call ``hook(new_state)`` after each successful reload (for caches derived from name data)."""
+    _RELOAD_HOOKS.append(hook)
+
+
+def reload_name_data() -> NameDataState:
+    """
+    Rebuild pools + heritage composition from disk and publish them with one reference swap.
+    Readers keep using the old state until the swap; concurrent reloads are serialized.
+    """
+    global _STATE
+    with _RELOAD_LOCK:
+        t0 = time.perf_counter()
+        _RELOAD_STATUS["in_progress"] = True
+        try:
+            new_state = build_name_data(_STATE.COMPOSITION_GENERATION + 1)
+            _STATE = new_state
+            for hook in list(_RELOAD_HOOKS):
+                try:
+                    hook(new_state)
+                except Exception as e:
+                    print(f"Warning: name data reload hook failed: {e}")
+            _RELOAD_STATUS["last_error"] = None
+        except Exception as e:
+            _RELOAD_STATUS["last_error"] = str(e)
+            raise
+        finally:
+            _RELOAD_STATUS["in_progress"] = False
+            _RELOAD_STATUS["generation"] = _STATE.COMPOSITION_GENERATION
+            _RELOAD_STATUS["last_reload_at"] = time.time()
+            _RELOAD_STATUS["last_duration_s"] = round(time.perf_counter() - t0, 3)
+    return new_state
+
+
+def reload_name_data_if_changed() -> bool:
+    """
+    Reload when the files on disk differ from the active state's. For long-lived worker
+    processes, which do not see a hot reload triggered in the API process. Returns whether
+    it reloaded.
+    """
+    if source_fingerprint() == _STATE.SOURCE_FINGERPRINT:
+        return False
+    reload_name_data()
+    return True
+
+
+def reload_name_data_in_background() -> bool:
+    """Start ``reload_name_data`` on a daemon thread. Returns False if a reload is already running."""
+    if _RELOAD_STATUS["in_progress"] or _RELOAD_LOCK.locked():
+        return False
+
+    def _run() -> None:
+        try:
+            reload_name_data()
+        except Exception:
+            # Error is recorded in reload status; the previous state stays active.
+            pass
+
+    _RELOAD_STATUS["in_progress"] = True
+    threading.Thread(target=_run, name="name-data-reload", daemon=True).start()
+    return True
+
+
+def reload_status() -> Dict[str, Any]:
+    return dict(_RELOAD_STATUS)
@@ -6,16 +6,13 @@ compound surname probabilities from each selected name pool JSON, and anti-dupli
 """
 
 import random
-from typing import Dict, List, Optional, Set, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Set, Tuple
 from dataclasses import dataclass
 
+from . import name_data as _name_data
 from .name_data import (
-    COUNTRY_NAME_POOLS,
-    HERITAGE_CONFIG,
-    HERITAGE_NAME_POOLS,
-    NAME_POOLS_BY_ID,
     NAME_POOL_TIER_KEYS,
-    POOL_ID_TO_COUNTRY_CODE,
     compound_surname_prob_for_pool,
     middle_name_prob_for_pool,
     surname_connector_for_pool,
@@ -23,6 +20,7 @@ from .name_data import (
     DEFAULT_GIVEN_NAME_TIER_PROBS,
     DEFAULT_SURNAME_TIER_PROBS,
 )
+from .sampling import WeightedChoice
 from .tier_prob_profiles import merge_zero_prob_tiers
 
 
@@ -180,6 +178,87 @@ def sample_distinct_from_pool(
     return None
 
 
+class _PoolSampler:
+    """
+    Tiered pool prepared once for repeated draws (same rules as ``sample_name_from_pool``).
+
+    ``merge_zero_prob_tiers`` copies every tier list, so doing it per draw dominates the cost of
+    naming; a sampler merges once and is reused for every name drawn from the same pool.
+    """
+
+    __slots__ = ("name_pool", "tiers", "cum_weights", "lists", "nonempty")
+
+    def __init__(self, name_pool: Dict[str, List[str]], tier_probs: Dict[str, float]):
+        eff_pool, eff_probs = merge_zero_prob_tiers(name_pool, tier_probs)
+        self.name_pool = name_pool
+        self.tiers = list(eff_probs.keys())
+        self.lists = eff_pool
+        self.nonempty = [k for k in NAME_POOL_TIER_KEYS if eff_pool.get(k)]
+        weights = [max(0.0, float(eff_probs.get(t, 0.0))) for t in self.tiers]
+        if sum(weights) > 1e-15:
+            acc = 0.0
+            cum: List[float] = []
+            for w in weights:
+                acc += w
+                cum.append(acc)
+            self.cum_weights: Optional[List[float]] = cum
+        else:
+            self.cum_weights = None
+
+    def _roll_tier(self) -> str:
+        if self.cum_weights is not None:
+            return random.choices(self.tiers, cum_weights=self.cum_weights, k=1)[0]
+        pool = [t for t in self.tiers if t in self.nonempty]
+        if pool:
+            return random.choice(pool)
+        return self.tiers[0] if self.tiers else NAME_POOL_TIER_KEYS[0]
+
+    def sample(self) -> str:
+        tier_list = self.lists.get(self._roll_tier(), [])
+        return random.choice(tier_list) if tier_list else ""
+
+    def sample_distinct(self, avoid: str, max_attempts: int = 40) -> Optional[str]:
+        """Same contract as ``sample_distinct_from_pool``."""
+        af = (avoid or "").strip().casefold()
+        if not af:
+            return self.sample()
+        for _ in range(max_attempts):
+            cand = self.sample()
+            if (cand or "").strip() and not _names_equivalent(cand, avoid):
+                return cand
+        for tier in NAME_POOL_TIER_KEYS:
+            for n in self.name_pool.get(tier, []):
+                if (n or "").strip() and not _names_equivalent(n, avoid):
+                    return n
+        return None
+
+
+# Per-call memo for samplers and tier probabilities (see ``_compose_name``).
+_SamplerCache = Dict[Tuple, object]
+
+
+def _cached_tier_probs(
+    cache: _SamplerCache, pool_id: str, country_code: str, branch: str
+) -> Dict[str, float]:
+    key = ("tier_probs", pool_id, country_code, branch)
+    probs = cache.get(key)
+    if probs is None:
+        probs = tier_probs_for_pool(pool_id, country_code, branch)
+        cache[key] = probs
+    return probs  # type: ignore[return-value]
+
+
+def _cached_sampler(
+    cache: _SamplerCache, name_pool: Dict[str, List[str]], tier_probs: Dict[str, float]
+) -> _PoolSampler:
+    key = ("sampler", id(name_pool), tuple(tier_probs.get(k, 0.0) for k in NAME_POOL_TIER_KEYS))
+    sampler = cache.get(key)
+    if sampler is None:
+        sampler = _PoolSampler(name_pool, tier_probs)
+        cache[key] = sampler
+    return sampler  # type: ignore[return-value]
+
+
 def get_country_name_pool(country_code: str, name_type: str) -> Optional[Dict[str, List[str]]]:
     """
     Get name pool for a country and name type.
@@ -191,7 +270,8 @@ def get_country_name_pool(country_code: str, name_type: str) -> Optional[Dict[st
     Returns:
         Name pool dictionary or None if not found
     """
-    country_pools = COUNTRY_NAME_POOLS.get(country_code)
+    st = _name_data.current_state()
+    country_pools = st.COUNTRY_NAME_POOLS.get(country_code)
     if not country_pools:
         return None
     return country_pools.get(name_type)
@@ -201,11 +281,12 @@ def get_name_pool(pool_id: str, name_type: str) -> Optional[Dict[str, List[str]]
     """
     Tiered names for a pool_id (country_ENG, custom_belgium_dutch) or bare 3-letter FIFA code.
     """
-    np = NAME_POOLS_BY_ID.get(pool_id)
+    st = _name_data.current_state()
+    np = st.NAME_POOLS_BY_ID.get(pool_id)
     if np:
         return np.get(name_type)
     if len(pool_id) == 3 and pool_id.isupper():
-        p = COUNTRY_NAME_POOLS.get(pool_id)
+        p = st.COUNTRY_NAME_POOLS.get(pool_id)
         if p:
             return p.get(name_type)
     return None
@@ -244,9 +325,10 @@ def effective_surname_pool_for_sampling(named_pool_id: str) -> Tuple[str, Option
 
 def _pool_id_is_registered(pool_id: str) -> bool:
     """True if this pool_id was loaded into NAME_POOLS_BY_ID or COUNTRY_NAME_POOLS."""
-    if pool_id in NAME_POOLS_BY_ID:
+    st = _name_data.current_state()
+    if pool_id in st.NAME_POOLS_BY_ID:
         return True
-    return len(pool_id) == 3 and pool_id.isupper() and pool_id in COUNTRY_NAME_POOLS
+    return len(pool_id) == 3 and pool_id.isupper() and pool_id in st.COUNTRY_NAME_POOLS
 
 
 def _local_pool_entry_is_usable(pool_id: str) -> bool:
@@ -270,34 +352,36 @@ def pool_id_to_country_code(pool_id: str) -> Optional[str]:
 
 def country_code_for_tier_probs(pool_id: str, nationality: str) -> str:
     """FIFA-style code for ``tier_probs_for_pool`` fallback when pool JSON has no ``tier_probs``."""
-    cc = POOL_ID_TO_COUNTRY_CODE.get(pool_id)
+    st = _name_data.current_state()
+    cc = st.POOL_ID_TO_COUNTRY_CODE.get(pool_id)
     if cc:
         return cc
-    if len(pool_id) == 3 and pool_id.isupper() and pool_id in COUNTRY_NAME_POOLS:
+    if len(pool_id) == 3 and pool_id.isupper() and pool_id in st.COUNTRY_NAME_POOLS:
         return pool_id
     if pool_id.startswith("country_"):
         return pool_id[len("country_") :]
     return nationality
 
 
-def resolve_local_pool_id(nationality: str) -> str:
+def _local_pool_candidates(nationality: str) -> Tuple[List[str], List[float], str]:
     """
-    pool_id to use for LOCAL given/surname (local_core_naming_pools.json or country_<NAT>).
+    (pool_ids, weights, fallback_pool_id) for LOCAL sampling. When ``pool_ids`` is empty every
+    draw resolves to ``fallback_pool_id``.
     """
-    from .name_data import LOCAL_CORE_NAMING_POOLS
-
-    entries = LOCAL_CORE_NAMING_POOLS.get(nationality)
+    st = _name_data.current_state()
+    entries = st.LOCAL_CORE_NAMING_POOLS.get(nationality)
+    cand = f"country_{nationality}"
     if not entries:
-        cand = f"country_{nationality}"
-        if cand in NAME_POOLS_BY_ID:
-            return cand
-        if nationality in COUNTRY_NAME_POOLS:
-            return nationality
-        return cand if cand in NAME_POOLS_BY_ID else nationality
+        if cand in st.NAME_POOLS_BY_ID:
+            return [], [], cand
+        if nationality in st.COUNTRY_NAME_POOLS:
+            return [], [], nationality
+        return [], [], cand if cand in st.NAME_POOLS_BY_ID else nationality
     # Only choose among entries that are actually loaded and have both given + surnames.
     # Otherwise random.choices can pick a missing pool and fall through to bare FIFA code
     # (e.g. ATG) with no name data, while heritage still uses country_JAM/TTO — breaks LH/LL.
-    valid: List[Tuple[str, float]] = []
+    pool_ids: List[str] = []
+    weights: List[float] = []
     for e in entries:
         if not isinstance(e, dict):
             continue
@@ -306,17 +390,30 @@ def resolve_local_pool_id(nationality: str) -> str:
             continue
         w = float(e.get("weight", 1.0))
         if _local_pool_entry_is_usable(pid):
-            valid.append((pid, w))
-    if valid:
-        pool_ids = [p for p, _ in valid]
-        weights = [w for _, w in valid]
-        return random.choices(pool_ids, weights=weights, k=1)[0]
-    cand = f"country_{nationality}"
-    if cand in NAME_POOLS_BY_ID and _local_pool_entry_is_usable(cand):
-        return cand
-    if nationality in COUNTRY_NAME_POOLS and _local_pool_entry_is_usable(nationality):
-        return nationality
-    return cand if cand in NAME_POOLS_BY_ID else nationality
+            pool_ids.append(pid)
+            weights.append(w)
+    if pool_ids:
+        return pool_ids, weights, pool_ids[0]
+    if cand in st.NAME_POOLS_BY_ID and _local_pool_entry_is_usable(cand):
+        return [], [], cand
+    if nationality in st.COUNTRY_NAME_POOLS and _local_pool_entry_is_usable(nationality):
+        return [], [], nationality
+    return [], [], cand if cand in st.NAME_POOLS_BY_ID else nationality
+
+
+def resolve_local_pool_ids(nationality: str, k: int) -> List[str]:
+    """Draw ``k`` LOCAL pool_ids at once (batch form of ``resolve_local_pool_id``)."""
+    plan = selection_plan(nationality)
+    if plan.local is None:
+        return [plan.local_fallback] * k
+    return plan.local.draw_many(k)
+
+
+def resolve_local_pool_id(nationality: str) -> str:
+    """
+    pool_id to use for LOCAL given/surname (local_core_naming_pools.json or country_<NAT>).
+    """
+    return resolve_local_pool_ids(nationality, 1)[0]
 
 
 def resolve_local_pool_country(nationality: str) -> str:
@@ -351,6 +448,96 @@ def _coerce_origin_pool_id(origin: Optional[str]) -> Optional[str]:
     return origin
 
 
+_STRUCTURE_ORIGINS = {
+    "LL": ("LOCAL", "LOCAL"),
+    "LH": ("LOCAL", "HERITAGE"),
+    "HL": ("HERITAGE", "LOCAL"),
+    "HH": ("HERITAGE", "HERITAGE"),
+}
+
+
+@dataclass(frozen=True)
+class SelectionPlan:
+    """
+    Compiled per-nationality selection tables (alias tables over pre-filtered candidates).
+
+    Origin tables already map unusable pools (no given names) to the group's fallback, so draws
+    need no ``pool_has_names`` checks. Plans are rebuilt only when the composition is reapplied
+    (``name_data.COMPOSITION_GENERATION`` changes).
+    """
+
+    nationality: str
+    local: Optional[WeightedChoice]
+    local_fallback: str
+    heritage_groups: Optional[WeightedChoice]
+    origins: Mapping[str, WeightedChoice]
+    origin_given_fallback: Mapping[str, str]
+    structures: Mapping[str, WeightedChoice]
+
+
+def _build_selection_plan(nationality: str) -> SelectionPlan:
+    st = _name_data.current_state()
+    local_ids, local_weights, local_fallback = _local_pool_candidates(nationality)
+    groups, group_weights = _heritage_group_candidates(nationality)
+
+    origins: Dict[str, WeightedChoice] = {}
+    origin_given_fallback: Dict[str, str] = {}
+    structures: Dict[str, WeightedChoice] = {}
+    for group, cfg in st.HERITAGE_CONFIG.get(nationality, {}).items():
+        cands = _origin_pool_candidates(nationality, group)
+        if cands is not None:
+            pool_ids, weights, usable, fallback = cands
+            origins[group] = WeightedChoice(
+                [p if p in usable else fallback for p in pool_ids], weights
+            )
+            fb = _origin_given_fallback(heritage_origin_weights_as_pool_ids(cfg))
+            if fb:
+                origin_given_fallback[group] = fb
+        structure_probs = cfg.get("name_structure_probs") or {}
+        if structure_probs:
+            codes = list(structure_probs.keys())
+            structures[group] = WeightedChoice(
+                [_STRUCTURE_ORIGINS.get(c, ("LOCAL", "LOCAL")) for c in codes],
+                [structure_probs[c] for c in codes],
+            )
+
+    return SelectionPlan(
+        nationality=nationality,
+        local=WeightedChoice(local_ids, local_weights) if local_ids else None,
+        local_fallback=local_fallback,
+        heritage_groups=WeightedChoice(groups, group_weights) if groups else None,
+        origins=MappingProxyType(origins),
+        origin_given_fallback=MappingProxyType(origin_given_fallback),
+        structures=MappingProxyType(structures),
+    )
+
+
+# (composition generation, nationality -> plan). Replaced as a whole when the generation moves,
+# so concurrent readers never see a half-cleared cache.
+_SELECTION_PLANS: Tuple[int, Dict[str, SelectionPlan]] = (-1, {})
+
+
+def selection_plan(nationality: str) -> SelectionPlan:
+    """Compiled selection tables for a nationality (built on first use per composition load)."""
+    global _SELECTION_PLANS
+    generation = _name_data.current_state().COMPOSITION_GENERATION
+    cached_generation, plans = _SELECTION_PLANS
+    if cached_generation != generation:
+        plans = {}
+        _SELECTION_PLANS = (generation, plans)
+    plan = plans.get(nationality)
+    if plan is None:
+        plan = _build_selection_plan(nationality)
+        plans[nationality] = plan
+    return plan
+
+
+def invalidate_selection_plans() -> None:
+    """Drop all compiled plans (next access rebuilds from current name data)."""
+    global _SELECTION_PLANS
+    _SELECTION_PLANS = (-1, {})
+
+
 def select_heritage_group(nationality: str) -> Optional[str]:
     """
     Select a heritage group for a player based on nationality.
@@ -361,31 +548,53 @@ def select_heritage_group(nationality: str) -> Optional[str]:
     Returns:
         Heritage group name or None if no heritage groups defined
     """
-    heritage_groups = HERITAGE_CONFIG.get(nationality)
+    return select_heritage_groups(nationality, 1)[0]
+
+
+def _heritage_group_candidates(nationality: str) -> Tuple[List[str], List[float]]:
+    """Heritage groups with positive weight for a nationality, and their weights."""
+    st = _name_data.current_state()
+    heritage_groups = st.HERITAGE_CONFIG.get(nationality)
     if not heritage_groups:
-        return None
-    
+        return [], []
+
     # Filter out groups with zero or negative weights
-    groups = []
-    weights = []
+    groups: List[str] = []
+    weights: List[float] = []
     for group_name, group_config in heritage_groups.items():
         weight = group_config.get("weight", 0.0)
         if weight > 0:
             groups.append(group_name)
             weights.append(weight)
-    
-    if not groups:
-        return None
-    
-    return random.choices(groups, weights=weights, k=1)[0]
+    return groups, weights
 
 
-def select_origin_pool_id(nationality: str, heritage_group: str) -> Optional[str]:
+def select_heritage_groups(nationality: str, k: int) -> List[Optional[str]]:
+    """Draw ``k`` heritage groups at once (batch form of ``select_heritage_group``)."""
+    table = selection_plan(nationality).heritage_groups
+    if table is None:
+        return [None] * k
+    return table.draw_many(k)
+
+
+def _origin_given_fallback(origin_weights: Dict[str, float]) -> Optional[str]:
+    """Highest-weight origin pool that has non-empty given names (None if there is none)."""
+    for pid, _ in sorted(origin_weights.items(), key=lambda x: x[1], reverse=True):
+        if pool_has_names(pid, "given_names_male"):
+            return pid
+    return None
+
+
+def _origin_pool_candidates(
+    nationality: str, heritage_group: str
+) -> Optional[Tuple[List[str], List[float], Set[str], str]]:
     """
-    Select origin naming pool_id (country_* or custom_*) for heritage name generation.
-    Falls back to highest-weight pool that has non-empty given names.
+    (pool_ids, weights, usable_pool_ids, fallback_pool_id) for heritage origin draws, or None
+    when the group has no origin weights. A drawn pool outside ``usable_pool_ids`` (no given
+    names) is replaced by ``fallback_pool_id``.
     """
-    heritage_config = HERITAGE_CONFIG.get(nationality, {}).get(heritage_group)
+    st = _name_data.current_state()
+    heritage_config = st.HERITAGE_CONFIG.get(nationality, {}).get(heritage_group)
     if not heritage_config:
         return None
 
@@ -395,15 +604,37 @@ def select_origin_pool_id(nationality: str, heritage_group: str) -> Optional[str
 
     pool_ids = list(origin_weights.keys())
     weights = [origin_weights[p] for p in pool_ids]
-    selected = random.choices(pool_ids, weights=weights, k=1)[0]
+    usable = {p for p in pool_ids if pool_has_names(p, "given_names_male")}
+    fallback = _origin_given_fallback(origin_weights)
+    if fallback is None:
+        fallback = max(origin_weights.items(), key=lambda x: x[1])[0]
+    return pool_ids, weights, usable, fallback
 
-    if pool_has_names(selected, "given_names_male"):
-        return selected
-    sorted_pools = sorted(origin_weights.items(), key=lambda x: x[1], reverse=True)
-    for pid, _ in sorted_pools:
-        if pool_has_names(pid, "given_names_male"):
-            return pid
-    return sorted_pools[0][0] if sorted_pools else selected
+
+def select_origin_pool_ids(nationality: str, heritage_group: str, k: int) -> List[Optional[str]]:
+    """Draw ``k`` origin pool_ids at once (batch form of ``select_origin_pool_id``)."""
+    table = selection_plan(nationality).origins.get(heritage_group)
+    if table is None:
+        return [None] * k
+    return table.draw_many(k)
+
+
+def select_origin_pool_id(nationality: str, heritage_group: str) -> Optional[str]:
+    """
+    Select origin naming pool_id (country_* or custom_*) for heritage name generation.
+    Falls back to highest-weight pool that has non-empty given names.
+    """
+    return select_origin_pool_ids(nationality, heritage_group, 1)[0]
+
+
+def _override_origin_pool_id(
+    nationality: str, heritage_group: str, origin_pool_id: str
+) -> str:
+    """Explicit origin pool without given names: use the group's best origin that has some."""
+    if pool_has_names(origin_pool_id, "given_names_male"):
+        return origin_pool_id
+    fb = selection_plan(nationality).origin_given_fallback.get(heritage_group)
+    return fb or origin_pool_id
 
 
 def select_origin_country(nationality: str, heritage_group: str) -> Optional[str]:
@@ -414,6 +645,16 @@ def select_origin_country(nationality: str, heritage_group: str) -> Optional[str
     return country_code_for_tier_probs(pid, nationality)
 
 
+def select_name_structures(
+    nationality: str, heritage_group: str, k: int
+) -> List[Tuple[str, str]]:
+    """Draw ``k`` (given_origin, surname_origin) pairs at once (batch form of ``select_name_structure``)."""
+    table = selection_plan(nationality).structures.get(heritage_group)
+    if table is None:
+        return [("LOCAL", "LOCAL")] * k
+    return table.draw_many(k)
+
+
 def select_name_structure(nationality: str, heritage_group: str) -> Tuple[str, str]:
     """
     Select name structure pair (given origin, surname origin).
@@ -421,27 +662,7 @@ def select_name_structure(nationality: str, heritage_group: str) -> Tuple[str, s
     Returns:
         Tuple of (given_origin, surname_origin) where each is "LOCAL" or "HERITAGE"
     """
-    heritage_config = HERITAGE_CONFIG.get(nationality, {}).get(heritage_group)
-    if not heritage_config:
-        return ("LOCAL", "LOCAL")
-    
-    structure_probs = heritage_config.get("name_structure_probs", {})
-    if not structure_probs:
-        return ("LOCAL", "LOCAL")
-    
-    # Map structure codes to (given, surname) origins
-    structure_map = {
-        "LL": ("LOCAL", "LOCAL"),
-        "LH": ("LOCAL", "HERITAGE"),
-        "HL": ("HERITAGE", "LOCAL"),
-        "HH": ("HERITAGE", "HERITAGE")
-    }
-    
-    structures = list(structure_probs.keys())
-    weights = [structure_probs[s] for s in structures]
-    selected = random.choices(structures, weights=weights, k=1)[0]
-    
-    return structure_map.get(selected, ("LOCAL", "LOCAL"))
+    return select_name_structures(nationality, heritage_group, 1)[0]
 
 
 def select_name_structure_with_variants(
@@ -465,6 +686,112 @@ def name_structure_code(given_origin: str, surname_origin: str) -> str:
     }.get((given_origin, surname_origin), "LL")
 
 
+def _compose_name(
+    nationality: str,
+    local_pool_id: str,
+    origin_pool_id: Optional[str],
+    given_origin: str,
+    surname_origin: str,
+    cache: _SamplerCache,
+    name_pool_debug: Optional[Dict[str, str]] = None,
+) -> PlayerName:
+    """
+    Sample one name once local pool, heritage origin and structure have been rolled.
+
+    ``cache`` memoizes tier probabilities and prepared samplers; callers share one dict across
+    all names of a request so pools are only prepared once.
+    """
+    # If heritage origin missing, fall back to local pool_id for HERITAGE parts
+    eff_heritage_pid = (
+        origin_pool_id if origin_pool_id is not None else local_pool_id
+    )
+    given_pid = eff_heritage_pid if given_origin == "HERITAGE" else local_pool_id
+    surname_pid = eff_heritage_pid if surname_origin == "HERITAGE" else local_pool_id
+
+    if name_pool_debug is not None:
+        name_pool_debug["local_pool_id"] = local_pool_id
+        name_pool_debug["given_pool_id"] = given_pid
+        name_pool_debug["surname_pool_id"] = surname_pid
+        name_pool_debug["name_structure"] = name_structure_code(
+            given_origin, surname_origin
+        )
+        if origin_pool_id is not None:
+            name_pool_debug["heritage_origin_pool_id"] = str(origin_pool_id)
+
+    given_pool = get_name_pool(given_pid, "given_names_male")
+    if not given_pool:
+        given_pool = get_name_pool(local_pool_id, "given_names_male")
+    if not given_pool:
+        given_pool = get_name_pool(eff_heritage_pid, "given_names_male")
+
+    surname_sample_id, surname_pool = effective_surname_pool_for_sampling(surname_pid)
+    if not surname_pool or not pool_has_names(surname_sample_id, "surnames"):
+        surname_sample_id, surname_pool = effective_surname_pool_for_sampling(local_pool_id)
+    if not surname_pool or not pool_has_names(surname_sample_id, "surnames"):
+        surname_sample_id, surname_pool = effective_surname_pool_for_sampling(eff_heritage_pid)
+
+    if not given_pool or not surname_pool or not pool_has_names(surname_sample_id, "surnames"):
+        return PlayerName(given_first="NoFirstName", surname_parts=["NoLastName"])
+
+    if name_pool_debug is not None and surname_sample_id != surname_pid:
+        name_pool_debug["surname_sampled_from_pool_id"] = surname_sample_id
+
+    g_cc = country_code_for_tier_probs(given_pid, nationality)
+    s_cc = country_code_for_tier_probs(surname_sample_id, nationality)
+    given_tier_probs = _cached_tier_probs(cache, given_pid, g_cc, "given")
+    surname_tier_probs = _cached_tier_probs(cache, surname_sample_id, s_cc, "surname")
+    given_sampler = _cached_sampler(cache, given_pool, given_tier_probs)
+    # Second compound part and middle name use the same tier weights as the primary draw.
+    surname_sampler = _cached_sampler(cache, surname_pool, surname_tier_probs)
+
+    # Sample given name
+    given_first = given_sampler.sample()
+    if not (given_first or "").strip():
+        given_first = "NoFirstName"
+
+    # Sample surname
+    surname_first = surname_sampler.sample()
+    if not (surname_first or "").strip():
+        surname_first = "NoLastName"
+    surname_parts = [surname_first]
+    surname_connector = None
+
+    # Compound surname: probability from the *surname* pool JSON only
+    compound_prob = compound_surname_prob_for_pool(surname_pid, nationality)
+    if random.random() < compound_prob:
+        surname_second = surname_sampler.sample()
+        if not (surname_second or "").strip():
+            surname_second = "NoLastName"
+        if _names_equivalent(surname_second, surname_first):
+            surname_second = surname_sampler.sample_distinct(surname_first)
+        if surname_second is not None and (surname_second or "").strip():
+            surname_parts.append(surname_second)
+            surname_connector = surname_connector_for_pool(surname_pid, nationality)
+
+    # Middle name: probability from the *given* pool JSON; sample from same given pool
+    middle_name = None
+    middle_prob = middle_name_prob_for_pool(given_pid, nationality)
+    if random.random() < middle_prob and given_pool:
+        middle_name = given_sampler.sample()
+        if middle_name and _names_equivalent(middle_name, given_first):
+            middle_name = given_sampler.sample_distinct(given_first)
+
+    # Max three logical parts: not given + middle + two surnames — drop middle or second surname
+    if middle_name and len(surname_parts) == 2:
+        if random.random() < 0.5:
+            middle_name = None
+        else:
+            surname_parts = [surname_parts[0]]
+            surname_connector = None
+
+    return PlayerName(
+        given_first=given_first,
+        given_middle=middle_name,
+        surname_parts=surname_parts,
+        surname_connector=surname_connector
+    )
+
+
 def generate_name(
     nationality: str,
     heritage_group: Optional[str] = None,
@@ -492,6 +819,7 @@ def generate_name(
 
     name = PlayerName(given_first="NoFirstName", surname_parts=["NoLastName"])
     origin_override = _coerce_origin_pool_id(origin_country)
+    cache: _SamplerCache = {}
     for attempt in range(max_retries):
         if name_pool_debug is not None:
             name_pool_debug.clear()
@@ -505,18 +833,10 @@ def generate_name(
             origin_pool_id = origin_override
             if origin_pool_id is None:
                 origin_pool_id = select_origin_pool_id(nationality, heritage_group)
-
-            if origin_pool_id and not pool_has_names(origin_pool_id, "given_names_male"):
-                heritage_config = HERITAGE_CONFIG.get(nationality, {}).get(heritage_group)
-                if heritage_config:
-                    origin_weights = heritage_origin_weights_as_pool_ids(heritage_config)
-                    if origin_weights:
-                        for pid, _ in sorted(
-                            origin_weights.items(), key=lambda x: x[1], reverse=True
-                        ):
-                            if pool_has_names(pid, "given_names_male"):
-                                origin_pool_id = pid
-                                break
+            elif origin_pool_id:
+                origin_pool_id = _override_origin_pool_id(
+                    nationality, heritage_group, origin_pool_id
+                )
 
             given_origin, surname_origin, _ = select_name_structure_with_variants(
                 nationality, heritage_group
@@ -525,111 +845,17 @@ def generate_name(
             given_origin = "LOCAL"
             surname_origin = "LOCAL"
             origin_pool_id = None
-        
-        # If heritage origin missing, fall back to local pool_id for HERITAGE parts
-        eff_heritage_pid = (
-            origin_pool_id if origin_pool_id is not None else local_pool_id
-        )
-        given_pid = eff_heritage_pid if given_origin == "HERITAGE" else local_pool_id
-        surname_pid = eff_heritage_pid if surname_origin == "HERITAGE" else local_pool_id
-
-        if name_pool_debug is not None:
-            name_pool_debug["local_pool_id"] = local_pool_id
-            name_pool_debug["given_pool_id"] = given_pid
-            name_pool_debug["surname_pool_id"] = surname_pid
-            name_pool_debug["name_structure"] = name_structure_code(
-                given_origin, surname_origin
-            )
-            if origin_pool_id is not None:
-                name_pool_debug["heritage_origin_pool_id"] = str(origin_pool_id)
-        
-        given_pool = get_name_pool(given_pid, "given_names_male")
-        if not given_pool:
-            given_pool = get_name_pool(local_pool_id, "given_names_male")
-        if not given_pool:
-            given_pool = get_name_pool(eff_heritage_pid, "given_names_male")
-
-        surname_sample_id, surname_pool = effective_surname_pool_for_sampling(surname_pid)
-        if not surname_pool or not pool_has_names(surname_sample_id, "surnames"):
-            surname_sample_id, surname_pool = effective_surname_pool_for_sampling(local_pool_id)
-        if not surname_pool or not pool_has_names(surname_sample_id, "surnames"):
-            surname_sample_id, surname_pool = effective_surname_pool_for_sampling(eff_heritage_pid)
-
-        if not given_pool or not surname_pool or not pool_has_names(surname_sample_id, "surnames"):
-            name = PlayerName(
-                given_first="NoFirstName",
-                surname_parts=["NoLastName"],
-            )
-            full_name = name.display_full
-            if full_name not in used_names:
-                used_names.add(full_name)
-                return name
-            continue
 
-        if name_pool_debug is not None and surname_sample_id != surname_pid:
-            name_pool_debug["surname_sampled_from_pool_id"] = surname_sample_id
-
-        g_cc = country_code_for_tier_probs(given_pid, nationality)
-        s_cc = country_code_for_tier_probs(surname_sample_id, nationality)
-        given_tier_probs = tier_probs_for_pool(given_pid, g_cc, "given")
-        surname_tier_probs = tier_probs_for_pool(surname_sample_id, s_cc, "surname")
-        
-        # Sample given name
-        given_first = sample_name_from_pool(given_pool, given_tier_probs)
-        if not (given_first or "").strip():
-            given_first = "NoFirstName"
-        
-        # Sample surname
-        surname_first = sample_name_from_pool(surname_pool, surname_tier_probs)
-        if not (surname_first or "").strip():
-            surname_first = "NoLastName"
-        surname_parts = [surname_first]
-        surname_connector = None
-
-        # Compound surname: probability from the *surname* pool JSON only
-        compound_prob = compound_surname_prob_for_pool(surname_pid, nationality)
-        # Second compound part: same tier weights as primary surname draw (temporary uniform / profile).
-        compound_tier_probs = dict(surname_tier_probs)
-        if random.random() < compound_prob:
-            surname_second = sample_name_from_pool(surname_pool, compound_tier_probs)
-            if not (surname_second or "").strip():
-                surname_second = "NoLastName"
-            if _names_equivalent(surname_second, surname_first):
-                alt = sample_distinct_from_pool(
-                    surname_pool, compound_tier_probs, surname_first
-                )
-                surname_second = alt if alt else None
-            if surname_second is not None and (surname_second or "").strip():
-                surname_parts.append(surname_second)
-                surname_connector = surname_connector_for_pool(surname_pid, nationality)
-
-        # Middle name: probability from the *given* pool JSON; sample from same given pool
-        middle_name = None
-        middle_prob = middle_name_prob_for_pool(given_pid, nationality)
-        if random.random() < middle_prob and given_pool:
-            middle_tier_probs = tier_probs_for_pool(given_pid, g_cc, "given")
-            middle_name = sample_name_from_pool(given_pool, middle_tier_probs)
-            if middle_name and _names_equivalent(middle_name, given_first):
-                middle_name = sample_distinct_from_pool(
-                    given_pool, middle_tier_probs, given_first
-                )
-
-        # Max three logical parts: not given + middle + two surnames — drop middle or second surname
-        if middle_name and len(surname_parts) == 2:
-            if random.random() < 0.5:
-                middle_name = None
-            else:
-                surname_parts = [surname_parts[0]]
-                surname_connector = None
-        
-        # Create name object
-        name = PlayerName(
-            given_first=given_first,
-            given_middle=middle_name,
-            surname_parts=surname_parts,
-            surname_connector=surname_connector
+        name = _compose_name(
+            nationality,
+            local_pool_id,
+            origin_pool_id,
+            given_origin,
+            surname_origin,
+            cache,
+            name_pool_debug,
         )
-        
+
         # Check for duplicates
         full_name = name.display_full
         if full_name not in used_names:
@@ -640,6 +866,112 @@ def generate_name(
     return name
 
 
+def generate_names_batch(
+    nationality: str,
+    count: int,
+    used_names: Optional[Set[str]] = None,
+    heritage_group: Optional[str] = None,
+    origin_country: Optional[str] = None,
+    max_retries: int = 50,
+    name_pool_debug: Optional[List[Dict[str, str]]] = None,
+) -> List[PlayerName]:
+    """
+    Generate ``count`` names for one nationality in a single call.
+
+    Same distribution and duplicate rules as calling ``generate_name`` ``count`` times with a
+    shared ``used_names`` set, but pools are prepared once per batch and the local pool,
+    heritage group, origin pool and structure are drawn for all pending slots at once.
+    Names are unique within the batch and against ``used_names`` (which is updated in place);
+    a slot that still collides after ``max_retries`` rounds keeps its last draw.
+
+    Args:
+        nationality: Player's nationality code
+        count: Number of names to generate
+        used_names: Set of already-used full names to avoid duplicates
+        heritage_group: Optional heritage group applied to every slot (rolled per slot if None)
+        origin_country: Optional origin pool / country code applied to every heritage slot
+        max_retries: Maximum rounds for slots whose draw was a duplicate
+        name_pool_debug: If provided, cleared and filled with one pool-id dict per returned name
+
+    Returns:
+        List of ``count`` PlayerName objects, in slot order
+    """
+    if used_names is None:
+        used_names = set()
+    if name_pool_debug is not None:
+        name_pool_debug.clear()
+    if count <= 0:
+        return []
+
+    names: List[PlayerName] = [
+        PlayerName(given_first="NoFirstName", surname_parts=["NoLastName"])
+    ] * count
+    debugs: List[Optional[Dict[str, str]]] = [None] * count
+    origin_override = _coerce_origin_pool_id(origin_country)
+    cache: _SamplerCache = {}
+
+    # Heritage group is fixed per slot across retries (as in generate_name).
+    if heritage_group is None:
+        slot_groups = select_heritage_groups(nationality, count)
+    else:
+        slot_groups = [heritage_group] * count
+
+    pending = list(range(count))
+    for _ in range(max(1, max_retries)):
+        if not pending:
+            break
+        local_ids = resolve_local_pool_ids(nationality, len(pending))
+
+        by_group: Dict[Optional[str], List[int]] = {}
+        for pos, slot in enumerate(pending):
+            by_group.setdefault(slot_groups[slot], []).append(pos)
+
+        origins: List[Optional[str]] = [None] * len(pending)
+        structures: List[Tuple[str, str]] = [("LOCAL", "LOCAL")] * len(pending)
+        for group, positions in by_group.items():
+            if not group or group == "ENG_Mainstream":
+                continue
+            n = len(positions)
+            if origin_override is None:
+                group_origins = select_origin_pool_ids(nationality, group, n)
+            elif origin_override:
+                group_origins = [
+                    _override_origin_pool_id(nationality, group, origin_override)
+                ] * n
+            else:
+                group_origins = [origin_override] * n
+            group_structures = select_name_structures(nationality, group, n)
+            for j, pos in enumerate(positions):
+                origins[pos] = group_origins[j]
+                structures[pos] = group_structures[j]
+
+        still_pending: List[int] = []
+        for pos, slot in enumerate(pending):
+            debug: Optional[Dict[str, str]] = {} if name_pool_debug is not None else None
+            given_origin, surname_origin = structures[pos]
+            name = _compose_name(
+                nationality,
+                local_ids[pos],
+                origins[pos],
+                given_origin,
+                surname_origin,
+                cache,
+                debug,
+            )
+            names[slot] = name
+            debugs[slot] = debug
+            full_name = name.display_full
+            if full_name in used_names:
+                still_pending.append(slot)
+            else:
+                used_names.add(full_name)
+        pending = still_pending
+
+    if name_pool_debug is not None:
+        name_pool_debug.extend(d or {} for d in debugs)
+    return names
+
+
 def generate_name_string(nationality: str, **kwargs) -> str:
     """
     Convenience function to generate a name and return as string.
@@ -0,0 +1,180 @@
+"""
+Per-game-mode name-uniqueness index.
+
+``NameUniquenessIndex`` is a set-like view of every full name already used in a game mode, so
+it can be passed straight to ``generate_name`` / ``generate_names_batch`` as ``used_names``.
+Membership is O(1) on 64-bit hashes of the normalized name (``normalize_full_name``), which
+keeps tens of thousands of names per game mode small in memory.
+
+The persistent side is the ``player_name_keys`` table (models.PlayerNameKey), keyed by
+(game_mode_id, name_key). Names reserved during generation stay in memory only; call
+``persist_names`` with the names that were actually saved, in the same transaction, to
+write them in one bulk insert. In in-memory mode (no database) the index lives only in the
+process.
+
+Indexes in other processes catch up incrementally on ``PlayerNameKey.seq``, a per-game-mode
+batch number assigned in commit order: ``persist_names`` holds a transaction-scoped advisory
+lock on the game mode while it takes ``max(seq) + 1``, so once a batch is visible every
+earlier batch is too. (``created_at`` is the transaction start time, so a filter on it skips
+keys of transactions that started before the last sync but committed after it.)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+from uuid import UUID
+
+
+def normalize_full_name(name: str) -> str:
+    """Lowercase, trimmed, single-spaced full name (mirrored in SQL by the backfill migration)."""
+    return " ".join((name or "").split()).lower()
+
+
+def _name_hash(name_key: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(name_key.encode("utf-8"), digest_size=8).digest(), "little"
+    )
+
+
+class NameUniquenessIndex:
+    """Hashed set of normalized full names for one game mode (thread-safe add/contains)."""
+
+    def __init__(self, game_mode_id: Optional[UUID] = None):
+        self.game_mode_id = game_mode_id
+        self._hashes: Set[int] = set()
+        self._lock = threading.Lock()
+        # Highest player_name_keys.seq loaded (for incremental refresh)
+        self.synced_seq: Optional[int] = None
+
+    def __contains__(self, name: object) -> bool:
+        if not isinstance(name, str):
+            return False
+        return _name_hash(normalize_full_name(name)) in self._hashes
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def __iter__(self) -> Iterator[int]:
+        # Only hashes are kept; iteration is for diagnostics / len-style checks.
+        return iter(list(self._hashes))
+
+    def __getstate__(self):
+        # Picklable (e.g. sent to process-pool workers) without the lock
+        with self._lock:
+            hashes = set(self._hashes)
+        return {"game_mode_id": self.game_mode_id, "hashes": hashes, "synced_seq": self.synced_seq}
+
+    def __setstate__(self, state) -> None:
+        self.game_mode_id = state["game_mode_id"]
+        self._hashes = set(state["hashes"])
+        self._lock = threading.Lock()
+        self.synced_seq = state["synced_seq"]
+
+    def add(self, name: str) -> None:
+        """Reserve a name in memory (generation-time). Persist with ``persist_names``."""
+        h = _name_hash(normalize_full_name(name))
+        with self._lock:
+            self._hashes.add(h)
+
+    def update(self, names: Iterable[str]) -> None:
+        hashes = [_name_hash(normalize_full_name(n)) for n in names]
+        with self._lock:
+            self._hashes.update(hashes)
+
+    def _add_keys(self, name_keys: Iterable[str]) -> None:
+        hashes = [_name_hash(k) for k in name_keys]
+        with self._lock:
+            self._hashes.update(hashes)
+
+
+# game_mode_id -> index (one per process)
+_INDEXES: Dict[UUID, NameUniquenessIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def _sync_from_db(db, index: NameUniquenessIndex) -> None:
+    """Load keys for the index's game mode from batches after ``index.synced_seq``."""
+    from models.player_name_key import PlayerNameKey
+
+    q = db.query(PlayerNameKey.name_key, PlayerNameKey.seq).filter(
+        PlayerNameKey.game_mode_id == index.game_mode_id
+    )
+    if index.synced_seq is not None:
+        q = q.filter(PlayerNameKey.seq > index.synced_seq)
+    keys: List[str] = []
+    newest = index.synced_seq
+    for name_key, seq in q.yield_per(5000):
+        keys.append(name_key)
+        if newest is None or seq > newest:
+            newest = seq
+    index._add_keys(keys)
+    index.synced_seq = newest
+
+
+def _advisory_key(game_mode_id: UUID) -> int:
+    return int.from_bytes(game_mode_id.bytes[:8], "big", signed=True)
+
+
+def get_name_index(db, game_mode_id: UUID) -> NameUniquenessIndex:
+    """
+    Process-wide index for a game mode. With a DB session, the first call loads all keys and
+    later calls pull only keys added since (e.g. by other workers).
+    """
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(game_mode_id)
+        if index is None:
+            index = NameUniquenessIndex(game_mode_id)
+            _INDEXES[game_mode_id] = index
+    if db is not None:
+        _sync_from_db(db, index)
+    return index
+
+
+def persist_names(db, game_mode_id: UUID, names: Iterable[str]) -> List[str]:
+    """
+    Record persisted names for a game mode: one bulk INSERT ... ON CONFLICT DO NOTHING into
+    player_name_keys as the game mode's next batch (caller commits; the advisory lock is
+    held until then), plus the in-process index. Returns the normalized names that were
+    already taken in the game mode (skipped by the insert; logged), normally none.
+    """
+    keys = sorted({normalize_full_name(n) for n in names if (n or "").strip()})
+    if not keys:
+        return []
+    get_name_index(None, game_mode_id)._add_keys(keys)
+    if db is None:
+        return []
+
+    from sqlalchemy import func, select, text
+    from sqlalchemy.dialects.postgresql import insert as pg_insert
+    from models.player_name_key import PlayerNameKey
+
+    # Batches of a game mode get their seq in commit order (see module docstring)
+    db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _advisory_key(game_mode_id)})
+    seq = db.execute(
+        select(func.coalesce(func.max(PlayerNameKey.seq), 0) + 1).where(
+            PlayerNameKey.game_mode_id == game_mode_id
+        )
+    ).scalar_one()
+    stmt = (
+        pg_insert(PlayerNameKey.__table__)
+        .values([{"game_mode_id": game_mode_id, "name_key": k, "seq": seq} for k in keys])
+        .on_conflict_do_nothing(index_elements=["game_mode_id", "name_key"])
+        .returning(PlayerNameKey.__table__.c.name_key)
+    )
+    inserted = set(db.execute(stmt).scalars())
+    taken = [k for k in keys if k not in inserted]
+    if taken:
+        logging.warning(
+            "%d name(s) already taken in game mode %s: %s",
+            len(taken), game_mode_id, ", ".join(taken[:10]) + (" ..." if len(taken) > 10 else ""),
+        )
+    return taken
+
+
+def clear_name_indexes() -> None:
+    """Drop all in-process indexes (next ``get_name_index`` reloads from the DB)."""
+    with _INDEXES_LOCK:
+        _INDEXES.clear()
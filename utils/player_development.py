@@ -5,7 +5,15 @@ Based on the PlayerGenAndTraining notebook.
 
 import random
 import math
-from typing import Any, Dict, Optional, List, Tuple
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import Any, Dict, Optional, List, Tuple, Union
+
+import numpy as np
+
 from match_engine.constants import OUTFIELD_ATTRS, GOALKEEPER_ATTRS
 
 
@@ -305,12 +313,122 @@ def build_program_mix_weights(
     return final_weights
 
 
+@dataclass(frozen=True)
+class CompiledProgramMix:
+    """
+    A programme mix compiled over one attribute list: normalized weights plus their running
+    sum, so an attribute draw is one ``bisect`` instead of a pass over a dict.
+    """
+
+    attrs: Tuple[str, ...]
+    weights: Tuple[float, ...]
+    cumulative: Tuple[float, ...]
+
+    def as_dict(self) -> Dict[str, float]:
+        return dict(zip(self.attrs, self.weights))
+
+    def choose(self, attributes: Dict[str, int]) -> Optional[str]:
+        """Weighted draw over attributes below 20 (capped ones are masked out)."""
+        attrs = self.attrs
+        if all(attributes.get(a, 0) < 20 for a in attrs):
+            cum = self.cumulative
+        else:
+            cum = list(accumulate(
+                w if attributes.get(a, 0) < 20 else 0.0 for a, w in zip(attrs, self.weights)
+            ))
+        total = cum[-1] if cum else 0.0
+        if total <= 0:
+            names = [a for a in attrs if attributes.get(a, 0) < 20]
+            return random.choice(names) if names else None
+        i = bisect_left(cum, random.uniform(0, total))
+        return attrs[min(i, len(attrs) - 1)]
+
+
+# (attrs, is_goalkeeper, programme names/shares/individual attrs) -> CompiledProgramMix,
+# least recently used first. Shares come straight from request bodies, so the cache is
+# bounded rather than keyed on rounded values (which would change the compiled weights).
+_PROGRAM_MIX_CACHE: "OrderedDict[Tuple, CompiledProgramMix]" = OrderedDict()
+_PROGRAM_MIX_CACHE_SIZE = 1024
+_PROGRAM_MIX_LOCK = threading.Lock()
+
+
+def invalidate_program_mix_cache() -> None:
+    """Drop compiled mixes; call after editing OUTFIELD_PROGRAMS / GK_PROGRAMS in place."""
+    with _PROGRAM_MIX_LOCK:
+        _PROGRAM_MIX_CACHE.clear()
+
+
+def register_training_program(name: str, weights: Dict[str, float], *, is_goalkeeper: bool) -> None:
+    """Add or replace a catalogue programme and invalidate compiled mixes."""
+    if is_goalkeeper:
+        GK_PROGRAMS[name] = {a: float(weights.get(a, 0.0)) for a in GOALKEEPER_ATTRS}
+    else:
+        OUTFIELD_PROGRAMS[name] = _make_outfield_program(weights)
+    invalidate_program_mix_cache()
+
+
+def compiled_program_mix(
+    player_attrs: List[str],
+    is_goalkeeper: bool,
+    *,
+    primary_name: Optional[str],
+    primary_share: float,
+    primary_individual_attr: Optional[str] = None,
+    secondary_name: Optional[str],
+    secondary_share: float,
+    secondary_individual_attr: Optional[str] = None,
+    general_share: float
+) -> CompiledProgramMix:
+    """
+    Memoized ``build_program_mix_weights``: the mix only changes when a manager edits it, so
+    each (programme, share, individual attr) signature is compiled once per process.
+    """
+    key = (
+        tuple(player_attrs),
+        bool(is_goalkeeper),
+        primary_name,
+        float(primary_share),
+        primary_individual_attr,
+        secondary_name,
+        float(secondary_share),
+        secondary_individual_attr,
+        float(general_share),
+    )
+    with _PROGRAM_MIX_LOCK:
+        mix = _PROGRAM_MIX_CACHE.get(key)
+        if mix is not None:
+            _PROGRAM_MIX_CACHE.move_to_end(key)
+            return mix
+    weights = build_program_mix_weights(
+        player_attrs,
+        is_goalkeeper,
+        primary_name=primary_name,
+        primary_share=primary_share,
+        primary_individual_attr=primary_individual_attr,
+        secondary_name=secondary_name,
+        secondary_share=secondary_share,
+        secondary_individual_attr=secondary_individual_attr,
+        general_share=general_share,
+    )
+    w = tuple(max(0.0, weights.get(a, 1.0)) for a in player_attrs)
+    mix = CompiledProgramMix(attrs=tuple(player_attrs), weights=w, cumulative=tuple(accumulate(w)))
+    with _PROGRAM_MIX_LOCK:
+        _PROGRAM_MIX_CACHE[key] = mix
+        while len(_PROGRAM_MIX_CACHE) > _PROGRAM_MIX_CACHE_SIZE:
+            _PROGRAM_MIX_CACHE.popitem(last=False)
+    return mix
+
+
 def choose_training_attribute(
     attributes: Dict[str, int],
     attrs_list: List[str],
-    weights: Optional[Dict[str, float]]
+    weights: Optional[Union[Dict[str, float], CompiledProgramMix]]
 ) -> Optional[str]:
     """Choose an attribute for training based on weights, excluding capped attributes."""
+    if isinstance(weights, CompiledProgramMix):
+        if weights.attrs == tuple(attrs_list):
+            return weights.choose(attributes)
+        weights = weights.as_dict()
     # Filter out capped
     candidates = [(a, max(0.0, (weights or {}).get(a, 1.0))) for a in attrs_list if attributes.get(a, 0) < 20]
     if not candidates:
@@ -342,6 +460,61 @@ def weibull_pdf_months(x_months: int, k: float, b: float) -> float:
     return (a / scale) * (x10 ** (a - 1.0)) * math.exp(-((x10 / b) ** a))
 
 
+# Discrete growth grids used by player generation (growth_shape k, growth_peak_age b)
+GROWTH_SHAPE_VALUES: Tuple[float, ...] = tuple(round(1.1 + i * 0.1, 1) for i in range(20))  # 1.1 .. 3.0
+GROWTH_PEAK_AGE_VALUES: Tuple[float, ...] = tuple(1.0 + i * 0.5 for i in range(19))  # 1.0 .. 10.0
+GROWTH_SCHEDULE_WEEKS = 160
+
+_GROWTH_TABLE: Optional[np.ndarray] = None
+_GROWTH_TABLE_LOCK = threading.Lock()
+
+
+def _weibull_schedule_matrix(k: np.ndarray, b: np.ndarray, total_weeks: int) -> np.ndarray:
+    """Normalized ``weibull_pdf_months`` rows for broadcastable k / b arrays (weeks on the last axis)."""
+    a = (k * b)[..., None]
+    bb = np.broadcast_to(b, a.shape[:-1])[..., None]
+    x10 = np.arange(1, total_weeks + 1, dtype=np.float64) / 10.0
+    with np.errstate(over="ignore", under="ignore"):
+        pdf = (a / (10.0 * bb ** a)) * x10 ** (a - 1.0) * np.exp(-((x10 / bb) ** a))
+    sums = pdf.sum(axis=-1, keepdims=True)
+    return pdf / np.where(sums > 0, sums, 1.0)
+
+
+def growth_schedule_table() -> np.ndarray:
+    """
+    (len(GROWTH_SHAPE_VALUES), len(GROWTH_PEAK_AGE_VALUES), 160) array of normalized growth
+    schedules for the whole k x b grid; built once per process (read-only).
+    """
+    global _GROWTH_TABLE
+    table = _GROWTH_TABLE
+    if table is None:
+        with _GROWTH_TABLE_LOCK:
+            if _GROWTH_TABLE is None:
+                k = np.asarray(GROWTH_SHAPE_VALUES)[:, None]
+                b = np.asarray(GROWTH_PEAK_AGE_VALUES)[None, :]
+                built = _weibull_schedule_matrix(k, b, GROWTH_SCHEDULE_WEEKS)
+                built.setflags(write=False)
+                _GROWTH_TABLE = built
+            table = _GROWTH_TABLE
+    return table
+
+
+def _grid_index(value: float, values: Tuple[float, ...], step: float) -> Optional[int]:
+    i = int(round((value - values[0]) / step))
+    if 0 <= i < len(values) and abs(values[i] - value) < 1e-6:
+        return i
+    return None
+
+
+def growth_schedule_row(growth_shape: float, growth_peak_age: float) -> Optional[np.ndarray]:
+    """Table row for an on-grid (k, b) pair (after the same clamping as compile_growth_schedule), else None."""
+    ki = _grid_index(max(1.1, float(growth_shape)), GROWTH_SHAPE_VALUES, 0.1)
+    bi = _grid_index(max(1.0, float(growth_peak_age)), GROWTH_PEAK_AGE_VALUES, 0.5)
+    if ki is None or bi is None:
+        return None
+    return growth_schedule_table()[ki, bi]
+
+
 def compile_growth_schedule(
     growth_shape: float,
     growth_peak_age: float,
@@ -355,10 +528,17 @@ def compile_growth_schedule(
         growth_peak_age: The b parameter (ranges 1.0-10.0). Peak growth age in years.
     
     The Weibull shape parameter a = k * b, where k = growth_shape and b = growth_peak_age.
+    Generated players sit on the k/b grid, so this is normally a lookup in
+    ``growth_schedule_table``; off-grid values are computed directly.
     """
     k = max(1.1, float(growth_shape))  # k ranges from 1.1 to 3.0
     b = max(1.0, float(growth_peak_age))  # b ranges from 1.0 to 10.0
 
+    if total_weeks == GROWTH_SCHEDULE_WEEKS:
+        row = growth_schedule_row(k, b)
+        if row is not None:
+            return row.tolist()
+
     weights = [weibull_pdf_months(wk, k, b) for wk in range(1, total_weeks + 1)]
     s = sum(weights) or 1.0
     return [w / s for w in weights]
@@ -369,7 +549,7 @@ def _assign_chunk_with_efficiency(
     attrs_list: List[str],
     train_carry: Dict[str, float],
     chunk: float,
-    weights: Optional[Dict[str, float]] = None
+    weights: Optional[Union[Dict[str, float], CompiledProgramMix]] = None
 ) -> Tuple[float, float]:
     """
     Try to assign 'chunk' DP to a weighted random attribute using efficiency bands.
@@ -420,6 +600,22 @@ def _convert_carry_to_attributes(
             train_carry[a] -= DP_PER_ATTR_POINT
 
 
+def load_train_carry(stored: Optional[Dict[str, float]], attrs_list: List[str]) -> Dict[str, float]:
+    """Per-attribute carry from a stored ``Player.train_carry`` value (missing attrs -> 0.0)."""
+    stored = stored or {}
+    return {a: float(stored.get(a, 0.0)) for a in attrs_list}
+
+
+def compact_train_carry(train_carry: Dict[str, float], ndigits: int = 3) -> Dict[str, float]:
+    """Carry for storage: rounded, zero entries dropped (load_train_carry restores them)."""
+    out = {}
+    for a, v in train_carry.items():
+        v = round(float(v), ndigits)
+        if v > 0:
+            out[a] = v
+    return out
+
+
 def train_player_week(
     player,
     growth_weights_cache: List[float],
@@ -460,8 +656,8 @@ def train_player_week(
     attrs_list = GOALKEEPER_ATTRS if player.is_goalkeeper else OUTFIELD_ATTRS
     attributes = player.attributes  # Reference to the dict
     
-    # Build mixed program weights
-    prog_weights = build_program_mix_weights(
+    # Mixed program weights (compiled once per mix signature)
+    prog_weights = compiled_program_mix(
         attrs_list,
         player.is_goalkeeper,
         primary_name=primary_program,
@@ -6,6 +6,8 @@ Based on the PlayerGenAndTraining notebook.
 import random
 import math
 import uuid
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Optional, Tuple, List, Set
 import numpy as np
 
@@ -200,116 +202,105 @@ def apply_birth_development(
     return attrs, round(nominal_total, 3), round(assigned_total, 3)
 
 
-def create_player_data(
-    *,
-    club_id: Optional[str],
-    youth_facilities: int,
-    is_goalkeeper: bool = False,
-    youth_player: bool = False,
-    nationality: Optional[str] = None,
-    heritage_options: Optional[List[str]] = None,
-    potential_alpha_base: float = 2.0,
-    potential_beta_base: float = 2.5,
-    potential_beta_facility_scale: float = 20.0,
-    potential_tail_gamma: float = 1.0,
-) -> Dict:
-    """
-    Create player data dictionary with all generation parameters.
-    This can be used to populate a Player model instance.
-    
-    Returns a dict with all player fields for database insertion.
+def apply_birth_development_batch(
+    is_gk: bool,
+    potentials,
+    birth_dev_pcts,
+    DP_PER_ATTR_POINT: float = 10.0,
+    rng=None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]:
     """
-    # Actual starting age based on youth flag
-    if youth_player:
-        start_age_years, start_age_months = 15, 0
-    else:
-        start_age_years, start_age_months = 16, 0
-
-    actual_age_months = start_age_years * 12 + start_age_months
-    baseline_16m = 16 * 12
-    training_age_weeks = max(0, actual_age_months - baseline_16m)
-
-    # Potential
-    potential = sample_potential(
-        youth_facilities,
-        is_goalkeeper,
-        alpha_base=potential_alpha_base,
-        beta_base=potential_beta_base,
-        beta_facility_scale=potential_beta_facility_scale,
-        tail_gamma=potential_tail_gamma,
-    )
+    Vectorized ``apply_birth_development`` for N players of the same kind (all GK or all outfield).
 
-    # Dev splits
-    birth_dev_pct = round(random.uniform(0.20, 0.40), 2)
-    base_training_pct = round(random.uniform(0.10, 0.40), 2)
-    growth_training_pct = round(max(0.0, 1.0 - birth_dev_pct - base_training_pct), 2)
+    Every step advances all players that still have budget: each picks one uncapped attribute
+    uniformly, draws a chunk in [1, 15] (3 dp), applies the same efficiency bands and converts
+    carry to +1 per ``DP_PER_ATTR_POINT`` (cap 20). Players drop out independently, so the loop
+    runs as many steps as the largest budget needs instead of once per player.
 
-    # ---- Weighted growth_peak_age (b parameter: 1.0 to 10.0, steps 0.5) ----
-    # Decreasing probability for higher values, ~10% should have b > 8
-    b_values = [1.0 + i * 0.5 for i in range(19)]  # 1.0, 1.5, 2.0, ..., 10.0
-    b_weights = []
-    for b_val in b_values:
-        # Exponential decay: weight decreases as b increases
-        # Use steeper decay for values > 8.0
-        if b_val <= 8.0:
-            weight = math.exp(-0.15 * (b_val - 1.0))
-        else:
-            weight = math.exp(-0.25 * (b_val - 1.0))
-        b_weights.append(weight)
-    
-    # Normalize separately for <= 8.0 and > 8.0 to get 90/10 split
-    sum_low = sum(b_weights[i] for i, b_val in enumerate(b_values) if b_val <= 8.0)
-    sum_high = sum(b_weights[i] for i, b_val in enumerate(b_values) if b_val > 8.0)
-    
-    # Scale to get 90/10 split
-    for i, b_val in enumerate(b_values):
-        if b_val <= 8.0:
-            b_weights[i] = b_weights[i] * (0.9 / sum_low) if sum_low > 0 else 0
-        else:
-            b_weights[i] = b_weights[i] * (0.1 / sum_high) if sum_high > 0 else 0
-    
-    growth_peak_age = random.choices(b_values, weights=b_weights, k=1)[0]
-
-    # ---- Weighted growth_k (k parameter: 1.1 to 3.0, steps 0.1) ----
-    # More evenly split with larger probability around k=2
-    k_values = [round(1.1 + i * 0.1, 1) for i in range(20)]  # 1.1, 1.2, ..., 3.0
-    k_weights = []
-    for k_val in k_values:
-        # Gaussian-like distribution centered around k=2
-        # Higher weight near k=2, decreasing as we move away
-        distance_from_2 = abs(k_val - 2.0)
-        weight = math.exp(-0.5 * (distance_from_2 ** 2) / 0.3)  # Gaussian with sigma ~0.55
-        k_weights.append(weight)
-    
-    # Normalize weights
-    k_sum = sum(k_weights)
-    k_weights = [w / k_sum for w in k_weights]
-    
-    growth_shape = round(random.choices(k_values, weights=k_weights, k=1)[0], 1)
+    Args:
+        potentials, birth_dev_pcts: length-N arrays (or sequences)
+        rng: ``np.random.Generator`` / ``RandomState``; defaults to the global ``np.random``
 
-    # Growth width is now redundant (k replaces it), but keep for backwards compatibility
-    # Calculate approximate width from k for display purposes
-    # k=1.1 gives broad (~5 years), k=3.0 gives narrow (~3 years)
-    # Linear interpolation: width = 5.0 - (k - 1.1) * (2.0 / 1.9)
-    estimated_width = 5.0 - (growth_shape - 1.1) * (2.0 / 1.9)
-    growth_width = round(max(3.0, min(5.0, estimated_width)), 1)
+    Returns:
+        (attributes int16 [N, A], nominal_dp_total [N], assigned_dp_total [N], attribute names)
+    """
+    rng = np.random if rng is None else rng
+    attrs_list = list(GOALKEEPER_ATTRS if is_gk else OUTFIELD_ATTRS)
+    potentials = np.asarray(potentials, dtype=np.float64).reshape(-1)
+    birth_dev_pcts = np.asarray(birth_dev_pcts, dtype=np.float64).reshape(-1)
+    n = potentials.shape[0]
+    n_attrs = len(attrs_list)
+
+    attrs = np.ones((n, n_attrs), dtype=np.int16)
+    carry = np.zeros((n, n_attrs), dtype=np.float64)
+    base_cost = n_attrs * 5.0
+    budget = np.maximum(0.0, potentials * birth_dev_pcts - base_cost)
+    nominal = np.zeros(n, dtype=np.float64)
+    assigned_total = np.zeros(n, dtype=np.float64)
+
+    active = np.flatnonzero(budget - nominal >= 0.1 - 1e-12)
+    while active.size:
+        a_attrs = attrs[active]
+        uncapped = a_attrs < 20
+        has_room = uncapped.any(axis=1)
+        if not has_room.all():
+            active = active[has_room]
+            if not active.size:
+                break
+            a_attrs = a_attrs[has_room]
+            uncapped = uncapped[has_room]
+        m = active.size
+
+        # Uniform pick among uncapped attributes: argmax of random keys with capped masked out
+        keys = rng.random((m, n_attrs))
+        keys[~uncapped] = -1.0
+        col = keys.argmax(axis=1)
+        val = a_attrs[np.arange(m), col]
+
+        chunk = np.round(rng.uniform(1.0, 15.0, size=m), 3)
+        roll = rng.random(m)
+        gain = np.where(
+            val <= 4,
+            np.where(roll < 0.5, 2.0, 1.0),
+            np.where(
+                val <= 14,
+                1.0,
+                np.where(val <= 17, (roll < 0.5).astype(np.float64), (roll < 0.33).astype(np.float64)),
+            ),
+        )
+        assigned = chunk * gain
+        nominal[active] += chunk
+        assigned_total[active] += assigned
+
+        # Carry -> attribute points (cap 20; leftover carry stays once capped)
+        c = carry[active, col] + assigned
+        points = np.minimum(np.floor(c / DP_PER_ATTR_POINT), 20 - val).astype(np.int16)
+        points = np.maximum(points, 0)
+        attrs[active, col] = val + points
+        carry[active, col] = c - points * DP_PER_ATTR_POINT
+
+        still = budget[active] - nominal[active] >= 0.1 - 1e-12
+        active = active[still]
+
+    return attrs, np.round(nominal, 3), np.round(assigned_total, 3), attrs_list
+
+
+def birth_attributes_as_dicts(attrs: np.ndarray, attr_names: List[str]) -> List[Dict[str, int]]:
+    """Per-player ``{attribute: value}`` dicts from ``apply_birth_development_batch`` output."""
+    return [dict(zip(attr_names, map(int, row))) for row in attrs.tolist()]
+
+
+def _generate_player_name(
+    nationality: str,
+    heritage_options: Optional[List[str]],
+    used_names: Optional[set],
+) -> Tuple[str, Optional[str], Optional[str], Dict[str, str]]:
+    """
+    Name + heritage for one player (shared by ``create_player_data`` and the heritage-options
+    path of ``create_players_batch``).
 
-    # ---- Attributes via birth development ----
-    attributes, birth_nominal_dp, birth_assigned_dp = apply_birth_development(
-        is_gk=is_goalkeeper,
-        potential=potential,
-        birth_dev_pct=birth_dev_pct
-    )
-    
-    non_playing = {a: clamp(int(random.gauss(10, 4))) for a in NON_PLAYING_ATTRIBUTES}
-    
-    position_traits = [random.choice(POSITION_TRAITS)]
-    gainable_traits = random.sample(GAINABLE_TRAITS, k=random.randint(1, 3))
-    
-    # Generate nationality first, then use it for name generation
-    if nationality is None:
-        nationality = random.choice(NATIONALITIES)
-    
+    Returns (player_name, heritage_group, name_structure, name_pool_debug).
+    """
     # Determine heritage origin country if heritage options provided
     # Determine heritage group for this player
     origin_country = None
@@ -343,7 +334,7 @@ def create_player_data(
                 nationality=nationality,
                 heritage_group=heritage_group,
                 origin_country=origin_country,
-                used_names=None,
+                used_names=used_names,
                 name_pool_debug=name_pool_debug,
             )
             player_name = str(name_obj)
@@ -410,6 +401,8 @@ def create_player_data(
             surname_origin = "HERITAGE" if surname_country == origin_country else "LOCAL"
             name_structure = name_structure_code(given_origin, surname_origin)
             name_pool_debug["name_structure"] = name_structure
+            if used_names is not None:
+                used_names.add(player_name)
     else:
         # When origin_country == nationality or no origin_country, use heritage_group if available
         # This ensures names match the heritage group used for profile pictures
@@ -420,14 +413,159 @@ def create_player_data(
                 nationality=nationality,
                 heritage_group=heritage_group,
                 origin_country=None,  # No heritage origin when origin_country == nationality
-                used_names=None,
+                used_names=used_names,
                 name_pool_debug=name_pool_debug,
             )
             player_name = str(name_obj)
             name_structure = name_pool_debug.get("name_structure", "LL")
         else:
-            player_name = rnd_name(nationality=nationality, name_pool_debug=name_pool_debug)
+            player_name = rnd_name(
+                nationality=nationality,
+                used_names=used_names,
+                name_pool_debug=name_pool_debug,
+            )
             name_structure = name_pool_debug.get("name_structure", "LL")
+
+    return player_name, heritage_group, name_structure, name_pool_debug
+
+
+_GROWTH_GRIDS: Dict[str, Tuple[List[float], List[float]]] = {}
+
+
+def _growth_peak_age_grid() -> Tuple[List[float], List[float]]:
+    """(b values, weights) for growth_peak_age: 1.0 to 10.0 step 0.5, ~10% mass above 8."""
+    grid = _GROWTH_GRIDS.get("b")
+    if grid is not None:
+        return grid
+    # Decreasing probability for higher values, ~10% should have b > 8
+    b_values = [1.0 + i * 0.5 for i in range(19)]  # 1.0, 1.5, 2.0, ..., 10.0
+    b_weights = []
+    for b_val in b_values:
+        # Exponential decay: weight decreases as b increases
+        # Use steeper decay for values > 8.0
+        if b_val <= 8.0:
+            weight = math.exp(-0.15 * (b_val - 1.0))
+        else:
+            weight = math.exp(-0.25 * (b_val - 1.0))
+        b_weights.append(weight)
+    
+    # Normalize separately for <= 8.0 and > 8.0 to get 90/10 split
+    sum_low = sum(b_weights[i] for i, b_val in enumerate(b_values) if b_val <= 8.0)
+    sum_high = sum(b_weights[i] for i, b_val in enumerate(b_values) if b_val > 8.0)
+    
+    # Scale to get 90/10 split
+    for i, b_val in enumerate(b_values):
+        if b_val <= 8.0:
+            b_weights[i] = b_weights[i] * (0.9 / sum_low) if sum_low > 0 else 0
+        else:
+            b_weights[i] = b_weights[i] * (0.1 / sum_high) if sum_high > 0 else 0
+    _GROWTH_GRIDS["b"] = (b_values, b_weights)
+    return b_values, b_weights
+
+
+def _growth_shape_grid() -> Tuple[List[float], List[float]]:
+    """(k values, weights) for growth_shape: 1.1 to 3.0 step 0.1, Gaussian-like around 2."""
+    grid = _GROWTH_GRIDS.get("k")
+    if grid is not None:
+        return grid
+    # More evenly split with larger probability around k=2
+    k_values = [round(1.1 + i * 0.1, 1) for i in range(20)]  # 1.1, 1.2, ..., 3.0
+    k_weights = []
+    for k_val in k_values:
+        # Gaussian-like distribution centered around k=2
+        # Higher weight near k=2, decreasing as we move away
+        distance_from_2 = abs(k_val - 2.0)
+        weight = math.exp(-0.5 * (distance_from_2 ** 2) / 0.3)  # Gaussian with sigma ~0.55
+        k_weights.append(weight)
+    
+    # Normalize weights
+    k_sum = sum(k_weights)
+    k_weights = [w / k_sum for w in k_weights]
+    _GROWTH_GRIDS["k"] = (k_values, k_weights)
+    return k_values, k_weights
+
+
+def create_player_data(
+    *,
+    club_id: Optional[str],
+    youth_facilities: int,
+    is_goalkeeper: bool = False,
+    youth_player: bool = False,
+    nationality: Optional[str] = None,
+    heritage_options: Optional[List[str]] = None,
+    potential_alpha_base: float = 2.0,
+    potential_beta_base: float = 2.5,
+    potential_beta_facility_scale: float = 20.0,
+    potential_tail_gamma: float = 1.0,
+    used_names: Optional[set] = None,
+) -> Dict:
+    """
+    Create player data dictionary with all generation parameters.
+    This can be used to populate a Player model instance.
+
+    ``used_names`` (a set or utils.name_index.NameUniquenessIndex) is checked and updated by
+    name generation so the player's full name is unique within it.
+    
+    Returns a dict with all player fields for database insertion.
+    """
+    # Actual starting age based on youth flag
+    if youth_player:
+        start_age_years, start_age_months = 15, 0
+    else:
+        start_age_years, start_age_months = 16, 0
+
+    actual_age_months = start_age_years * 12 + start_age_months
+    baseline_16m = 16 * 12
+    training_age_weeks = max(0, actual_age_months - baseline_16m)
+
+    # Potential
+    potential = sample_potential(
+        youth_facilities,
+        is_goalkeeper,
+        alpha_base=potential_alpha_base,
+        beta_base=potential_beta_base,
+        beta_facility_scale=potential_beta_facility_scale,
+        tail_gamma=potential_tail_gamma,
+    )
+
+    # Dev splits
+    birth_dev_pct = round(random.uniform(0.20, 0.40), 2)
+    base_training_pct = round(random.uniform(0.10, 0.40), 2)
+    growth_training_pct = round(max(0.0, 1.0 - birth_dev_pct - base_training_pct), 2)
+
+    # ---- Weighted growth_peak_age (b) and growth_k (k); see _growth_peak_age_grid / _growth_shape_grid ----
+    b_values, b_weights = _growth_peak_age_grid()
+    growth_peak_age = random.choices(b_values, weights=b_weights, k=1)[0]
+
+    k_values, k_weights = _growth_shape_grid()
+    growth_shape = round(random.choices(k_values, weights=k_weights, k=1)[0], 1)
+
+    # Growth width is now redundant (k replaces it), but keep for backwards compatibility
+    # Calculate approximate width from k for display purposes
+    # k=1.1 gives broad (~5 years), k=3.0 gives narrow (~3 years)
+    # Linear interpolation: width = 5.0 - (k - 1.1) * (2.0 / 1.9)
+    estimated_width = 5.0 - (growth_shape - 1.1) * (2.0 / 1.9)
+    growth_width = round(max(3.0, min(5.0, estimated_width)), 1)
+
+    # ---- Attributes via birth development ----
+    attributes, birth_nominal_dp, birth_assigned_dp = apply_birth_development(
+        is_gk=is_goalkeeper,
+        potential=potential,
+        birth_dev_pct=birth_dev_pct
+    )
+    
+    non_playing = {a: clamp(int(random.gauss(10, 4))) for a in NON_PLAYING_ATTRIBUTES}
+    
+    position_traits = [random.choice(POSITION_TRAITS)]
+    gainable_traits = random.sample(GAINABLE_TRAITS, k=random.randint(1, 3))
+    
+    # Generate nationality first, then use it for name generation
+    if nationality is None:
+        nationality = random.choice(NATIONALITIES)
+    
+    player_name, heritage_group, name_structure, name_pool_debug = _generate_player_name(
+        nationality, heritage_options, used_names
+    )
     
     return {
         "name": player_name,
@@ -451,3 +589,375 @@ def create_player_data(
         "position_traits": position_traits,
         "gainable_traits": gainable_traits,
     }
+
+
+_POTENTIAL_FLOOR = 200
+_BETA_GRID_CELLS = 1 << 16
+
+
+def _max_potential_points(is_goalkeeper: bool) -> int:
+    return 3000 if not is_goalkeeper else int(3000 * len(GOALKEEPER_ATTRS) / len(OUTFIELD_ATTRS))
+
+
+@lru_cache(maxsize=64)
+def _potential_cdf(alpha: float, beta: float, gamma: float, max_points: int) -> np.ndarray:
+    """
+    CDF of ``sample_potential``'s integer output: ``cdf[k] = P(potential <= k)`` for
+    k = 0..max_points. The Beta CDF is integrated numerically (midpoint rule on a fine grid),
+    then mapped through the tail transform and the int/clamp of the potential scale.
+    """
+    edges = np.linspace(0.0, 1.0, _BETA_GRID_CELLS + 1)
+    mid = (edges[:-1] + edges[1:]) / 2
+    log_pdf = (alpha - 1.0) * np.log(mid) + (beta - 1.0) * np.log1p(-mid)
+    pdf = np.exp(log_pdf - log_pdf.max())
+    beta_cdf = np.concatenate(([0.0], np.cumsum(pdf)))
+    beta_cdf /= beta_cdf[-1]
+
+    # potential <= k  <=>  raw ** gamma < (k + 1) / max_points  (for floor <= k < max_points)
+    k = np.arange(max_points + 1)
+    x = np.clip((k + 1) / max_points, 0.0, 1.0) ** (1.0 / gamma)
+    cdf = np.interp(x, edges, beta_cdf)
+    cdf[:_POTENTIAL_FLOOR] = 0.0  # clamped up to the floor
+    cdf[max_points] = 1.0
+    cdf.setflags(write=False)
+    return cdf
+
+
+def sample_potential_batch(
+    n: int,
+    youth_facilities: int,
+    is_goalkeeper: bool,
+    *,
+    alpha_base: float = 2.0,
+    beta_base: float = 2.5,
+    beta_facility_scale: float = 20.0,
+    tail_gamma: float = 1.0,
+    potential_range: Optional[Tuple[int, int]] = None,
+    rng=None,
+) -> np.ndarray:
+    """
+    ``sample_potential`` for ``n`` players in one Beta draw (int64 array).
+
+    With ``potential_range=(lo, hi)`` the draw comes from the same distribution truncated to
+    [lo, hi] (inverse CDF), so every player lands in range without filter-and-retry. A range
+    with no probability mass falls back to uniform integers in range.
+    """
+    rng = np.random if rng is None else rng
+    alpha = float(alpha_base)
+    beta = float(beta_base) + (10 - youth_facilities) / float(beta_facility_scale)
+    gamma = max(0.01, float(tail_gamma)) if tail_gamma and float(tail_gamma) != 1.0 else 1.0
+    max_points = _max_potential_points(is_goalkeeper)
+
+    if potential_range is not None:
+        lo = min(max(int(potential_range[0]), _POTENTIAL_FLOOR), max_points)
+        hi = min(max(int(potential_range[1]), lo), max_points)
+        cdf = _potential_cdf(alpha, beta, gamma, max_points)
+        p_lo, p_hi = float(cdf[lo - 1]), float(cdf[hi])
+        if p_hi - p_lo <= 1e-12:
+            return _randint(rng, lo, hi + 1, n).astype(np.int64)
+        u = rng.uniform(p_lo, p_hi, size=n)
+        return np.clip(np.searchsorted(cdf, u, side="right"), lo, hi).astype(np.int64)
+
+    raw = rng.beta(alpha, beta, size=n)
+    if gamma != 1.0:
+        raw = raw ** gamma
+    return np.clip((raw * max_points).astype(np.int64), _POTENTIAL_FLOOR, max_points)
+
+
+def _randint(rng, low: int, high: int, size) -> np.ndarray:
+    """Integers in [low, high) from either ``np.random``/``RandomState`` or a ``Generator``."""
+    if hasattr(rng, "integers"):
+        return rng.integers(low, high, size=size)
+    return rng.randint(low, high, size=size)
+
+
+@dataclass
+class PlayerBatch:
+    """
+    Columnar output of ``create_players_batch``: one entry per player in every column.
+
+    Numeric columns are NumPy arrays (``attributes`` is [N, len(attribute_names)]); string and
+    trait columns are lists. ``record(i)`` / ``to_dicts()`` give the same dict shape as
+    ``create_player_data`` for existing callers.
+    """
+
+    is_goalkeeper: bool
+    actual_age_months: int
+    training_age_weeks: int
+    names: List[str]
+    nationalities: List[str]
+    heritage_groups: List[Optional[str]]
+    name_structures: List[Optional[str]]
+    naming_pool_attempted: List[Optional[str]]
+    skin_tones: List[str]
+    potential: np.ndarray
+    birth_dev_pct: np.ndarray
+    base_training_pct: np.ndarray
+    growth_training_pct: np.ndarray
+    growth_shape: np.ndarray
+    growth_peak_age: np.ndarray
+    growth_width: np.ndarray
+    attribute_names: List[str]
+    attributes: np.ndarray
+    non_playing_attributes: np.ndarray
+    position_traits: List[List[str]]
+    gainable_traits: List[List[str]]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def columns(self) -> Dict[str, object]:
+        """Column name -> array/list (scalar fields broadcast are left out)."""
+        return {
+            "name": self.names,
+            "nationality": self.nationalities,
+            "heritage_group": self.heritage_groups,
+            "name_structure": self.name_structures,
+            "naming_pool_attempted": self.naming_pool_attempted,
+            "skin_tone": self.skin_tones,
+            "potential": self.potential,
+            "birth_dev_pct": self.birth_dev_pct,
+            "base_training_pct": self.base_training_pct,
+            "growth_training_pct": self.growth_training_pct,
+            "growth_shape": self.growth_shape,
+            "growth_peak_age": self.growth_peak_age,
+            "growth_width": self.growth_width,
+            "attributes": self.attributes,
+            "non_playing_attributes": self.non_playing_attributes,
+            "position_traits": self.position_traits,
+            "gainable_traits": self.gainable_traits,
+        }
+
+    def to_dicts(self) -> List[Dict]:
+        """Per-player dicts (same keys and Python types as ``create_player_data``)."""
+        potential = self.potential.tolist()
+        birth = self.birth_dev_pct.tolist()
+        base = self.base_training_pct.tolist()
+        growth = self.growth_training_pct.tolist()
+        shape = self.growth_shape.tolist()
+        peak = self.growth_peak_age.tolist()
+        width = self.growth_width.tolist()
+        attrs = self.attributes.tolist()
+        non_playing = self.non_playing_attributes.tolist()
+        out: List[Dict] = []
+        for i in range(len(self.names)):
+            out.append({
+                "name": self.names[i],
+                "nationality": self.nationalities[i],
+                "heritage_group": self.heritage_groups[i],
+                "name_structure": self.name_structures[i],
+                "naming_pool_attempted": self.naming_pool_attempted[i],
+                "skin_tone": self.skin_tones[i],
+                "is_goalkeeper": self.is_goalkeeper,
+                "actual_age_months": self.actual_age_months,
+                "training_age_weeks": self.training_age_weeks,
+                "potential": potential[i],
+                "birth_dev_pct": birth[i],
+                "base_training_pct": base[i],
+                "growth_training_pct": growth[i],
+                "growth_shape": shape[i],
+                "growth_peak_age": peak[i],
+                "growth_width": width[i],
+                "attributes": dict(zip(self.attribute_names, attrs[i])),
+                "non_playing_attributes": dict(zip(NON_PLAYING_ATTRIBUTES, non_playing[i])),
+                "position_traits": list(self.position_traits[i]),
+                "gainable_traits": list(self.gainable_traits[i]),
+            })
+        return out
+
+    def record(self, i: int) -> Dict:
+        """Dict view of player ``i`` (prefer ``to_dicts`` for many players)."""
+        return {
+            "name": self.names[i],
+            "nationality": self.nationalities[i],
+            "heritage_group": self.heritage_groups[i],
+            "name_structure": self.name_structures[i],
+            "naming_pool_attempted": self.naming_pool_attempted[i],
+            "skin_tone": self.skin_tones[i],
+            "is_goalkeeper": self.is_goalkeeper,
+            "actual_age_months": self.actual_age_months,
+            "training_age_weeks": self.training_age_weeks,
+            "potential": int(self.potential[i]),
+            "birth_dev_pct": float(self.birth_dev_pct[i]),
+            "base_training_pct": float(self.base_training_pct[i]),
+            "growth_training_pct": float(self.growth_training_pct[i]),
+            "growth_shape": float(self.growth_shape[i]),
+            "growth_peak_age": float(self.growth_peak_age[i]),
+            "growth_width": float(self.growth_width[i]),
+            "attributes": dict(zip(self.attribute_names, self.attributes[i].tolist())),
+            "non_playing_attributes": dict(
+                zip(NON_PLAYING_ATTRIBUTES, self.non_playing_attributes[i].tolist())
+            ),
+            "position_traits": list(self.position_traits[i]),
+            "gainable_traits": list(self.gainable_traits[i]),
+        }
+
+
+def _batch_names(
+    nationalities: List[str],
+    heritage_options: Optional[List[str]],
+    used_names: Optional[set],
+) -> Tuple[List[str], List[Optional[str]], List[Optional[str]], List[Optional[str]]]:
+    """Names for a batch: one ``generate_names_batch`` call per (nationality, heritage group)."""
+    from utils.name_generation import generate_names_batch, select_heritage_groups
+
+    n = len(nationalities)
+    names: List[str] = [""] * n
+    groups: List[Optional[str]] = [None] * n
+    structures: List[Optional[str]] = [None] * n
+    attempted: List[Optional[str]] = [None] * n
+
+    if heritage_options:
+        # Explicit heritage options use the workbench mixing rules; keep the per-player path.
+        for i, nat in enumerate(nationalities):
+            name, group, structure, debug = _generate_player_name(nat, heritage_options, used_names)
+            names[i], groups[i], structures[i] = name, group, structure
+            attempted[i] = _format_naming_pool_attempted(debug)
+        return names, groups, structures, attempted
+
+    if used_names is None:
+        used_names = set()
+    by_nat: Dict[str, List[int]] = {}
+    for i, nat in enumerate(nationalities):
+        by_nat.setdefault(nat, []).append(i)
+    for nat, idxs in by_nat.items():
+        nat_groups = select_heritage_groups(nat, len(idxs))
+        by_group: Dict[Optional[str], List[int]] = {}
+        for i, g in zip(idxs, nat_groups):
+            by_group.setdefault(g, []).append(i)
+        for group, slots in by_group.items():
+            debugs: List[Dict[str, str]] = []
+            batch = generate_names_batch(
+                nat,
+                len(slots),
+                used_names=used_names,
+                heritage_group=group,
+                name_pool_debug=debugs,
+            )
+            for i, name_obj, debug in zip(slots, batch, debugs):
+                names[i] = name_obj.display_full
+                groups[i] = group
+                structures[i] = debug.get("name_structure", "LL")
+                attempted[i] = _format_naming_pool_attempted(debug)
+    return names, groups, structures, attempted
+
+
+def create_players_batch(
+    n: int,
+    *,
+    youth_facilities: int,
+    is_goalkeeper: bool = False,
+    youth_player: bool = False,
+    nationality: Optional[str] = None,
+    heritage_options: Optional[List[str]] = None,
+    potential_alpha_base: float = 2.0,
+    potential_beta_base: float = 2.5,
+    potential_beta_facility_scale: float = 20.0,
+    potential_tail_gamma: float = 1.0,
+    potential_range: Optional[Tuple[int, int]] = None,
+    uniform_potential: bool = False,
+    used_names: Optional[set] = None,
+    rng=None,
+) -> PlayerBatch:
+    """
+    Bulk ``create_player_data``: same distributions, each sampled in one vectorized call per
+    field; attributes via ``apply_birth_development_batch``; names via ``generate_names_batch``.
+
+    ``potential_range=(lo, hi)`` keeps potential in range by sampling the truncated
+    distribution; with ``uniform_potential`` potential is uniform in the range instead.
+
+    Use ``.to_dicts()`` (or ``.record(i)``) where the per-player dict shape is needed.
+    """
+    rng = np.random if rng is None else rng
+    n = max(0, int(n))
+
+    if youth_player:
+        start_age_years, start_age_months = 15, 0
+    else:
+        start_age_years, start_age_months = 16, 0
+    actual_age_months = start_age_years * 12 + start_age_months
+    training_age_weeks = max(0, actual_age_months - 16 * 12)
+
+    if potential_range is not None and uniform_potential:
+        lo, hi = int(potential_range[0]), int(potential_range[1])
+        potential = _randint(rng, lo, max(lo, hi) + 1, n).astype(np.int64)
+    else:
+        potential = sample_potential_batch(
+            n,
+            youth_facilities,
+            is_goalkeeper,
+            alpha_base=potential_alpha_base,
+            beta_base=potential_beta_base,
+            beta_facility_scale=potential_beta_facility_scale,
+            tail_gamma=potential_tail_gamma,
+            potential_range=potential_range,
+            rng=rng,
+        )
+
+    # Dev splits
+    birth_dev_pct = np.round(rng.uniform(0.20, 0.40, size=n), 2)
+    base_training_pct = np.round(rng.uniform(0.10, 0.40, size=n), 2)
+    growth_training_pct = np.round(np.maximum(0.0, 1.0 - birth_dev_pct - base_training_pct), 2)
+
+    b_values, b_weights = _growth_peak_age_grid()
+    growth_peak_age = rng.choice(np.asarray(b_values), size=n, p=np.asarray(b_weights) / sum(b_weights))
+    k_values, k_weights = _growth_shape_grid()
+    growth_shape = np.round(
+        rng.choice(np.asarray(k_values), size=n, p=np.asarray(k_weights) / sum(k_weights)), 1
+    )
+    # Same backwards-compatible width estimate as create_player_data
+    growth_width = np.round(np.clip(5.0 - (growth_shape - 1.1) * (2.0 / 1.9), 3.0, 5.0), 1)
+
+    attributes, _nominal, _assigned, attribute_names = apply_birth_development_batch(
+        is_goalkeeper, potential, birth_dev_pct, rng=rng
+    )
+
+    # int(gauss) truncates toward zero; clamp to 1..20
+    non_playing = np.clip(
+        np.trunc(rng.normal(10.0, 4.0, size=(n, len(NON_PLAYING_ATTRIBUTES)))), 1, 20
+    ).astype(np.int64)
+
+    position_idx = _randint(rng, 0, len(POSITION_TRAITS), n)
+    position_traits = [[POSITION_TRAITS[j]] for j in position_idx.tolist()]
+    # random.sample(GAINABLE_TRAITS, k=1..3): first k of a random permutation per row
+    gain_counts = _randint(rng, 1, 4, n).tolist()
+    gain_order = np.argsort(rng.random((n, len(GAINABLE_TRAITS))), axis=1).tolist()
+    gainable_traits = [
+        [GAINABLE_TRAITS[j] for j in order[:k]] for order, k in zip(gain_order, gain_counts)
+    ]
+
+    if nationality is None:
+        nat_idx = _randint(rng, 0, len(NATIONALITIES), n)
+        nationalities = [NATIONALITIES[j] for j in nat_idx.tolist()]
+    else:
+        nationalities = [nationality] * n
+    names, heritage_groups, name_structures, attempted = _batch_names(
+        nationalities, heritage_options, used_names
+    )
+
+    skin_idx = _randint(rng, 0, len(SKIN_TONES), n)
+    skin_tones = [SKIN_TONES[j] for j in skin_idx.tolist()]
+
+    return PlayerBatch(
+        is_goalkeeper=is_goalkeeper,
+        actual_age_months=actual_age_months,
+        training_age_weeks=training_age_weeks,
+        names=names,
+        nationalities=nationalities,
+        heritage_groups=heritage_groups,
+        name_structures=name_structures,
+        naming_pool_attempted=attempted,
+        skin_tones=skin_tones,
+        potential=potential,
+        birth_dev_pct=birth_dev_pct,
+        base_training_pct=base_training_pct,
+        growth_training_pct=growth_training_pct,
+        growth_shape=growth_shape,
+        growth_peak_age=growth_peak_age,
+        growth_width=growth_width,
+        attribute_names=attribute_names,
+        attributes=attributes,
+        non_playing_attributes=non_playing,
+        position_traits=position_traits,
+        gainable_traits=gainable_traits,
+    )
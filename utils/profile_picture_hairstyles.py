@@ -52,6 +52,11 @@ _COUNTRY_SPECIALTY_DELTAS: List[Tuple[str, str, Tuple[int, int, int, int]]] = [
 ]
 
 
+def hairstyle_target_rels() -> Tuple[str, ...]:
+    """Every folder ``roll_player_profile_pics_rel`` can redirect to (logical gfx paths)."""
+    return tuple(f"player_profile_pics/{name}" for name in _SPECIALTY_FOLDER_NAMES)
+
+
 def visual_bucket_from_picture_rel(rel: str) -> Optional[str]:
     """Last path segment of ``player_profile_pics/<VisualBucket>``."""
     norm = rel.replace("\\", "/").strip("/")
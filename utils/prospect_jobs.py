@@ -0,0 +1,278 @@
+"""
+Bulk prospect generation jobs (all-nations intake) off the request thread.
+
+``start_prospect_job`` registers a job and runs it on a daemon thread. The nations are split
+into chunks and generated in parallel on the ``cpu`` process pool of utils/execution.py; each
+worker gets a pickled copy of the game mode's ``NameUniquenessIndex``. Names are unique within
+a worker, so the job thread re-checks every name against the live index and regenerates the
+(rare) cross-chunk collisions itself, until none are left or ``_MAX_REGENERATION_ROUNDS``.
+The finished intake is handed to a ``store`` callback in one call (bulk insert / in-memory
+store). The job's names are reserved job-locally and only added to the live index once
+``store`` has saved them, so a cancelled or failed job leaves the index as it found it.
+
+Job state is kept per process; poll ``get_prospect_job`` for progress. ``cancel_prospect_job``
+stops a job before its intake is stored (chunks not yet started are dropped).
+"""
+
+import logging
+import threading
+import time
+from collections import Counter
+from concurrent.futures import as_completed
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+from uuid import UUID, uuid4
+
+from .execution import EXECUTION_CLASSES, get_executor
+from .name_index import NameUniquenessIndex
+
+_JOBS: Dict[str, "ProspectJob"] = {}
+_JOBS_LOCK = threading.Lock()
+_MAX_FINISHED_JOBS = 50
+
+# Cross-chunk name collisions are regenerated on the job thread, at most this many rounds
+_MAX_REGENERATION_ROUNDS = 10
+
+
+@dataclass
+class ProspectJob:
+    id: str
+    club_id: str
+    game_mode_id: str
+    nations_total: int
+    status: str = "pending"  # pending | running | completed | failed | cancelled
+    nations_done: int = 0
+    prospects_generated: int = 0
+    prospects_created: int = 0
+    names_regenerated: int = 0
+    error: Optional[str] = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    finished_at: Optional[datetime] = None
+    seconds: Optional[float] = None
+    cancel_requested: threading.Event = field(default_factory=threading.Event)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "club_id": self.club_id,
+            "game_mode_id": self.game_mode_id,
+            "nations_total": self.nations_total,
+            "nations_done": self.nations_done,
+            "prospects_generated": self.prospects_generated,
+            "count": self.prospects_created,
+            "names_regenerated": self.names_regenerated,
+            "error": self.error,
+            "created_at": self.created_at.isoformat(),
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "seconds": self.seconds,
+        }
+
+
+def generate_nation_prospects(
+    params: Dict[str, Any],
+    nation_codes: List[str],
+    used_names,
+) -> List[Dict]:
+    """
+    Process-pool worker: ``params['per_nation']`` prospects for every nation in
+    ``nation_codes`` (``params`` are ``generate_weekly_prospects`` keyword arguments).
+    """
+    from utils.youth_academy import generate_weekly_prospects
+
+    per_nation = params["per_nation"]
+    kwargs = {k: v for k, v in params.items() if k != "per_nation"}
+    out: List[Dict] = []
+    for nat_code in nation_codes:
+        out.extend(
+            generate_weekly_prospects(
+                nationality=nat_code,
+                heritage_options=None,
+                num_prospects_override=per_nation,
+                used_names=used_names,
+                **kwargs,
+            )
+        )
+    return out
+
+
+class _JobNames:
+    """The live name index plus this job's own reservations, published once they are stored."""
+
+    def __init__(self, live):
+        self.live = live
+        self.reserved = NameUniquenessIndex()
+        self.names: List[str] = []
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.reserved or name in self.live
+
+    def add(self, name: str) -> None:
+        self.reserved.add(name)
+        self.names.append(name)
+
+    def publish(self) -> None:
+        self.live.update(self.names)
+
+
+class _RecordingNames:
+    """``used_names`` wrapper that records which names the generator actually reserved."""
+
+    def __init__(self, names):
+        self.names = names
+        self.added = set()
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.names
+
+    def add(self, name: str) -> None:
+        self.names.add(name)
+        self.added.add(name)
+
+
+def _chunks(items: List[str], n_chunks: int) -> List[List[str]]:
+    n_chunks = max(1, min(n_chunks, len(items)))
+    return [items[i::n_chunks] for i in range(n_chunks)]
+
+
+def _run_job(
+    job: ProspectJob,
+    params: Dict[str, Any],
+    nation_codes: List[str],
+    name_index,
+    store: Callable[[List[Dict]], int],
+) -> None:
+    from utils.youth_academy import generate_weekly_prospects
+
+    started = time.perf_counter()
+    job.status = "running"
+    try:
+        # Chunks are submitted straight to the executor (no admission bound): a job's
+        # chunks queue behind each other instead of turning requests away with 503s
+        pool = get_executor("cpu")
+        futures = {
+            pool.submit(generate_nation_prospects, params, chunk, name_index): chunk
+            for chunk in _chunks(nation_codes, EXECUTION_CLASSES["cpu"].max_workers * 2)
+        }
+        job_names = _JobNames(name_index)
+        prospects: List[Dict] = []
+        collisions: Counter = Counter()
+        for fut in as_completed(futures):
+            if job.cancel_requested.is_set():
+                break
+            for prospect in fut.result():
+                if prospect["name"] in job_names:
+                    collisions[prospect["nationality"]] += 1
+                    continue
+                job_names.add(prospect["name"])
+                prospects.append(prospect)
+            job.nations_done += len(futures[fut])
+            job.prospects_generated = len(prospects)
+
+        # Names taken by another chunk: regenerate against the live index and this job's names. The generator
+        # reserves the names it returns, except when it runs out of retries and hands back a
+        # taken one; those go round again.
+        kwargs = {k: v for k, v in params.items() if k != "per_nation"}
+        rounds = 0
+        while collisions and rounds < _MAX_REGENERATION_ROUNDS and not job.cancel_requested.is_set():
+            rounds += 1
+            job.names_regenerated += sum(collisions.values())
+            retry, collisions = collisions, Counter()
+            for nat_code, count in retry.items():
+                recorder = _RecordingNames(job_names)
+                for prospect in generate_weekly_prospects(
+                    nationality=nat_code,
+                    heritage_options=None,
+                    num_prospects_override=count,
+                    used_names=recorder,
+                    **kwargs,
+                ):
+                    if prospect["name"] in recorder.added:
+                        recorder.added.discard(prospect["name"])
+                        prospects.append(prospect)
+                    else:
+                        collisions[nat_code] += 1
+        if collisions:
+            logging.warning(
+                "prospect job %s: dropped %d prospects without a unique name after %d rounds",
+                job.id, sum(collisions.values()), rounds,
+            )
+        job.prospects_generated = len(prospects)
+
+        if job.cancel_requested.is_set():
+            for fut in futures:
+                fut.cancel()
+            job.status = "cancelled"
+            return
+        job.prospects_created = store(prospects)
+        job_names.publish()
+        job.status = "completed"
+    except Exception as e:
+        job.status = "failed"
+        job.error = str(e)
+        logging.exception("prospect job %s failed", job.id)
+    finally:
+        job.finished_at = datetime.utcnow()
+        job.seconds = round(time.perf_counter() - started, 2)
+
+
+def _prune_jobs() -> None:
+    finished = [j for j in _JOBS.values() if j.finished_at is not None]
+    finished.sort(key=lambda j: j.finished_at)
+    for job in finished[: max(0, len(finished) - _MAX_FINISHED_JOBS)]:
+        _JOBS.pop(job.id, None)
+
+
+def start_prospect_job(
+    *,
+    club_id: UUID,
+    game_mode_id: UUID,
+    nation_codes: List[str],
+    per_nation: int,
+    name_index,
+    store: Callable[[List[Dict]], int],
+    **prospect_kwargs: Any,
+) -> Dict[str, Any]:
+    """
+    Generate ``per_nation`` prospects for every nation in ``nation_codes`` in the background.
+
+    ``prospect_kwargs`` go to ``generate_weekly_prospects`` (season_id, week_number,
+    youth_facilities_level, is_goalkeeper, potential_range, uniform_potential). ``store``
+    receives the generated prospect dicts once and returns how many were saved.
+    Returns the job summary.
+    """
+    job = ProspectJob(
+        id=str(uuid4()),
+        club_id=str(club_id),
+        game_mode_id=str(game_mode_id),
+        nations_total=len(nation_codes),
+    )
+    params = dict(prospect_kwargs, club_id=club_id, game_mode_id=game_mode_id, per_nation=per_nation)
+    with _JOBS_LOCK:
+        _prune_jobs()
+        _JOBS[job.id] = job
+    threading.Thread(
+        target=_run_job,
+        args=(job, params, list(nation_codes), name_index, store),
+        name=f"prospect-job-{job.id}",
+        daemon=True,
+    ).start()
+    return job.summary()
+
+
+def cancel_prospect_job(job_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Ask a job to stop; it ends as ``cancelled`` without storing anything, unless its intake
+    was already being stored (then it still completes). Returns the job summary.
+    """
+    job = _JOBS.get(str(job_id))
+    if job is None:
+        return None
+    job.cancel_requested.set()
+    return job.summary()
+
+
+def get_prospect_job(job_id: str) -> Optional[Dict[str, Any]]:
+    job = _JOBS.get(str(job_id))
+    return job.summary() if job else None
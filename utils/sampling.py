@@ -0,0 +1,96 @@
+"""
+Weighted sampling helpers shared by name generation.
+
+``AliasTable`` is Vose's alias method: O(n) build, O(1) per draw using a single
+``random.random()`` call, so it stays seed-compatible with the rest of the code that uses the
+stdlib ``random`` module.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Generic, List, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class AliasTable:
+    """Immutable alias table over indices ``0..n-1`` built from non-negative weights."""
+
+    __slots__ = ("_n", "_prob", "_alias")
+
+    def __init__(self, weights: Sequence[float]):
+        n = len(weights)
+        if n == 0:
+            raise ValueError("AliasTable needs at least one weight")
+        clean = [max(0.0, float(w)) for w in weights]
+        total = sum(clean)
+        if total <= 0.0:
+            # Same behaviour as random.choices with all-zero weights is an error; treat as uniform.
+            clean = [1.0] * n
+            total = float(n)
+
+        scaled = [w * n / total for w in clean]
+        prob = [0.0] * n
+        alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            prob[s] = scaled[s]
+            alias[s] = l
+            scaled[l] = (scaled[l] + scaled[s]) - 1.0
+            (small if scaled[l] < 1.0 else large).append(l)
+        # Leftovers are 1.0 up to rounding.
+        for i in large:
+            prob[i] = 1.0
+        for i in small:
+            prob[i] = 1.0
+
+        self._n = n
+        self._prob: Tuple[float, ...] = tuple(prob)
+        self._alias: Tuple[int, ...] = tuple(alias)
+
+    def __len__(self) -> int:
+        return self._n
+
+    def sample_index(self) -> int:
+        u = random.random() * self._n
+        i = int(u)
+        if i >= self._n:
+            i = self._n - 1
+        return i if (u - i) < self._prob[i] else self._alias[i]
+
+    def sample_indices(self, k: int) -> List[int]:
+        n = self._n
+        prob = self._prob
+        alias = self._alias
+        rnd = random.random
+        out: List[int] = []
+        for _ in range(k):
+            u = rnd() * n
+            i = int(u)
+            if i >= n:
+                i = n - 1
+            out.append(i if (u - i) < prob[i] else alias[i])
+        return out
+
+
+class WeightedChoice(Generic[T]):
+    """Frozen ``items`` + alias table; ``draw``/``draw_many`` replace ``random.choices``."""
+
+    __slots__ = ("items", "table")
+
+    def __init__(self, items: Sequence[T], weights: Sequence[float]):
+        if len(items) != len(weights):
+            raise ValueError("items and weights must have the same length")
+        self.items: Tuple[T, ...] = tuple(items)
+        self.table = AliasTable(weights)
+
+    def draw(self) -> T:
+        return self.items[self.table.sample_index()]
+
+    def draw_many(self, k: int) -> List[T]:
+        items = self.items
+        return [items[i] for i in self.table.sample_indices(k)]
@@ -0,0 +1,512 @@
+"""
+Season-rollover training job: apply a week or a season of training to every player of a
+game mode, directly in Postgres.
+
+Players are streamed in ``players.id`` order from a server-side cursor on a dedicated
+read connection, ``chunk_size`` rows at a time. Each chunk is trained with the vectorized
+engine (utils/training_engine.py, same rules as ``player_development.train_player_week``)
+using the training facilities of the player's club, then written back (attributes,
+train_carry, age columns) with one ``UPDATE players ... FROM (VALUES ...)`` per chunk.
+``Player.train_carry`` keeps the fractional DP between runs, so a weekly run is an
+O(players) incremental step rather than a replay from 16y1.
+
+The chunk's updates and the run's resume point (``TrainingRun.last_player_id``) commit
+together, so a failed or interrupted run can be resumed with ``resume_run_id`` without
+training any player twice. A game mode has at most one active (pending / running) run: a
+partial unique index refuses a second one, and starting or resuming a run is an atomic
+claim. Running runs refresh ``heartbeat_at``; one silent for ``STALE_AFTER`` (its process
+died) counts as interrupted and can be resumed. The training kwargs (programme mix) are
+stored on the run, so a resume trains with the same mix.
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from match_engine.constants import GOALKEEPER_ATTRS, OUTFIELD_ATTRS
+
+from .player_development import compact_train_carry, compile_growth_schedule, load_train_carry
+from .training_engine import train_weeks_vectorized
+
+DEFAULT_CHUNK_SIZE = 5000
+DEFAULT_FACILITIES_LEVEL = 5  # Club.training_facilities_level default (players without a contract)
+
+ACTIVE_STATUSES = ("pending", "running")
+HEARTBEAT_INTERVAL = 30.0
+STALE_AFTER = timedelta(minutes=3)
+
+
+class TrainingRunConflict(RuntimeError):
+    """The game mode already has an active training run, or the run is being processed."""
+
+
+def _player_rows_query(game_mode_id: UUID, after_id: Optional[UUID]):
+    """Training inputs per player plus the training facilities of the latest contract's club."""
+    from sqlalchemy import select
+    from models import Club, Contract, Player
+
+    facilities = (
+        select(Club.training_facilities_level)
+        .join(Contract, Contract.club_id == Club.id)
+        .where(Contract.player_id == Player.id)
+        .order_by(Contract.end_date.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    q = select(
+        Player.id,
+        Player.is_goalkeeper,
+        Player.potential,
+        Player.base_training_pct,
+        Player.growth_training_pct,
+        Player.growth_shape,
+        Player.growth_peak_age,
+        Player.attributes,
+        Player.train_carry,
+        Player.training_age_weeks,
+        Player.actual_age_months,
+        facilities.label("training_facilities_level"),
+    ).where(
+        Player.game_mode_id == game_mode_id,
+        Player.potential.isnot(None),
+        Player.base_training_pct.isnot(None),
+        Player.growth_training_pct.isnot(None),
+    )
+    if after_id is not None:
+        q = q.where(Player.id > after_id)
+    return q.order_by(Player.id)
+
+
+def _train_chunk(
+    rows: List[Any],
+    *,
+    weeks: int,
+    offseason: bool,
+    training_kwargs: Dict[str, Any],
+) -> List[SimpleNamespace]:
+    training_kwargs = dict(training_kwargs)
+    # Goalkeepers train on their own programme names (GK_PROGRAMS); runs stored without them
+    # keep the shared names, which a keeper only matches for "Balanced"
+    gk_programs = {
+        key: training_kwargs.pop(f"gk_{key}")
+        for key in ("primary_program", "secondary_program")
+        if f"gk_{key}" in training_kwargs
+    }
+    if gk_programs:
+        overrides = dict(training_kwargs.get("program_overrides") or {})
+        for r in rows:
+            if r.is_goalkeeper:
+                overrides[str(r.id)] = {**gk_programs, **overrides.get(str(r.id), {})}
+        training_kwargs["program_overrides"] = overrides
+    players = [
+        SimpleNamespace(
+            id=r.id,
+            is_goalkeeper=bool(r.is_goalkeeper),
+            potential=r.potential,
+            base_training_pct=r.base_training_pct,
+            growth_training_pct=r.growth_training_pct,
+            attributes=dict(r.attributes) if r.attributes else None,
+            training_age_weeks=r.training_age_weeks or 0,
+            actual_age_months=r.actual_age_months or 0,
+        )
+        for r in rows
+    ]
+    growth_caches = {
+        str(r.id): compile_growth_schedule(r.growth_shape or 2.0, r.growth_peak_age or 4.0)
+        for r in rows
+    }
+    facilities = {
+        str(r.id): (
+            r.training_facilities_level
+            if r.training_facilities_level is not None
+            else DEFAULT_FACILITIES_LEVEL
+        )
+        for r in rows
+    }
+    # Fractional DP persisted from earlier runs, so chunked weekly runs lose nothing
+    train_carries: Dict[str, Dict[str, float]] = {
+        str(r.id): load_train_carry(r.train_carry, GOALKEEPER_ATTRS if r.is_goalkeeper else OUTFIELD_ATTRS)
+        for r in rows
+    }
+    if weeks > 0:
+        train_weeks_vectorized(
+            players,
+            growth_caches,
+            train_carries,
+            weeks=weeks,
+            training_facilities_level=facilities,
+            **training_kwargs,
+        )
+    for p in players:
+        if offseason:
+            p.actual_age_months += 2
+        p.train_carry = compact_train_carry(train_carries[str(p.id)])
+    return players
+
+
+def _write_chunk(db, players: List[SimpleNamespace]) -> None:
+    """One UPDATE players ... FROM (VALUES ...) for the whole chunk."""
+    from sqlalchemy import Integer, column, update, values
+    from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
+    from models import Player
+
+    v = values(
+        column("id", PGUUID(as_uuid=True)),
+        column("attributes", JSONB),
+        column("train_carry", JSONB),
+        column("training_age_weeks", Integer),
+        column("actual_age_months", Integer),
+        name="v",
+    ).data([
+        (p.id, p.attributes, p.train_carry, p.training_age_weeks, p.actual_age_months) for p in players
+    ])
+    db.execute(
+        update(Player.__table__)
+        .where(Player.__table__.c.id == v.c.id)
+        .values(
+            attributes=v.c.attributes,
+            train_carry=v.c.train_carry,
+            training_age_weeks=v.c.training_age_weeks,
+            actual_age_months=v.c.actual_age_months,
+        )
+    )
+
+
+def _heartbeat(run_id: UUID, done: threading.Event) -> None:
+    from database import SessionLocal
+    from models import TrainingRun
+
+    while not done.wait(HEARTBEAT_INTERVAL):
+        db = SessionLocal()
+        try:
+            db.query(TrainingRun).filter(TrainingRun.id == run_id).update(
+                {"heartbeat_at": datetime.utcnow()}, synchronize_session=False
+            )
+            db.commit()
+        except Exception:
+            logging.exception("training run %s heartbeat failed", run_id)
+        finally:
+            db.close()
+
+
+def _silent_since(cutoff: datetime):
+    from sqlalchemy import or_
+    from models import TrainingRun
+
+    return or_(TrainingRun.heartbeat_at.is_(None), TrainingRun.heartbeat_at < cutoff)
+
+
+def _claim_run(db, run_id: UUID) -> Optional[Any]:
+    """
+    Mark run ``run_id`` running for this process. Returns the run, None if it is completed;
+    raises ValueError if it does not exist and TrainingRunConflict if it (or another run of
+    its game mode) is being processed.
+    """
+    from sqlalchemy import and_, or_, update
+    from sqlalchemy.exc import IntegrityError
+    from models import TrainingRun
+
+    run = db.get(TrainingRun, run_id)
+    if run is None:
+        raise ValueError(f"Training run not found: {run_id}")
+    if run.status == "completed":
+        return None
+    now = datetime.utcnow()
+    claimable = or_(
+        TrainingRun.status.in_(("pending", "failed")),
+        # Interrupted: the process died without recording failure
+        and_(TrainingRun.status == "running", _silent_since(now - STALE_AFTER)),
+    )
+    try:
+        claimed = db.execute(
+            update(TrainingRun)
+            .where(TrainingRun.id == run_id, claimable)
+            .values(status="running", error=None, heartbeat_at=now)
+        ).rowcount
+        db.commit()
+    except IntegrityError:
+        # ux_training_runs_active_game_mode: another run of the game mode is active
+        db.rollback()
+        raise TrainingRunConflict(f"Another training run of game mode {run.game_mode_id} is active")
+    if not claimed:
+        db.rollback()
+        raise TrainingRunConflict(f"Training run {run_id} is already running")
+    db.refresh(run)
+    return run
+
+
+def _create_run(
+    db,
+    game_mode_id: UUID,
+    *,
+    weeks: int,
+    offseason: bool,
+    chunk_size: int,
+    training_kwargs: Dict[str, Any],
+    status: str,
+) -> Any:
+    """Insert a run; raises TrainingRunConflict while another run of the game mode is active."""
+    from sqlalchemy import update
+    from sqlalchemy.exc import IntegrityError
+    from models import TrainingRun
+
+    now = datetime.utcnow()
+    # Interrupted runs stop blocking the game mode; they stay resumable
+    db.execute(
+        update(TrainingRun)
+        .where(
+            TrainingRun.game_mode_id == game_mode_id,
+            TrainingRun.status.in_(ACTIVE_STATUSES),
+            _silent_since(now - STALE_AFTER),
+        )
+        .values(status="failed", error="Interrupted (no heartbeat); resume with resume_run_id")
+    )
+    run = TrainingRun(
+        game_mode_id=game_mode_id,
+        weeks=int(weeks),
+        offseason=bool(offseason),
+        chunk_size=max(1, int(chunk_size)),
+        training_kwargs=dict(training_kwargs),
+        status=status,
+        heartbeat_at=now,
+    )
+    db.add(run)
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise TrainingRunConflict(f"Another training run of game mode {game_mode_id} is active")
+    return run
+
+
+def _start_run(
+    game_mode_id: Optional[UUID],
+    *,
+    weeks: int,
+    offseason: bool,
+    chunk_size: int,
+    resume_run_id: Optional[UUID],
+    training_kwargs: Dict[str, Any],
+) -> Tuple[UUID, bool]:
+    """Claim ``resume_run_id`` or create a new running run: (run id, whether there is work left)."""
+    from database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        if resume_run_id is not None:
+            run = _claim_run(db, resume_run_id)
+            return resume_run_id, run is not None
+        run = _create_run(
+            db,
+            game_mode_id,
+            weeks=weeks,
+            offseason=offseason,
+            chunk_size=chunk_size,
+            training_kwargs=training_kwargs,
+            status="running",
+        )
+        return run.id, True
+    finally:
+        db.close()
+
+
+def _process_run(run_id: UUID, progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+    """Train the remaining players of a claimed run and record the outcome on its row."""
+    from sqlalchemy import func, select
+    from database import SessionLocal, engine
+    from models import Player, TrainingRun
+
+    db = SessionLocal()
+    done = threading.Event()
+    threading.Thread(target=_heartbeat, args=(run_id, done), name=f"training-heartbeat-{run_id}", daemon=True).start()
+    try:
+        run = db.get(TrainingRun, run_id)
+        training_kwargs = dict(run.training_kwargs or {})
+        if run.players_total is None:
+            run.players_total = db.execute(
+                select(func.count()).select_from(Player).where(
+                    Player.game_mode_id == run.game_mode_id,
+                    Player.potential.isnot(None),
+                    Player.base_training_pct.isnot(None),
+                    Player.growth_training_pct.isnot(None),
+                )
+            ).scalar_one()
+            db.commit()
+
+        started = time.perf_counter()
+        done_this_call = 0
+        try:
+            # Separate read-only connection keeps the server-side cursor open across the
+            # per-chunk commits made on ``db``.
+            with engine.connect() as read_conn:
+                result = read_conn.execution_options(
+                    stream_results=True, yield_per=run.chunk_size
+                ).execute(_player_rows_query(run.game_mode_id, run.last_player_id))
+                for rows in result.partitions(run.chunk_size):
+                    players = _train_chunk(
+                        rows, weeks=run.weeks, offseason=run.offseason, training_kwargs=training_kwargs
+                    )
+                    _write_chunk(db, players)
+                    done_this_call += len(players)
+                    elapsed = time.perf_counter() - started
+                    run.last_player_id = rows[-1].id
+                    run.players_processed = (run.players_processed or 0) + len(players)
+                    run.players_per_sec = round(done_this_call / elapsed, 1) if elapsed > 0 else None
+                    run.heartbeat_at = datetime.utcnow()
+                    db.commit()
+                    logging.info(
+                        "training run %s: %s/%s players (%.0f players/sec)",
+                        run.id, run.players_processed, run.players_total, run.players_per_sec or 0.0,
+                    )
+                    if progress is not None:
+                        progress(training_run_summary(run))
+        except Exception as e:
+            db.rollback()
+            run.status = "failed"
+            run.error = str(e)
+            db.commit()
+            raise
+
+        run.status = "completed"
+        run.finished_at = datetime.utcnow()
+        db.commit()
+        return training_run_summary(run)
+    finally:
+        done.set()
+        db.close()
+
+
+def run_training_rollover(
+    game_mode_id: Optional[UUID],
+    *,
+    weeks: int = 10,
+    offseason: bool = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    resume_run_id: Optional[UUID] = None,
+    progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    **training_kwargs: Any,
+) -> Dict[str, Any]:
+    """
+    Train every player of ``game_mode_id`` for ``weeks`` weeks (+ off-season when ``offseason``).
+
+    ``training_kwargs`` go to ``train_weeks_vectorized`` (programme mix, total_weeks, ...) and
+    are stored on the run; ``gk_primary_program`` / ``gk_secondary_program`` replace the
+    programme names for goalkeepers. ``resume_run_id`` continues a pending, failed or interrupted run
+    after its last committed chunk, with its stored weeks / offseason / chunk_size / training
+    kwargs. ``progress`` is called after each chunk with the run summary. Returns the final
+    run summary. Raises TrainingRunConflict while another run of the game mode is active.
+    """
+    from database import engine
+
+    if engine is None:
+        raise RuntimeError("Season rollover needs a database (DATABASE_URL is not set)")
+
+    run_id, pending = _start_run(
+        game_mode_id,
+        weeks=weeks,
+        offseason=offseason,
+        chunk_size=chunk_size,
+        resume_run_id=resume_run_id,
+        training_kwargs=training_kwargs,
+    )
+    if not pending:
+        return get_training_run(run_id)
+    return _process_run(run_id, progress)
+
+
+def training_run_summary(run) -> Dict[str, Any]:
+    return {
+        "id": str(run.id),
+        "game_mode_id": str(run.game_mode_id),
+        "status": run.status,
+        "weeks": run.weeks,
+        "offseason": run.offseason,
+        "players_total": run.players_total,
+        "players_processed": run.players_processed,
+        "players_per_sec": run.players_per_sec,
+        "last_player_id": str(run.last_player_id) if run.last_player_id else None,
+        "error": run.error,
+        "finished_at": run.finished_at.isoformat() if run.finished_at else None,
+    }
+
+
+def create_training_run(
+    game_mode_id: UUID,
+    *,
+    weeks: int = 10,
+    offseason: bool = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **training_kwargs: Any,
+) -> UUID:
+    """
+    Insert a pending training run (picked up with ``run_training_rollover(resume_run_id=...)``).
+    Raises TrainingRunConflict while another run of the game mode is active.
+    """
+    from database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        run = _create_run(
+            db,
+            game_mode_id,
+            weeks=weeks,
+            offseason=offseason,
+            chunk_size=chunk_size,
+            training_kwargs=training_kwargs,
+            status="pending",
+        )
+        return run.id
+    finally:
+        db.close()
+
+
+def get_training_run(run_id: UUID) -> Optional[Dict[str, Any]]:
+    from database import SessionLocal
+    from models import TrainingRun
+
+    db = SessionLocal()
+    try:
+        run = db.get(TrainingRun, run_id)
+        return training_run_summary(run) if run else None
+    finally:
+        db.close()
+
+
+def start_training_rollover_in_background(
+    game_mode_id: Optional[UUID],
+    *,
+    weeks: int = 10,
+    offseason: bool = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    resume_run_id: Optional[UUID] = None,
+    **training_kwargs: Any,
+) -> UUID:
+    """
+    Create (or claim, with ``resume_run_id``) a training run and process it on a daemon
+    thread. Returns the run id; poll ``get_training_run`` for progress. Conflicts raise
+    TrainingRunConflict here, before the thread starts.
+    """
+    run_id, pending = _start_run(
+        game_mode_id,
+        weeks=weeks,
+        offseason=offseason,
+        chunk_size=chunk_size,
+        resume_run_id=resume_run_id,
+        training_kwargs=training_kwargs,
+    )
+    if not pending:
+        return run_id
+
+    def _run() -> None:
+        try:
+            _process_run(run_id)
+        except Exception:
+            # Failure is recorded on the training run row.
+            logging.exception("training run %s failed", run_id)
+
+    threading.Thread(target=_run, name=f"training-rollover-{run_id}", daemon=True).start()
+    return run_id
@@ -0,0 +1,270 @@
+"""
+Vectorized training engine: advance many players one training week at a time as
+(players x attributes) NumPy matrices.
+
+Same rules as ``player_development.train_player_week``:
+  - weekly DP = base pool / total_weeks + growth pool * growth schedule[training week],
+    times the training-facility multiplier (no DP once training_age_weeks >= total_weeks)
+  - DP is spent in random chunks (chunk_min..chunk_max); each chunk goes to an attribute drawn
+    from the player's programme mix with capped (20) attributes masked out
+  - efficiency bands on the chosen attribute: 1-5 double with p=0.5, 6-15 full,
+    16-17 full with p=0.5, 18-19 full with p=0.33
+  - assigned DP accumulates in the per-attribute carry and converts to +1s every
+    DP_PER_ATTR_POINT, never above 20
+
+Players are split by attribute set (outfield / goalkeeper). Each chunk round advances every
+player that still has budget, so a week costs about (max chunks per player) array operations
+instead of one Python loop iteration per chunk per player.
+"""
+
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+
+from match_engine.constants import GOALKEEPER_ATTRS, OUTFIELD_ATTRS
+
+from .player_development import (
+    compiled_program_mix,
+    tick_offseason,
+    training_facility_multiplier,
+)
+
+_MAX_ROUNDS_PER_WEEK = 4000
+
+
+class _TrainingGroup:
+    """Matrix state for players sharing one attribute list (written back by ``flush``)."""
+
+    def __init__(
+        self,
+        players: List,
+        attrs_list: List[str],
+        weights: np.ndarray,
+        growth: np.ndarray,
+        facility_mult: np.ndarray,
+        train_carries: Dict[str, Dict[str, float]],
+    ):
+        self.players = players
+        self.ids = [str(p.id) for p in players]
+        self.attrs_list = attrs_list
+        n = len(players)
+
+        self.attrs = np.empty((n, len(attrs_list)), dtype=np.int16)
+        self.carry = np.zeros((n, len(attrs_list)), dtype=np.float64)
+        for i, (p, pid) in enumerate(zip(players, self.ids)):
+            if p.attributes is None:
+                p.attributes = {a: 1 for a in attrs_list}
+            src = p.attributes
+            self.attrs[i] = [src.get(a, 0) for a in attrs_list]
+            carry = train_carries.get(pid)
+            if carry:
+                self.carry[i] = [float(carry.get(a, 0.0)) for a in attrs_list]
+
+        self.weights = weights
+        self.growth = growth
+        self.facility_mult = facility_mult
+        self.potential = np.array([float(p.potential) for p in players])
+        self.base_pct = np.array([float(p.base_training_pct) for p in players])
+        self.growth_pct = np.array([float(p.growth_training_pct) for p in players])
+        self.training_weeks = np.array([int(p.training_age_weeks or 0) for p in players], dtype=np.int64)
+        self.age_months = np.array([int(p.actual_age_months or 0) for p in players], dtype=np.int64)
+
+    def week_dp(self, total_weeks: int) -> np.ndarray:
+        """Facility-adjusted DP budget for the current training week of every player."""
+        in_window = self.training_weeks < total_weeks
+        idx = np.clip(self.training_weeks, 0, self.growth.shape[1] - 1)
+        growth_w = self.growth[np.arange(len(idx)), idx]
+        base = np.where(in_window, self.potential * self.base_pct / total_weeks, 0.0)
+        growth = np.where(in_window, self.potential * self.growth_pct * growth_w, 0.0)
+        return (base + growth) * self.facility_mult
+
+    def train_week(
+        self,
+        total_weeks: int,
+        dp_per_point: float,
+        chunk_min: float,
+        chunk_max: float,
+        rng,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Spend one week of DP for every player; returns (nominal_used, assigned_dp) arrays."""
+        n = len(self.ids)
+        budget = self.week_dp(total_weeks)
+        nominal = np.zeros(n)
+        assigned = np.zeros(n)
+        active = np.flatnonzero(budget >= chunk_min - 1e-9)
+
+        rounds = 0
+        while active.size and rounds < _MAX_ROUNDS_PER_WEEK:
+            rounds += 1
+            vals = self.attrs[active]
+            open_ = vals < 20
+            has_open = open_.any(axis=1)
+            if not has_open.all():
+                # Every attribute capped: nothing left to train this week
+                active = active[has_open]
+                vals, open_ = vals[has_open], open_[has_open]
+                if not active.size:
+                    break
+            m = active.size
+
+            chunk = np.minimum(budget[active] - nominal[active], rng.uniform(chunk_min, chunk_max, size=m))
+
+            # Weighted pick over uncapped attributes (uniform over them if all weights are 0)
+            w = np.where(open_, self.weights[active], 0.0)
+            zero = w.sum(axis=1) <= 0
+            if zero.any():
+                w[zero] = open_[zero]
+            cum = np.cumsum(w, axis=1)
+            r = rng.random(m) * cum[:, -1]
+            pick = np.minimum((cum < r[:, None]).sum(axis=1), len(self.attrs_list) - 1)
+
+            val = vals[np.arange(m), pick]
+            roll = rng.random(m)
+            got = np.where(
+                val <= 5,
+                chunk * np.where(roll < 0.5, 2.0, 1.0),
+                np.where(
+                    val <= 15,
+                    chunk,
+                    np.where(val <= 17, np.where(roll < 0.5, chunk, 0.0), np.where(roll < 0.33, chunk, 0.0)),
+                ),
+            )
+            nominal[active] += chunk
+            assigned[active] += got
+
+            # Carry -> +1s for the attribute that just received DP, capped at 20
+            c = self.carry[active, pick] + got
+            points = np.minimum(np.floor(c / dp_per_point), 20 - val).clip(min=0)
+            self.attrs[active, pick] = val + points.astype(np.int16)
+            self.carry[active, pick] = c - points * dp_per_point
+
+            active = active[budget[active] - nominal[active] >= chunk_min - 1e-9]
+
+        self.training_weeks += 1
+        self.age_months += 1
+        return nominal, assigned
+
+    def flush(self, train_carries: Dict[str, Dict[str, float]]) -> None:
+        """Write attributes, ages and carries back to the player objects / carry dicts."""
+        attrs = self.attrs.tolist()
+        carry = self.carry.tolist()
+        weeks = self.training_weeks.tolist()
+        ages = self.age_months.tolist()
+        for i, (p, pid) in enumerate(zip(self.players, self.ids)):
+            updated = dict(p.attributes or {})
+            updated.update(zip(self.attrs_list, attrs[i]))
+            p.attributes = updated  # new dict so JSONB changes are detected
+            p.training_age_weeks = weeks[i]
+            p.actual_age_months = ages[i]
+            train_carries[pid] = dict(zip(self.attrs_list, carry[i]))
+
+
+def _growth_matrix(ids: List[str], growth_caches: Mapping[str, List[float]], total_weeks: int) -> np.ndarray:
+    out = np.zeros((len(ids), total_weeks))
+    for i, pid in enumerate(ids):
+        sched = growth_caches[pid]
+        k = min(total_weeks, len(sched))
+        out[i, :k] = sched[:k]
+    return out
+
+
+def train_weeks_vectorized(
+    players: List,
+    growth_caches: Mapping[str, List[float]],
+    train_carries: Dict[str, Dict[str, float]],
+    *,
+    weeks: int,
+    training_facilities_level: Union[int, Mapping[str, int]] = 10,
+    primary_program: Optional[str] = "Tackling Focus",
+    primary_share: float = 0.4,
+    primary_individual_attr: Optional[str] = None,
+    secondary_program: Optional[str] = "Heading Focus",
+    secondary_share: float = 0.2,
+    secondary_individual_attr: Optional[str] = None,
+    general_share: float = 0.4,
+    total_weeks: int = 160,
+    DP_PER_ATTR_POINT: float = 10.0,
+    chunk_min: float = 0.1,
+    chunk_max: float = 0.5,
+    program_overrides: Optional[Dict[str, Dict[str, Any]]] = None,
+    rng=None,
+) -> Dict[str, Tuple[float, float]]:
+    """
+    Train ``players`` for ``weeks`` in-season weeks (no off-season tick).
+
+    Args mirror ``train_one_season_with_growth``; ``training_facilities_level`` may also be a
+    map player_id -> level when players from several clubs are trained together.
+    ``train_carries`` is read and updated in place. Returns player_id -> (nominal, assigned).
+    """
+    rng = np.random if rng is None else rng
+    overrides = program_overrides or {}
+    totals: Dict[str, Tuple[float, float]] = {}
+
+    for is_gk, attrs_list in ((False, OUTFIELD_ATTRS), (True, GOALKEEPER_ATTRS)):
+        group_players = [p for p in players if bool(p.is_goalkeeper) == is_gk]
+        if not group_players:
+            continue
+        ids = [str(p.id) for p in group_players]
+
+        # One weight row per player from the compiled (memoized) programme mix
+        rows = []
+        for pid in ids:
+            ov = overrides.get(pid) or {}
+            mix = compiled_program_mix(
+                attrs_list,
+                is_gk,
+                primary_name=ov.get("primary_program", primary_program),
+                primary_share=float(ov.get("primary_share", primary_share)),
+                primary_individual_attr=ov.get("primary_individual_attr", primary_individual_attr),
+                secondary_name=ov.get("secondary_program", secondary_program),
+                secondary_share=float(ov.get("secondary_share", secondary_share)),
+                secondary_individual_attr=ov.get("secondary_individual_attr", secondary_individual_attr),
+                general_share=float(ov.get("general_share", general_share)),
+            )
+            rows.append(mix.weights)
+
+        if isinstance(training_facilities_level, Mapping):
+            mult = np.array([
+                training_facility_multiplier(training_facilities_level.get(pid, 10)) for pid in ids
+            ])
+        else:
+            mult = np.full(len(ids), training_facility_multiplier(training_facilities_level))
+
+        group = _TrainingGroup(
+            group_players,
+            attrs_list,
+            np.array(rows, dtype=np.float64),
+            _growth_matrix(ids, growth_caches, total_weeks),
+            mult,
+            train_carries,
+        )
+        nom_total = np.zeros(len(ids))
+        asg_total = np.zeros(len(ids))
+        for _ in range(weeks):
+            nom, asg = group.train_week(total_weeks, DP_PER_ATTR_POINT, chunk_min, chunk_max, rng)
+            # Per-week rounding as in train_player_week
+            nom_total += np.round(nom, 3)
+            asg_total += np.round(asg, 3)
+        group.flush(train_carries)
+        for pid, n, a in zip(ids, nom_total.tolist(), asg_total.tolist()):
+            totals[pid] = (n, a)
+
+    return totals
+
+
+def train_one_season_vectorized(
+    players: List,
+    growth_caches: Mapping[str, List[float]],
+    train_carries: Dict[str, Dict[str, float]],
+    *,
+    season_weeks: int = 10,
+    **kwargs: Any,
+) -> Dict[str, Tuple[float, float]]:
+    """
+    Drop-in for ``train_one_season_with_growth``: ``season_weeks`` vectorized weeks, then the
+    off-season tick. Returns player_id -> (nominal, assigned) rounded to 1 dp.
+    """
+    totals = train_weeks_vectorized(players, growth_caches, train_carries, weeks=season_weeks, **kwargs)
+    for player in players:
+        tick_offseason(player)
+    return {pid: (round(n, 1), round(a, 1)) for pid, (n, a) in totals.items()}
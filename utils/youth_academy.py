@@ -6,50 +6,66 @@ import random
 import os
 import re
 import difflib
+import logging
+import threading
+import time
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from itertools import accumulate
+from typing import Dict, Iterable, List, Optional, Tuple
 from uuid import UUID
 
+import numpy as np
+
+from utils.gfx_catalog import (
+    GFX_ROOT,
+    GfxCatalog,
+    build_gfx_catalog,
+    get_gfx_catalog,
+    is_profile_image,
+)
 from utils.player_generation import (
-    create_player_data,
+    create_players_batch,
     sample_potential,
     OUTFIELD_ATTRS,
     GOALKEEPER_ATTRS
 )
 
 
-# ── gfx folder mapping (built once, cached) ─────────────────────────────────
+# ── gfx folder mapping (derived from the gfx catalog) ───────────────────────
 # Maps clean heritage picture_folder names (e.g. "AfricaWest") → actual gfx
 # directory names which may carry numbered prefixes (e.g. "10. AfricaWest").
-_GFX_FOLDER_MAP: Optional[Dict[str, str]] = None
+_GFX_FOLDER_MAP: Optional[Tuple[GfxCatalog, Dict[str, str]]] = None
+
+
+def _catalog_for(gfx_root: Optional[str] = None) -> GfxCatalog:
+    """Shared catalog for the app's gfx/ (a one-off scan for any other root)."""
+    if gfx_root is None or os.path.abspath(gfx_root) == os.path.abspath(GFX_ROOT):
+        return get_gfx_catalog()
+    return build_gfx_catalog(gfx_root)
 
 
 def _build_gfx_folder_map() -> Dict[str, str]:
     """
-    Scan the gfx/ directory and build a mapping from clean folder names to
-    actual directory names.  Handles numbered prefixes like '10. AfricaWest'.
+    Mapping from clean top-level gfx folder names to actual directory names.
+    Handles numbered prefixes like '10. AfricaWest'. Rebuilt when the catalog changes.
     """
     global _GFX_FOLDER_MAP
-    if _GFX_FOLDER_MAP is not None:
-        return _GFX_FOLDER_MAP
-
-    _GFX_FOLDER_MAP = {}
-    gfx_root = os.path.join(os.path.dirname(os.path.dirname(__file__)), "gfx")
-
-    if not os.path.isdir(gfx_root):
-        return _GFX_FOLDER_MAP
-
-    for entry in os.listdir(gfx_root):
-        full_path = os.path.join(gfx_root, entry)
-        if not os.path.isdir(full_path):
-            continue
+    catalog = get_gfx_catalog()
+    cached = _GFX_FOLDER_MAP
+    if cached is not None and cached[0] is catalog:
+        return cached[1]
 
+    folder_map: Dict[str, str] = {}
+    for entry in catalog.folder_subfolders(""):
         # Strip optional leading "N. " or "NN. " prefix to get the clean name
         clean = re.sub(r"^\d+\.\s*", "", entry)
-        _GFX_FOLDER_MAP[clean] = entry          # "AfricaWest" → "10. AfricaWest"
-        _GFX_FOLDER_MAP[entry] = entry           # also allow exact match
+        folder_map[clean] = entry          # "AfricaWest" → "10. AfricaWest"
+        folder_map[entry] = entry           # also allow exact match
 
-    return _GFX_FOLDER_MAP
+    _GFX_FOLDER_MAP = (catalog, folder_map)
+    return folder_map
 
 
 def _true_player_profile_pics_rel(gfx_root: str, rel: str) -> Optional[str]:
@@ -58,26 +74,21 @@ def _true_player_profile_pics_rel(gfx_root: str, rel: str) -> Optional[str]:
     name under ``gfx/`` (supports ``N. `` prefixes on the bucket folder, same
     as top-level gfx folders).
     """
+    catalog = _catalog_for(gfx_root)
     rel = rel.replace("\\", "/").strip("/")
     parts = rel.split("/")
     if len(parts) != 2 or parts[0] != "player_profile_pics":
         return None
     bucket = parts[1]
-    ppp = os.path.join(gfx_root, "player_profile_pics")
-    direct = os.path.join(ppp, bucket)
-    if os.path.isdir(direct) and any(
-            _profile_pic_extensions(f) for f in os.listdir(direct)):
+    if catalog.has_images(rel):
         return rel
-    if not os.path.isdir(ppp):
+    if not catalog.has_folder("player_profile_pics"):
         return None
 
     # Build clean-name → actual dir mapping (supports "N. " prefixes)
     entries: List[str] = []
     clean_to_entry: Dict[str, str] = {}
-    for entry in sorted(os.listdir(ppp)):
-        sub = os.path.join(ppp, entry)
-        if not os.path.isdir(sub):
-            continue
+    for entry in catalog.folder_subfolders("player_profile_pics"):
         clean = re.sub(r"^\d+\.\s*", "", entry)
         entries.append(clean)
         # Prefer first occurrence if duplicates exist
@@ -103,25 +114,19 @@ def _true_player_profile_pics_rel(gfx_root: str, rel: str) -> Optional[str]:
     lower_map = {k.lower(): v for k, v in clean_to_entry.items()}
     for cand in bucket_candidates:
         entry = clean_to_entry.get(cand)
-        if entry:
-            sub = os.path.join(ppp, entry)
-            if any(_profile_pic_extensions(f) for f in os.listdir(sub)):
-                return f"player_profile_pics/{entry}"
+        if entry and catalog.has_images(f"player_profile_pics/{entry}"):
+            return f"player_profile_pics/{entry}"
 
         entry = lower_map.get(cand.lower())
-        if entry:
-            sub = os.path.join(ppp, entry)
-            if any(_profile_pic_extensions(f) for f in os.listdir(sub)):
-                return f"player_profile_pics/{entry}"
+        if entry and catalog.has_images(f"player_profile_pics/{entry}"):
+            return f"player_profile_pics/{entry}"
 
     # Fuzzy match (safe): only accept a single strong match
     matches = difflib.get_close_matches(bucket, entries, n=2, cutoff=0.86)
     if len(matches) == 1:
         entry = clean_to_entry.get(matches[0])
-        if entry:
-            sub = os.path.join(ppp, entry)
-            if any(_profile_pic_extensions(f) for f in os.listdir(sub)):
-                return f"player_profile_pics/{entry}"
+        if entry and catalog.has_images(f"player_profile_pics/{entry}"):
+            return f"player_profile_pics/{entry}"
 
     return None
 
@@ -185,103 +190,269 @@ def get_prospect_count(youth_facilities_level: int) -> int:
 
 
 def _profile_pic_extensions(fname: str) -> bool:
-    fl = fname.lower()
-    return fl.endswith(".png") or fl.endswith(".webp")
-
-
-def _apply_afro_hairstyle_roll(
-    base_rel: str,
-    nationality: Optional[str],
-    gfx_root: str,
-) -> str:
-    """If base is an afro-lineage bucket, optionally switch to a specialty hairstyle folder."""
-    from .profile_picture_hairstyles import roll_player_profile_pics_rel
+    return is_profile_image(fname)
 
-    rolled = roll_player_profile_pics_rel(base_rel, nationality)
-    if rolled == base_rel:
-        return base_rel
-    rolled_fp = rolled.replace("\\", "/").strip("/")
-    rp = rolled_fp.split("/")
-    if len(rp) == 2 and rp[0] == "player_profile_pics":
-        mapped = _true_player_profile_pics_rel(gfx_root, rolled_fp)
-        if mapped:
-            rolled_fp = mapped
-    full_path = os.path.join(gfx_root, *rolled_fp.split("/"))
-    if not os.path.isdir(full_path):
-        return base_rel
-    if not any(_profile_pic_extensions(f) for f in os.listdir(full_path)):
-        return base_rel
-    return rolled_fp
 
-
-def get_profile_picture_folder(
-    heritage_group: Optional[str] = None,
-    nationality: Optional[str] = None,
-) -> Optional[str]:
+def _resolve_picture_folder(
+    picture_folder: str,
+    catalog: GfxCatalog,
+    folder_map: Dict[str, str],
+) -> Tuple[Optional[str], bool]:
     """
-    Get the gfx-relative directory for profile pictures for this heritage group.
-
-    Supports:
-    - Legacy single-segment folders (optionally with ``N. `` prefix), resolved via scan.
-    - Composition layout: ``player_profile_pics/<VisualBucket>`` under ``gfx/``.
-    - Afro-lineage buckets: optional ``nationality`` triggers a roll vs global specialty folders
-      (``hairshortloc``, ``hairbigloc``, ``cornrows``, ``HairBigAfro``).
+    Configured heritage ``picture_folder`` → (gfx-relative folder with images, hairstyle roll
+    applies). Slow path (name normalization, fuzzy matching); used to build the table below.
     """
-    from .name_data import HERITAGE_PICTURE_FOLDER_MAP
-
-    folder_map = _build_gfx_folder_map()
-    gfx_root = os.path.join(os.path.dirname(os.path.dirname(__file__)), "gfx")
-
-    clean_name: Optional[str] = None
-    if heritage_group and heritage_group in HERITAGE_PICTURE_FOLDER_MAP:
-        clean_name = HERITAGE_PICTURE_FOLDER_MAP[heritage_group]
-
-    if not clean_name:
-        return None
+    gfx_root = catalog.root
 
     # Explicit path under gfx (e.g. player_profile_pics/Scandinavia)
-    if "/" in clean_name.replace("\\", "/"):
-        rel = clean_name.replace("\\", "/").strip("/")
+    if "/" in picture_folder.replace("\\", "/"):
+        rel = picture_folder.replace("\\", "/").strip("/")
         parts = rel.split("/")
         if len(parts) >= 2 and parts[0] == "player_profile_pics" and len(parts) == 2:
             mapped = _true_player_profile_pics_rel(gfx_root, rel)
             if mapped is None:
-                return None
+                return None, False
             rel = mapped
-        full_path = os.path.join(gfx_root, *rel.split("/"))
-        if not os.path.isdir(full_path):
-            return None
-        if not any(_profile_pic_extensions(f) for f in os.listdir(full_path)):
-            return None
-        rel = _apply_afro_hairstyle_roll(rel, nationality, gfx_root)
-        return rel
+        if not catalog.has_images(rel):
+            return None, False
+        return rel, True
 
-    actual_dir = folder_map.get(clean_name)
+    actual_dir = folder_map.get(picture_folder)
     if not actual_dir:
         # Legacy scheme: some configs use picture_folder like
         # "BritishIsles" (bucket name only) instead of
         # "player_profile_pics/BritishIsles". Handle by mapping under
         # gfx/player_profile_pics/<bucket>.
         legacy_rel = _true_player_profile_pics_rel(
-            gfx_root, f"player_profile_pics/{clean_name}"
+            gfx_root, f"player_profile_pics/{picture_folder}"
         )
         if legacy_rel:
-            legacy_rel = _apply_afro_hairstyle_roll(legacy_rel, nationality, gfx_root)
-            return legacy_rel
-        return None
+            return legacy_rel, True
+        return None, False
+
+    if not catalog.has_images(actual_dir):
+        return None, False
+
+    return actual_dir, False
+
+
+@dataclass(frozen=True)
+class PictureFolderTable:
+    """
+    Every heritage group's profile-picture folder (and every hairstyle roll target) resolved
+    against one gfx catalog snapshot, so picking a picture is dict lookups only.
+    """
+    catalog: GfxCatalog
+    generation: int
+    # heritage group -> configured picture_folder (HERITAGE_PICTURE_FOLDER_MAP snapshot)
+    configured: Dict[str, str]
+    # heritage group -> (resolved folder, hairstyle roll applies)
+    folders: Dict[str, Tuple[str, bool]]
+    # logical hairstyle roll target (player_profile_pics/<name>) -> resolved folder
+    hairstyle_targets: Dict[str, str]
+    # heritage group -> configured picture_folder that did not resolve to a folder with images
+    unmatched: Dict[str, str]
+    unmatched_hairstyles: Tuple[str, ...]
+    build_seconds: float
+
+    def diagnostics(self) -> Dict:
+        remapped = {}
+        for hg, (folder, _roll) in self.folders.items():
+            configured = (self.configured.get(hg) or "").replace("\\", "/").strip("/")
+            if configured and folder != configured and folder != f"player_profile_pics/{configured}":
+                remapped[hg] = {"configured": configured, "folder": folder}
+        return {
+            "name_data_generation": self.generation,
+            "catalog_built_at": self.catalog.built_at,
+            "build_seconds": self.build_seconds,
+            "heritage_groups": len(self.folders) + len(self.unmatched),
+            "resolved": len(self.folders),
+            "folders_in_use": sorted({f for f, _ in self.folders.values()}),
+            "remapped": remapped,
+            "unmatched": dict(sorted(self.unmatched.items())),
+            "hairstyle_targets": dict(sorted(self.hairstyle_targets.items())),
+            "unmatched_hairstyles": list(self.unmatched_hairstyles),
+        }
+
+
+def _build_picture_folder_table(catalog: GfxCatalog) -> PictureFolderTable:
+    from . import name_data
+    from .profile_picture_hairstyles import hairstyle_target_rels
+
+    t0 = time.perf_counter()
+    folder_map = _build_gfx_folder_map()
+    configured = dict(name_data.HERITAGE_PICTURE_FOLDER_MAP)
+    folders: Dict[str, Tuple[str, bool]] = {}
+    unmatched: Dict[str, str] = {}
+    resolved_by_config: Dict[str, Tuple[Optional[str], bool]] = {}
+    for hg, picture_folder in configured.items():
+        if not picture_folder:
+            unmatched[hg] = picture_folder
+            continue
+        if picture_folder not in resolved_by_config:
+            resolved_by_config[picture_folder] = _resolve_picture_folder(picture_folder, catalog, folder_map)
+        folder, roll = resolved_by_config[picture_folder]
+        if folder is None:
+            unmatched[hg] = picture_folder
+        else:
+            folders[hg] = (folder, roll)
+
+    hairstyle_targets: Dict[str, str] = {}
+    unmatched_hairstyles: List[str] = []
+    for rel in hairstyle_target_rels():
+        mapped = _true_player_profile_pics_rel(catalog.root, rel) or rel
+        if catalog.has_images(mapped):
+            hairstyle_targets[rel] = mapped
+        else:
+            unmatched_hairstyles.append(rel)
+
+    if unmatched or unmatched_hairstyles:
+        logging.warning(
+            "profile pictures: %d heritage group(s) and %d hairstyle folder(s) have no gfx folder with images",
+            len(unmatched), len(unmatched_hairstyles),
+        )
+    return PictureFolderTable(
+        catalog=catalog,
+        generation=name_data.COMPOSITION_GENERATION,
+        configured=configured,
+        folders=folders,
+        hairstyle_targets=hairstyle_targets,
+        unmatched=unmatched,
+        unmatched_hairstyles=tuple(unmatched_hairstyles),
+        build_seconds=round(time.perf_counter() - t0, 4),
+    )
+
+
+_PICTURE_FOLDER_TABLE: Optional[PictureFolderTable] = None
+_PICTURE_FOLDER_TABLE_LOCK = threading.Lock()
+
+
+def _drop_picture_folder_table(*_args) -> None:
+    global _PICTURE_FOLDER_TABLE
+    _PICTURE_FOLDER_TABLE = None
+
+
+def get_picture_folder_table() -> PictureFolderTable:
+    """Heritage → picture folder table; rebuilt after a name data reload or gfx catalog change."""
+    global _PICTURE_FOLDER_TABLE
+    catalog = get_gfx_catalog()
+    table = _PICTURE_FOLDER_TABLE
+    if table is not None and table.catalog is catalog:
+        return table
+    with _PICTURE_FOLDER_TABLE_LOCK:
+        table = _PICTURE_FOLDER_TABLE
+        if table is None or table.catalog is not catalog:
+            table = _build_picture_folder_table(catalog)
+            _PICTURE_FOLDER_TABLE = table
+        return table
+
+
+def _register_picture_folder_table_hooks() -> None:
+    from . import name_data
+
+    name_data.register_reload_hook(_drop_picture_folder_table)
 
-    full_path = os.path.join(gfx_root, actual_dir)
-    if not os.path.isdir(full_path):
-        return None
 
-    if not any(_profile_pic_extensions(f) for f in os.listdir(full_path)):
+_register_picture_folder_table_hooks()
+
+
+def get_profile_picture_folder(
+    heritage_group: Optional[str] = None,
+    nationality: Optional[str] = None,
+) -> Optional[str]:
+    """
+    Get the gfx-relative directory for profile pictures for this heritage group.
+
+    Supports:
+    - Legacy single-segment folders (optionally with ``N. `` prefix), resolved via the gfx catalog.
+    - Composition layout: ``player_profile_pics/<VisualBucket>`` under ``gfx/``.
+    - Afro-lineage buckets: optional ``nationality`` triggers a roll vs global specialty folders
+      (``hairshortloc``, ``hairbigloc``, ``cornrows``, ``HairBigAfro``).
+
+    Folders come from the precomputed ``PictureFolderTable`` (no filesystem / fuzzy matching).
+    """
+    if not heritage_group:
+        return None
+    table = get_picture_folder_table()
+    entry = table.folders.get(heritage_group)
+    if entry is None:
         return None
+    folder, roll = entry
+    if not roll or nationality is None:
+        return folder
 
-    return actual_dir
+    from .profile_picture_hairstyles import roll_player_profile_pics_rel
+
+    rolled = roll_player_profile_pics_rel(folder, nationality)
+    if rolled == folder:
+        return folder
+    return table.hairstyle_targets.get(rolled, folder)
 
 
 def _gfx_root() -> str:
-    return os.path.join(os.path.dirname(os.path.dirname(__file__)), "gfx")
+    return GFX_ROOT
+
+
+@dataclass(frozen=True)
+class ProfilePicFileIndex:
+    """
+    Reverse index over ``gfx/player_profile_pics/<bucket>/``: image filename → bucket folder,
+    built from one gfx catalog snapshot. Filenames present in more than one bucket are kept
+    out of ``folder_by_file`` and listed in ``collisions`` (the bucket cannot be inferred).
+    """
+    catalog: GfxCatalog
+    folder_by_file: Dict[str, str]
+    collisions: Dict[str, Tuple[str, ...]]
+    # Stored ``player_profile_pics/<bucket>`` → real folder (memo of _true_player_profile_pics_rel)
+    bucket_rels: Dict[str, Optional[str]]
+
+    def map_bucket_rel(self, rel: str) -> Optional[str]:
+        if rel not in self.bucket_rels:
+            self.bucket_rels[rel] = _true_player_profile_pics_rel(self.catalog.root, rel)
+        return self.bucket_rels[rel]
+
+    def diagnostics(self) -> Dict:
+        return {
+            "catalog_built_at": self.catalog.built_at,
+            "files": len(self.folder_by_file),
+            "collisions": len(self.collisions),
+            "colliding_files": {k: list(v) for k, v in sorted(self.collisions.items())[:100]},
+        }
+
+
+def _build_profile_pic_file_index(catalog: GfxCatalog) -> ProfilePicFileIndex:
+    folder_by_file: Dict[str, str] = {}
+    collisions: Dict[str, Tuple[str, ...]] = {}
+    for filename, folders in catalog.file_folders.items():
+        buckets = tuple(
+            key for key in folders if key.startswith("player_profile_pics/") and key.count("/") == 1
+        )
+        if len(buckets) == 1:
+            folder_by_file[filename] = buckets[0]
+        elif len(buckets) > 1:
+            collisions[filename] = buckets
+    if collisions:
+        logging.info("profile pictures: %d filename(s) exist in more than one bucket", len(collisions))
+    return ProfilePicFileIndex(
+        catalog=catalog,
+        folder_by_file=folder_by_file,
+        collisions=collisions,
+        bucket_rels={},
+    )
+
+
+_PROFILE_PIC_FILE_INDEX: Optional[ProfilePicFileIndex] = None
+
+
+def get_profile_pic_file_index() -> ProfilePicFileIndex:
+    """Filename → bucket index for the current gfx catalog (rebuilt when the catalog changes)."""
+    global _PROFILE_PIC_FILE_INDEX
+    catalog = get_gfx_catalog()
+    index = _PROFILE_PIC_FILE_INDEX
+    if index is None or index.catalog is not catalog:
+        index = _build_profile_pic_file_index(catalog)
+        _PROFILE_PIC_FILE_INDEX = index
+    return index
 
 
 def find_player_profile_pic_folder_rel(
@@ -295,57 +466,63 @@ def find_player_profile_pic_folder_rel(
     """
     if not profile_pic_filename:
         return None
-    root = gfx_root or _gfx_root()
-    ppp = os.path.join(root, "player_profile_pics")
-    if not os.path.isdir(ppp):
-        return None
-    matches: List[str] = []
-    try:
-        for entry in os.listdir(ppp):
-            sub = os.path.join(ppp, entry)
-            if not os.path.isdir(sub):
-                continue
-            fp = os.path.join(sub, profile_pic_filename)
-            if os.path.isfile(fp):
-                matches.append(f"player_profile_pics/{entry}")
-    except OSError:
-        return None
-    if len(matches) == 1:
-        return matches[0]
-    return None
+    if gfx_root is None or _catalog_for(gfx_root) is get_gfx_catalog():
+        return get_profile_pic_file_index().folder_by_file.get(profile_pic_filename)
+    return _build_profile_pic_file_index(_catalog_for(gfx_root)).folder_by_file.get(profile_pic_filename)
 
 
-def resolve_profile_pic_folder_for_display(
+def _folder_for_display(
+    index: ProfilePicFileIndex,
     heritage_group: Optional[str],
     profile_pic_filename: Optional[str],
-    stored_folder: Optional[str] = None,
+    stored_folder: Optional[str],
 ) -> Optional[str]:
-    """
-    Folder path for serving a stored profile image (workbench / API).
-
-    Prefer a stored folder if the file exists there; else locate the file under
-    ``player_profile_pics``; else derive from heritage without a hairstyle re-roll
-    (``nationality=None``) so URLs stay stable when the folder was not persisted.
-    """
     if not profile_pic_filename:
         return None
-    gfx_root = _gfx_root()
     if stored_folder:
         rel = stored_folder.replace("\\", "/").strip("/")
         sp = rel.split("/")
         if len(sp) == 2 and sp[0] == "player_profile_pics":
-            mapped = _true_player_profile_pics_rel(gfx_root, rel)
+            mapped = index.map_bucket_rel(rel)
             if mapped:
                 rel = mapped
-        cand = os.path.join(gfx_root, *rel.split("/"), profile_pic_filename)
-        if os.path.isfile(cand):
+        if index.catalog.has_file(rel, profile_pic_filename):
             return rel
-    found = find_player_profile_pic_folder_rel(profile_pic_filename, gfx_root)
+    found = index.folder_by_file.get(profile_pic_filename)
     if found:
         return found
     return get_profile_picture_folder(heritage_group, nationality=None)
 
 
+def resolve_profile_pic_folder_for_display(
+    heritage_group: Optional[str],
+    profile_pic_filename: Optional[str],
+    stored_folder: Optional[str] = None,
+) -> Optional[str]:
+    """
+    Folder path for serving a stored profile image (workbench / API).
+
+    Prefer a stored folder if the file exists there; else locate the file under
+    ``player_profile_pics``; else derive from heritage without a hairstyle re-roll
+    (``nationality=None``) so URLs stay stable when the folder was not persisted.
+    """
+    return _folder_for_display(
+        get_profile_pic_file_index(), heritage_group, profile_pic_filename, stored_folder
+    )
+
+
+def resolve_profile_pic_folders_for_display(
+    rows: Iterable[Tuple[Optional[str], Optional[str], Optional[str]]],
+) -> List[Optional[str]]:
+    """
+    ``resolve_profile_pic_folder_for_display`` for a list endpoint: one
+    (heritage_group, profile_pic_filename, stored_folder) tuple per row, resolved against a
+    single index snapshot with dict lookups only.
+    """
+    index = get_profile_pic_file_index()
+    return [_folder_for_display(index, hg, fname, stored) for hg, fname, stored in rows]
+
+
 def get_profile_picture(
     heritage_group: Optional[str] = None,
     nationality: Optional[str] = None,
@@ -362,10 +539,7 @@ def get_profile_picture(
     if folder_name is None:
         return None, None
 
-    gfx_root = os.path.join(os.path.dirname(os.path.dirname(__file__)), "gfx")
-    full_path = os.path.join(gfx_root, *folder_name.replace("\\", "/").split("/"))
-
-    img_files = [f for f in os.listdir(full_path) if _profile_pic_extensions(f)]
+    img_files = get_gfx_catalog().folder_images(folder_name)
     if not img_files:
         return None, None
 
@@ -382,6 +556,9 @@ def generate_weekly_prospects(
     nationality: Optional[str] = None,
     heritage_options: Optional[List[str]] = None,
     num_prospects_override: Optional[int] = None,
+    used_names: Optional[set] = None,
+    potential_range: Optional[Tuple[int, int]] = None,
+    uniform_potential: bool = False,
 ) -> List[Dict]:
     """
     Generate prospects for a club this week.
@@ -397,6 +574,9 @@ def generate_weekly_prospects(
         heritage_options: Optional list of heritage country codes to choose from
         num_prospects_override: When set, forces an exact number of prospects instead of
             using the youth-facilities distribution.
+        used_names: Optional set / NameUniquenessIndex of names already taken (updated in place)
+        potential_range: Optional (min, max) potential; sampled from the truncated potential
+            distribution (uniform in range with ``uniform_potential``)
     
     Returns:
         List of prospect dictionaries with all data needed for YouthProspect model
@@ -407,18 +587,21 @@ def generate_weekly_prospects(
         else max(1, int(num_prospects_override))
     )
     prospects = []
-    
-    for _ in range(num_prospects):
-        # Generate full player data (hidden from manager initially)
-        player_data = create_player_data(
-            club_id=str(club_id),
-            youth_facilities=youth_facilities_level,
-            is_goalkeeper=is_goalkeeper,
-            youth_player=False,
-            nationality=nationality,
-            heritage_options=heritage_options
-        )
-        
+
+    # Generate full player data for the whole intake at once (hidden from manager initially)
+    batch = create_players_batch(
+        num_prospects,
+        youth_facilities=youth_facilities_level,
+        is_goalkeeper=is_goalkeeper,
+        youth_player=False,
+        nationality=nationality,
+        heritage_options=heritage_options,
+        potential_range=potential_range,
+        uniform_potential=uniform_potential,
+        used_names=used_names,
+    )
+
+    for player_data in batch.to_dicts():
         # Assign talent rating
         actual_potential = player_data["potential"]
         talent_rating, potential_min, potential_max = assign_talent_rating(
@@ -463,6 +646,150 @@ def generate_weekly_prospects(
     return prospects
 
 
+DEFAULT_REVEAL_WIDTHS: Tuple[float, ...] = (0.4, 0.3, 0.2, 0.1, 0.0)
+
+
+def _final_initial_range(actual_value: int, min_val: int, max_val: int) -> Tuple[int, int]:
+    """Width <= 6 and actual-in-range enforcement applied to every week-0 range."""
+    # Final check: ensure width is at most 6
+    final_width = max_val - min_val
+    if final_width > 6:
+        # Adjust to exactly 6 while keeping actual value in range
+        if actual_value - min_val <= 6:
+            max_val = min(20, min_val + 6)
+        else:
+            min_val = max(1, max_val - 6)
+        # Re-check width after adjustment
+        final_width = max_val - min_val
+        if final_width > 6:
+            # Force to exactly 6, centered on actual if needed
+            if actual_value <= 10:
+                min_val = max(1, actual_value - 3)
+                max_val = min(20, min_val + 6)
+            else:
+                max_val = min(20, actual_value + 3)
+                min_val = max(1, max_val - 6)
+
+    # Ensure actual value is in range (final safety check)
+    if actual_value < min_val:
+        min_val = actual_value
+    if actual_value > max_val:
+        max_val = actual_value
+
+    # Absolute final check: width must be <= 6
+    final_width = max_val - min_val
+    if final_width > 6:
+        # Force width to 6, keeping actual value in range
+        center = (min_val + max_val) / 2
+        if actual_value <= center:
+            min_val = max(1, actual_value)
+            max_val = min(20, min_val + 6)
+        else:
+            max_val = min(20, actual_value)
+            min_val = max(1, max_val - 6)
+    return int(min_val), int(max_val)
+
+
+@lru_cache(maxsize=None)
+def _initial_range_candidates(
+    actual_value: int, max_width: int
+) -> Tuple[Tuple[Tuple[int, int], ...], Tuple[float, ...]]:
+    """
+    Every week-0 (min, max) range an attribute with this value can get, with cumulative
+    weights for ``random.choices``. Only (value, width) matters, so the weighted candidate
+    list is built once per pair instead of once per attribute per player.
+    """
+    # Minimum possible start (ensuring actual is in range)
+    min_start = max(1, actual_value - max_width)
+    # Maximum possible start (ensuring we don't exceed max)
+    max_start = min(actual_value, 20 - max_width)
+
+    if min_start > max_start:
+        # Edge case: can't fit full width, use symmetric range
+        min_val = max(1, actual_value - max_width // 2)
+        max_val = min(20, actual_value + max_width // 2)
+        return (_final_initial_range(actual_value, min_val, max_val),), (1.0,)
+
+    # Bias: Make actual value more likely to be in upper half of range
+    # This makes players seem to improve rather than get worse
+    # Calculate weights: higher weight for ranges where actual is closer to max
+    weights = []
+    positions = []
+    for start in range(min_start, max_start + 1):
+        end = min(20, start + max_width)
+        # Ensure range width doesn't exceed max_width
+        actual_width = end - start
+        if actual_width > max_width:
+            end = start + max_width
+        if end > 20:
+            end = 20
+            start = max(1, end - max_width)
+
+        # Position of actual in this range (0.0 = at min, 1.0 = at max)
+        if end > start:
+            pos = (actual_value - start) / (end - start)
+        else:
+            pos = 0.5
+        positions.append((start, end))
+        # Higher weight for positions > 0.5 (upper half); target average position ~0.7
+        if pos > 0.5:
+            if pos <= 0.7:
+                weight = (pos / 0.7) ** 0.5  # Strong increase to 0.7
+            else:
+                # Taper off gently from 0.7 to 1.0, keeping some weight above 0.7
+                weight = 0.8 - ((pos - 0.7) / 0.3) ** 1.0
+                weight = max(0.3, weight)  # Minimum weight of 0.3
+        else:
+            # Penalize lower positions more
+            weight = (pos ** 1.5)
+        weights.append(weight)
+
+    weighted = sum(weights) > 0
+    if not weighted:
+        # Fallback: uniform over range starts
+        weights = [1.0] * len(positions)
+
+    ranges = []
+    for start, end in positions:
+        if weighted:
+            min_val, max_val = start, end
+            # Ensure width doesn't exceed max_width
+            if max_val - min_val > max_width:
+                max_val = min_val + max_width
+                if max_val > 20:
+                    max_val = 20
+                    min_val = max(1, max_val - max_width)
+        else:
+            min_val = start
+            max_val = min(20, start + max_width)
+            if max_val - min_val > max_width:
+                max_val = min_val + max_width
+
+        # Ensure actual value is within range
+        if actual_value < min_val:
+            min_val = max(1, actual_value)
+        elif actual_value > max_val:
+            max_val = min(20, actual_value)
+
+        # Final enforcement: ensure width doesn't exceed max_width
+        current_width = max_val - min_val
+        if current_width > max_width:
+            # Adjust to fit max_width while keeping actual value in range
+            if actual_value - min_val <= max_width:
+                max_val = min(20, min_val + max_width)
+            else:
+                min_val = max(1, max_val - max_width)
+        ranges.append(_final_initial_range(actual_value, min_val, max_val))
+
+    return tuple(ranges), tuple(accumulate(weights))
+
+
+def _fallback_initial_range(actual_value: int, reveal_widths) -> Tuple[int, int]:
+    """Symmetric start range when no initial range was stored."""
+    max_width = int((20 - 1) * reveal_widths[0])  # Use week 0 width
+    return max(1, actual_value - max_width // 2), min(20, actual_value + max_width // 2)
+
+
 def calculate_attribute_ranges(
     actual_attributes: Dict[str, int],
     weeks_in_academy: int,
@@ -482,224 +809,189 @@ def calculate_attribute_ranges(
     Returns:
         Dict of attribute_name -> {"min": int, "max": int}
     """
-    # Clamp weeks_in_academy to available reveal widths
-    week_idx = min(weeks_in_academy, len(reveal_widths) - 1)
-    width_pct = reveal_widths[week_idx]
-    
+    if weeks_in_academy != 0:
+        # Week 1+: deterministic narrowing from the stored initial range
+        return reveal_attribute_ranges(
+            [actual_attributes], [initial_ranges], [weeks_in_academy], reveal_widths
+        )[0]
+
+    # Week 0: Generate initial asymmetric range
+    # Max width is 6 skill points (hard limit), at least 1
+    calculated_width = int((20 - 1) * reveal_widths[0])
+    max_width = max(1, min(6, calculated_width))
+
     ranges = {}
-    
     for attr_name, actual_value in actual_attributes.items():
-        if weeks_in_academy == 0:
-            # Week 0: Generate initial asymmetric range
-            # Max width is 6 skill points (hard limit)
-            calculated_width = int((20 - 1) * width_pct)
-            max_width = min(6, calculated_width)
-            
-            # Ensure we have at least some width
-            if max_width < 1:
-                max_width = 1
-            
-            # Bias: Make actual value more likely to be in upper half of range
-            # This makes players seem to improve rather than get worse
-            # Strategy: Prefer ranges where actual is closer to max than min
-            
-            # Minimum possible start (ensuring actual is in range)
-            min_start = max(1, actual_value - max_width)
-            # Maximum possible start (ensuring we don't exceed max)
-            max_start = min(actual_value, 20 - max_width)
-            
-            if min_start > max_start:
-                # Edge case: can't fit full width, use symmetric range
-                min_val = max(1, actual_value - max_width // 2)
-                max_val = min(20, actual_value + max_width // 2)
-            else:
-                # Bias toward ranges where actual is in upper portion
-                # Calculate position of actual value in potential range
-                # We want actual to be in upper 60% of range on average
-                # Use weighted random: prefer ranges where actual is higher
-                
-                # Calculate weights: higher weight for ranges where actual is closer to max
-                weights = []
-                positions = []
-                for start in range(min_start, max_start + 1):
-                    end = min(20, start + max_width)
-                    # Ensure range width doesn't exceed max_width
-                    actual_width = end - start
-                    if actual_width > max_width:
-                        end = start + max_width
-                    if end > 20:
-                        end = 20
-                        start = max(1, end - max_width)
-                    
-                    # Position of actual in this range (0.0 = at min, 1.0 = at max)
-                    if end > start:
-                        pos = (actual_value - start) / (end - start)
-                    else:
-                        pos = 0.5
-                    positions.append((start, end, pos))
-                    # Higher weight for positions > 0.5 (upper half)
-                    # Target average position around 0.7 (upper 70%)
-                    # Use exponential weighting that favors positions around 0.7
-                    if pos > 0.5:
-                        # Favor positions around 0.7
-                        # Use a curve that peaks around 0.7
-                        if pos <= 0.7:
-                            weight = (pos / 0.7) ** 0.5  # Strong increase to 0.7
-                        else:
-                            # Taper off gently from 0.7 to 1.0, but not too much
-                            # Keep some weight for positions above 0.7
-                            weight = 0.8 - ((pos - 0.7) / 0.3) ** 1.0  # Gentler taper, higher base
-                            weight = max(0.3, weight)  # Minimum weight of 0.3
-                    else:
-                        # Penalize lower positions more
-                        weight = (pos ** 1.5)
-                    weights.append(weight)
-                
-                # Normalize weights
-                if sum(weights) > 0:
-                    weights = [w / sum(weights) for w in weights]
-                    # Weighted random choice
-                    chosen_idx = random.choices(range(len(positions)), weights=weights)[0]
-                    min_val, max_val, _ = positions[chosen_idx]
-                    # Final check: ensure width doesn't exceed max_width
-                    if max_val - min_val > max_width:
-                        max_val = min_val + max_width
-                        if max_val > 20:
-                            max_val = 20
-                            min_val = max(1, max_val - max_width)
-                else:
-                    # Fallback: random choice
-                    range_start = random.randint(min_start, max_start)
-                    min_val = range_start
-                    max_val = min(20, range_start + max_width)
-                    # Ensure width doesn't exceed max_width
-                    if max_val - min_val > max_width:
-                        max_val = min_val + max_width
-                
-                # Ensure actual value is within range (should always be, but double-check)
-                if actual_value < min_val:
-                    min_val = max(1, actual_value)
-                elif actual_value > max_val:
-                    max_val = min(20, actual_value)
-                
-                # Final enforcement: ensure width doesn't exceed max_width
-                current_width = max_val - min_val
-                if current_width > max_width:
-                    # Adjust to fit max_width while keeping actual value in range
-                    if actual_value - min_val <= max_width:
-                        max_val = min(20, min_val + max_width)
-                    else:
-                        min_val = max(1, max_val - max_width)
-            
-            # Final check: ensure width is at most 6
-            final_width = max_val - min_val
-            if final_width > 6:
-                # Adjust to exactly 6 while keeping actual value in range
-                if actual_value - min_val <= 6:
-                    max_val = min(20, min_val + 6)
-                else:
-                    min_val = max(1, max_val - 6)
-                # Re-check width after adjustment
-                final_width = max_val - min_val
-                if final_width > 6:
-                    # Force to exactly 6, centered on actual if needed
-                    if actual_value <= 10:
-                        min_val = max(1, actual_value - 3)
-                        max_val = min(20, min_val + 6)
-                    else:
-                        max_val = min(20, actual_value + 3)
-                        min_val = max(1, max_val - 6)
-            
-            # Ensure actual value is in range (final safety check)
-            if actual_value < min_val:
-                min_val = actual_value
-            if actual_value > max_val:
-                max_val = actual_value
-            
-            # Absolute final check: width must be <= 6
-            final_width = max_val - min_val
-            if final_width > 6:
-                # Force width to 6, keeping actual value in range
-                center = (min_val + max_val) / 2
-                if actual_value <= center:
-                    min_val = max(1, actual_value)
-                    max_val = min(20, min_val + 6)
-                else:
-                    max_val = min(20, actual_value)
-                    min_val = max(1, max_val - 6)
-            
-            ranges[attr_name] = {"min": int(min_val), "max": int(max_val)}
-        else:
-            # Week 1+: Narrow the range toward the actual value
-            if initial_ranges and attr_name in initial_ranges:
-                # Use stored initial range
-                initial_min = initial_ranges[attr_name]["min"]
-                initial_max = initial_ranges[attr_name]["max"]
-            else:
-                # Fallback: calculate symmetric range from current width
-                span = 20 - 1
-                max_width = int(span * reveal_widths[0])  # Use week 0 width
-                initial_min = max(1, actual_value - max_width // 2)
-                initial_max = min(20, actual_value + max_width // 2)
-            
-            # Calculate progress (0.0 = week 0, 1.0 = final week)
-            total_weeks = len(reveal_widths) - 1
-            if total_weeks > 0:
-                progress = week_idx / total_weeks  # 0.0 to 1.0
-            else:
-                progress = 1.0
-            
-            if progress >= 1.0 or width_pct == 0:
-                # Final week: show exact value
-                min_val = actual_value
-                max_val = actual_value
-            else:
-                # Interpolate between initial range and actual value
-                # Move min toward actual_value, max toward actual_value
-                min_val = int(initial_min + (actual_value - initial_min) * progress)
-                max_val = int(initial_max - (initial_max - actual_value) * progress)
-                
-                # Ensure bounds don't cross actual value
-                min_val = min(min_val, actual_value)
-                max_val = max(max_val, actual_value)
-                
-                # Ensure bounds are within valid range
-                min_val = max(1, min_val)
-                max_val = min(20, max_val)
-                
-                # Final safety check: actual value must be in range
-                if actual_value < min_val:
-                    min_val = actual_value
-                if actual_value > max_val:
-                    max_val = actual_value
-            
-            ranges[attr_name] = {"min": min_val, "max": max_val}
-    
+        candidates, cum_weights = _initial_range_candidates(int(actual_value), max_width)
+        min_val, max_val = random.choices(candidates, cum_weights=cum_weights)[0]
+        ranges[attr_name] = {"min": min_val, "max": max_val}
     return ranges
 
 
+def narrow_attribute_ranges(
+    actual: np.ndarray,
+    initial_min: np.ndarray,
+    initial_max: np.ndarray,
+    weeks_in_academy: np.ndarray,
+    reveal_widths=DEFAULT_REVEAL_WIDTHS,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Week 1+ ranges for many attributes at once (same shape arrays; weeks broadcast).
+
+    Linear narrowing from the initial range toward the actual value: progress is
+    week / (len(reveal_widths) - 1), exact value once progress reaches 1 or the width is 0.
+    """
+    widths = np.asarray(reveal_widths, dtype=np.float64)
+    week_idx = np.minimum(np.asarray(weeks_in_academy), len(widths) - 1)
+    total_weeks = len(widths) - 1
+    progress = week_idx / total_weeks if total_weeks > 0 else np.ones_like(week_idx, dtype=np.float64)
+    exact = (progress >= 1.0) | (widths[week_idx] == 0)
+
+    actual = np.asarray(actual, dtype=np.int64)
+    # Interpolate between initial range and actual value (int() truncation)
+    mins = np.trunc(initial_min + (actual - initial_min) * progress).astype(np.int64)
+    maxs = np.trunc(initial_max - (initial_max - actual) * progress).astype(np.int64)
+    # Bounds never cross the actual value and stay within 1..20
+    mins = np.maximum(1, np.minimum(mins, actual))
+    maxs = np.minimum(20, np.maximum(maxs, actual))
+    mins = np.minimum(mins, actual)
+    maxs = np.maximum(maxs, actual)
+    return np.where(exact, actual, mins), np.where(exact, actual, maxs)
+
+
+def reveal_attribute_ranges(
+    actual_attributes: List[Dict[str, int]],
+    initial_ranges: List[Optional[Dict[str, Dict[str, int]]]],
+    weeks_in_academy: List[int],
+    reveal_widths=DEFAULT_REVEAL_WIDTHS,
+) -> List[Dict[str, Dict[str, int]]]:
+    """
+    Week 1+ attribute ranges for a list of academy players in one vectorized pass.
+
+    Every (player, attribute) pair is flattened into one array, narrowed with
+    ``narrow_attribute_ranges`` and regrouped per player. Attributes without a stored initial
+    range use the symmetric fallback.
+    """
+    names: List[str] = []
+    owner: List[int] = []
+    actual: List[int] = []
+    init_min: List[int] = []
+    init_max: List[int] = []
+    weeks: List[int] = []
+    for i, (attrs, init, wk) in enumerate(zip(actual_attributes, initial_ranges, weeks_in_academy)):
+        init = init or {}
+        for attr_name, actual_value in (attrs or {}).items():
+            r = init.get(attr_name)
+            if r:
+                lo, hi = r["min"], r["max"]
+            else:
+                lo, hi = _fallback_initial_range(actual_value, reveal_widths)
+            names.append(attr_name)
+            owner.append(i)
+            actual.append(actual_value)
+            init_min.append(lo)
+            init_max.append(hi)
+            weeks.append(wk)
+
+    out: List[Dict[str, Dict[str, int]]] = [{} for _ in actual_attributes]
+    if not names:
+        return out
+    mins, maxs = narrow_attribute_ranges(
+        np.asarray(actual),
+        np.asarray(init_min, dtype=np.float64),
+        np.asarray(init_max, dtype=np.float64),
+        np.asarray(weeks),
+        reveal_widths,
+    )
+    for i, name, lo, hi in zip(owner, names, mins.tolist(), maxs.tolist()):
+        out[i][name] = {"min": lo, "max": hi}
+    return out
+
+
 def process_academy_week(academy_players: List, week_number: int) -> None:
     """
     Process one week of academy progression for a list of players.
-    Updates weeks_in_academy and recalculates attribute ranges.
+    Updates weeks_in_academy and recalculates attribute ranges (one vectorized pass).
     
     Args:
         academy_players: List of YouthAcademyPlayer objects
         week_number: Current week number
     """
-    for player in academy_players:
-        if player.status != "active":
-            continue
-        
+    active = [p for p in academy_players if p.status == "active"]
+    for player in active:
         # Increment weeks in academy
         player.weeks_in_academy += 1
-        
-        # Recalculate attribute ranges (more accurate each week)
-        if player.actual_attributes:
-            player.attribute_ranges = calculate_attribute_ranges(
-                player.actual_attributes,
-                player.weeks_in_academy
-            )
+
+    # Recalculate attribute ranges (more accurate each week)
+    revealed = [p for p in active if p.actual_attributes]
+    ranges = reveal_attribute_ranges(
+        [p.actual_attributes for p in revealed],
+        [getattr(p, "initial_attribute_ranges", None) for p in revealed],
+        [p.weeks_in_academy for p in revealed],
+    )
+    for player, r in zip(revealed, ranges):
+        player.attribute_ranges = r
+
+
+def progress_academy_week_bulk(db_session, club_id: UUID) -> Tuple[int, int]:
+    """
+    Database version of one academy week for every active player of a club.
+
+    Reads only the columns the reveal needs, narrows all attribute ranges in one vectorized
+    pass and writes weeks_in_academy + attribute_ranges with a single
+    ``UPDATE youth_academy_players ... FROM (VALUES ...)``. ORM objects are loaded only for
+    players reaching weeks_to_promotion, which are promoted. The caller commits.
+
+    Returns (progressed, promoted).
+    """
+    from sqlalchemy import Integer, column, select, update, values
+    from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
+    from models.youth_academy_player import YouthAcademyPlayer
+
+    table = YouthAcademyPlayer.__table__
+    rows = db_session.execute(
+        select(
+            table.c.id,
+            table.c.actual_attributes,
+            table.c.initial_attribute_ranges,
+            table.c.attribute_ranges,
+            table.c.weeks_in_academy,
+            table.c.weeks_to_promotion,
+        ).where(table.c.club_id == club_id, table.c.status == "active")
+    ).all()
+    if not rows:
+        return 0, 0
+
+    weeks = [(r.weeks_in_academy or 0) + 1 for r in rows]
+    revealed = [i for i, r in enumerate(rows) if r.actual_attributes]
+    ranges = [r.attribute_ranges for r in rows]
+    for i, rng in zip(revealed, reveal_attribute_ranges(
+        [rows[i].actual_attributes for i in revealed],
+        [rows[i].initial_attribute_ranges for i in revealed],
+        [weeks[i] for i in revealed],
+    )):
+        ranges[i] = rng
+
+    v = values(
+        column("id", PGUUID(as_uuid=True)),
+        column("weeks_in_academy", Integer),
+        column("attribute_ranges", JSONB),
+        name="v",
+    ).data([(r.id, wk, rng) for r, wk, rng in zip(rows, weeks, ranges)])
+    db_session.execute(
+        update(table)
+        .where(table.c.id == v.c.id)
+        .values(weeks_in_academy=v.c.weeks_in_academy, attribute_ranges=v.c.attribute_ranges)
+    )
+
+    # Auto-promote if weeks >= weeks_to_promotion
+    due = [r.id for r, wk in zip(rows, weeks) if wk >= r.weeks_to_promotion]
+    if due:
+        for academy_player in db_session.query(YouthAcademyPlayer).filter(
+            YouthAcademyPlayer.id.in_(due)
+        ).populate_existing():
+            promote_academy_player(academy_player, db_session)
+    return len(rows), len(due)
 
 
 def promote_academy_player(academy_player, db_session) -> 'Player':